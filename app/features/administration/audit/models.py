@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
 from app.features.core.database import Base
+from app.features.core.full_text_search import search_vector_column, search_vector_index, trigram_index
 
 
 class AuditLog(Base):
@@ -55,6 +56,9 @@ class AuditLog(Base):
     endpoint = Column(String(255), nullable=True)  # API endpoint accessed
     method = Column(String(10), nullable=True)  # HTTP method
 
+    # Full-text search over what happened (generated by Postgres)
+    search_vector = search_vector_column(("action", "A"), ("resource_type", "B"), ("description", "C"))
+
     # Performance indexes
     __table_args__ = (
         Index('idx_audit_tenant_timestamp', 'tenant_id', 'timestamp'),
@@ -62,6 +66,8 @@ class AuditLog(Base):
         Index('idx_audit_action_timestamp', 'action', 'timestamp'),
         Index('idx_audit_category_severity', 'category', 'severity'),
         Index('idx_audit_resource', 'resource_type', 'resource_id'),
+        search_vector_index('idx_audit_search_vector'),
+        trigram_index('idx_audit_action_trgm', 'action'),
     )
 
     def to_dict(self) -> Dict[str, Any]:
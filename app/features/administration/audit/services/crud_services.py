@@ -6,6 +6,7 @@ Read-only operations for audit log integrity.
 # Use centralized imports for consistency
 from app.features.core.sqlalchemy_imports import *
 from app.features.core.enhanced_base_service import BaseService
+from app.features.core.full_text_search import search_match, search_rank
 
 from app.features.administration.audit.models import AuditLog
 
@@ -120,7 +121,10 @@ class AuditCrudService(BaseService[AuditLog]):
         limit: int = 50
     ) -> List[AuditLog]:
         """
-        Search audit logs by description or metadata.
+        Search audit logs by action, resource type and description.
+
+        Uses the full-text index, plus the action trigram index for partial
+        action names; best matches first, then newest.
 
         Args:
             search_term: Search term to look for
@@ -130,12 +134,13 @@ class AuditCrudService(BaseService[AuditLog]):
             List of matching audit logs
         """
         try:
-            # Search in description and metadata fields using BaseService
+            fuzzy_columns = (AuditLog.action,)
             query = self.create_base_query(AuditLog).where(
-                func.lower(AuditLog.description).contains(search_term.lower()) |
-                func.lower(AuditLog.action).contains(search_term.lower()) |
-                func.lower(AuditLog.resource_type).contains(search_term.lower())
-            ).order_by(desc(AuditLog.timestamp)).limit(limit)
+                search_match(AuditLog.search_vector, search_term, fuzzy_columns)
+            ).order_by(
+                search_rank(AuditLog.search_vector, search_term, fuzzy_columns).desc(),
+                desc(AuditLog.timestamp)
+            ).limit(limit)
 
             result = await self.db.execute(query)
             return result.scalars().all()
@@ -14,6 +14,7 @@ from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.features.core.database import Base
 from app.features.core.audit_mixin import AuditMixin
+from app.features.core.full_text_search import search_vector_column, search_vector_index, trigram_index
 
 
 class ContentPlanStatus(str, Enum):
@@ -104,34 +105,8 @@ class ContentPlan(Base, AuditMixin):
     current_iteration = Column(Integer, nullable=False, default=0)
     latest_seo_score = Column(Integer, nullable=True)
 
-    # Processing results (JSONB for flexible storage)
-    research_data = Column(JSONB, nullable=False, default=dict)
-    # Structure: {
-    #   "top_results": [{"title": "...", "url": "...", "scraped_content": "..."}],
-    #   "seo_analysis": "AI-generated SEO gap analysis",
-    #   "keywords_found": ["api", "best practices", ...]
-    # }
-
-    generation_metadata = Column(JSONB, nullable=False, default=dict)
-    # Structure: {
-    #   "model": "gpt-4",
-    #   "prompt_tokens": 1500,
-    #   "completion_tokens": 2000,
-    #   "cost_estimate": 0.15,
-    #   "generated_at": "2025-10-11T..."
-    # }
-
-    refinement_history = Column(JSONB, nullable=False, default=list)
-    # Structure: [
-    #   {
-    #     "iteration": 1,
-    #     "score": 78,
-    #     "issues": ["Schema Markup", "Keyword Density"],
-    #     "feedback": {...},
-    #     "refined_at": "2025-10-11T..."
-    #   },
-    #   ...
-    # ]
+    # Heavy processing results (research, metadata, refinement history) live in
+    # ContentPlanPayload and are only loaded on request; see the properties below.
 
     prompt_settings = Column(JSONB, nullable=False, default=dict)
 
@@ -142,11 +117,71 @@ class ContentPlan(Base, AuditMixin):
     error_log = Column(Text, nullable=True)
     retry_count = Column(Integer, nullable=False, default=0)
 
+    # Full-text search (generated by Postgres)
+    search_vector = search_vector_column(("title", "A"), ("description", "B"))
+
     # Relationships
     generated_content = relationship("ContentItem", foreign_keys=[generated_content_item_id], uselist=False)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert model to dictionary for API responses."""
+    __table_args__ = (
+        search_vector_index("idx_content_plans_search_vector"),
+        trigram_index("idx_content_plans_title_trgm", "title"),
+    )
+    # Never lazy-loaded: callers must ask for it with selectinload(ContentPlan.payload)
+    payload = relationship(
+        "ContentPlanPayload",
+        uselist=False,
+        lazy="raise",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
+    PAYLOAD_FIELDS = ("research_data", "generation_metadata", "refinement_history")
+
+    def _get_payload_field(self, name: str, default):
+        payload = self.payload
+        if payload is None:
+            return default
+        value = getattr(payload, name)
+        return default if value is None else value
+
+    def _set_payload_field(self, name: str, value) -> None:
+        if self.payload is None:
+            self.payload = ContentPlanPayload(tenant_id=self.tenant_id or "global")
+        setattr(self.payload, name, value)
+
+    @property
+    def research_data(self) -> Dict[str, Any]:
+        return self._get_payload_field("research_data", {})
+
+    @research_data.setter
+    def research_data(self, value: Dict[str, Any]) -> None:
+        self._set_payload_field("research_data", value)
+
+    @property
+    def generation_metadata(self) -> Dict[str, Any]:
+        return self._get_payload_field("generation_metadata", {})
+
+    @generation_metadata.setter
+    def generation_metadata(self, value: Dict[str, Any]) -> None:
+        self._set_payload_field("generation_metadata", value)
+
+    @property
+    def refinement_history(self) -> List[Dict[str, Any]]:
+        return self._get_payload_field("refinement_history", [])
+
+    @refinement_history.setter
+    def refinement_history(self, value: List[Dict[str, Any]]) -> None:
+        self._set_payload_field("refinement_history", value)
+
+    def to_dict(self, include_payload: bool = True) -> Dict[str, Any]:
+        """
+        Convert model to dictionary for API responses.
+
+        Args:
+            include_payload: Include research/generation/refinement payloads
+                (requires the payload relationship to be loaded)
+        """
         base_dict = {
             "id": self.id,
             "tenant_id": self.tenant_id,
@@ -163,14 +198,17 @@ class ContentPlan(Base, AuditMixin):
             "status": self.status,
             "current_iteration": self.current_iteration,
             "latest_seo_score": self.latest_seo_score,
-            "research_data": self.research_data or {},
-            "generation_metadata": self.generation_metadata or {},
-            "refinement_history": self.refinement_history or [],
             "prompt_settings": self.prompt_settings or {},
             "generated_content_item_id": self.generated_content_item_id,
             "error_log": self.error_log,
             "retry_count": self.retry_count,
         }
+        if include_payload:
+            base_dict.update({
+                "research_data": self.research_data,
+                "generation_metadata": self.generation_metadata,
+                "refinement_history": self.refinement_history,
+            })
         # Add audit information
         base_dict.update(self.get_audit_info())
         return base_dict
@@ -179,6 +217,59 @@ class ContentPlan(Base, AuditMixin):
         return f"<ContentPlan(id={self.id}, tenant_id='{self.tenant_id}', title='{self.title}', status='{self.status}')>"
 
 
+class ContentPlanPayload(Base):
+    """
+    Off-row storage for the large JSONB results of a content plan.
+
+    Scraped competitor articles and per-iteration drafts can run to megabytes,
+    so they are kept out of ``content_plans`` (whose rows are read on every
+    status change and list request) and only loaded for detail views and the
+    generation workflow. The columns use lz4 TOAST compression where the server
+    supports it.
+    """
+    __tablename__ = "content_plan_payloads"
+
+    plan_id = Column(String(36), ForeignKey("content_plans.id", ondelete="CASCADE"), primary_key=True)
+    tenant_id = Column(String(50), nullable=False, index=True, default="global")
+
+    research_data = Column(JSONB, nullable=False, default=dict)
+    # Structure: {
+    #   "top_results": [{"title": "...", "url": "...", "scraped_content": "..."}],
+    #   "seo_analysis": "AI-generated SEO gap analysis",
+    #   "keywords_found": ["api", "best practices", ...]
+    # }
+
+    generation_metadata = Column(JSONB, nullable=False, default=dict)
+    # Structure: {
+    #   "model": "gpt-4",
+    #   "prompt_tokens": 1500,
+    #   "completion_tokens": 2000,
+    #   "cost_estimate": 0.15,
+    #   "generated_at": "2025-10-11T..."
+    # }
+
+    refinement_history = Column(JSONB, nullable=False, default=list)
+    # Structure: [
+    #   {
+    #     "iteration": 1,
+    #     "score": 78,
+    #     "issues": ["Schema Markup", "Keyword Density"],
+    #     "feedback": {...},
+    #     "refined_at": "2025-10-11T..."
+    #   },
+    #   ...
+    # ]
+
+    updated_at = Column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc)
+    )
+
+    def __repr__(self) -> str:
+        return f"<ContentPlanPayload(plan_id={self.plan_id}, tenant_id='{self.tenant_id}')>"
+
+
 class ContentItem(Base, AuditMixin):
     """
     Content items for multi-channel broadcasting.
@@ -214,9 +305,17 @@ class ContentItem(Base, AuditMixin):
     content_metadata = Column(JSONB, nullable=True)
     tags = Column(JSON, nullable=True, default=list)
 
+    # Full-text search (generated by Postgres)
+    search_vector = search_vector_column(("title", "A"), ("body", "B"))
+
     # Relationships
     publish_jobs = relationship("PublishJob", back_populates="content_item", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        search_vector_index("idx_content_items_search_vector"),
+        trigram_index("idx_content_items_title_trgm", "title"),
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to dictionary for API responses."""
         base_dict = {
@@ -4,7 +4,7 @@ Content Broadcaster external API routes.
 import asyncio
 import uuid
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Header, Query
 from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.features.core.database import get_db, get_async_session
@@ -234,15 +234,19 @@ async def generate_seo_content(
 @router.get("/api/generation-stream")
 async def generation_progress_stream(
     tenant_id: str = Depends(tenant_dependency),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    last_event_id: Optional[str] = Header(default=None, alias="Last-Event-ID")
 ):
     """
-    SSE endpoint that streams SEO generation progress events for the current user.
+    SSE endpoint that streams generation progress events for the current user.
+
+    Events published by Celery workers arrive through the shared progress log;
+    a reconnect carrying ``Last-Event-ID`` resumes after that event.
     """
 
     async def event_generator():
         try:
-            async for chunk in progress_stream_manager.stream(tenant_id, current_user.id):
+            async for chunk in progress_stream_manager.stream(tenant_id, current_user.id, last_event_id):
                 yield chunk
         except asyncio.CancelledError:
             # Propagate cancellation so Starlette can close the connection gracefully.
@@ -251,6 +255,7 @@ async def generation_progress_stream(
     headers = {
         "Cache-Control": "no-cache",
         "Connection": "keep-alive",
+        "X-Accel-Buffering": "no",
     }
 
     return StreamingResponse(
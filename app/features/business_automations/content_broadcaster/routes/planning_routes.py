@@ -25,13 +25,14 @@ from app.features.administration.ai_prompts.services import AIPromptService
 from app.features.core.route_imports import is_global_admin
 from app.features.core.audit_mixin import AuditContext
 from app.features.core.task_manager import process_content_plan_async as enqueue_content_plan_task
+from app.features.core.task_manager import process_content_plan_batch_async as enqueue_content_plan_batch_task
 
 from ..models import ContentItem, ContentPlanStatus
-from ..schemas import ContentPlanCreate, ProcessPlanRequest
+from ..schemas import BatchProcessPlansRequest, ContentPlanCreate, ProcessPlanRequest
 from ..services.content_planning_service import ContentPlanningService
 from ..services.content_orchestrator_service import ContentOrchestratorService
 from ..services.prompt_templates import PROMPT_DEFAULTS
-from ..tasks import run_plan_generation
+from ..tasks import run_plan_generation, run_plan_batch
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -100,6 +101,20 @@ async def _run_plan_generation_in_app(plan_id: str, tenant_id: str, triggered_by
         )
 
 
+async def _run_plan_batch_in_app(batch_id: str, plan_ids: List[str], tenant_id: str, triggered_by: Dict[str, Any]):
+    """
+    Fallback path to process a plan batch within the FastAPI app process.
+    """
+    try:
+        await run_plan_batch(batch_id=batch_id, plan_ids=plan_ids, tenant_id=tenant_id, triggered_by=triggered_by)
+    except Exception:
+        logger.exception(
+            "In-process content plan batch failed",
+            batch_id=batch_id,
+            tenant_id=tenant_id
+        )
+
+
 async def _build_run_history_context(plan, db: AsyncSession, tenant_id: str) -> Tuple[List[Dict[str, Any]], Dict[str, ContentItem]]:
     generation_meta = plan.generation_metadata or {}
     raw_history = generation_meta.get("run_history") or []
@@ -1203,7 +1218,7 @@ async def delete_prompt_override(
     """Remove a tenant-specific prompt override for the Content Broadcaster prompts."""
     plan_service = ContentPlanningService(db, tenant_id)
     try:
-        plan = await plan_service.get_plan(plan_id)
+        plan = await plan_service.get_plan(plan_id, include_payload=False)
     except ValueError:
         raise HTTPException(status_code=404, detail="Content plan not found")
 
@@ -1228,6 +1243,90 @@ async def delete_prompt_override(
     return response
 
 
+@router.post("/batch/process-async")
+async def enqueue_content_plan_batch(
+    request: BatchProcessPlansRequest,
+    tenant_id: str = Depends(tenant_dependency),
+    current_user = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Queue several content plans for processing under one shared LLM budget.
+
+    Plans that are missing or already running are skipped and reported back.
+    Declared before the /{plan_id}/... routes so "batch" is not read as a plan ID.
+    """
+    service = ContentPlanningService(db, tenant_id)
+    requested_ids = list(dict.fromkeys(request.plan_ids))
+    plans = {plan.id: plan for plan in await service.get_plans_by_ids(requested_ids)}
+
+    in_progress_statuses = {
+        ContentPlanStatus.RESEARCHING.value,
+        ContentPlanStatus.GENERATING.value,
+        ContentPlanStatus.REFINING.value,
+    }
+
+    queued_ids: List[str] = []
+    skipped: List[Dict[str, str]] = []
+    for plan_id in requested_ids:
+        plan = plans.get(plan_id)
+        if not plan:
+            skipped.append({"plan_id": plan_id, "reason": "not_found"})
+            continue
+        if plan.status in in_progress_statuses:
+            skipped.append({"plan_id": plan_id, "reason": f"already_{plan.status}"})
+            continue
+        # Optimistically move to researching so the table reflects background work.
+        plan.status = ContentPlanStatus.RESEARCHING.value
+        plan.error_log = None
+        plan.updated_at = datetime.now()
+        queued_ids.append(plan_id)
+
+    if not queued_ids:
+        raise HTTPException(status_code=400, detail="None of the selected plans can be processed")
+
+    await db.commit()
+
+    triggered_by = {
+        "id": getattr(current_user, "id", None),
+        "email": getattr(current_user, "email", None),
+        "name": getattr(current_user, "name", None),
+    }
+    batch_id = f"batch-{uuid4().hex}"
+    task_id = None
+
+    if USE_CELERY_FOR_PLANS:
+        try:
+            task_id = enqueue_content_plan_batch_task(
+                batch_id=batch_id,
+                plan_ids=queued_ids,
+                tenant_id=tenant_id,
+                triggered_by=triggered_by
+            )
+        except Exception:
+            logger.exception(
+                "Failed to enqueue plan batch via Celery, falling back to local execution",
+                batch_id=batch_id,
+                tenant_id=tenant_id
+            )
+    if not task_id:
+        task_id = f"inproc-{batch_id}"
+        asyncio.create_task(_run_plan_batch_in_app(batch_id, queued_ids, tenant_id, triggered_by))
+
+    return JSONResponse(
+        status_code=202,
+        content={
+            "success": True,
+            "batch_id": batch_id,
+            "task_id": task_id,
+            "queued": queued_ids,
+            "skipped": skipped,
+            "message": f"{len(queued_ids)} content plans queued for AI processing.",
+        },
+        headers={"HX-Trigger": "showSuccess"}
+    )
+
+
 @router.post("/{plan_id}/process-async")
 async def enqueue_content_plan_processing(
     plan_id: str,
@@ -1241,7 +1340,7 @@ async def enqueue_content_plan_processing(
     service = ContentPlanningService(db, tenant_id)
 
     try:
-        plan = await service.get_plan(plan_id)
+        plan = await service.get_plan(plan_id, include_payload=False)
     except ValueError:
         raise HTTPException(status_code=404, detail="Content plan not found")
 
@@ -80,7 +80,19 @@ class ProcessPlanRequest(BaseModel):
     )
 
 
+class BatchProcessPlansRequest(BaseModel):
+    """Request model for processing several content plans as one batch."""
+
+    plan_ids: List[str] = Field(
+        ...,
+        min_items=1,
+        max_items=100,
+        description="Content plan IDs to process under a shared LLM budget"
+    )
+
+
 __all__ = [
+    "BatchProcessPlansRequest",
     "ApprovalRequest",
     "ContentCreateRequest",
     "ContentPlanCreate",
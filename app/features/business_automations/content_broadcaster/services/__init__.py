@@ -7,6 +7,7 @@ from .content_planning_service import ContentPlanningService
 from .ai_research_service import AIResearchService
 from .ai_generation_service import AIGenerationService
 from .content_orchestrator_service import ContentOrchestratorService
+from .batch_orchestrator_service import ContentBatchOrchestratorService
 
 __all__ = [
     "ContentBroadcasterService",
@@ -14,4 +15,5 @@ __all__ = [
     "AIResearchService",
     "AIGenerationService",
     "ContentOrchestratorService",
+    "ContentBatchOrchestratorService",
 ]
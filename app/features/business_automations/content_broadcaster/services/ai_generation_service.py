@@ -9,8 +9,10 @@ This service handles:
 Ported from SEO Blog Generator.py (lines 163-246)
 """
 
+import asyncio
 import json
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Callable, Awaitable
 from jinja2 import Template
 from openai import AsyncOpenAI, AuthenticationError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,9 +20,76 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.features.core.sqlalchemy_imports import get_logger
 from app.features.administration.ai_prompts.services import AIPromptService
 from .prompt_templates import PROMPT_DEFAULTS
+from .llm_budget import LlmBudget, budgeted_chat_completion, estimate_tokens
 
 logger = get_logger(__name__)
 
+# Minimum interval between streamed draft chunks handed to the caller.
+# Coalescing keeps SSE traffic to a few events per second instead of one per token.
+STREAM_COALESCE_INTERVAL_SECONDS = 0.2
+
+# Receives (delta, full_text_so_far) for each coalesced chunk of a streamed draft.
+DraftStreamCallback = Callable[[str, str], Awaitable[None]]
+
+# Expected completion sizes used to reserve LLM budget before each call.
+BLOG_POST_COMPLETION_TOKENS = 3000
+VALIDATION_COMPLETION_TOKENS = 800
+VARIANT_COMPLETION_TOKENS = 600
+
+# Maximum concurrent OpenAI calls when generating channel variants.
+VARIANT_CONCURRENCY = 4
+
+# Channels short enough to be generated together in one structured call.
+SHORT_FORM_CHANNELS = frozenset({"twitter", "linkedin", "facebook"})
+
+# Stands in for the article inside channel prompts; the article itself is sent
+# once as a shared system message.
+SHARED_ARTICLE_REFERENCE = "(The full article is provided in the system message above.)"
+
+# Channel-specific constraints
+CHANNEL_CONSTRAINTS: Dict[str, Dict[str, Any]] = {
+    "twitter": {
+        "max_chars": 280,
+        "format": "plain text",
+        "tone": "casual and engaging",
+        "instructions": "Create a compelling tweet with hashtags"
+    },
+    "linkedin": {
+        "max_chars": 3000,
+        "format": "professional text with line breaks",
+        "tone": "professional and insightful",
+        "instructions": "Create a LinkedIn post that sparks professional discussion"
+    },
+    "wordpress": {
+        "max_chars": None,
+        "format": "HTML with proper headings",
+        "tone": "informative and comprehensive",
+        "instructions": "Full blog post with proper HTML structure"
+    },
+    "medium": {
+        "max_chars": None,
+        "format": "Markdown",
+        "tone": "storytelling and engaging",
+        "instructions": "Medium-style article with narrative flow"
+    },
+    "facebook": {
+        "max_chars": 63206,
+        "format": "plain text with emoji",
+        "tone": "friendly and conversational",
+        "instructions": "Engaging Facebook post with call-to-action"
+    }
+}
+
+
+def channel_constraints_for(channel: str) -> Dict[str, Any]:
+    """Constraints for a channel, with generic defaults for unknown channels."""
+    return CHANNEL_CONSTRAINTS.get(channel, {
+        "max_chars": 1000,
+        "format": "plain text",
+        "tone": "professional",
+        "instructions": f"Adapt content for {channel}"
+    })
+
 
 class AIGenerationService:
     """
@@ -30,17 +99,41 @@ class AIGenerationService:
     Now uses dynamic AI prompts from database with Jinja2 templates.
     """
 
-    def __init__(self, db_session: AsyncSession, tenant_id: str = "global"):
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        tenant_id: str = "global",
+        llm_budget: Optional[LlmBudget] = None
+    ):
         """
         Initialize generation service.
 
         Args:
             db_session: Database session for fetching prompts
             tenant_id: Tenant ID for tenant-specific prompt overrides
+            llm_budget: Optional shared request/token budget; when set, every
+                OpenAI call waits for budget and reports rate-limit headers back
         """
         self.db = db_session
         self.tenant_id = tenant_id
         self.prompt_service = AIPromptService(db_session)
+        self.llm_budget = llm_budget
+
+    async def _create_completion(
+        self,
+        client: AsyncOpenAI,
+        expected_completion_tokens: int,
+        **kwargs
+    ):
+        """
+        Create a chat completion, going through the LLM budget when configured
+        (see ``budgeted_chat_completion``).
+        """
+        if not self.llm_budget:
+            return await client.chat.completions.create(**kwargs)
+        return await budgeted_chat_completion(
+            self.llm_budget, self.tenant_id, client, expected_completion_tokens, **kwargs
+        )
 
     async def generate_blog_post(
         self,
@@ -53,7 +146,8 @@ class AIGenerationService:
         previous_content: Optional[str] = None,
         validation_feedback: Optional[str] = None,
         tone: str = "professional",
-        prompt_settings: Optional[Dict[str, Any]] = None
+        prompt_settings: Optional[Dict[str, Any]] = None,
+        stream_callback: Optional[DraftStreamCallback] = None
     ) -> str:
         """
         Generate SEO-optimized blog post using AI with dynamic prompts from database.
@@ -68,6 +162,8 @@ class AIGenerationService:
             previous_content: Previous version to improve (optional)
             validation_feedback: Feedback from validation (optional)
             tone: Writing tone (default: "professional")
+            stream_callback: When provided, the completion is streamed and the
+                callback receives coalesced (delta, text_so_far) chunks as they arrive
 
         Returns:
             Generated blog post content
@@ -135,13 +231,26 @@ class AIGenerationService:
             # Call OpenAI with the rendered prompt
             client = AsyncOpenAI(api_key=openai_api_key)
 
-            response = await client.chat.completions.create(
-                model="gpt-4",
-                messages=[{"role": "user", "content": blog_prompt}],
-                temperature=0.7
-            )
-
-            content = response.choices[0].message.content
+            if stream_callback:
+                content, model, usage = await self._stream_completion(
+                    client,
+                    model="gpt-4",
+                    messages=[{"role": "user", "content": blog_prompt}],
+                    temperature=0.7,
+                    stream_callback=stream_callback,
+                    expected_completion_tokens=BLOG_POST_COMPLETION_TOKENS
+                )
+            else:
+                response = await self._create_completion(
+                    client,
+                    BLOG_POST_COMPLETION_TOKENS,
+                    model="gpt-4",
+                    messages=[{"role": "user", "content": blog_prompt}],
+                    temperature=0.7
+                )
+                content = response.choices[0].message.content
+                model = response.model
+                usage = response.usage
 
             # Track successful usage
             await self.prompt_service.track_usage(
@@ -154,8 +263,9 @@ class AIGenerationService:
                 "Blog post generated successfully with dynamic prompt",
                 title=title,
                 content_length=len(content),
-                model=response.model,
-                tokens_used=response.usage.total_tokens if response.usage else None
+                model=model,
+                tokens_used=usage.total_tokens if usage else None,
+                streamed=bool(stream_callback)
             )
 
             return content
@@ -191,142 +301,335 @@ class AIGenerationService:
             logger.error(f"Failed to generate blog post: {e}", title=title)
             raise ValueError(f"Content generation failed: {str(e)}")
 
+    async def _stream_completion(
+        self,
+        client: AsyncOpenAI,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        stream_callback: DraftStreamCallback,
+        expected_completion_tokens: int = BLOG_POST_COMPLETION_TOKENS
+    ):
+        """
+        Run a streamed chat completion, forwarding coalesced token chunks.
+
+        Deltas are buffered and handed to ``stream_callback`` at most every
+        STREAM_COALESCE_INTERVAL_SECONDS, with a final flush once the stream ends.
+
+        Returns:
+            Tuple of (content, model, usage); usage is None if the API omitted it
+        """
+        stream = await self._create_completion(
+            client,
+            expected_completion_tokens,
+            model=model,
+            messages=messages,
+            temperature=temperature,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+
+        parts: List[str] = []
+        pending: List[str] = []
+        usage = None
+        response_model = model
+        last_flush = time.monotonic()
+
+        async def flush():
+            delta = "".join(pending)
+            pending.clear()
+            try:
+                await stream_callback(delta, "".join(parts))
+            except Exception as callback_error:
+                logger.warning(f"Draft stream callback failed: {callback_error}")
+
+        async for chunk in stream:
+            if getattr(chunk, "usage", None):
+                usage = chunk.usage
+            if getattr(chunk, "model", None):
+                response_model = chunk.model
+            if not chunk.choices:
+                continue
+
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+
+            parts.append(delta)
+            pending.append(delta)
+
+            now = time.monotonic()
+            if now - last_flush >= STREAM_COALESCE_INTERVAL_SECONDS:
+                await flush()
+                last_flush = now
+
+        if pending:
+            await flush()
+
+        if self.llm_budget and usage:
+            await self.llm_budget.settle(
+                estimate_tokens(messages, expected_completion_tokens),
+                usage.total_tokens
+            )
+
+        return "".join(parts), response_model, usage
+
     async def generate_variants_per_channel(
         self,
         content: str,
         title: str,
         channels: List[str],
         openai_api_key: str,
-        prompt_settings: Optional[Dict[str, Any]] = None
+        prompt_settings: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = VARIANT_CONCURRENCY,
+        combine_short_form: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Generate channel-specific content variants.
 
+        The base article is sent once per call as an identical system message
+        (a shared prefix OpenAI can cache) instead of being embedded in every
+        channel prompt. Short-form channels are produced together by a single
+        structured-output call; long-form channels get their own calls. All
+        calls run concurrently, bounded by ``max_concurrency``.
+
         Args:
             content: Base content to adapt
             title: Content title
             channels: List of channel keys (e.g., ["twitter", "linkedin", "wordpress"])
             openai_api_key: OpenAI API key
+            max_concurrency: Maximum OpenAI calls in flight
+            combine_short_form: Merge short-form channels into one call
 
         Returns:
-            List of variant dicts with 'channel', 'body', 'metadata'
+            List of variant dicts with 'channel', 'body', 'variant_metadata';
+            ``variant_metadata["generation"]`` records latency and token usage
+            of the call that produced the variant
         """
-        # Channel-specific constraints
-        channel_constraints = {
-            "twitter": {
-                "max_chars": 280,
-                "format": "plain text",
-                "tone": "casual and engaging",
-                "instructions": "Create a compelling tweet with hashtags"
-            },
-            "linkedin": {
-                "max_chars": 3000,
-                "format": "professional text with line breaks",
-                "tone": "professional and insightful",
-                "instructions": "Create a LinkedIn post that sparks professional discussion"
-            },
-            "wordpress": {
-                "max_chars": None,
-                "format": "HTML with proper headings",
-                "tone": "informative and comprehensive",
-                "instructions": "Full blog post with proper HTML structure"
-            },
-            "medium": {
-                "max_chars": None,
-                "format": "Markdown",
-                "tone": "storytelling and engaging",
-                "instructions": "Medium-style article with narrative flow"
-            },
-            "facebook": {
-                "max_chars": 63206,
-                "format": "plain text with emoji",
-                "tone": "friendly and conversational",
-                "instructions": "Engaging Facebook post with call-to-action"
-            }
-        }
-
         prompt_settings = prompt_settings or {}
-        variants = []
-
-        for channel in channels:
-            constraints = channel_constraints.get(channel, {
-                "max_chars": 1000,
-                "format": "plain text",
-                "tone": "professional",
-                "instructions": f"Adapt content for {channel}"
-            })
+        started = time.monotonic()
 
+        # Prompt lookups share this service's DB session, so render them
+        # sequentially before fanning out the OpenAI calls.
+        channel_prompts: Dict[str, str] = {}
+        for channel in dict.fromkeys(channels):
             try:
-                prompt_key = f"channel_variant_{channel}"
-                template_defaults = PROMPT_DEFAULTS.get(prompt_key)
-                if not template_defaults:
-                    prompt_key = "channel_variant_twitter"
-                    template_defaults = PROMPT_DEFAULTS["channel_variant_twitter"]
-
-                await self.prompt_service.ensure_system_prompt(prompt_key, template_defaults)
-
-                variables = {
-                    "title": title,
-                    "content": content,
-                    "constraints": constraints,
-                    "professionalism_level": prompt_settings.get("professionalism_level", 4),
-                    "humor_level": prompt_settings.get("humor_level", 1),
-                    "creativity_level": prompt_settings.get("creativity_level", 3),
-                }
+                channel_prompts[channel] = await self._render_variant_prompt(channel, title, prompt_settings)
+            except Exception as e:
+                logger.error(f"Failed to prepare variant prompt for {channel}: {e}")
 
-                variant_prompt = await self.prompt_service.render_prompt(
-                    prompt_key=prompt_key,
-                    variables=variables,
-                    tenant_id=self.tenant_id,
-                    track_usage=True
-                )
+        shared_context = {
+            "role": "system",
+            "content": (
+                "You adapt an existing article for publishing channels.\n\n"
+                f"Article title: {title}\n\nArticle:\n{content}"
+            )
+        }
+        client = AsyncOpenAI(api_key=openai_api_key)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        short_form = [c for c in channel_prompts if c in SHORT_FORM_CHANNELS] if combine_short_form else []
+        if len(short_form) < 2:
+            short_form = []
+        long_form = [c for c in channel_prompts if c not in short_form]
+
+        async def run_single(channel: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return [await self._generate_single_variant(
+                        client, shared_context, channel, channel_prompts[channel]
+                    )]
+                except Exception as e:
+                    # Continue with other channels even if one fails
+                    logger.error(f"Failed to generate variant for {channel}: {e}")
+                    return []
+
+        async def run_combined() -> List[Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self._generate_combined_variants(
+                        client, shared_context, {c: channel_prompts[c] for c in short_form}
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Combined short-form variant generation failed, falling back to per-channel calls",
+                        channels=short_form,
+                        error=str(e)
+                    )
+            fallback = await asyncio.gather(*(run_single(c) for c in short_form))
+            return [variant for variants in fallback for variant in variants]
+
+        jobs = [run_single(channel) for channel in long_form]
+        if short_form:
+            jobs.append(run_combined())
+        results = await asyncio.gather(*jobs)
+
+        by_channel = {variant["channel"]: variant for variants in results for variant in variants}
+        variants = [by_channel[channel] for channel in channel_prompts if channel in by_channel]
+
+        calls = {v["variant_metadata"]["generation"]["call"]: v["variant_metadata"]["generation"] for v in variants}
+        logger.info(
+            "Generated channel variants",
+            channels=list(channel_prompts),
+            variant_count=len(variants),
+            call_count=len(calls),
+            wall_ms=int((time.monotonic() - started) * 1000),
+            summed_call_ms=sum(call["latency_ms"] for call in calls.values()),
+            total_tokens=sum(call["total_tokens"] for call in calls.values()),
+            cached_prompt_tokens=sum(call["cached_tokens"] for call in calls.values())
+        )
 
-                if not variant_prompt:
-                    variant_prompt = Template(template_defaults["prompt_template"]).render(**variables)
+        return variants
 
-                client = AsyncOpenAI(api_key=openai_api_key)
+    async def _render_variant_prompt(
+        self,
+        channel: str,
+        title: str,
+        prompt_settings: Dict[str, Any],
+        content: str = SHARED_ARTICLE_REFERENCE
+    ) -> str:
+        """
+        Render the channel prompt. By default it refers to the shared article
+        instead of embedding it; pass ``content`` to embed the article as the
+        pre-shared-prefix prompts did (used by the benchmark baseline).
+        """
+        prompt_key = f"channel_variant_{channel}"
+        template_defaults = PROMPT_DEFAULTS.get(prompt_key)
+        if not template_defaults:
+            prompt_key = "channel_variant_twitter"
+            template_defaults = PROMPT_DEFAULTS["channel_variant_twitter"]
+
+        await self.prompt_service.ensure_system_prompt(prompt_key, template_defaults)
+
+        variables = {
+            "title": title,
+            "content": content,
+            "constraints": channel_constraints_for(channel),
+            "professionalism_level": prompt_settings.get("professionalism_level", 4),
+            "humor_level": prompt_settings.get("humor_level", 1),
+            "creativity_level": prompt_settings.get("creativity_level", 3),
+        }
 
-                response = await client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[{"role": "user", "content": variant_prompt}],
-                    temperature=0.7
-                )
+        variant_prompt = await self.prompt_service.render_prompt(
+            prompt_key=prompt_key,
+            variables=variables,
+            tenant_id=self.tenant_id,
+            track_usage=True
+        )
+
+        if not variant_prompt:
+            variant_prompt = Template(template_defaults["prompt_template"]).render(**variables)
 
-                variant_body = response.choices[0].message.content.strip()
+        return variant_prompt
 
-                # Build metadata
-                variant_metadata = {
-                    "char_count": len(variant_body),
-                    "max_chars": constraints.get("max_chars"),
-                    "format": constraints["format"],
-                    "tone": constraints["tone"],
-                    "truncated": False
+    async def _generate_single_variant(
+        self,
+        client: AsyncOpenAI,
+        shared_context: Dict[str, str],
+        channel: str,
+        variant_prompt: str
+    ) -> Dict[str, Any]:
+        """Generate one channel variant with its own completion call."""
+        started = time.monotonic()
+        response = await self._create_completion(
+            client,
+            VARIANT_COMPLETION_TOKENS,
+            model="gpt-4o-mini",
+            messages=[shared_context, {"role": "user", "content": variant_prompt}],
+            temperature=0.7
+        )
+        generation = self._variant_call_stats(channel, started, response)
+        return self._build_variant(channel, response.choices[0].message.content.strip(), generation)
+
+    async def _generate_combined_variants(
+        self,
+        client: AsyncOpenAI,
+        shared_context: Dict[str, str],
+        channel_prompts: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        """Generate several short-form variants in one JSON-schema constrained call."""
+        started = time.monotonic()
+        instructions = "\n\n".join(
+            f"### {channel}\n{prompt}" for channel, prompt in channel_prompts.items()
+        )
+        user_prompt = (
+            "Write one post for each channel below, following that channel's instructions. "
+            "Return a JSON object with one string property per channel key.\n\n"
+            f"{instructions}"
+        )
+        response_format = {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "channel_variants",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {channel: {"type": "string"} for channel in channel_prompts},
+                    "required": list(channel_prompts),
+                    "additionalProperties": False
                 }
+            }
+        }
 
-                # Truncate if needed
-                if constraints["max_chars"] and len(variant_body) > constraints["max_chars"]:
-                    variant_body = variant_body[:constraints["max_chars"] - 3] + "..."
-                    variant_metadata["truncated"] = True
-
-                variants.append({
-                    "channel": channel,
-                    "body": variant_body,
-                    "variant_metadata": variant_metadata
-                })
-
-                logger.info(
-                    "Generated channel variant",
-                    channel=channel,
-                    char_count=len(variant_body),
-                    truncated=variant_metadata["truncated"]
-                )
+        response = await self._create_completion(
+            client,
+            VARIANT_COMPLETION_TOKENS * len(channel_prompts),
+            model="gpt-4o-mini",
+            messages=[shared_context, {"role": "user", "content": user_prompt}],
+            temperature=0.7,
+            response_format=response_format
+        )
+        payload = json.loads(response.choices[0].message.content)
+        generation = self._variant_call_stats("short_form_combined", started, response)
+
+        missing = [channel for channel in channel_prompts if not str(payload.get(channel) or "").strip()]
+        if missing:
+            raise ValueError(f"Combined response missing channels: {', '.join(missing)}")
+
+        return [
+            self._build_variant(channel, str(payload[channel]).strip(), generation)
+            for channel in channel_prompts
+        ]
+
+    @staticmethod
+    def _variant_call_stats(call: str, started: float, response: Any) -> Dict[str, Any]:
+        """Latency and token usage of one variant completion call."""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        return {
+            "call": call,
+            "latency_ms": int((time.monotonic() - started) * 1000),
+            "prompt_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+            "completion_tokens": getattr(usage, "completion_tokens", 0) or 0,
+            "total_tokens": getattr(usage, "total_tokens", 0) or 0,
+            "cached_tokens": getattr(details, "cached_tokens", 0) or 0,
+        }
 
-            except Exception as e:
-                logger.error(f"Failed to generate variant for {channel}: {e}")
-                # Continue with other channels even if one fails
-                continue
+    @staticmethod
+    def _build_variant(channel: str, variant_body: str, generation: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply channel constraints (truncation) and assemble variant metadata."""
+        constraints = channel_constraints_for(channel)
+
+        # Build metadata
+        variant_metadata = {
+            "char_count": len(variant_body),
+            "max_chars": constraints.get("max_chars"),
+            "format": constraints["format"],
+            "tone": constraints["tone"],
+            "truncated": False,
+            "generation": generation
+        }
 
-        return variants
+        # Truncate if needed
+        if constraints["max_chars"] and len(variant_body) > constraints["max_chars"]:
+            variant_body = variant_body[:constraints["max_chars"] - 3] + "..."
+            variant_metadata["truncated"] = True
+
+        return {
+            "channel": channel,
+            "body": variant_body,
+            "variant_metadata": variant_metadata
+        }
 
     async def validate_content(
         self,
@@ -373,7 +676,9 @@ class AIGenerationService:
                     PROMPT_DEFAULTS["seo_content_validation"]["prompt_template"]
                 ).render(**variables)
 
-            response = await client.chat.completions.create(
+            response = await self._create_completion(
+                client,
+                VALIDATION_COMPLETION_TOKENS,
                 model="gpt-4",
                 messages=[{"role": "user", "content": validation_prompt}],
                 temperature=0.3  # Lower temperature for consistent scoring
@@ -16,6 +16,7 @@ import httpx
 from app.features.core.sqlalchemy_imports import get_logger
 from app.features.administration.ai_prompts.services import AIPromptService
 from .prompt_templates import PROMPT_DEFAULTS
+from .llm_budget import LlmBudget, budgeted_chat_completion
 from openai import AuthenticationError
 
 from app.features.core.utils.external_api_clients import (
@@ -42,14 +43,19 @@ class AIResearchService:
     - Clean async interfaces
     """
 
-    def __init__(self, tenant_id: Optional[str] = None):
+    # Expected completion size of the competitor analysis (for LLM budgeting)
+    ANALYSIS_COMPLETION_TOKENS = 1500
+
+    def __init__(self, tenant_id: Optional[str] = None, llm_budget: Optional[LlmBudget] = None):
         """
         Initialize research service.
 
         Args:
             tenant_id: Tenant ID for secrets retrieval
+            llm_budget: Optional shared request/token budget for the analysis call
         """
         self.tenant_id = tenant_id
+        self.llm_budget = llm_budget
         self.openai_client: Optional[OpenAIClient] = None
         self.firecrawl_client: Optional[FirecrawlClient] = None
         self.prompt_service: Optional[AIPromptService] = None
@@ -239,10 +245,22 @@ class AIResearchService:
                 {"role": "user", "content": prompt}
             ]
 
-            analysis = await self.openai_client.chat_completion(
-                messages=messages,
-                temperature=0.7
-            )
+            if self.llm_budget:
+                response = await budgeted_chat_completion(
+                    self.llm_budget,
+                    self.tenant_id or "global",
+                    self.openai_client.client,
+                    self.ANALYSIS_COMPLETION_TOKENS,
+                    model=self.openai_client.default_model,
+                    messages=messages,
+                    temperature=0.7
+                )
+                analysis = response.choices[0].message.content
+            else:
+                analysis = await self.openai_client.chat_completion(
+                    messages=messages,
+                    temperature=0.7
+                )
 
             logger.info(
                 "Completed SEO analysis",
@@ -0,0 +1,192 @@
+"""
+Batch Orchestrator Service - Runs many content plans under one LLM budget.
+
+Each plan still goes through the regular ContentOrchestratorService workflow
+(research → generate → validate → refine), but plans in a batch run as an
+overlapping pipeline: while one plan is scraping competitors another can be
+generating. Every OpenAI call draws from the shared LlmBudget so the batch (and
+any other batches on other workers using the same key) stays inside the
+account's request/token limits. Progress is reported once per batch rather
+than per plan.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.features.core.config import get_settings
+from app.features.core.database import get_async_session
+from app.features.core.sqlalchemy_imports import get_logger
+from .content_orchestrator_service import ContentOrchestratorService
+from .llm_budget import LlmBudget, get_llm_budget
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+DEFAULT_BATCH_CONCURRENCY = int(getattr(settings, "CONTENT_BROADCASTER_BATCH_CONCURRENCY", 6))
+# Minimum interval between aggregate progress events (terminal events are never throttled).
+BATCH_PROGRESS_INTERVAL_SECONDS = 1.0
+
+ProgressCallback = Callable[..., Awaitable[None]]
+
+
+class BatchProgressTracker:
+    """
+    Aggregate per-plan progress into batch-level events.
+
+    Plan stage callbacks update an in-memory map; a single ``batch_progress``
+    event summarising every plan is emitted at most once per
+    BATCH_PROGRESS_INTERVAL_SECONDS.
+    """
+
+    TERMINAL_STAGES = {"completed", "error"}
+    # Per-token draft events carry no stage information for the batch view.
+    IGNORED_STAGES = {"draft_stream"}
+
+    def __init__(self, batch_id: str, plan_ids: List[str], progress_callback: Optional[ProgressCallback] = None):
+        self.batch_id = batch_id
+        self.plan_stages: Dict[str, str] = {plan_id: "queued" for plan_id in plan_ids}
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.progress_callback = progress_callback
+        self._last_emit = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Summarise the batch for progress events and the task result."""
+        stage_counts: Dict[str, int] = {}
+        for stage in self.plan_stages.values():
+            stage_counts[stage] = stage_counts.get(stage, 0) + 1
+        return {
+            "batch_id": self.batch_id,
+            "total": len(self.plan_stages),
+            "completed": stage_counts.get("completed", 0),
+            "failed": stage_counts.get("error", 0),
+            "stage_counts": stage_counts,
+            "plan_statuses": dict(self.plan_stages),
+        }
+
+    async def emit(self, force: bool = False) -> None:
+        if not self.progress_callback:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_emit < BATCH_PROGRESS_INTERVAL_SECONDS:
+            return
+        self._last_emit = now
+
+        summary = self.snapshot()
+        done = summary["completed"] + summary["failed"]
+        finished = done == summary["total"]
+        try:
+            await self.progress_callback(
+                stage="batch_progress",
+                message=f"Batch progress: {done}/{summary['total']} plans finished ({summary['failed']} failed).",
+                status="success" if finished else "running",
+                data=summary
+            )
+        except Exception as emit_error:
+            logger.warning("Batch progress callback failed", batch_id=self.batch_id, error=str(emit_error))
+
+    def plan_callback(self, plan_id: str) -> ProgressCallback:
+        """Progress callback handed to the orchestrator for one plan."""
+        async def on_progress(stage: str, message: str, status: str = "running", data: Optional[Dict[str, Any]] = None):
+            if stage in self.IGNORED_STAGES:
+                return
+            self.plan_stages[plan_id] = stage
+            await self.emit(force=stage in self.TERMINAL_STAGES)
+
+        return on_progress
+
+    async def record_result(self, plan_id: str, result: Dict[str, Any]) -> None:
+        self.results[plan_id] = result
+        self.plan_stages[plan_id] = "completed" if result.get("success") else "error"
+        await self.emit(force=True)
+
+
+class ContentBatchOrchestratorService:
+    """
+    Process a batch of content plans concurrently under a shared LLM budget.
+
+    Plans run in their own database sessions (the orchestrator commits after
+    each status change), bounded by ``max_concurrent_plans``.
+    """
+
+    def __init__(
+        self,
+        tenant_id: str,
+        max_concurrent_plans: int = DEFAULT_BATCH_CONCURRENCY,
+        session_factory=None,
+        llm_budget: Optional[LlmBudget] = None
+    ):
+        """
+        Initialize batch orchestrator.
+
+        Args:
+            tenant_id: Tenant ID for multi-tenant isolation
+            max_concurrent_plans: Plans allowed in flight at once
+            session_factory: Async session maker (defaults to the app session maker)
+            llm_budget: Budget override; defaults to the shared budget for the API key
+        """
+        self.tenant_id = tenant_id
+        self.max_concurrent_plans = max(1, max_concurrent_plans)
+        self.session_factory = session_factory or get_async_session()
+        self.llm_budget = llm_budget
+
+    async def process_batch(
+        self,
+        batch_id: str,
+        plan_ids: List[str],
+        openai_api_key: str,
+        progress_callback: Optional[ProgressCallback] = None,
+        stream_draft: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Run every plan in the batch and return an aggregate summary.
+
+        A failing plan is recorded (and marked FAILED by the orchestrator)
+        without stopping the rest of the batch.
+        """
+        budget = self.llm_budget or get_llm_budget(openai_api_key)
+        tracker = BatchProgressTracker(batch_id, plan_ids, progress_callback)
+        semaphore = asyncio.Semaphore(self.max_concurrent_plans)
+
+        logger.info(
+            "Starting content plan batch",
+            batch_id=batch_id,
+            tenant_id=self.tenant_id,
+            plan_count=len(plan_ids),
+            concurrency=self.max_concurrent_plans
+        )
+        await tracker.emit(force=True)
+
+        async def run_plan(plan_id: str) -> None:
+            async with semaphore:
+                async with self.session_factory() as db:
+                    orchestrator = ContentOrchestratorService(db, self.tenant_id, llm_budget=budget)
+                    try:
+                        result = await orchestrator.process_content_plan(
+                            plan_id=plan_id,
+                            openai_api_key=openai_api_key,
+                            progress_callback=tracker.plan_callback(plan_id),
+                            stream_draft=stream_draft
+                        )
+                    except Exception as plan_error:
+                        logger.error(
+                            "Plan failed within batch",
+                            batch_id=batch_id,
+                            plan_id=plan_id,
+                            error=str(plan_error)
+                        )
+                        result = {"success": False, "plan_id": plan_id, "error": str(plan_error)}
+                    await tracker.record_result(plan_id, result)
+
+        await asyncio.gather(*(run_plan(plan_id) for plan_id in plan_ids))
+
+        summary = tracker.snapshot()
+        summary["results"] = tracker.results
+        logger.info(
+            "Content plan batch finished",
+            batch_id=batch_id,
+            tenant_id=self.tenant_id,
+            completed=summary["completed"],
+            failed=summary["failed"]
+        )
+        return summary
@@ -20,6 +20,7 @@ from ..models import (
 )
 from app.features.core.audit_mixin import AuditContext
 from app.features.core.enhanced_base_service import BaseService
+from app.features.core.full_text_search import search_match, search_rank
 from app.features.core.sqlalchemy_imports import get_logger
 
 logger = get_logger(__name__)
@@ -65,12 +66,7 @@ class ContentBroadcasterService(BaseService[ContentItem]):
 
             # Apply filters
             if search:
-                query = query.filter(
-                    or_(
-                        ContentItem.title.ilike(f"%{search}%"),
-                        ContentItem.body.ilike(f"%{search}%")
-                    )
-                )
+                query = query.filter(search_match(ContentItem.search_vector, search, (ContentItem.title,)))
 
             if state:
                 query = query.filter(ContentItem.state == state.value)
@@ -86,10 +82,7 @@ class ContentBroadcasterService(BaseService[ContentItem]):
             count_query = count_query.filter(plan_visibility_filter)
             if search:
                 count_query = count_query.filter(
-                    or_(
-                        ContentItem.title.ilike(f"%{search}%"),
-                        ContentItem.body.ilike(f"%{search}%")
-                    )
+                    search_match(ContentItem.search_vector, search, (ContentItem.title,))
                 )
             if state:
                 count_query = count_query.filter(ContentItem.state == state.value)
@@ -102,6 +95,10 @@ class ContentBroadcasterService(BaseService[ContentItem]):
             total = total_result.scalar()
 
             # Apply ordering and pagination
+            if search:
+                query = query.order_by(
+                    search_rank(ContentItem.search_vector, search, (ContentItem.title,)).desc()
+                )
             query = query.order_by(desc(ContentItem.created_at))
             query = query.offset(offset).limit(limit)
 
@@ -704,7 +701,7 @@ class ContentBroadcasterService(BaseService[ContentItem]):
             # Clear references from any plans that point at this content
             stmt = select(ContentPlan).where(
                 ContentPlan.generated_content_item_id == content.id
-            )
+            ).options(selectinload(ContentPlan.payload))
             plan_result = await self.db.execute(stmt)
             plans = plan_result.scalars().all()
             for plan in plans:
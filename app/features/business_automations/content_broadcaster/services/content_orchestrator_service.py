@@ -8,19 +8,29 @@ This service orchestrates the complete AI content generation pipeline:
 4. Refinement (iterative improvement)
 """
 
+import time
 import uuid
 from datetime import datetime
 from typing import Optional, Dict, Any, Callable, Awaitable
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.features.core.config import get_settings
 from app.features.core.sqlalchemy_imports import get_logger
 from app.features.core.audit_mixin import AuditContext
 from .content_planning_service import ContentPlanningService
 from .ai_research_service import AIResearchService
 from .ai_generation_service import AIGenerationService
+from .llm_budget import LlmBudget
+from .seo_analyzer import LocalSeoAnalyzer
 from ..models import ContentPlanStatus, ContentItem, ContentState, ContentVariant
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+# Minimum interval between partial draft writes while a draft is streaming.
+DRAFT_PERSIST_INTERVAL_SECONDS = 5.0
+# Skip the LLM validator for drafts that fail the local mechanical SEO gates.
+LOCAL_SEO_GATES_ENABLED = bool(getattr(settings, "CONTENT_BROADCASTER_LOCAL_SEO_GATES", True))
 
 
 class ContentOrchestratorService:
@@ -31,33 +41,83 @@ class ContentOrchestratorService:
     into a ready-to-publish draft.
     """
 
-    def __init__(self, db_session: AsyncSession, tenant_id: str):
+    def __init__(self, db_session: AsyncSession, tenant_id: str, llm_budget: Optional[LlmBudget] = None):
         """
         Initialize orchestrator with all required services.
 
         Args:
             db_session: Database session
             tenant_id: Tenant ID for multi-tenant isolation
+            llm_budget: Optional shared OpenAI budget (used by batch processing)
         """
         self.db = db_session
         self.tenant_id = tenant_id
         self.planning_service = ContentPlanningService(db_session, tenant_id)
-        self.research_service = AIResearchService(tenant_id)
-        self.generation_service = AIGenerationService(db_session, tenant_id)
+        self.research_service = AIResearchService(tenant_id, llm_budget=llm_budget)
+        self.generation_service = AIGenerationService(db_session, tenant_id, llm_budget=llm_budget)
+        self.seo_analyzer = LocalSeoAnalyzer()
 
     async def _commit_and_refresh_plan(self, plan_id: str):
         """
         Persist current transaction and refresh plan from the database so that
         other sessions (and subsequent reads) observe the latest status.
+        The heavy payload is not re-read; it stays loaded from the initial fetch.
         """
         await self.db.commit()
-        return await self.planning_service.get_plan(plan_id)
+        return await self.planning_service.get_plan(plan_id, include_payload=False)
+
+    def _build_draft_stream_callback(
+        self,
+        plan_id: str,
+        iteration: int,
+        emit_progress: Callable[..., Awaitable[None]]
+    ) -> Callable[[str, str], Awaitable[None]]:
+        """
+        Build the token stream handler for a single draft generation.
+
+        Every coalesced chunk is forwarded as a ``draft_stream`` progress event,
+        while the partial draft is persisted at most every
+        DRAFT_PERSIST_INTERVAL_SECONDS so page reloads can pick it up.
+        """
+        last_persisted = 0.0
+
+        async def on_chunk(delta: str, text: str) -> None:
+            nonlocal last_persisted
+            await emit_progress(
+                "draft_stream",
+                f"Drafting content (iteration {iteration})...",
+                data={
+                    "plan_id": plan_id,
+                    "iteration": iteration,
+                    "delta": delta,
+                    "content_length": len(text)
+                }
+            )
+
+            now = time.monotonic()
+            if now - last_persisted < DRAFT_PERSIST_INTERVAL_SECONDS:
+                return
+            last_persisted = now
+            try:
+                await self.planning_service.save_partial_draft(plan_id, text, iteration)
+                await self.db.commit()
+            except Exception as persist_error:
+                await self.db.rollback()
+                logger.warning(
+                    "Failed to persist partial draft",
+                    plan_id=plan_id,
+                    iteration=iteration,
+                    error=str(persist_error)
+                )
+
+        return on_chunk
 
     async def process_content_plan(
         self,
         plan_id: str,
         openai_api_key: str,
-        progress_callback: Optional[Callable[[str, str, str, Dict[str, Any]], Awaitable[None]]] = None
+        progress_callback: Optional[Callable[[str, str, str, Dict[str, Any]], Awaitable[None]]] = None,
+        stream_draft: bool = False
     ) -> Dict[str, Any]:
         """
         Process a content plan through the complete AI workflow.
@@ -65,6 +125,9 @@ class ContentOrchestratorService:
         Args:
             plan_id: ContentPlan ID to process
             openai_api_key: OpenAI API key for content generation
+            progress_callback: Optional coroutine receiving progress events
+            stream_draft: Stream drafts token-by-token, emitting ``draft_stream``
+                progress events and periodically persisting the partial draft
 
         Returns:
             Dictionary with results including:
@@ -214,7 +277,11 @@ class ContentOrchestratorService:
                 seo_analysis=research_data.get("seo_analysis", "") if not plan.skip_research else None,
                 openai_api_key=openai_api_key,
                 tone=plan.tone or "professional",
-                prompt_settings=prompt_settings
+                prompt_settings=prompt_settings,
+                stream_callback=(
+                    self._build_draft_stream_callback(plan_id, 1, emit_progress)
+                    if stream_draft else None
+                )
             )
 
             logger.info(
@@ -245,14 +312,24 @@ class ContentOrchestratorService:
                 )
                 plan = await self._commit_and_refresh_plan(plan_id)
 
-                # Validate current content
-                validation_result = await self.generation_service.validate_content(
-                    title=plan.title,
-                    content=content_body,
-                    openai_api_key=openai_api_key,
-                    prompt_settings=validation_settings
+                # Mechanical checks first; the LLM validator only sees drafts that pass them.
+                # The last iteration is always LLM-validated so the kept draft has a real score.
+                local_analysis = self.seo_analyzer.analyze(plan.title, content_body, plan.seo_keywords or [])
+                llm_validated = not (
+                    LOCAL_SEO_GATES_ENABLED
+                    and not local_analysis.passes_gates
+                    and current_iteration < max_iterations
                 )
-                final_validation_result = validation_result
+                if not llm_validated:
+                    validation_result = local_analysis.to_validation_result(min_seo_score)
+                else:
+                    validation_result = await self.generation_service.validate_content(
+                        title=plan.title,
+                        content=content_body,
+                        openai_api_key=openai_api_key,
+                        prompt_settings=validation_settings
+                    )
+                    validation_result.setdefault("metadata", {})["local_seo"] = local_analysis.metrics
 
                 seo_score = validation_result.get("score", 0)
                 validation_status = validation_result.get("status", "UNKNOWN")
@@ -264,6 +341,9 @@ class ContentOrchestratorService:
                     "status": validation_status,
                     "issues": validation_result.get("issues", []),
                     "recommendations": validation_result.get("recommendations", []),
+                    "llm_validated": llm_validated,
+                    "local_score": local_analysis.score,
+                    "local_passed": local_analysis.passes_gates,
                     "timestamp": datetime.now().isoformat()
                 }
                 refinement_history.append(iteration_record)
@@ -277,10 +357,11 @@ class ContentOrchestratorService:
                     target=min_seo_score
                 )
 
-                # Keep track of best version
-                if seo_score > best_score:
+                # Keep track of best version; local pre-check scores never compete with LLM scores
+                if llm_validated and (final_validation_result is None or seo_score > best_score):
                     best_score = seo_score
                     best_content = content_body
+                    final_validation_result = validation_result
 
                 # Check if we've met the target score
                 if seo_score >= min_seo_score:
@@ -305,7 +386,10 @@ class ContentOrchestratorService:
                     plan = await self._commit_and_refresh_plan(plan_id)
 
                     # Create feedback for refinement
-                    feedback_text = f"""
+                    if validation_status == "LOCAL_FAIL":
+                        feedback_text = local_analysis.to_feedback()
+                    else:
+                        feedback_text = f"""
 Current SEO Score: {seo_score}/100 (Target: {min_seo_score})
 Status: {validation_status}
 
@@ -329,7 +413,11 @@ Please improve the content to address these specific issues while maintaining th
                         validation_feedback=feedback_text,
                         openai_api_key=openai_api_key,
                         tone=plan.tone or "professional",
-                        prompt_settings=prompt_settings
+                        prompt_settings=prompt_settings,
+                        stream_callback=(
+                            self._build_draft_stream_callback(plan_id, current_iteration + 1, emit_progress)
+                            if stream_draft else None
+                        )
                     )
 
                     logger.info(
@@ -440,7 +528,10 @@ Please improve the content to address these specific issues while maintaining th
                 "sub_score_details": sub_score_details
             }
             run_history_list.append(run_entry)
-            updated_metadata = dict(existing_metadata)
+            updated_metadata = {
+                key: value for key, value in existing_metadata.items()
+                if not key.startswith("partial_draft")
+            }
             updated_metadata.update({
                 "content_length": len(final_content),
                 "tone": plan.tone or "professional",
@@ -458,6 +549,7 @@ Please improve the content to address these specific issues while maintaining th
                     "generation_metadata": updated_metadata,
                     "latest_seo_score": final_score,
                     "refinement_history": refinement_history,
+                    "current_iteration": len(refinement_history),
                     "message": f"Draft ready for review (SEO Score: {final_score}/100 after {len(refinement_history)} iterations)"
                 }
             )
@@ -501,7 +593,7 @@ Please improve the content to address these specific issues while maintaining th
                             connector_catalog_key=variant_data["channel"],
                             purpose="default",
                             body=variant_data["body"],
-                            metadata=variant_data.get("variant_metadata", {})
+                            variant_metadata=variant_data.get("variant_metadata", {})
                         )
                         self.db.add(variant)
 
@@ -547,6 +639,8 @@ Please improve the content to address these specific issues while maintaining th
         except Exception as e:
             # Update plan status to failed
             try:
+                if stream_draft:
+                    await self.planning_service.clear_partial_draft(plan_id)
                 await self.planning_service.update_plan_status(
                     plan_id,
                     ContentPlanStatus.FAILED.value,
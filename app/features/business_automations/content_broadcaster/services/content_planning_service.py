@@ -8,18 +8,24 @@ import uuid
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, or_, func
+from sqlalchemy import select, desc, func, cast, literal, update, Text
+from sqlalchemy.dialects.postgresql import JSONB, array, insert as pg_insert
+from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.exc import IntegrityError
 
 from app.features.core.enhanced_base_service import BaseService
+from app.features.core.full_text_search import search_match, search_rank
 from app.features.core.sqlalchemy_imports import get_logger
 from app.features.core.audit_mixin import AuditContext
-from ..models import ContentPlan, ContentPlanStatus, ContentItem
+from ..models import ContentPlan, ContentPlanPayload, ContentPlanStatus, ContentItem
 from .ai_generation_service import AIGenerationService
 
 logger = get_logger(__name__)
 
+# generation_metadata keys written by save_partial_draft()
+PARTIAL_DRAFT_KEYS = ("partial_draft", "partial_draft_iteration", "partial_draft_length", "partial_draft_updated_at")
+
 
 class ContentPlanningService(BaseService[ContentPlan]):
     """
@@ -193,7 +199,8 @@ class ContentPlanningService(BaseService[ContentPlan]):
             offset: Pagination offset (default 0)
 
         Returns:
-            Dict with 'data', 'total', 'offset', 'limit'
+            Dict with 'data', 'total', 'offset', 'limit'. Rows carry summary
+            columns only; the research/generation payloads are not loaded.
         """
         # Base query with tenant isolation
         stmt = self.create_base_query(ContentPlan)
@@ -204,13 +211,7 @@ class ContentPlanningService(BaseService[ContentPlan]):
 
         # Search filter
         if search:
-            search_term = f"%{search}%"
-            stmt = stmt.where(
-                or_(
-                    ContentPlan.title.ilike(search_term),
-                    ContentPlan.description.ilike(search_term)
-                )
-            )
+            stmt = stmt.where(search_match(ContentPlan.search_vector, search, (ContentPlan.title,)))
 
         # Get total count
         count_stmt = select(func.count()).select_from(stmt.subquery())
@@ -218,6 +219,8 @@ class ContentPlanningService(BaseService[ContentPlan]):
         total = total_result.scalar()
 
         # Apply ordering and pagination
+        if search:
+            stmt = stmt.order_by(search_rank(ContentPlan.search_vector, search, (ContentPlan.title,)).desc())
         stmt = stmt.order_by(desc(ContentPlan.created_at))
         stmt = stmt.limit(limit).offset(offset)
 
@@ -226,18 +229,21 @@ class ContentPlanningService(BaseService[ContentPlan]):
         plans = result.scalars().all()
 
         return {
-            "data": [plan.to_dict() for plan in plans],
+            "data": [plan.to_dict(include_payload=False) for plan in plans],
             "total": total,
             "offset": offset,
             "limit": limit
         }
 
-    async def get_plan(self, plan_id: str) -> Optional[ContentPlan]:
+    async def get_plan(self, plan_id: str, include_payload: bool = True) -> Optional[ContentPlan]:
         """
         Get a single content plan by ID.
 
         Args:
             plan_id: Plan ID
+            include_payload: Also load research_data/generation_metadata/
+                refinement_history. Status-only callers should pass False;
+                the payload stays loaded if this session already has it.
 
         Returns:
             ContentPlan if found, None otherwise
@@ -245,13 +251,36 @@ class ContentPlanningService(BaseService[ContentPlan]):
         Raises:
             ValueError: If plan not found
         """
-        plan = await self.get_by_id(ContentPlan, plan_id)
+        plan = await self.get_by_id(
+            ContentPlan,
+            plan_id,
+            load_relationships=["payload"] if include_payload else None
+        )
 
         if not plan:
             raise ValueError(f"Content plan {plan_id} not found")
 
         return plan
 
+    async def get_plans_by_ids(self, plan_ids: List[str], include_payload: bool = False) -> List[ContentPlan]:
+        """
+        Load several plans in one query (tenant-scoped).
+
+        Args:
+            plan_ids: Plan IDs; unknown IDs are silently omitted
+            include_payload: Also load the heavy payload relationship
+
+        Returns:
+            List of ContentPlan instances found
+        """
+        if not plan_ids:
+            return []
+        stmt = self.create_base_query(ContentPlan).where(ContentPlan.id.in_(plan_ids))
+        if include_payload:
+            stmt = stmt.options(selectinload(ContentPlan.payload))
+        result = await self.db.execute(stmt)
+        return list(result.scalars().all())
+
     async def update_plan(
         self,
         plan_id: str,
@@ -392,7 +421,7 @@ class ContentPlanningService(BaseService[ContentPlan]):
         Raises:
             ValueError: If plan not in failed state
         """
-        plan = await self.get_plan(plan_id)
+        plan = await self.get_plan(plan_id, include_payload=False)
 
         if plan.status != ContentPlanStatus.FAILED.value:
             raise ValueError(f"Can only retry failed plans (current status: {plan.status})")
@@ -426,7 +455,7 @@ class ContentPlanningService(BaseService[ContentPlan]):
         Raises:
             ValueError: If plan not in draft_ready state
         """
-        plan = await self.get_plan(plan_id)
+        plan = await self.get_plan(plan_id, include_payload=False)
 
         if plan.status != ContentPlanStatus.DRAFT_READY.value:
             raise ValueError(
@@ -477,7 +506,8 @@ class ContentPlanningService(BaseService[ContentPlan]):
         Returns:
             Updated ContentPlan
         """
-        plan = await self.get_plan(plan_id)
+        needs_payload = any(field in metadata for field in ContentPlan.PAYLOAD_FIELDS)
+        plan = await self.get_plan(plan_id, include_payload=needs_payload)
 
         plan.status = new_status
         plan.updated_at = datetime.now()
@@ -530,6 +560,73 @@ class ContentPlanningService(BaseService[ContentPlan]):
             metadata = {}
         return await self.update_status(plan_id, new_status, **metadata)
 
+    async def save_partial_draft(
+        self,
+        plan_id: str,
+        content: str,
+        iteration: int = 1
+    ) -> None:
+        """
+        Persist an in-progress streamed draft into generation_metadata.
+
+        Merges the partial draft keys server-side (JSONB ``||``) so run history
+        and other metadata are neither loaded nor rewritten from Python. The
+        ORM instance is intentionally not synchronised: the final status update
+        replaces generation_metadata and drops the partial draft.
+        """
+        partial = {
+            "partial_draft": content,
+            "partial_draft_iteration": iteration,
+            "partial_draft_length": len(content),
+            "partial_draft_updated_at": datetime.now().isoformat(),
+        }
+        plan_query = select(
+            ContentPlan.id,
+            ContentPlan.tenant_id,
+            literal({}, JSONB),
+            cast(partial, JSONB),
+            literal([], JSONB),
+            func.now()
+        ).where(ContentPlan.id == plan_id)
+        if self.tenant_id is not None:
+            plan_query = plan_query.where(ContentPlan.tenant_id == self.tenant_id)
+
+        # Plans created before the payload table existed may not have a row yet.
+        stmt = pg_insert(ContentPlanPayload).from_select(
+            ["plan_id", "tenant_id", "research_data", "generation_metadata", "refinement_history", "updated_at"],
+            plan_query
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ContentPlanPayload.plan_id],
+            set_={
+                "generation_metadata": ContentPlanPayload.generation_metadata.op("||")(stmt.excluded.generation_metadata),
+                "updated_at": func.now(),
+            }
+        ).execution_options(synchronize_session=False)
+        await self.db.execute(stmt)
+
+    async def clear_partial_draft(self, plan_id: str) -> None:
+        """
+        Drop an in-progress streamed draft from generation_metadata.
+
+        Used when a run fails, so the planning UI does not keep showing the
+        abandoned draft. Removes the keys server-side (JSONB ``-``).
+        """
+        stmt = (
+            update(ContentPlanPayload)
+            .where(ContentPlanPayload.plan_id == plan_id)
+            .values(
+                generation_metadata=ContentPlanPayload.generation_metadata.op("-")(
+                    array(PARTIAL_DRAFT_KEYS, type_=Text)
+                ),
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if self.tenant_id is not None:
+            stmt = stmt.where(ContentPlanPayload.tenant_id == self.tenant_id)
+        await self.db.execute(stmt)
+
     async def update_content_item_run_metadata(
         self,
         content_item_id: Optional[str],
@@ -612,7 +709,7 @@ class ContentPlanningService(BaseService[ContentPlan]):
                 generation_meta.pop("published_run_id", None)
 
         plan.generation_metadata = dict(generation_meta)
-        flag_modified(plan, "generation_metadata")
+        flag_modified(plan.payload, "generation_metadata")
         if target.get("content_item_id"):
             plan.generated_content_item_id = target["content_item_id"]
         if target.get("seo_score") is not None:
@@ -698,7 +795,7 @@ class ContentPlanningService(BaseService[ContentPlan]):
 
         generation_meta["run_history"] = history
         plan.generation_metadata = dict(generation_meta)
-        flag_modified(plan, "generation_metadata")
+        flag_modified(plan.payload, "generation_metadata")
         plan.updated_at = datetime.now()
 
         await self.db.flush()
@@ -776,7 +873,7 @@ class ContentPlanningService(BaseService[ContentPlan]):
 
         generation_meta["run_history"] = history
         plan.generation_metadata = dict(generation_meta)
-        flag_modified(plan, "generation_metadata")
+        flag_modified(plan.payload, "generation_metadata")
 
         current_run_id = generation_meta.get("current_run_id")
         target_identifier = target.get("run_id") or target.get("content_item_id")
@@ -863,7 +960,7 @@ class ContentPlanningService(BaseService[ContentPlan]):
 
         generation_meta["run_history"] = history
         plan.generation_metadata = dict(generation_meta)
-        flag_modified(plan, "generation_metadata")
+        flag_modified(plan.payload, "generation_metadata")
         plan.updated_at = datetime.now()
 
         await self.db.flush()
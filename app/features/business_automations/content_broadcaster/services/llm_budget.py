@@ -0,0 +1,548 @@
+"""
+Shared OpenAI request/token budget for Content Broadcaster workloads.
+
+Batch plan processing runs many research/generate/validate/refine pipelines at
+once, often across several Celery workers. Without coordination they exceed the
+OpenAI per-key rate limits together and fall into retry storms. This module
+provides a token bucket (requests-per-minute and tokens-per-minute) that:
+
+1. Is shared across workers through Redis (in-memory fallback for development)
+2. Serves tenants sharing an API key fairly (least recent usage goes first)
+3. Learns the real limits from ``x-ratelimit-*`` response headers
+4. Backs off for ``retry-after`` when OpenAI still returns a 429
+"""
+
+import asyncio
+import hashlib
+import math
+import os
+import random
+import re
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+from openai import AsyncOpenAI, RateLimitError
+
+from app.features.core.config import get_settings
+from app.features.core.sqlalchemy_imports import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+DEFAULT_REQUESTS_PER_MINUTE = int(getattr(settings, "CONTENT_BROADCASTER_LLM_RPM", 500))
+DEFAULT_TOKENS_PER_MINUTE = int(getattr(settings, "CONTENT_BROADCASTER_LLM_TPM", 30000))
+
+# Tenants that have not asked for budget within this many seconds no longer
+# take part in fairness decisions (covers crashed workers).
+WAITER_TTL_SECONDS = 5.0
+# Half-life for per-tenant usage used to order competing tenants.
+USAGE_HALF_LIFE_SECONDS = 60.0
+# Upper bound for a single sleep while waiting for budget.
+MAX_WAIT_STEP_SECONDS = 2.0
+# Back-off applied when another tenant has priority for the next grant.
+FAIRNESS_WAIT_SECONDS = 0.1
+# How many times a budgeted call is re-queued after OpenAI still returns 429.
+MAX_RATE_LIMIT_RETRIES = 3
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_reset_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse OpenAI reset durations such as ``"6m0s"``, ``"1s"`` or ``"20ms"``.
+
+    Returns:
+        Duration in seconds, or None if the value is missing/unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], expected_completion_tokens: int) -> int:
+    """
+    Estimate the total tokens a chat completion will consume.
+
+    Uses the common ~4 characters per token heuristic for the prompt plus the
+    caller's expectation for the completion; the estimate is settled against
+    actual usage once the response arrives.
+    """
+    prompt_chars = sum(len(str(message.get("content") or "")) for message in messages)
+    return max(1, math.ceil(prompt_chars / 4) + expected_completion_tokens)
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]], default: float = 5.0) -> float:
+    """Extract the retry delay from a 429 response."""
+    if not headers:
+        return default
+    for header in ("retry-after-ms", "retry-after"):
+        raw = headers.get(header)
+        if raw is None:
+            continue
+        try:
+            seconds = float(raw)
+        except ValueError:
+            continue
+        return seconds / 1000 if header == "retry-after-ms" else seconds
+    reset = parse_reset_duration(headers.get("x-ratelimit-reset-tokens")) or \
+        parse_reset_duration(headers.get("x-ratelimit-reset-requests"))
+    return reset if reset is not None else default
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    raw = headers.get(name)
+    if raw is None:
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        return None
+
+
+def api_key_fingerprint(api_key: str) -> str:
+    """Stable, non-reversible identifier for an API key (budgets are per key)."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+class LlmBudget(ABC):
+    """
+    Base class for request/token budgets.
+
+    Subclasses implement the atomic bucket operations; ``acquire`` provides the
+    waiting loop on top of them.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = DEFAULT_TOKENS_PER_MINUTE
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+    @abstractmethod
+    async def try_acquire(self, tenant_id: str, tokens: int) -> float:
+        """
+        Attempt to take one request and ``tokens`` tokens from the bucket.
+
+        Returns:
+            0 when granted, otherwise the suggested wait in seconds
+        """
+
+    @abstractmethod
+    async def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Refund (or charge) the difference between estimate and actual usage."""
+
+    @abstractmethod
+    async def observe_headers(self, headers: Mapping[str, str]) -> None:
+        """Align the bucket with ``x-ratelimit-*`` headers from an OpenAI response."""
+
+    @abstractmethod
+    async def penalize(self, retry_after: float) -> None:
+        """Drain the bucket and block all callers for ``retry_after`` seconds."""
+
+    async def acquire(self, tenant_id: str, tokens: int) -> float:
+        """
+        Wait until budget is granted for the tenant.
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = await self.try_acquire(tenant_id, tokens)
+            if wait <= 0:
+                if waited:
+                    logger.debug("LLM budget granted after wait", tenant_id=tenant_id, waited=round(waited, 2))
+                return waited
+            delay = min(wait, MAX_WAIT_STEP_SECONDS) + random.uniform(0, 0.05)
+            await asyncio.sleep(delay)
+            waited += delay
+
+
+@dataclass
+class _BucketState:
+    req_level: float
+    tok_level: float
+    req_cap: float
+    tok_cap: float
+    updated_at: float
+    blocked_until: float = 0.0
+
+    def refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self.updated_at)
+        self.req_level = min(self.req_cap, self.req_level + elapsed * self.req_cap / 60)
+        self.tok_level = min(self.tok_cap, self.tok_level + elapsed * self.tok_cap / 60)
+        self.updated_at = now
+
+
+class InMemoryLlmBudget(LlmBudget):
+    """
+    Process-local budget (development and single-worker deployments).
+
+    Mirrors the Redis implementation exactly so behaviour does not change
+    between environments apart from the sharing scope.
+    """
+
+    def __init__(self, *args, clock=time.monotonic, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._clock = clock
+        now = clock()
+        self._state = _BucketState(
+            req_level=self.requests_per_minute,
+            tok_level=self.tokens_per_minute,
+            req_cap=self.requests_per_minute,
+            tok_cap=self.tokens_per_minute,
+            updated_at=now,
+        )
+        self._usage: Dict[str, tuple] = {}
+        self._waiters: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    def _decayed_usage(self, tenant_id: str, now: float) -> float:
+        amount, at = self._usage.get(tenant_id, (0.0, now))
+        return amount * math.pow(0.5, (now - at) / USAGE_HALF_LIFE_SECONDS)
+
+    async def try_acquire(self, tenant_id: str, tokens: int) -> float:
+        async with self._lock:
+            now = self._clock()
+            state = self._state
+            state.refill(now)
+            cost = min(tokens, state.tok_cap)
+
+            if now < state.blocked_until:
+                return state.blocked_until - now
+
+            self._waiters[tenant_id] = now
+            self._waiters = {
+                waiter: seen for waiter, seen in self._waiters.items()
+                if seen >= now - WAITER_TTL_SECONDS
+            }
+            mine = self._decayed_usage(tenant_id, now)
+            for other in self._waiters:
+                if other != tenant_id and self._decayed_usage(other, now) < mine:
+                    return FAIRNESS_WAIT_SECONDS
+
+            if state.req_level >= 1 and state.tok_level >= cost:
+                state.req_level -= 1
+                state.tok_level -= cost
+                self._usage[tenant_id] = (mine + cost, now)
+                self._waiters.pop(tenant_id, None)
+                return 0.0
+
+            return max(
+                (1 - state.req_level) * 60 / state.req_cap,
+                (cost - state.tok_level) * 60 / state.tok_cap,
+            )
+
+    async def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        async with self._lock:
+            self._state.refill(self._clock())
+            self._state.tok_level = min(
+                self._state.tok_cap,
+                self._state.tok_level + (estimated_tokens - actual_tokens)
+            )
+
+    async def observe_headers(self, headers: Mapping[str, str]) -> None:
+        async with self._lock:
+            now = self._clock()
+            state = self._state
+            state.refill(now)
+
+            req_limit = _header_float(headers, "x-ratelimit-limit-requests")
+            tok_limit = _header_float(headers, "x-ratelimit-limit-tokens")
+            req_remaining = _header_float(headers, "x-ratelimit-remaining-requests")
+            tok_remaining = _header_float(headers, "x-ratelimit-remaining-tokens")
+
+            if req_limit:
+                state.req_cap = req_limit
+            if tok_limit:
+                state.tok_cap = tok_limit
+            if req_remaining is not None:
+                state.req_level = min(state.req_level, req_remaining)
+            if tok_remaining is not None:
+                state.tok_level = min(state.tok_level, tok_remaining)
+
+            for remaining, reset_header in (
+                (req_remaining, "x-ratelimit-reset-requests"),
+                (tok_remaining, "x-ratelimit-reset-tokens"),
+            ):
+                reset = parse_reset_duration(headers.get(reset_header))
+                if remaining == 0 and reset:
+                    state.blocked_until = max(state.blocked_until, now + reset)
+
+    async def penalize(self, retry_after: float) -> None:
+        async with self._lock:
+            now = self._clock()
+            self._state.refill(now)
+            self._state.req_level = 0.0
+            self._state.tok_level = 0.0
+            self._state.blocked_until = max(self._state.blocked_until, now + retry_after)
+
+
+# Shared prelude: load and refill the bucket using the Redis server clock.
+_LUA_PRELUDE = """
+local bucket = KEYS[1]
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', bucket, 'req_level', 'tok_level', 'ts', 'req_cap', 'tok_cap', 'blocked_until')
+local req_cap = tonumber(state[4]) or tonumber(ARGV[1])
+local tok_cap = tonumber(state[5]) or tonumber(ARGV[2])
+local req_level = tonumber(state[1]) or req_cap
+local tok_level = tonumber(state[2]) or tok_cap
+local ts = tonumber(state[3]) or now
+local blocked_until = tonumber(state[6]) or 0
+local elapsed = math.max(0, now - ts)
+req_level = math.min(req_cap, req_level + elapsed * req_cap / 60)
+tok_level = math.min(tok_cap, tok_level + elapsed * tok_cap / 60)
+local function persist()
+  redis.call('HSET', bucket, 'req_level', req_level, 'tok_level', tok_level, 'ts', now,
+    'req_cap', req_cap, 'tok_cap', tok_cap, 'blocked_until', blocked_until)
+  redis.call('EXPIRE', bucket, 3600)
+end
+"""
+
+# KEYS: bucket, usage hash, waiters zset
+# ARGV: default rpm, default tpm, tenant, cost, waiter ttl, usage half-life, fairness wait
+_LUA_ACQUIRE = _LUA_PRELUDE + """
+local usage = KEYS[2]
+local waiters = KEYS[3]
+local tenant = ARGV[3]
+local cost = math.min(tonumber(ARGV[4]), tok_cap)
+local waiter_ttl = tonumber(ARGV[5])
+local half_life = tonumber(ARGV[6])
+
+if now < blocked_until then
+  persist()
+  return tostring(blocked_until - now)
+end
+
+redis.call('ZADD', waiters, now, tenant)
+redis.call('ZREMRANGEBYSCORE', waiters, '-inf', now - waiter_ttl)
+redis.call('EXPIRE', waiters, 3600)
+
+local function decayed(name)
+  local u = redis.call('HMGET', usage, name, name .. ':ts')
+  local amount = tonumber(u[1]) or 0
+  local at = tonumber(u[2]) or now
+  return amount * math.pow(0.5, (now - at) / half_life)
+end
+
+local mine = decayed(tenant)
+for _, other in ipairs(redis.call('ZRANGE', waiters, 0, -1)) do
+  if other ~= tenant and decayed(other) < mine then
+    persist()
+    return ARGV[7]
+  end
+end
+
+if req_level >= 1 and tok_level >= cost then
+  req_level = req_level - 1
+  tok_level = tok_level - cost
+  redis.call('HSET', usage, tenant, mine + cost, tenant .. ':ts', now)
+  redis.call('EXPIRE', usage, 3600)
+  redis.call('ZREM', waiters, tenant)
+  persist()
+  return '0'
+end
+
+persist()
+return tostring(math.max((1 - req_level) * 60 / req_cap, (cost - tok_level) * 60 / tok_cap))
+"""
+
+# ARGV: default rpm, default tpm, token delta
+_LUA_SETTLE = _LUA_PRELUDE + """
+tok_level = math.min(tok_cap, tok_level + tonumber(ARGV[3]))
+persist()
+return 1
+"""
+
+# ARGV: default rpm, default tpm, req limit, tok limit, req remaining, tok remaining,
+#       req reset seconds, tok reset seconds (empty string when absent)
+_LUA_OBSERVE = _LUA_PRELUDE + """
+local req_limit = tonumber(ARGV[3])
+local tok_limit = tonumber(ARGV[4])
+local req_remaining = tonumber(ARGV[5])
+local tok_remaining = tonumber(ARGV[6])
+local req_reset = tonumber(ARGV[7])
+local tok_reset = tonumber(ARGV[8])
+if req_limit and req_limit > 0 then req_cap = req_limit end
+if tok_limit and tok_limit > 0 then tok_cap = tok_limit end
+if req_remaining then req_level = math.min(req_level, req_remaining) end
+if tok_remaining then tok_level = math.min(tok_level, tok_remaining) end
+if req_remaining == 0 and req_reset then blocked_until = math.max(blocked_until, now + req_reset) end
+if tok_remaining == 0 and tok_reset then blocked_until = math.max(blocked_until, now + tok_reset) end
+persist()
+return 1
+"""
+
+# ARGV: default rpm, default tpm, retry after seconds
+_LUA_PENALIZE = _LUA_PRELUDE + """
+req_level = 0
+tok_level = 0
+blocked_until = math.max(blocked_until, now + tonumber(ARGV[3]))
+persist()
+return 1
+"""
+
+
+class RedisLlmBudget(LlmBudget):
+    """
+    Budget shared by every worker through Redis.
+
+    All bucket updates run as Lua scripts so refill, fairness and consumption
+    happen atomically on the Redis clock. Redis errors fail open, matching the
+    rest of the rate limiting code.
+    """
+
+    def __init__(self, key_prefix: str, *args, redis_url: Optional[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.key_prefix = key_prefix
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self._redis = None
+        self._scripts: Dict[str, Any] = {}
+
+    async def _get_redis(self):
+        """Lazy initialization of Redis connection and scripts."""
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+            for name, source in (
+                ("acquire", _LUA_ACQUIRE),
+                ("settle", _LUA_SETTLE),
+                ("observe", _LUA_OBSERVE),
+                ("penalize", _LUA_PENALIZE),
+            ):
+                self._scripts[name] = self._redis.register_script(source)
+        return self._redis
+
+    @property
+    def _bucket_key(self) -> str:
+        return f"{self.key_prefix}:bucket"
+
+    async def _run(self, name: str, keys: List[str], args: List[Any]):
+        await self._get_redis()
+        defaults = [self.requests_per_minute, self.tokens_per_minute]
+        return await self._scripts[name](keys=keys, args=defaults + args)
+
+    async def try_acquire(self, tenant_id: str, tokens: int) -> float:
+        try:
+            result = await self._run(
+                "acquire",
+                [self._bucket_key, f"{self.key_prefix}:usage", f"{self.key_prefix}:waiters"],
+                [
+                    tenant_id or "global",
+                    tokens,
+                    WAITER_TTL_SECONDS,
+                    USAGE_HALF_LIFE_SECONDS,
+                    FAIRNESS_WAIT_SECONDS,
+                ],
+            )
+            return float(result)
+        except Exception as e:
+            logger.error(f"Redis LLM budget acquire error: {e}")
+            return 0.0
+
+    async def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        try:
+            await self._run("settle", [self._bucket_key], [estimated_tokens - actual_tokens])
+        except Exception as e:
+            logger.error(f"Redis LLM budget settle error: {e}")
+
+    async def observe_headers(self, headers: Mapping[str, str]) -> None:
+        def fmt(value: Optional[float]) -> str:
+            return "" if value is None else repr(value)
+
+        try:
+            await self._run("observe", [self._bucket_key], [
+                fmt(_header_float(headers, "x-ratelimit-limit-requests")),
+                fmt(_header_float(headers, "x-ratelimit-limit-tokens")),
+                fmt(_header_float(headers, "x-ratelimit-remaining-requests")),
+                fmt(_header_float(headers, "x-ratelimit-remaining-tokens")),
+                fmt(parse_reset_duration(headers.get("x-ratelimit-reset-requests"))),
+                fmt(parse_reset_duration(headers.get("x-ratelimit-reset-tokens"))),
+            ])
+        except Exception as e:
+            logger.error(f"Redis LLM budget observe error: {e}")
+
+    async def penalize(self, retry_after: float) -> None:
+        try:
+            await self._run("penalize", [self._bucket_key], [retry_after])
+        except Exception as e:
+            logger.error(f"Redis LLM budget penalize error: {e}")
+
+
+_budgets: Dict[str, LlmBudget] = {}
+
+
+def get_llm_budget(api_key: str) -> LlmBudget:
+    """
+    Return the process-wide budget for an OpenAI API key.
+
+    Uses Redis when ``REDIS_URL`` is configured so every worker draws from the
+    same bucket; otherwise falls back to an in-memory bucket.
+    """
+    fingerprint = api_key_fingerprint(api_key)
+    budget = _budgets.get(fingerprint)
+    if budget is None:
+        if os.getenv("REDIS_URL"):
+            budget = RedisLlmBudget(f"content_broadcaster:llm_budget:{fingerprint}")
+        else:
+            budget = InMemoryLlmBudget()
+        _budgets[fingerprint] = budget
+    return budget
+
+
+async def budgeted_chat_completion(
+    budget: LlmBudget,
+    tenant_id: Optional[str],
+    client: AsyncOpenAI,
+    expected_completion_tokens: int,
+    **kwargs
+):
+    """
+    Create a chat completion under ``budget``.
+
+    Rate-limit headers from each response feed back into the budget and a
+    429 drains it for ``retry-after`` before the call is re-queued. Token
+    estimates are settled against actual usage for non-streamed calls;
+    streamed calls are settled by the caller once usage is known.
+    """
+    estimated = estimate_tokens(kwargs.get("messages", []), expected_completion_tokens)
+    attempts = 0
+    while True:
+        await budget.acquire(tenant_id, estimated)
+        try:
+            raw_response = await client.chat.completions.with_raw_response.create(**kwargs)
+        except RateLimitError as rate_error:
+            attempts += 1
+            retry_after = retry_after_seconds(getattr(rate_error.response, "headers", None))
+            await budget.penalize(retry_after)
+            logger.warning(
+                "OpenAI rate limit hit, waiting for budget",
+                tenant_id=tenant_id,
+                retry_after=retry_after,
+                attempt=attempts
+            )
+            if attempts > MAX_RATE_LIMIT_RETRIES:
+                raise
+            continue
+
+        await budget.observe_headers(raw_response.headers)
+        # LegacyAPIResponse.parse() is synchronous (returns the stream for stream=True)
+        response = raw_response.parse()
+        if not kwargs.get("stream") and getattr(response, "usage", None):
+            await budget.settle(estimated, response.usage.total_tokens)
+        return response
@@ -1,15 +1,35 @@
 """
 SSE progress stream utilities for Content Broadcaster generation workflows.
 
-Provides a lightweight in-memory pub/sub manager so backend services can
-publish progress events that are consumed by the UI via Server-Sent Events.
+Backend services and Celery tasks publish progress events to a per-tenant
+event log (see ``app.features.core.event_streams``) that the UI consumes via
+Server-Sent Events. The log is a Redis stream when ``REDIS_URL`` is set, so
+events published from a Celery worker reach the web process serving the
+stream; otherwise an in-process log is used (development, in-app task runs).
 """
 
-import asyncio
 import json
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.features.core.config import get_settings
+from app.features.core.event_streams import (
+    HEARTBEAT_MESSAGE,
+    EventLog,
+    InMemoryEventLog,
+    RedisEventLog,
+    format_sse,
+    retry_message,
+)
+
+settings = get_settings()
+
+# Seconds between heartbeats on an idle stream (also the longest blocking read)
+HEARTBEAT_SECONDS = float(getattr(settings, "CONTENT_BROADCASTER_STREAM_HEARTBEAT_SECONDS", 15))
+# Events kept per tenant for Last-Event-ID resumption (draft deltas are frequent)
+MAX_EVENTS_PER_TENANT = 1000
 
 
 @dataclass
@@ -25,9 +45,8 @@ class ProgressEvent:
         default_factory=lambda: datetime.now(timezone.utc).isoformat()
     )
 
-    def to_json(self) -> str:
-        """Serialize event to JSON for SSE transmission."""
-        payload = {
+    def to_dict(self) -> Dict[str, Any]:
+        return {
             "job_id": self.job_id,
             "stage": self.stage,
             "message": self.message,
@@ -35,91 +54,84 @@ class ProgressEvent:
             "data": self.data,
             "timestamp": self.timestamp,
         }
-        return json.dumps(payload, default=str)
+
+    def to_json(self) -> str:
+        """Serialize event to JSON for SSE transmission."""
+        return json.dumps(self.to_dict(), default=str)
 
 
 class ProgressStreamManager:
     """
-    Manage SSE subscriptions per tenant/user.
+    Publish and stream progress events per tenant/user.
 
-    Each subscriber receives a dedicated asyncio.Queue. Publishers push
-    events keyed by (tenant_id, user_id) and optionally broadcast to the
-    tenant-wide channel.
+    Every event for a tenant goes to one log together with the publishing
+    user and whether it is broadcast; a user's stream relays their own
+    events and the tenant-wide ones.
     """
 
-    def __init__(self) -> None:
-        self._connections: Dict[Tuple[str, str], List[asyncio.Queue]] = {}
-        self._lock = asyncio.Lock()
-        self._tenant_channel = "__all__"
+    def __init__(self, log: Optional[EventLog] = None) -> None:
+        self._log = log
 
-    async def subscribe(self, tenant_id: str, user_id: str, include_tenant_channel: bool = True) -> List[asyncio.Queue]:
-        """
-        Register queues for the user (and optionally tenant-wide) channels.
-
-        Returns the list of queues that must be consumed by the caller.
-        """
-        queues: List[asyncio.Queue] = []
-        async with self._lock:
-            queues.append(self._register_queue((tenant_id, user_id)))
-            if include_tenant_channel:
-                queues.append(self._register_queue((tenant_id, self._tenant_channel)))
-        return queues
-
-    async def unsubscribe(self, tenant_id: str, user_id: str, queues: List[asyncio.Queue]) -> None:
-        """Remove queues from the subscription registry."""
-        async with self._lock:
-            for queue in queues:
-                for key in ((tenant_id, user_id), (tenant_id, self._tenant_channel)):
-                    if key in self._connections and queue in self._connections[key]:
-                        self._connections[key].remove(queue)
-                        if not self._connections[key]:
-                            del self._connections[key]
+    @property
+    def log(self) -> EventLog:
+        if self._log is None:
+            self._log = get_progress_event_log()
+        return self._log
 
     async def publish(self, tenant_id: str, user_id: str, event: ProgressEvent, broadcast: bool = True) -> None:
         """
         Publish event to user-specific subscribers (and optionally tenant-wide).
         """
-        async with self._lock:
-            targets = list(self._connections.get((tenant_id, user_id), []))
-            if broadcast:
-                targets += self._connections.get((tenant_id, self._tenant_channel), [])
-
-        for queue in targets:
-            await queue.put(event)
-
-    def _register_queue(self, key: Tuple[str, str]) -> asyncio.Queue:
-        queue: asyncio.Queue = asyncio.Queue()
-        self._connections.setdefault(key, []).append(queue)
-        return queue
-
-    async def stream(self, tenant_id: str, user_id: str) -> AsyncIterator[str]:
+        await self.log.publish(
+            str(tenant_id),
+            "generation",
+            {"user_id": str(user_id), "broadcast": broadcast, "event": event.to_dict()},
+        )
+
+    async def stream(
+        self,
+        tenant_id: str,
+        user_id: str,
+        last_event_id: Optional[str] = None,
+        heartbeat_seconds: float = HEARTBEAT_SECONDS,
+    ) -> AsyncIterator[str]:
         """
         Async iterator yielding SSE formatted strings for the subscriber.
+
+        Starts after ``last_event_id`` when the client is resuming, otherwise
+        with the next event published; idle periods produce heartbeats.
         """
-        queues = await self.subscribe(tenant_id, user_id)
-        try:
-            while True:
-                tasks = [asyncio.create_task(queue.get()) for queue in queues]
-                # Wait for the next event from any of the subscribed queues.
-                done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-
-                for task in done:
-                    event: ProgressEvent = task.result()
-                    yield f"event: generation\ndata: {event.to_json()}\n\n"
-
-                # Cancel any pending tasks to avoid leaks.
-                for task in pending:
-                    task.cancel()
-                for task in pending:
-                    try:
-                        await task
-                    except asyncio.CancelledError:
-                        pass
-        except asyncio.CancelledError:
-            # Propagate cancellation after cleanup.
-            raise
-        finally:
-            await self.unsubscribe(tenant_id, user_id, queues)
+        key, user_id = str(tenant_id), str(user_id)
+        cursor = last_event_id or await self.log.latest_id(key)
+        yield retry_message()
+        while True:
+            events = await self.log.read(key, cursor, timeout=heartbeat_seconds)
+            if not events:
+                yield HEARTBEAT_MESSAGE
+                continue
+            for event in events:
+                cursor = event.id
+                if event.data.get("broadcast") or event.data.get("user_id") == user_id:
+                    yield format_sse("generation", event.data.get("event") or {}, event.id)
+
+
+_log: Optional[EventLog] = None
+
+
+def get_progress_event_log() -> EventLog:
+    """
+    Return the process-wide progress event log.
+
+    Uses Redis when ``REDIS_URL`` is configured so events published by
+    Celery tasks reach every web worker; otherwise falls back to memory.
+    """
+    global _log
+    if _log is None:
+        if os.getenv("REDIS_URL"):
+            _log = RedisEventLog("content_broadcaster:progress", max_events=MAX_EVENTS_PER_TENANT)
+        else:
+            _log = InMemoryEventLog(max_events=MAX_EVENTS_PER_TENANT)
+    return _log
 
 
 # Global singleton used across the feature module
@@ -0,0 +1,308 @@
+"""
+Local SEO Analyzer - Deterministic, millisecond pre-scoring of drafts.
+
+Most refinement rounds fail for mechanical reasons (too short, missing FAQ,
+keyword stuffing, broken heading hierarchy) that do not need an LLM to detect.
+This analyzer measures those objective properties directly so the orchestrator
+can send precise fix instructions back to generation and only spend an LLM
+validation call on drafts that already clear the mechanical gates.
+
+The draft is split into blocks (paragraphs/headings) once and all per-block
+metrics are computed as NumPy arrays, so the cost is a few milliseconds even
+for long articles.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+_HEADING = re.compile(r"^(#{1,6})\s+(.*)$")
+_HTML_HEADING = re.compile(r"^<h([1-6])[^>]*>(.*?)</h\1>$", re.IGNORECASE)
+_META_DESCRIPTION = re.compile(r"^\W*meta[ _-]?description\W*[:\-]\s*(.+)$", re.IGNORECASE)
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+_FAQ = re.compile(r"\b(faq|faqs|frequently asked)\b", re.IGNORECASE)
+
+
+@dataclass
+class SeoGateThresholds:
+    """
+    Thresholds for the mechanical gates.
+
+    The gates only catch drafts that are clearly off target, so they sit below
+    what the generation prompt asks for (1,600 words, four H2 sections); the
+    LLM validator judges everything in between.
+    """
+
+    min_words: int = 1000
+    min_h2_sections: int = 3
+    # Occurrences of all target keywords together per 100 words
+    min_keyword_density: float = 0.5
+    max_keyword_density: float = 3.0
+    max_long_paragraph_share: float = 0.2
+    long_paragraph_words: int = 150
+    title_length: Sequence[int] = (20, 70)
+    meta_description_length: Sequence[int] = (120, 160)
+
+
+@dataclass
+class SeoCheck:
+    """Outcome of a single mechanical check."""
+
+    key: str
+    category: str
+    passed: bool
+    weight: float
+    instruction: str = ""
+
+
+@dataclass
+class SeoAnalysis:
+    """Result of a local analysis run."""
+
+    checks: List[SeoCheck]
+    metrics: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def score(self) -> int:
+        total = sum(check.weight for check in self.checks)
+        if not total:
+            return 100
+        passed = sum(check.weight for check in self.checks if check.passed)
+        return int(round(100 * passed / total))
+
+    @property
+    def passes_gates(self) -> bool:
+        return all(check.passed for check in self.checks)
+
+    @property
+    def instructions(self) -> List[str]:
+        return [check.instruction for check in self.checks if not check.passed]
+
+    def sub_scores(self) -> Dict[str, int]:
+        scores: Dict[str, int] = {}
+        for category in {check.category for check in self.checks}:
+            checks = [check for check in self.checks if check.category == category]
+            total = sum(check.weight for check in checks)
+            passed = sum(check.weight for check in checks if check.passed)
+            scores[category] = int(round(100 * passed / total)) if total else 100
+        return scores
+
+    def to_feedback(self) -> str:
+        """Precise fix list for the generation prompt."""
+        lines = [f"Local SEO pre-check score: {self.score}/100 (mechanical issues must be fixed first)", ""]
+        lines.append("Fix exactly these issues while keeping the rest of the article intact:")
+        lines.extend(f"- {instruction}" for instruction in self.instructions)
+        return "\n".join(lines)
+
+    def to_validation_result(self, target_score: int) -> Dict[str, Any]:
+        """
+        Shape the analysis like ``AIGenerationService.validate_content`` output.
+
+        Drafts failing a gate are capped below the target so they never count
+        as meeting it without an LLM validation.
+        """
+        score = self.score if self.passes_gates else min(self.score, max(0, target_score - 1))
+        sub_scores = self.sub_scores()
+        return {
+            "score": score,
+            "status": "LOCAL_FAIL" if not self.passes_gates else ("PASS" if score >= target_score else "FAIL"),
+            "issues": self.instructions,
+            "recommendations": [],
+            "strengths": [],
+            "sub_scores": {
+                "keyword_coverage": sub_scores.get("keyword_coverage", 0),
+                "structure": sub_scores.get("structure", 0),
+                "readability": sub_scores.get("readability", 0),
+                "engagement": 0,
+                "technical": sub_scores.get("technical", 0),
+            },
+            "sub_score_details": {},
+            "metadata": {
+                "word_count": self.metrics.get("word_count", 0),
+                "reading_level": "Unknown",
+                "local_seo": self.metrics,
+            },
+        }
+
+
+def _tokens(text: str) -> List[str]:
+    return _NON_WORD.sub(" ", text.lower()).split()
+
+
+def _normalise(text: str) -> str:
+    """Lowercase, strip punctuation, and separate tokens with double spaces.
+
+    Needles built by ``_needle`` carry a single space on each side, so
+    ``np.char.count`` matches whole words/phrases without the shared
+    separator swallowing back-to-back occurrences.
+    """
+    tokens = _tokens(text)
+    return "  " + "  ".join(tokens) + "  " if tokens else ""
+
+
+def _needle(keyword: str) -> str:
+    return " " + "  ".join(_tokens(keyword)) + " "
+
+
+def _split_blocks(content: str):
+    """Split markdown/HTML content into blocks with heading levels (0 = body)."""
+    texts: List[str] = []
+    levels: List[int] = []
+    meta_description: Optional[str] = None
+    paragraph: List[str] = []
+
+    def close_paragraph():
+        if paragraph:
+            texts.append(" ".join(paragraph))
+            levels.append(0)
+            paragraph.clear()
+
+    for raw_line in content.splitlines():
+        line = raw_line.strip()
+        if not line:
+            close_paragraph()
+            continue
+
+        meta_match = _META_DESCRIPTION.match(line.replace("*", ""))
+        if meta_match and meta_description is None:
+            close_paragraph()
+            meta_description = meta_match.group(1).strip()
+            continue
+
+        heading = _HEADING.match(line) or _HTML_HEADING.match(line)
+        if heading:
+            close_paragraph()
+            marker = heading.group(1)
+            texts.append(heading.group(2).strip().strip("#").strip())
+            levels.append(len(marker) if marker.startswith("#") else int(marker))
+            continue
+
+        paragraph.append(line)
+    close_paragraph()
+    return texts, np.array(levels, dtype=np.int8), meta_description
+
+
+class LocalSeoAnalyzer:
+    """Compute objective SEO metrics and mechanical gate results for a draft."""
+
+    def __init__(self, thresholds: Optional[SeoGateThresholds] = None):
+        self.thresholds = thresholds or SeoGateThresholds()
+
+    def analyze(self, title: str, content: str, keywords: Optional[List[str]] = None) -> SeoAnalysis:
+        t = self.thresholds
+        texts, levels, meta_description = _split_blocks(content or "")
+        normalised = np.array([_normalise(text) for text in texts] or [""], dtype=str)
+        if not texts:
+            levels = np.zeros(1, dtype=np.int8)
+
+        word_counts = np.array([len(text.split()) for text in texts] or [0], dtype=np.int32)
+        is_body = levels == 0
+        is_section_heading = (levels == 2) | (levels == 3)
+
+        word_count = int(word_counts[is_body].sum())
+        h1_count = int((levels == 1).sum())
+        h2_count = int((levels == 2).sum())
+        heading_levels = levels[levels > 0]
+        # A heading may go at most one level deeper than the previous one.
+        skipped_levels = int((np.diff(heading_levels.astype(np.int16)) > 1).sum()) if heading_levels.size > 1 else 0
+        body_words = word_counts[is_body]
+        long_paragraph_share = float((body_words > t.long_paragraph_words).mean()) if body_words.size else 0.0
+        has_faq = any(_FAQ.search(text) for text, level in zip(texts, levels) if level > 0)
+
+        h1_texts = [text for text, level in zip(texts, levels) if level == 1]
+        display_title = h1_texts[0] if h1_texts else title
+
+        checks = [
+            SeoCheck(
+                "word_count", "structure", word_count >= t.min_words, 2.0,
+                f"Expand the article from {word_count} to at least {t.min_words} words "
+                f"(add roughly {max(0, t.min_words - word_count)} words of substantive content)."
+            ),
+            SeoCheck(
+                "single_h1", "structure", h1_count == 1, 1.0,
+                f"Use exactly one H1 heading for the title (found {h1_count})."
+            ),
+            SeoCheck(
+                "h2_sections", "structure", h2_count >= t.min_h2_sections, 1.0,
+                f"Organise the body into at least {t.min_h2_sections} H2 sections (found {h2_count})."
+            ),
+            SeoCheck(
+                "heading_hierarchy", "structure", skipped_levels == 0, 0.5,
+                f"Fix the heading hierarchy: {skipped_levels} heading(s) skip a level (e.g. H1 directly to H3)."
+            ),
+            SeoCheck(
+                "faq_section", "structure", has_faq, 1.0,
+                "Add an FAQ section (a heading containing 'FAQ') answering at least four questions."
+            ),
+            SeoCheck(
+                "paragraph_length", "readability", long_paragraph_share <= t.max_long_paragraph_share, 0.5,
+                f"Split long paragraphs: {long_paragraph_share:.0%} exceed {t.long_paragraph_words} words "
+                f"(keep this under {t.max_long_paragraph_share:.0%})."
+            ),
+            SeoCheck(
+                "title_length", "technical",
+                t.title_length[0] <= len(display_title) <= t.title_length[1], 0.5,
+                f"Rewrite the H1/title to {t.title_length[0]}-{t.title_length[1]} characters "
+                f"(currently {len(display_title)})."
+            ),
+        ]
+
+        metrics: Dict[str, Any] = {
+            "word_count": word_count,
+            "paragraph_count": int(is_body.sum()),
+            "h1_count": h1_count,
+            "h2_count": h2_count,
+            "h3_count": int((levels == 3).sum()),
+            "skipped_heading_levels": skipped_levels,
+            "long_paragraph_share": round(long_paragraph_share, 3),
+            "has_faq": has_faq,
+            "title_length": len(display_title),
+            "keyword_density": {},
+        }
+
+        if meta_description is not None:
+            low, high = t.meta_description_length
+            metrics["meta_description_length"] = len(meta_description)
+            checks.append(SeoCheck(
+                "meta_description", "technical", low <= len(meta_description) <= high, 0.5,
+                f"Rewrite the meta description to {low}-{high} characters (currently {len(meta_description)})."
+            ))
+
+        keywords = [k.strip() for k in (keywords or []) if k and _tokens(k)]
+        if keywords and word_count:
+            needles = np.array([_needle(keyword) for keyword in keywords], dtype=str)
+            # (keywords × blocks) occurrence matrix in one vectorised pass.
+            counts = np.char.count(normalised[np.newaxis, :], needles[:, np.newaxis])
+            body_counts = counts[:, is_body].sum(axis=1)
+            densities = body_counts * 100.0 / word_count
+            total_density = float(densities.sum())
+            for keyword, density in zip(keywords, densities):
+                metrics["keyword_density"][keyword] = round(float(density), 2)
+            metrics["total_keyword_density"] = round(total_density, 2)
+
+            # Secondary keywords are free to appear as often as reads naturally;
+            # only their combined density is gated.
+            checks.append(SeoCheck(
+                "keyword_density", "keyword_coverage",
+                t.min_keyword_density <= total_density <= t.max_keyword_density, 1.0,
+                f"Adjust use of the target keywords to {t.min_keyword_density}-{t.max_keyword_density}% "
+                f"combined density (currently {total_density:.2f}%, {int(body_counts.sum())} uses)."
+            ))
+
+            # Placement checks apply to the primary (first) keyword only.
+            primary = keywords[0]
+            first_body = int(np.argmax(is_body)) if is_body.any() else None
+            in_intro = first_body is not None and counts[0, first_body] > 0
+            in_headings = bool((counts[0, is_section_heading] > 0).any())
+            checks.append(SeoCheck(
+                "keyword_in_intro", "keyword_coverage", bool(in_intro), 0.5,
+                f"Mention the primary keyword '{primary}' in the opening paragraph."
+            ))
+            checks.append(SeoCheck(
+                "keyword_in_headings", "keyword_coverage", in_headings, 0.5,
+                f"Use the primary keyword '{primary}' in at least one H2/H3 heading."
+            ))
+
+        return SeoAnalysis(checks=checks, metrics=metrics)
@@ -75,8 +75,9 @@ function formatSEOScore(cell) {
         scoreIcon = 'ti-alert-triangle';
     }
 
-    // Get iteration count if available
-    const iterations = rowData.refinement_history ? rowData.refinement_history.length : 1;
+    // Get iteration count if available (list rows carry the count, not the history)
+    const iterations = rowData.current_iteration
+        || (rowData.refinement_history ? rowData.refinement_history.length : 1);
     const iterationBadge = iterations > 1 ? `<small class="ms-1 text-muted" style="font-size: 0.75em;">×${iterations}</small>` : '';
 
     return `
@@ -320,6 +321,7 @@ const PlanGenerationWatcher = (() => {
         generating: 'generating',
         refining: 'refining'
     };
+    const draftBuffers = new Map();
     let eventSource = null;
 
     function init() {
@@ -344,8 +346,43 @@ const PlanGenerationWatcher = (() => {
         };
     }
 
+    function handleDraftStream(payload) {
+        const planId = payload.data.plan_id;
+        const iteration = payload.data.iteration || 1;
+        const buffer = draftBuffers.get(planId);
+        const text = buffer && buffer.iteration === iteration
+            ? buffer.text + (payload.data.delta || '')
+            : (payload.data.delta || '');
+        draftBuffers.set(planId, { iteration, text });
+        document.body.dispatchEvent(new CustomEvent('planDraftStream', {
+            detail: { planId, iteration, text, delta: payload.data.delta || '' }
+        }));
+    }
+
+    function handleBatchProgress(payload) {
+        const statuses = payload.data.plan_statuses || {};
+        Object.keys(statuses).forEach((planId) => {
+            handleEvent({
+                stage: statuses[planId],
+                status: statuses[planId] === 'completed' ? 'success' : (statuses[planId] === 'error' ? 'error' : 'running'),
+                data: { plan_id: planId }
+            });
+        });
+    }
+
     function handleEvent(payload) {
-        if (!payload || !payload.data || !payload.data.plan_id || !window.contentPlansTable) {
+        if (payload && payload.stage === 'batch_progress' && payload.data) {
+            handleBatchProgress(payload);
+            return;
+        }
+        if (!payload || !payload.data || !payload.data.plan_id) {
+            return;
+        }
+        if (payload.stage === 'draft_stream') {
+            handleDraftStream(payload);
+            return;
+        }
+        if (!window.contentPlansTable) {
             return;
         }
         const table = window.contentPlansTable;
@@ -367,6 +404,10 @@ const PlanGenerationWatcher = (() => {
             }
         };
 
+        if (status === 'success' || stage === 'completed' || status === 'error' || stage === 'error') {
+            draftBuffers.delete(planId);
+        }
+
         if (status === 'success' || stage === 'completed') {
             applyRowUpdate({ status: 'draft_ready', latest_seo_score: payload.data.seo_score || undefined });
             return;
@@ -383,7 +424,10 @@ const PlanGenerationWatcher = (() => {
         }
     }
 
-    return { init };
+    return {
+        init,
+        getDraft: (planId) => (draftBuffers.get(planId) || {}).text || ''
+    };
 })();
 
 window.PlanGenerationWatcher = PlanGenerationWatcher;
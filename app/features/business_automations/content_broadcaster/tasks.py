@@ -7,12 +7,13 @@ research/generation/refinement loop executes asynchronously.
 """
 
 import asyncio
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import structlog
 from celery import Task
 
 from app.features.core.celery_app import celery_app
+from app.features.core.config import get_settings
 from app.features.core.database import get_async_session
 from app.features.business_automations.content_broadcaster.services.content_orchestrator_service import (
     ContentOrchestratorService,
@@ -20,6 +21,9 @@ from app.features.business_automations.content_broadcaster.services.content_orch
 from app.features.business_automations.content_broadcaster.services.content_planning_service import (
     ContentPlanningService,
 )
+from app.features.business_automations.content_broadcaster.services.batch_orchestrator_service import (
+    ContentBatchOrchestratorService,
+)
 from app.features.business_automations.content_broadcaster.models import ContentPlanStatus
 from app.features.business_automations.content_broadcaster.services.progress_stream import (
     progress_stream_manager,
@@ -30,6 +34,10 @@ from app.features.auth.models import User
 from app.features.core.audit_mixin import AuditContext
 
 logger = structlog.get_logger(__name__)
+settings = get_settings()
+# Stream drafts token-by-token as ``draft_stream`` progress events (published
+# through the shared progress log, so they reach SSE clients from Celery too)
+STREAM_PLAN_DRAFTS = bool(getattr(settings, "CONTENT_BROADCASTER_STREAM_DRAFTS", True))
 
 
 def _run_async(coro):
@@ -69,6 +77,31 @@ async def _load_user(db_session, user_payload: Optional[Dict[str, Any]]):
     }
 
 
+def _resolve_sse_user_id(triggered_by: Optional[Dict[str, Any]], trigger_user) -> Optional[str]:
+    """Pick the user whose SSE channel should receive progress events."""
+    if triggered_by and triggered_by.get("id"):
+        return str(triggered_by["id"])
+    if isinstance(trigger_user, User) and getattr(trigger_user, "id", None):
+        return str(trigger_user.id)
+    return None
+
+
+async def _get_openai_api_key(db_session, tenant_id: str, trigger_user) -> str:
+    """Load the tenant's OpenAI API key from Secrets Management."""
+    secrets_service = SecretsManagementService(db_session, tenant_id)
+    openai_secret = await secrets_service.get_secret_by_name("OpenAI API Key")
+    if not openai_secret:
+        raise ValueError("OpenAI API key not configured in Secrets Management")
+
+    secret_value = await secrets_service.get_secret_value(
+        secret_id=openai_secret.id,
+        accessed_by_user=trigger_user or AuditContext.system(),
+    )
+    if not secret_value or not secret_value.value:
+        raise ValueError("Failed to retrieve OpenAI API key value")
+    return secret_value.value
+
+
 async def run_plan_generation(
     plan_id: str,
     tenant_id: str,
@@ -82,18 +115,14 @@ async def run_plan_generation(
         planning_service = ContentPlanningService(db, tenant_id)
 
         try:
-            plan = await planning_service.get_plan(plan_id)
+            plan = await planning_service.get_plan(plan_id, include_payload=False)
             if not plan:
                 raise ValueError(f"Content plan {plan_id} not found")
 
             trigger_user = await _load_user(db, triggered_by)
 
-            sse_user_id = None
-            if triggered_by and triggered_by.get("id"):
-                sse_user_id = str(triggered_by["id"])
-            elif isinstance(trigger_user, User) and getattr(trigger_user, "id", None):
-                sse_user_id = str(trigger_user.id)
-            elif hasattr(plan, "created_by_user_id") and plan.created_by_user_id:
+            sse_user_id = _resolve_sse_user_id(triggered_by, trigger_user)
+            if not sse_user_id and getattr(plan, "created_by_user_id", None):
                 sse_user_id = str(plan.created_by_user_id)
 
             progress_emitter = None
@@ -115,23 +144,14 @@ async def run_plan_generation(
                         broadcast=True
                     )
 
-            secrets_service = SecretsManagementService(db, tenant_id)
-            openai_secret = await secrets_service.get_secret_by_name("OpenAI API Key")
-            if not openai_secret:
-                raise ValueError("OpenAI API key not configured in Secrets Management")
-
-            secret_value = await secrets_service.get_secret_value(
-                secret_id=openai_secret.id,
-                accessed_by_user=trigger_user or AuditContext.system(),
-            )
-            if not secret_value or not secret_value.value:
-                raise ValueError("Failed to retrieve OpenAI API key value")
+            openai_api_key = await _get_openai_api_key(db, tenant_id, trigger_user)
 
             orchestrator = ContentOrchestratorService(db, tenant_id)
             result = await orchestrator.process_content_plan(
                 plan_id=plan_id,
-                openai_api_key=secret_value.value,
+                openai_api_key=openai_api_key,
                 progress_callback=progress_emitter,
+                stream_draft=STREAM_PLAN_DRAFTS,
             )
 
             await db.commit()
@@ -155,6 +175,52 @@ async def run_plan_generation(
             raise
 
 
+async def run_plan_batch(
+    batch_id: str,
+    plan_ids: List[str],
+    tenant_id: str,
+    triggered_by: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Execute the AI workflow for a batch of plans under a shared LLM budget.
+
+    Progress is published as aggregate ``batch_progress`` events keyed by the
+    batch id rather than one stream per plan. They go through the shared
+    progress log, so a Celery worker's events reach the web process's SSE
+    endpoint as well as the in-app fallback's.
+    """
+    session_factory = get_async_session()
+    async with session_factory() as db:
+        trigger_user = await _load_user(db, triggered_by)
+        openai_api_key = await _get_openai_api_key(db, tenant_id, trigger_user)
+
+    sse_user_id = _resolve_sse_user_id(triggered_by, trigger_user)
+
+    progress_emitter = None
+    if sse_user_id:
+        async def progress_emitter(stage: str, message: str, status: str = "running", data: Optional[Dict[str, Any]] = None):
+            await progress_stream_manager.publish(
+                tenant_id=tenant_id,
+                user_id=sse_user_id,
+                event=ProgressEvent(
+                    job_id=batch_id,
+                    stage=stage,
+                    message=message,
+                    status=status,
+                    data=dict(data or {})
+                ),
+                broadcast=True
+            )
+
+    batch_orchestrator = ContentBatchOrchestratorService(tenant_id)
+    return await batch_orchestrator.process_batch(
+        batch_id=batch_id,
+        plan_ids=plan_ids,
+        openai_api_key=openai_api_key,
+        progress_callback=progress_emitter,
+    )
+
+
 class ContentPlanTask(Task):
     """
     Base Celery task with structured logging and retries.
@@ -209,3 +275,26 @@ def process_content_plan_task(
         tenant_id=tenant_id,
     )
     return _run_async(run_plan_generation(plan_id, tenant_id, triggered_by))
+
+
+@celery_app.task(bind=True)
+def process_content_plan_batch_task(
+    self,
+    batch_id: str,
+    plan_ids: List[str],
+    tenant_id: str,
+    triggered_by: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Celery entrypoint for batch content plan processing.
+
+    Not auto-retried: individual plan failures are recorded on the plans and
+    re-running the whole batch would regenerate plans that already succeeded.
+    """
+    logger.info(
+        "Starting background content plan batch",
+        batch_id=batch_id,
+        tenant_id=tenant_id,
+        plan_count=len(plan_ids),
+    )
+    return _run_async(run_plan_batch(batch_id, plan_ids, tenant_id, triggered_by))
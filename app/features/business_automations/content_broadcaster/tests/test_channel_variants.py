@@ -0,0 +1,103 @@
+"""
+Unit tests for concurrent channel variant generation.
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.features.business_automations.content_broadcaster.services import ai_generation_service
+from app.features.business_automations.content_broadcaster.services.ai_generation_service import (
+    AIGenerationService,
+)
+
+
+class StubPromptService:
+    async def ensure_system_prompt(self, prompt_key, defaults):
+        return None
+
+    async def render_prompt(self, **kwargs):
+        # Fall back to the bundled templates.
+        return None
+
+
+def _response(content):
+    usage = SimpleNamespace(prompt_tokens=100, completion_tokens=20, total_tokens=120, prompt_tokens_details=None)
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=usage)
+
+
+class FakeOpenAI:
+    calls = []
+    fail_structured = False
+
+    def __init__(self, api_key=None):
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        FakeOpenAI.calls.append(kwargs)
+        if "response_format" in kwargs:
+            if FakeOpenAI.fail_structured:
+                raise RuntimeError("structured outputs unavailable")
+            channels = kwargs["response_format"]["json_schema"]["schema"]["required"]
+            return _response(json.dumps({channel: f"{channel} post" for channel in channels}))
+        return _response("long form body")
+
+
+@pytest.fixture
+def service(monkeypatch):
+    FakeOpenAI.calls = []
+    FakeOpenAI.fail_structured = False
+    monkeypatch.setattr(ai_generation_service, "AsyncOpenAI", FakeOpenAI)
+    generation_service = AIGenerationService(db_session=None)
+    generation_service.prompt_service = StubPromptService()
+    return generation_service
+
+
+@pytest.mark.asyncio
+async def test_short_form_channels_share_one_call(service):
+    variants = await service.generate_variants_per_channel(
+        content="Article body " * 50,
+        title="Title",
+        channels=["twitter", "wordpress", "linkedin", "facebook"],
+        openai_api_key="sk-test",
+    )
+
+    assert [v["channel"] for v in variants] == ["twitter", "wordpress", "linkedin", "facebook"]
+    assert len(FakeOpenAI.calls) == 2
+    structured = [call for call in FakeOpenAI.calls if "response_format" in call]
+    assert len(structured) == 1
+    assert variants[0]["body"] == "twitter post"
+    assert variants[0]["variant_metadata"]["generation"]["call"] == "short_form_combined"
+    assert variants[1]["variant_metadata"]["generation"]["call"] == "wordpress"
+
+
+@pytest.mark.asyncio
+async def test_article_sent_once_as_shared_prefix(service):
+    article = "Unique article text " * 20
+    await service.generate_variants_per_channel(
+        content=article,
+        title="Title",
+        channels=["wordpress", "medium"],
+        openai_api_key="sk-test",
+    )
+
+    system_messages = {call["messages"][0]["content"] for call in FakeOpenAI.calls}
+    assert len(system_messages) == 1
+    for call in FakeOpenAI.calls:
+        assert article not in call["messages"][1]["content"]
+
+
+@pytest.mark.asyncio
+async def test_combined_failure_falls_back_to_single_calls(service):
+    FakeOpenAI.fail_structured = True
+    variants = await service.generate_variants_per_channel(
+        content="Article",
+        title="Title",
+        channels=["twitter", "linkedin"],
+        openai_api_key="sk-test",
+    )
+
+    assert [v["channel"] for v in variants] == ["twitter", "linkedin"]
+    assert variants[0]["variant_metadata"]["generation"]["call"] == "twitter"
+    assert variants[0]["body"] == "long form body"
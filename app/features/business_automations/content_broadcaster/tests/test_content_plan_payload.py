@@ -0,0 +1,33 @@
+"""
+Unit tests for the off-row ContentPlan payload accessors.
+"""
+
+from app.features.business_automations.content_broadcaster.models import ContentPlan, ContentPlanPayload
+
+
+def test_payload_fields_are_stored_on_side_row():
+    plan = ContentPlan(
+        id="plan-1",
+        tenant_id="tenant-a",
+        title="Plan",
+        research_data={"seo_analysis": "gaps"},
+        generation_metadata={"model": "gpt-4"},
+        refinement_history=[{"iteration": 1}],
+    )
+
+    assert isinstance(plan.payload, ContentPlanPayload)
+    assert plan.payload.tenant_id == "tenant-a"
+    assert plan.payload.research_data == {"seo_analysis": "gaps"}
+    assert plan.generation_metadata == {"model": "gpt-4"}
+    assert plan.refinement_history == [{"iteration": 1}]
+
+
+def test_missing_payload_reads_as_empty_and_summary_omits_it():
+    plan = ContentPlan(id="plan-2", tenant_id="tenant-a", title="Plan")
+
+    assert plan.research_data == {}
+    assert plan.refinement_history == []
+
+    summary = plan.to_dict(include_payload=False)
+    assert not set(ContentPlan.PAYLOAD_FIELDS) & summary.keys()
+    assert summary["title"] == "Plan"
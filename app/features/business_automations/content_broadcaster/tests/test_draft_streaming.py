@@ -0,0 +1,117 @@
+"""
+Unit tests for streamed draft generation in AIGenerationService.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.features.business_automations.content_broadcaster.services import ai_generation_service
+from app.features.business_automations.content_broadcaster.services.ai_generation_service import (
+    AIGenerationService,
+)
+
+
+def _chunk(content=None, usage=None):
+    choices = [] if content is None else [SimpleNamespace(delta=SimpleNamespace(content=content))]
+    return SimpleNamespace(choices=choices, usage=usage, model="gpt-4-test")
+
+
+class FakeStream:
+    def __init__(self, chunks):
+        self._chunks = list(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._chunks:
+            raise StopAsyncIteration
+        return self._chunks.pop(0)
+
+
+class FakeClient:
+    def __init__(self, chunks):
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self._chunks = chunks
+
+    async def _create(self, **kwargs):
+        self.calls.append(kwargs)
+        return FakeStream(self._chunks)
+
+
+@pytest.mark.asyncio
+async def test_stream_completion_coalesces_chunks(monkeypatch):
+    usage = SimpleNamespace(total_tokens=42)
+    client = FakeClient([_chunk("Hello"), _chunk(" "), _chunk("world"), _chunk(None, usage=usage)])
+    received = []
+
+    async def on_chunk(delta, text):
+        received.append((delta, text))
+
+    # A large interval means only the final flush is delivered.
+    monkeypatch.setattr(ai_generation_service, "STREAM_COALESCE_INTERVAL_SECONDS", 3600)
+    service = AIGenerationService(db_session=None)
+    content, model, returned_usage = await service._stream_completion(
+        client,
+        model="gpt-4",
+        messages=[{"role": "user", "content": "hi"}],
+        temperature=0.7,
+        stream_callback=on_chunk,
+    )
+
+    assert content == "Hello world"
+    assert model == "gpt-4-test"
+    assert returned_usage is usage
+    assert received == [("Hello world", "Hello world")]
+    assert client.calls[0]["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_stream_completion_survives_callback_errors(monkeypatch):
+    client = FakeClient([_chunk("a"), _chunk("b")])
+
+    async def failing_callback(delta, text):
+        raise RuntimeError("subscriber went away")
+
+    monkeypatch.setattr(ai_generation_service, "STREAM_COALESCE_INTERVAL_SECONDS", 0)
+    service = AIGenerationService(db_session=None)
+    content, _, _ = await service._stream_completion(
+        client,
+        model="gpt-4",
+        messages=[],
+        temperature=0.7,
+        stream_callback=failing_callback,
+    )
+
+    assert content == "ab"
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+
+
+@pytest.mark.asyncio
+async def test_clear_partial_draft_removes_only_partial_keys():
+    from sqlalchemy.dialects import postgresql
+
+    from app.features.business_automations.content_broadcaster.services.content_planning_service import (
+        ContentPlanningService,
+    )
+
+    session = RecordingSession()
+    await ContentPlanningService(session, tenant_id="tenant_a").clear_partial_draft("plan-1")
+
+    (stmt,) = session.statements
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+    assert sql.startswith("UPDATE content_plan_payloads SET generation_metadata=(content_plan_payloads.generation_metadata - ARRAY[")
+    assert "content_plan_payloads.tenant_id = " in sql
+    assert set(compiled.params.values()) >= {
+        "plan-1", "tenant_a", "partial_draft", "partial_draft_iteration", "partial_draft_length", "partial_draft_updated_at",
+    }
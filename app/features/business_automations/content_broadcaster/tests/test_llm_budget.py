@@ -0,0 +1,218 @@
+"""
+Unit tests for the shared LLM request/token budget.
+"""
+
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from app.features.business_automations.content_broadcaster.services.ai_generation_service import (
+    AIGenerationService,
+)
+from app.features.business_automations.content_broadcaster.services.ai_research_service import (
+    AIResearchService,
+)
+from app.features.business_automations.content_broadcaster.services.llm_budget import (
+    InMemoryLlmBudget,
+    estimate_tokens,
+    parse_reset_duration,
+    retry_after_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_parse_reset_duration_formats():
+    assert parse_reset_duration("6m0s") == 360
+    assert parse_reset_duration("1s") == 1
+    assert parse_reset_duration("20ms") == pytest.approx(0.02)
+    assert parse_reset_duration("1h2m3.5s") == pytest.approx(3723.5)
+    assert parse_reset_duration("2.5") == 2.5
+    assert parse_reset_duration(None) is None
+    assert parse_reset_duration("soon") is None
+
+
+def test_retry_after_prefers_explicit_headers():
+    assert retry_after_seconds({"retry-after-ms": "1500"}) == 1.5
+    assert retry_after_seconds({"retry-after": "3"}) == 3
+    assert retry_after_seconds({"x-ratelimit-reset-tokens": "2s"}) == 2
+    assert retry_after_seconds(None, default=7) == 7
+
+
+def test_estimate_tokens_counts_prompt_and_completion():
+    messages = [{"role": "user", "content": "x" * 400}]
+    assert estimate_tokens(messages, 100) == 200
+
+
+@pytest.mark.asyncio
+async def test_bucket_refills_over_time():
+    clock = FakeClock()
+    budget = InMemoryLlmBudget(requests_per_minute=60, tokens_per_minute=600, clock=clock)
+
+    assert await budget.try_acquire("tenant-a", 600) == 0
+    wait = await budget.try_acquire("tenant-a", 300)
+    assert wait == pytest.approx(30)
+
+    clock.advance(30)
+    assert await budget.try_acquire("tenant-a", 300) == 0
+
+
+@pytest.mark.asyncio
+async def test_settle_refunds_overestimates():
+    clock = FakeClock()
+    budget = InMemoryLlmBudget(requests_per_minute=60, tokens_per_minute=1000, clock=clock)
+
+    assert await budget.try_acquire("tenant-a", 1000) == 0
+    await budget.settle(estimated_tokens=1000, actual_tokens=400)
+    assert await budget.try_acquire("tenant-a", 600) == 0
+
+
+@pytest.mark.asyncio
+async def test_headers_clamp_remaining_and_block_until_reset():
+    clock = FakeClock()
+    budget = InMemoryLlmBudget(requests_per_minute=60, tokens_per_minute=10000, clock=clock)
+
+    await budget.observe_headers({
+        "x-ratelimit-limit-tokens": "20000",
+        "x-ratelimit-remaining-tokens": "0",
+        "x-ratelimit-reset-tokens": "3s",
+    })
+    assert await budget.try_acquire("tenant-a", 10) == pytest.approx(3)
+
+    clock.advance(3)
+    # 3 seconds of refill at the learned 20k TPM limit.
+    assert await budget.try_acquire("tenant-a", 1000) == 0
+
+
+@pytest.mark.asyncio
+async def test_penalize_blocks_all_tenants():
+    clock = FakeClock()
+    budget = InMemoryLlmBudget(requests_per_minute=60, tokens_per_minute=1000, clock=clock)
+
+    await budget.penalize(5)
+    assert await budget.try_acquire("tenant-a", 1) == pytest.approx(5)
+    assert await budget.try_acquire("tenant-b", 1) == pytest.approx(5)
+
+
+@pytest.mark.asyncio
+async def test_less_served_tenant_gets_priority():
+    clock = FakeClock()
+    budget = InMemoryLlmBudget(requests_per_minute=600, tokens_per_minute=1000, clock=clock)
+
+    # tenant-a consumes most of the bucket, then both tenants wait for budget.
+    assert await budget.try_acquire("tenant-a", 900) == 0
+    assert await budget.try_acquire("tenant-b", 500) > 0
+
+    # tenant-a is deferred while tenant-b (less recent usage) is still waiting.
+    clock.advance(1)
+    assert await budget.try_acquire("tenant-a", 10) > 0
+
+    clock.advance(30)
+    assert await budget.try_acquire("tenant-b", 500) == 0
+    assert await budget.try_acquire("tenant-a", 10) == 0
+
+
+class RecordingBudget(InMemoryLlmBudget):
+    """In-memory budget that records the feedback it receives (penalties don't block)."""
+
+    def __init__(self):
+        super().__init__(requests_per_minute=600, tokens_per_minute=100000)
+        self.settled = []
+        self.headers = []
+        self.penalties = []
+
+    async def settle(self, estimated_tokens, actual_tokens):
+        self.settled.append((estimated_tokens, actual_tokens))
+        await super().settle(estimated_tokens, actual_tokens)
+
+    async def observe_headers(self, headers):
+        self.headers.append(dict(headers))
+        await super().observe_headers(headers)
+
+    async def penalize(self, retry_after):
+        self.penalties.append(retry_after)
+
+
+def _completion_body(content: str, total_tokens: int) -> dict:
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+        "usage": {"prompt_tokens": total_tokens - 10, "completion_tokens": 10, "total_tokens": total_tokens},
+    }
+
+
+def _openai_client(*responses: httpx.Response):
+    """AsyncOpenAI wired to an httpx.MockTransport replaying ``responses`` in order."""
+    queue = list(responses)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return queue.pop(0)
+
+    client = AsyncOpenAI(
+        api_key="sk-test",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    return client, requests
+
+
+@pytest.mark.asyncio
+async def test_budgeted_completion_parses_and_settles_real_usage():
+    client, requests = _openai_client(
+        httpx.Response(
+            429,
+            headers={"retry-after-ms": "10"},
+            json={"error": {"message": "slow down", "type": "rate_limit", "code": "rate_limit_exceeded"}},
+        ),
+        httpx.Response(200, headers={"x-ratelimit-remaining-tokens": "5000"}, json=_completion_body("Draft", 321)),
+    )
+    budget = RecordingBudget()
+    service = AIGenerationService(db_session=SimpleNamespace(), tenant_id="tenant-a", llm_budget=budget)
+
+    messages = [{"role": "user", "content": "x" * 400}]
+    response = await service._create_completion(client, 100, model="gpt-4", messages=messages)
+
+    assert response.choices[0].message.content == "Draft"
+    assert len(requests) == 2
+    assert budget.penalties == [0.01]
+    assert budget.headers[0]["x-ratelimit-remaining-tokens"] == "5000"
+    assert budget.settled == [(estimate_tokens(messages, 100), 321)]
+
+
+@pytest.mark.asyncio
+async def test_research_analysis_goes_through_the_budget():
+    client, requests = _openai_client(
+        httpx.Response(200, headers={"x-ratelimit-remaining-requests": "99"}, json=_completion_body("Gaps: none", 900)),
+    )
+    budget = RecordingBudget()
+    service = AIResearchService(tenant_id="tenant-a", llm_budget=budget)
+    service.openai_client = SimpleNamespace(client=client, default_model="gpt-4")
+
+    async def ensure_system_prompt(*args, **kwargs):
+        return None
+
+    async def render_prompt(**kwargs):
+        return "Analyse these competitors."
+
+    service.prompt_service = SimpleNamespace(ensure_system_prompt=ensure_system_prompt, render_prompt=render_prompt)
+
+    assert await service.analyze_competitor_seo("competitor text") == "Gaps: none"
+    assert len(requests) == 1
+    assert budget.headers[0]["x-ratelimit-remaining-requests"] == "99"
+    assert [actual for _, actual in budget.settled] == [900]
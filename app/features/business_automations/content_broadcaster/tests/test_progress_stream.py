@@ -0,0 +1,92 @@
+"""
+Unit tests for the Content Broadcaster progress stream.
+"""
+
+import json
+
+import pytest
+
+from app.features.business_automations.content_broadcaster.services.progress_stream import (
+    ProgressEvent,
+    ProgressStreamManager,
+)
+from app.features.core.event_streams import InMemoryEventLog
+
+
+def _parse(message):
+    fields = dict(line.split(": ", 1) for line in message.strip().splitlines())
+    fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+@pytest.mark.asyncio
+async def test_worker_events_reach_web_stream_through_shared_log():
+    # Two managers over one log stand in for a Celery worker and a web process sharing Redis
+    log = InMemoryEventLog()
+    worker, web = ProgressStreamManager(log), ProgressStreamManager(log)
+
+    stream = web.stream("t1", "u1", heartbeat_seconds=0.05)
+    assert (await stream.__anext__()).startswith("retry:")
+    assert await stream.__anext__() == ": heartbeat\n\n"
+
+    await worker.publish("t1", "u2", ProgressEvent("p0", "queued", "other user"), broadcast=False)
+    await worker.publish("t2", "u1", ProgressEvent("p0", "queued", "other tenant"))
+    await worker.publish("t1", "u1", ProgressEvent("p1", "draft_stream", "delta", data={"delta": "Hel"}), broadcast=False)
+    await worker.publish("t1", "u2", ProgressEvent("p2", "completed", "tenant-wide", status="success"))
+
+    draft = _parse(await stream.__anext__())
+    assert draft["event"] == "generation"
+    assert (draft["data"]["stage"], draft["data"]["data"]) == ("draft_stream", {"delta": "Hel"})
+    completed = _parse(await stream.__anext__())
+    assert completed["data"]["job_id"] == "p2"
+    await stream.aclose()
+
+    # A reconnect with Last-Event-ID replays what came after it
+    resumed = web.stream("t1", "u1", last_event_id=draft["id"], heartbeat_seconds=0.05)
+    await resumed.__anext__()
+    assert _parse(await resumed.__anext__())["id"] == completed["id"]
+    await resumed.aclose()
+
+
+@pytest.mark.asyncio
+async def test_batch_progress_from_a_worker_reaches_the_web_stream(monkeypatch):
+    from app.features.business_automations.content_broadcaster import tasks
+
+    log = InMemoryEventLog()
+    web = ProgressStreamManager(log)
+    stream = web.stream("t1", "u1", heartbeat_seconds=0.05)
+    await stream.__anext__()
+    await stream.__anext__()  # heartbeat: the stream is open before the batch runs
+
+    class NoSession:
+        async def __aenter__(self):
+            return None
+
+        async def __aexit__(self, *exc):
+            return False
+
+    class FakeBatchOrchestrator:
+        def __init__(self, tenant_id):
+            pass
+
+        async def process_batch(self, batch_id, plan_ids, openai_api_key, progress_callback=None):
+            await progress_callback(stage="batch_progress", message="1/2", data={"batch_id": batch_id, "completed": 1})
+            return {"batch_id": batch_id}
+
+    async def no_user(db, triggered_by):
+        return None
+
+    async def api_key(db, tenant_id, user):
+        return "sk-test"
+
+    monkeypatch.setattr(tasks, "progress_stream_manager", ProgressStreamManager(log))
+    monkeypatch.setattr(tasks, "get_async_session", lambda: NoSession)
+    monkeypatch.setattr(tasks, "_load_user", no_user)
+    monkeypatch.setattr(tasks, "_get_openai_api_key", api_key)
+    monkeypatch.setattr(tasks, "ContentBatchOrchestratorService", FakeBatchOrchestrator)
+
+    await tasks.run_plan_batch("b1", ["p1", "p2"], "t1", triggered_by={"id": "u1"})
+
+    event = _parse(await stream.__anext__())["data"]
+    assert (event["job_id"], event["stage"], event["data"]["completed"]) == ("b1", "batch_progress", 1)
+    await stream.aclose()
@@ -0,0 +1,67 @@
+"""
+Unit tests for the local SEO pre-scoring analyzer.
+"""
+
+from app.features.business_automations.content_broadcaster.services.seo_analyzer import (
+    LocalSeoAnalyzer,
+    SeoGateThresholds,
+)
+
+
+def _article(paragraph: str, sections: int = 4, faq: bool = True) -> str:
+    parts = ["# Content Automation for Growing Teams", "", paragraph, ""]
+    for index in range(sections):
+        parts += [f"## Section {index} on content automation", "", paragraph, ""]
+    if faq:
+        parts += ["## FAQ", "", "### What is content automation?", "", paragraph]
+    return "\n".join(parts)
+
+
+PARAGRAPH = ("Content automation helps small teams publish consistently. " + "Clear processes save time every week. " * 10).strip()
+
+
+def test_well_formed_article_passes_gates():
+    analyzer = LocalSeoAnalyzer(SeoGateThresholds(min_words=200))
+    analysis = analyzer.analyze("Ignored", _article(PARAGRAPH), ["content automation"])
+
+    assert analysis.passes_gates, analysis.instructions
+    assert analysis.score == 100
+    assert analysis.metrics["h1_count"] == 1
+    assert analysis.metrics["h2_count"] == 5
+    assert 0.5 <= analysis.metrics["total_keyword_density"] <= 3.0
+
+
+def test_mechanical_failures_produce_precise_instructions():
+    analyzer = LocalSeoAnalyzer()
+    content = "# Short\n\n### Jumped a level\n\nNothing about the topic here."
+    analysis = analyzer.analyze("Short", content, ["content automation"])
+
+    assert not analysis.passes_gates
+    failed = {check.key for check in analysis.checks if not check.passed}
+    assert {"word_count", "h2_sections", "heading_hierarchy", "faq_section",
+            "keyword_density", "keyword_in_intro"} <= failed
+
+    result = analysis.to_validation_result(target_score=95)
+    assert result["status"] == "LOCAL_FAIL"
+    assert result["score"] < 95
+    assert any("at least 1000 words" in issue for issue in result["issues"])
+    assert "Fix exactly these issues" in analysis.to_feedback()
+
+
+def test_keyword_counting_matches_whole_words_only():
+    analyzer = LocalSeoAnalyzer(SeoGateThresholds(min_words=1))
+    analysis = analyzer.analyze("T", "# T\n\napi api rapid API, apis", ["api"])
+
+    # 3 of 5 words are the keyword (the substring in "rapid"/"apis" does not count).
+    assert analysis.metrics["keyword_density"]["api"] == 60.0
+
+
+def test_secondary_keywords_only_count_towards_combined_density():
+    analyzer = LocalSeoAnalyzer(SeoGateThresholds(min_words=200))
+    keywords = ["content automation", "editorial calendar", "publishing workflow"]
+    analysis = analyzer.analyze("Ignored", _article(PARAGRAPH), keywords)
+
+    # Only the primary keyword must sit in the intro and a heading; the others never appear.
+    assert analysis.passes_gates, analysis.instructions
+    assert analysis.metrics["keyword_density"]["editorial calendar"] == 0.0
+    assert analysis.metrics["total_keyword_density"] == analysis.metrics["keyword_density"]["content automation"]
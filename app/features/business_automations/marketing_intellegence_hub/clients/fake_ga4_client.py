@@ -0,0 +1,127 @@
+"""Offline stand-in for Ga4Client used by tests and local fleet-sync runs."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from .ga4_client import BREAKDOWN_DIMENSIONS, MAX_REPORTS_PER_BATCH, DateWindow, Ga4BatchResult, _daily_row
+
+
+FAKE_BREAKDOWN_VALUES = {
+    "channel": ["Organic Search", "Direct", "Paid Search", "Referral"],
+    "device": ["desktop", "mobile", "tablet"],
+    "geo": ["United States", "United Kingdom", "Canada"],
+}
+
+
+class FakeGa4QuotaExhausted(Exception):
+    """Raised by FakeGa4Client when a property's simulated quota runs out."""
+
+
+class FakeGa4Client:
+    """
+    Deterministic GA4 client with the same batch interface as Ga4Client.
+
+    Daily values are derived from a hash of (property, date) so repeated
+    fetches return identical rows. Every batchRunReports call is recorded in
+    ``calls`` and charges ``tokens_per_report`` against the simulated hourly
+    quota of the property.
+    """
+
+    def __init__(
+        self,
+        tokens_per_hour: int = 40000,
+        tokens_per_day: int = 200000,
+        tokens_per_report: int = 10,
+        failing_properties: Optional[Set[str]] = None,
+    ):
+        self.tokens_per_hour = tokens_per_hour
+        self.tokens_per_day = tokens_per_day
+        self.tokens_per_report = tokens_per_report
+        self.failing_properties = set(failing_properties or ())
+        self.calls: List[Dict[str, Any]] = []
+        self._consumed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def current_token_data(self) -> Dict[str, Any]:
+        return {"access_token": None, "access_token_expires_at": None}
+
+    @staticmethod
+    def _metrics_for(property_id: str, day: date) -> List[Optional[float]]:
+        digest = hashlib.sha256(f"{property_id}:{day.isoformat()}".encode()).digest()
+        sessions = float(500 + int.from_bytes(digest[0:2], "big") % 1500)
+        users = round(sessions * (0.6 + digest[2] / 1000), 0)
+        new_users = round(users * (0.2 + digest[3] / 1000), 0)
+        conversions = float(digest[4] % 40)
+        engagement_rate = round(0.4 + digest[5] / 1000, 4)
+        bounce_rate = round(1 - engagement_rate, 4)
+        avg_duration = float(60 + digest[6])
+        return [sessions, users, new_users, conversions, engagement_rate, bounce_rate, avg_duration]
+
+    def _charge(self, property_id: str, reports: int, call: Dict[str, Any]) -> Dict[str, Optional[int]]:
+        if property_id in self.failing_properties:
+            raise RuntimeError(f"Simulated GA4 failure for {property_id}")
+        with self._lock:
+            consumed = self._consumed.get(property_id, 0) + self.tokens_per_report * reports
+            if consumed > self.tokens_per_hour:
+                raise FakeGa4QuotaExhausted(f"Hourly quota exhausted for {property_id}")
+            self._consumed[property_id] = consumed
+            self.calls.append({"property_id": property_id, **call})
+        return {
+            "tokens_per_day": self.tokens_per_day - consumed,
+            "tokens_per_hour": self.tokens_per_hour - consumed,
+            "tokens_per_project_per_hour": None,
+        }
+
+    @staticmethod
+    def _days(start: date, end: date):
+        day = start
+        while day <= end:
+            yield day
+            day += timedelta(days=1)
+
+    def batch_fetch_daily_metrics(self, property_id: str, windows: Sequence[DateWindow]) -> Ga4BatchResult:
+        result = Ga4BatchResult()
+        windows = list(windows)
+        for offset in range(0, len(windows), MAX_REPORTS_PER_BATCH):
+            chunk = windows[offset:offset + MAX_REPORTS_PER_BATCH]
+            result.quota = self._charge(property_id, len(chunk), {"windows": list(chunk)})
+            for start, end in chunk:
+                for day in self._days(start, end):
+                    result.rows.append(_daily_row(day, self._metrics_for(property_id, day)))
+        return result
+
+    def batch_fetch_breakdowns(
+        self,
+        property_id: str,
+        windows: Sequence[DateWindow],
+        dimensions: Sequence[str] = tuple(BREAKDOWN_DIMENSIONS),
+    ) -> Ga4BatchResult:
+        """Split each day's metrics across FAKE_BREAKDOWN_VALUES with descending weights."""
+        result = Ga4BatchResult()
+        reports = [(dimension, start, end) for start, end in windows for dimension in dimensions]
+        for offset in range(0, len(reports), MAX_REPORTS_PER_BATCH):
+            chunk = reports[offset:offset + MAX_REPORTS_PER_BATCH]
+            result.quota = self._charge(property_id, len(chunk), {"breakdowns": list(chunk)})
+            for dimension, start, end in chunk:
+                values = FAKE_BREAKDOWN_VALUES[dimension]
+                for day in self._days(start, end):
+                    sessions, users, new_users, conversions = self._metrics_for(property_id, day)[:4]
+                    weights = [len(values) - index for index in range(len(values))]
+                    total_weight = sum(weights)
+                    for value, weight in zip(values, weights):
+                        share = weight / total_weight
+                        result.rows.append({
+                            "date": day,
+                            "dimension": dimension,
+                            "dimension_value": value,
+                            "sessions": round(sessions * share, 2),
+                            "users": round(users * share, 2),
+                            "new_users": round(new_users * share, 2),
+                            "conversions": round(conversions * share, 2),
+                            "engaged_sessions": round(sessions * share * 0.6, 2),
+                        })
+        return result
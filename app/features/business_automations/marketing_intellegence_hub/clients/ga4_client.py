@@ -2,18 +2,84 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass, field
 from datetime import date, datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import logging
 
 try:
     from google.analytics.data_v1beta import BetaAnalyticsDataClient
-    from google.analytics.data_v1beta.types import DateRange, Metric, Dimension, RunReportRequest, MetricAggregation
+    from google.analytics.data_v1beta.types import (
+        BatchRunReportsRequest,
+        DateRange,
+        Metric,
+        Dimension,
+        RunReportRequest,
+        MetricAggregation,
+    )
     from google.oauth2.credentials import Credentials
 except ModuleNotFoundError:  # pragma: no cover - handled at runtime
     BetaAnalyticsDataClient = None  # type: ignore
     Credentials = None  # type: ignore
-    DateRange = Metric = Dimension = RunReportRequest = MetricAggregation = None  # type: ignore
+    BatchRunReportsRequest = DateRange = Metric = Dimension = RunReportRequest = MetricAggregation = None  # type: ignore
+
+# GA4 accepts at most five reports per batchRunReports call.
+MAX_REPORTS_PER_BATCH = 5
+
+DAILY_METRIC_NAMES = (
+    "sessions",
+    "totalUsers",
+    "newUsers",
+    "conversions",
+    "engagementRate",
+    "bounceRate",
+    "averageSessionDuration",
+)
+
+# Breakdown dimension key -> GA4 dimension name.
+BREAKDOWN_DIMENSIONS = {
+    "channel": "sessionDefaultChannelGroup",
+    "device": "deviceCategory",
+    "geo": "country",
+}
+
+BREAKDOWN_METRIC_NAMES = (
+    "sessions",
+    "totalUsers",
+    "newUsers",
+    "conversions",
+    "engagedSessions",
+)
+
+DateWindow = Tuple[date, date]
+
+
+@dataclass
+class Ga4BatchResult:
+    """Rows from one or more batched reports plus the latest property quota snapshot."""
+
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    quota: Dict[str, Optional[int]] = field(default_factory=dict)
+
+
+def _daily_row(report_date: Optional[date], metric_values: List[Optional[float]]) -> Dict[str, Any]:
+    sessions_val = metric_values[0]
+    conversions_val = metric_values[3]
+    conversion_rate = (conversions_val / sessions_val) if sessions_val not in (None, 0) and conversions_val is not None else None
+    conversions_per_1k = (conversion_rate * 1000) if conversion_rate is not None else None
+    return {
+        "date": report_date,
+        "sessions": sessions_val,
+        "users": metric_values[1],
+        "new_users": metric_values[2],
+        "conversions": conversions_val,
+        "engagement_rate": metric_values[4],
+        "bounce_rate": metric_values[5],
+        "avg_engagement_time": metric_values[6],  # seconds
+        "conversion_rate": conversion_rate,
+        "conversions_per_1k": conversions_per_1k,
+    }
 
 
 class Ga4Client:
@@ -80,27 +146,44 @@ class Ga4Client:
                 return date(int(digits[0:4]), int(digits[4:6]), int(digits[6:8]))
             raise ValueError(f"Unexpected GA4 date format: {raw_date!r}")
 
-    async def fetch_daily_metrics(self, property_id: str, start: date, end: date) -> List[Dict[str, Any]]:
-        """Fetch basic daily metrics for the given property."""
-        # BetaAnalyticsDataClient is sync; wrap in thread if needed.
-        request = RunReportRequest(
-            property=property_id,
-            date_ranges=[DateRange(start_date=start.isoformat(), end_date=end.isoformat())],
-            dimensions=[Dimension(name="date")],
-            metrics=[
-                Metric(name="sessions"),
-                Metric(name="totalUsers"),
-                Metric(name="newUsers"),
-                Metric(name="conversions"),
-                Metric(name="engagementRate"),
-                Metric(name="bounceRate"),
-                Metric(name="averageSessionDuration"),
-            ],
-            metric_aggregations=[MetricAggregation.TOTAL],
-        )
-        response = self.client.run_report(request)
+    @staticmethod
+    def _daily_report_request(property_id: Optional[str], start: date, end: date, include_totals: bool = False) -> "RunReportRequest":
+        kwargs: Dict[str, Any] = {
+            "date_ranges": [DateRange(start_date=start.isoformat(), end_date=end.isoformat())],
+            "dimensions": [Dimension(name="date")],
+            "metrics": [Metric(name=name) for name in DAILY_METRIC_NAMES],
+            "return_property_quota": True,
+        }
+        if property_id:
+            kwargs["property"] = property_id
+        if include_totals:
+            kwargs["metric_aggregations"] = [MetricAggregation.TOTAL]
+        return RunReportRequest(**kwargs)
 
+    @classmethod
+    def _parse_rows(cls, response) -> List[Dict[str, Any]]:
         results: List[Dict[str, Any]] = []
+        for row in response.rows:
+            dim_values = [d.value for d in row.dimension_values]
+            metric_values = [float(m.value) if m.value else None for m in row.metric_values]
+            results.append(_daily_row(cls._parse_ga4_date(dim_values[0]), metric_values))
+        return results
+
+    @staticmethod
+    def _quota_snapshot(property_quota) -> Dict[str, Optional[int]]:
+        """Extract remaining token counts from a PropertyQuota message."""
+        if not property_quota:
+            return {}
+        snapshot: Dict[str, Optional[int]] = {}
+        for key in ("tokens_per_day", "tokens_per_hour", "tokens_per_project_per_hour"):
+            status = getattr(property_quota, key, None)
+            snapshot[key] = int(status.remaining) if status is not None else None
+        return snapshot
+
+    def _run_report_sync(self, property_id: str, start: date, end: date) -> List[Dict[str, Any]]:
+        request = self._daily_report_request(property_id, start, end, include_totals=True)
+        response = self.client.run_report(request)
+
         if not response.rows:
             logging.getLogger(__name__).warning(
                 "GA4 run_report returned no rows",
@@ -113,48 +196,95 @@ class Ga4Client:
                     "metadata": str(response.metadata),
                 },
             )
-            if response.totals:
-                for total in response.totals:
-                    metric_values = [float(m.value) if m.value else None for m in total.metric_values]
-                    sessions_val = metric_values[0]
-                    conversions_val = metric_values[3]
-                    conversion_rate = (conversions_val / sessions_val) if sessions_val not in (None, 0) else None
-                    conversions_per_1k = ((conversions_val / sessions_val) * 1000) if sessions_val not in (None, 0) else None
-                    results.append(
-                        {
-                            "date": None,
-                            "sessions": metric_values[0],
-                            "users": metric_values[1],
-                            "new_users": metric_values[2],
-                            "conversions": metric_values[3],
-                            "engagement_rate": metric_values[4],
-                            "bounce_rate": metric_values[5],
-                            "avg_engagement_time": metric_values[6],
-                            "conversion_rate": conversion_rate,
-                            "conversions_per_1k": conversions_per_1k,
-                        }
-                    )
+            results: List[Dict[str, Any]] = []
+            for total in response.totals or []:
+                metric_values = [float(m.value) if m.value else None for m in total.metric_values]
+                results.append(_daily_row(None, metric_values))
             return results
 
+        return self._parse_rows(response)
+
+    async def fetch_daily_metrics(self, property_id: str, start: date, end: date) -> List[Dict[str, Any]]:
+        """Fetch basic daily metrics for the given property."""
+        # BetaAnalyticsDataClient is sync; keep the Google round trip off the event loop.
+        return await asyncio.to_thread(self._run_report_sync, property_id, start, end)
+
+    def batch_fetch_daily_metrics(self, property_id: str, windows: Sequence[DateWindow]) -> Ga4BatchResult:
+        """
+        Fetch daily metrics for several date windows with batchRunReports (blocking).
+
+        Windows are sent MAX_REPORTS_PER_BATCH at a time; callers run this in a
+        worker thread.
+        """
+        result = Ga4BatchResult()
+        windows = list(windows)
+        for offset in range(0, len(windows), MAX_REPORTS_PER_BATCH):
+            chunk = windows[offset:offset + MAX_REPORTS_PER_BATCH]
+            request = BatchRunReportsRequest(
+                property=property_id,
+                requests=[self._daily_report_request(None, start, end) for start, end in chunk],
+            )
+            response = self.client.batch_run_reports(request)
+            for report in response.reports:
+                result.rows.extend(self._parse_rows(report))
+                quota = self._quota_snapshot(report.property_quota)
+                if quota:
+                    result.quota = quota
+        return result
+
+    @staticmethod
+    def _breakdown_report_request(dimension: str, start: date, end: date) -> "RunReportRequest":
+        return RunReportRequest(
+            date_ranges=[DateRange(start_date=start.isoformat(), end_date=end.isoformat())],
+            dimensions=[Dimension(name="date"), Dimension(name=BREAKDOWN_DIMENSIONS[dimension])],
+            metrics=[Metric(name=name) for name in BREAKDOWN_METRIC_NAMES],
+            return_property_quota=True,
+            limit=100000,
+        )
+
+    @classmethod
+    def _parse_breakdown_rows(cls, dimension: str, response) -> List[Dict[str, Any]]:
+        results: List[Dict[str, Any]] = []
         for row in response.rows:
             dim_values = [d.value for d in row.dimension_values]
             metric_values = [float(m.value) if m.value else None for m in row.metric_values]
-            sessions_val = metric_values[0]
-            conversions_val = metric_values[3]
-            conversion_rate = (conversions_val / sessions_val) if sessions_val not in (None, 0) else None
-            conversions_per_1k = ((conversions_val / sessions_val) * 1000) if sessions_val not in (None, 0) else None
             results.append(
                 {
-                    "date": self._parse_ga4_date(dim_values[0]),
-                    "sessions": sessions_val,
+                    "date": cls._parse_ga4_date(dim_values[0]),
+                    "dimension": dimension,
+                    "dimension_value": dim_values[1] or "(not set)",
+                    "sessions": metric_values[0],
                     "users": metric_values[1],
                     "new_users": metric_values[2],
-                    "conversions": conversions_val,
-                    "engagement_rate": metric_values[4],
-                    "bounce_rate": metric_values[5],
-                    "avg_engagement_time": metric_values[6],  # seconds
-                    "conversion_rate": conversion_rate,
-                    "conversions_per_1k": conversions_per_1k,
+                    "conversions": metric_values[3],
+                    "engaged_sessions": metric_values[4],
                 }
             )
         return results
+
+    def batch_fetch_breakdowns(
+        self,
+        property_id: str,
+        windows: Sequence[DateWindow],
+        dimensions: Sequence[str] = tuple(BREAKDOWN_DIMENSIONS),
+    ) -> Ga4BatchResult:
+        """
+        Fetch per-day channel/device/geo breakdowns with batchRunReports (blocking).
+
+        One report per (window, dimension), sent MAX_REPORTS_PER_BATCH at a time.
+        """
+        result = Ga4BatchResult()
+        reports = [(dimension, start, end) for start, end in windows for dimension in dimensions]
+        for offset in range(0, len(reports), MAX_REPORTS_PER_BATCH):
+            chunk = reports[offset:offset + MAX_REPORTS_PER_BATCH]
+            request = BatchRunReportsRequest(
+                property=property_id,
+                requests=[self._breakdown_report_request(dimension, start, end) for dimension, start, end in chunk],
+            )
+            response = self.client.batch_run_reports(request)
+            for (dimension, _, _), report in zip(chunk, response.reports):
+                result.rows.extend(self._parse_breakdown_rows(dimension, report))
+                quota = self._quota_snapshot(report.property_quota)
+                if quota:
+                    result.quota = quota
+        return result
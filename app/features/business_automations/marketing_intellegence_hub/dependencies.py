@@ -10,6 +10,7 @@ from .services import (
     Ga4ConnectionCrudService,
     Ga4MetricsIngestionService,
     Ga4MetricsQueryService,
+    Ga4DerivedMetricsService,
     Ga4InsightCrudService,
     Ga4ReportCrudService,
     Ga4ClientCrudService,
@@ -37,6 +38,13 @@ def get_metrics_query_service(
     return Ga4MetricsQueryService(session, tenant_id)
 
 
+def get_derived_metrics_service(
+    session: AsyncSession = Depends(get_db),
+    tenant_id: str = Depends(tenant_dependency),
+) -> Ga4DerivedMetricsService:
+    return Ga4DerivedMetricsService(session, tenant_id)
+
+
 def get_insight_service(
     session: AsyncSession = Depends(get_db),
     tenant_id: str = Depends(tenant_dependency),
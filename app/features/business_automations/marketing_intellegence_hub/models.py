@@ -6,7 +6,7 @@ import uuid
 from datetime import datetime
 from typing import Any, Dict
 
-from sqlalchemy import Column, String, Text, Date, DateTime, Boolean, ForeignKey, Numeric, Index
+from sqlalchemy import Column, String, Text, Date, DateTime, Boolean, ForeignKey, Numeric, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
@@ -121,6 +121,51 @@ class Ga4DailyMetric(Base, AuditMixin):
         return data
 
 
+class Ga4DimensionMetric(Base):
+    """
+    Daily GA4 metrics sliced by one dimension (channel, device, geo).
+
+    A narrow fact table so breakdowns can be aggregated across clients with
+    plain indexed SQL. Rows are append-mostly in date order, so a BRIN index
+    on ``date`` keeps range scans cheap at a fraction of a btree's size.
+    """
+
+    __tablename__ = "ga4_dimension_metrics"
+
+    tenant_id = Column(String(64), primary_key=True)
+    connection_id = Column(String(36), ForeignKey("ga4_connections.id", ondelete="CASCADE"), primary_key=True)
+    date = Column(Date, primary_key=True)
+    dimension = Column(String(32), primary_key=True)  # channel, device, geo
+    dimension_value = Column(String(255), primary_key=True)
+
+    sessions = Column(Numeric(18, 2), nullable=True)
+    users = Column(Numeric(18, 2), nullable=True)
+    new_users = Column(Numeric(18, 2), nullable=True)
+    conversions = Column(Numeric(18, 2), nullable=True)
+    engaged_sessions = Column(Numeric(18, 2), nullable=True)
+
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_ga4_dimension_metrics_date_brin", "date", postgresql_using="brin"),
+        Index("ix_ga4_dimension_metrics_tenant_dimension_date", "tenant_id", "dimension", "date"),
+    )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tenant_id": self.tenant_id,
+            "connection_id": self.connection_id,
+            "date": self.date,
+            "dimension": self.dimension,
+            "dimension_value": self.dimension_value,
+            "sessions": float(self.sessions) if self.sessions is not None else None,
+            "users": float(self.users) if self.users is not None else None,
+            "new_users": float(self.new_users) if self.new_users is not None else None,
+            "conversions": float(self.conversions) if self.conversions is not None else None,
+            "engaged_sessions": float(self.engaged_sessions) if self.engaged_sessions is not None else None,
+        }
+
+
 class Ga4Insight(Base, AuditMixin):
     __tablename__ = "ga4_insights"
 
@@ -132,9 +177,15 @@ class Ga4Insight(Base, AuditMixin):
     content = Column(Text, nullable=False)
     source = Column(String(32), nullable=False, default="ai")
     generated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    score = Column(Numeric(10, 4), nullable=True)  # ranking for detected anomalies (|robust z|)
+    details = Column(JSONB, nullable=True)  # metric, date, value, baseline, zscore
 
     connection = relationship("Ga4Connection")
 
+    __table_args__ = (
+        Index("ix_ga4_insights_tenant_type_score", "tenant_id", "summary_type", "score"),
+    )
+
 
 class Ga4Report(Base, AuditMixin):
     __tablename__ = "ga4_reports"
@@ -7,8 +7,8 @@ from app.features.core.route_imports import APIRouter, Depends, HTTPException, R
 from app.features.auth.dependencies import get_current_user
 
 from ..schemas import Ga4ConnectionCreate, Ga4ConnectionResponse, Ga4ConnectionUpdate, Ga4DailyMetricPayload
-from ..services import Ga4ConnectionCrudService, Ga4MetricsIngestionService
-from ..dependencies import get_connection_service, get_metrics_ingestion_service
+from ..services import Ga4ConnectionCrudService, Ga4DerivedMetricsService, Ga4MetricsIngestionService
+from ..dependencies import get_connection_service, get_derived_metrics_service, get_metrics_ingestion_service
 from ..clients.ga4_client import Ga4Client
 from ..ga4_credentials import load_ga4_credentials
 try:
@@ -85,6 +85,7 @@ async def sync_connection(
     request: Request = None,
     connection_service: Ga4ConnectionCrudService = Depends(get_connection_service),
     metrics_service: Ga4MetricsIngestionService = Depends(get_metrics_ingestion_service),
+    derived_service: Ga4DerivedMetricsService = Depends(get_derived_metrics_service),
     current_user=Depends(get_current_user),
 ):
     """
@@ -154,9 +155,12 @@ async def sync_connection(
         ]
 
         await metrics_service.upsert_daily_metrics(connection_id, payloads, current_user)
+        # Moving averages, deltas and z-scores from the earliest synced day onwards.
+        await derived_service.recompute(connection_id, min(payload.date for payload in payloads))
         await connection_service.update_connection(connection_id, Ga4ConnectionUpdate(last_synced_at=datetime.utcnow()), current_user)
         # Commit at the route boundary to keep transaction control here.
         await connection_service.db.commit()
+        await metrics_service.invalidate_cached_metrics([connection_id])
 
         if hx:
             return templates.TemplateResponse(
@@ -12,6 +12,16 @@ from ..dependencies import get_insight_service
 router = APIRouter(prefix="/ga4/insights", tags=["ga4-insights"])
 
 
+@router.get("/anomalies", response_model=List[Ga4InsightResponse])
+async def list_anomalies(
+    limit: int = 50,
+    service: Ga4InsightCrudService = Depends(get_insight_service),
+):
+    """Ranked anomaly insights from the portfolio detection job."""
+    insights = await service.list_ranked_anomalies(limit=limit)
+    return [Ga4InsightResponse.model_validate(item, from_attributes=True) for item in insights]
+
+
 @router.get("/{connection_id}", response_model=List[Ga4InsightResponse])
 async def list_insights(
     connection_id: str,
@@ -6,13 +6,25 @@ from typing import List
 from app.features.core.route_imports import APIRouter, Depends, HTTPException
 from app.features.auth.dependencies import get_current_user
 
+from ..clients.ga4_client import BREAKDOWN_DIMENSIONS
 from ..schemas import (
     Ga4DailyMetricPayload,
+    MetricsBreakdownResponse,
     MetricsKpiResponse,
     MetricsTimeSeriesResponse,
 )
-from ..services import Ga4MetricsIngestionService, Ga4MetricsQueryService, Ga4ConnectionCrudService
-from ..dependencies import get_metrics_ingestion_service, get_metrics_query_service, get_connection_service
+from ..services import (
+    Ga4ConnectionCrudService,
+    Ga4DerivedMetricsService,
+    Ga4MetricsIngestionService,
+    Ga4MetricsQueryService,
+)
+from ..dependencies import (
+    get_connection_service,
+    get_derived_metrics_service,
+    get_metrics_ingestion_service,
+    get_metrics_query_service,
+)
 
 router = APIRouter(prefix="/ga4/metrics", tags=["ga4-metrics"])
 
@@ -22,56 +34,71 @@ async def ingest_metrics(
     connection_id: str,
     payloads: List[Ga4DailyMetricPayload],
     service: Ga4MetricsIngestionService = Depends(get_metrics_ingestion_service),
+    derived_service: Ga4DerivedMetricsService = Depends(get_derived_metrics_service),
     current_user = Depends(get_current_user),
 ):
     await service.upsert_daily_metrics(connection_id, payloads, current_user)
+    if payloads:
+        await derived_service.recompute(connection_id, min(payload.date for payload in payloads))
+    # Commit at the route boundary, then drop cached aggregates for the connection.
+    await service.db.commit()
+    if payloads:
+        await service.invalidate_cached_metrics([connection_id])
     return None
 
 
-@router.get("/{connection_id}/kpis", response_model=MetricsKpiResponse)
-async def get_kpis(
-    connection_id: str,
-    start_date: date,
-    end_date: date,
-    compare_start: date | None = None,
-    compare_end: date | None = None,
-    service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
-    connection_service: Ga4ConnectionCrudService = Depends(get_connection_service),
-):
-    kpis = await service.get_kpis(connection_id, start_date, end_date, compare_start, compare_end)
-    connection = await connection_service.get_connection(connection_id)
-    if connection:
-        kpis.last_synced_at = connection.last_synced_at
-    return kpis
+def _check_dimension(dimension: str) -> str:
+    if dimension not in BREAKDOWN_DIMENSIONS:
+        raise HTTPException(status_code=400, detail=f"Unknown dimension '{dimension}'")
+    return dimension
 
 
-@router.get("/{connection_id}/timeseries", response_model=MetricsTimeSeriesResponse)
-async def get_time_series(
-    connection_id: str,
+def _breakdown_chart(items) -> dict:
+    """Breakdown items as a chart-widget category/series payload."""
+    return {
+        "categories": [item.dimension_value for item in items],
+        "series": [
+            {"name": "Sessions", "data": [item.sessions for item in items]},
+            {"name": "Conversions", "data": [item.conversions for item in items]},
+        ],
+    }
+
+
+def _parse_ids(csv: str | None) -> List[str]:
+    if not csv:
+        return []
+    return [part.strip() for part in csv.split(",") if part.strip()]
+
+
+# Rollup (multi-connection) endpoints. Declared before the /{connection_id}/...
+# routes, otherwise "rollup" is matched as a connection id.
+
+@router.get("/rollup/kpis", response_model=MetricsKpiResponse)
+async def get_rollup_kpis(
+    connection_ids: str,
     start_date: date,
     end_date: date,
+    compare_start: date | None = None,
+    compare_end: date | None = None,
     service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
 ):
-    points = await service.get_time_series(connection_id, start_date, end_date)
-    return MetricsTimeSeriesResponse(points=points)
+    ids = _parse_ids(connection_ids)
+    return await service.get_rollup_kpis(ids, start_date, end_date, compare_start, compare_end)
 
 
-@router.get("/{connection_id}/timeseries_chart")
-async def get_time_series_chart(
-    connection_id: str,
+@router.get("/rollup/timeseries_chart")
+async def get_rollup_time_series_chart(
+    connection_ids: str,
     start_date: date,
     end_date: date,
     metrics: str = "sessions,users",
     service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
 ):
-    """
-    Return time series in chart-widget friendly format.
-    metrics: comma-separated keys (sessions,users,conversions,engagement_rate,bounce_rate,new_users,avg_engagement_time,conversion_rate,conversions_per_1k)
-    """
-    requested = [m.strip() for m in metrics.split(",") if m.strip()]
-    points = await service.get_time_series(connection_id, start_date, end_date)
+    ids = _parse_ids(connection_ids)
+    points = await service.get_time_series_multi(ids, start_date, end_date)
     if not points:
         return {"categories": [], "series": []}
+    requested = [m.strip() for m in metrics.split(",") if m.strip()]
     categories = [p.date.isoformat() for p in points]
 
     def pick(metric_key):
@@ -112,40 +139,123 @@ async def get_rollup_top(
     return {"items": result}
 
 
-# Rollup (multi-connection) endpoints
-
-def _parse_ids(csv: str | None) -> List[str]:
-    if not csv:
-        return []
-    return [part.strip() for part in csv.split(",") if part.strip()]
+@router.get("/rollup/breakdown", response_model=MetricsBreakdownResponse)
+async def get_rollup_breakdown(
+    connection_ids: str,
+    start_date: date,
+    end_date: date,
+    dimension: str = "channel",
+    limit: int = 10,
+    service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
+):
+    _check_dimension(dimension)
+    items = await service.get_dimension_breakdown(_parse_ids(connection_ids), dimension, start_date, end_date, limit=limit)
+    return MetricsBreakdownResponse(dimension=dimension, items=items)
 
 
-@router.get("/rollup/kpis", response_model=MetricsKpiResponse)
-async def get_rollup_kpis(
+@router.get("/rollup/breakdown_chart")
+async def get_rollup_breakdown_chart(
     connection_ids: str,
     start_date: date,
     end_date: date,
+    dimension: str = "channel",
+    limit: int = 10,
+    service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
+):
+    _check_dimension(dimension)
+    items = await service.get_dimension_breakdown(_parse_ids(connection_ids), dimension, start_date, end_date, limit=limit)
+    return _breakdown_chart(items)
+
+
+# Single-connection endpoints
+
+
+@router.get("/{connection_id}/breakdown", response_model=MetricsBreakdownResponse)
+async def get_breakdown(
+    connection_id: str,
+    start_date: date,
+    end_date: date,
+    dimension: str = "channel",
+    limit: int = 10,
+    service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
+):
+    _check_dimension(dimension)
+    items = await service.get_dimension_breakdown([connection_id], dimension, start_date, end_date, limit=limit)
+    return MetricsBreakdownResponse(dimension=dimension, items=items)
+
+
+@router.get("/{connection_id}/breakdown_chart")
+async def get_breakdown_chart(
+    connection_id: str,
+    start_date: date,
+    end_date: date,
+    dimension: str = "channel",
+    limit: int = 10,
+    service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
+):
+    _check_dimension(dimension)
+    items = await service.get_dimension_breakdown([connection_id], dimension, start_date, end_date, limit=limit)
+    return _breakdown_chart(items)
+
+
+@router.get("/{connection_id}/breakdown_timeseries_chart")
+async def get_breakdown_time_series_chart(
+    connection_id: str,
+    start_date: date,
+    end_date: date,
+    dimension: str = "channel",
+    metric: str = "sessions",
+    service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
+):
+    """Daily ``metric`` per dimension value (one series per value)."""
+    _check_dimension(dimension)
+    return await service.get_dimension_time_series([connection_id], dimension, start_date, end_date, metric=metric)
+
+
+@router.get("/{connection_id}/kpis", response_model=MetricsKpiResponse)
+async def get_kpis(
+    connection_id: str,
+    start_date: date,
+    end_date: date,
     compare_start: date | None = None,
     compare_end: date | None = None,
     service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
+    connection_service: Ga4ConnectionCrudService = Depends(get_connection_service),
 ):
-    ids = _parse_ids(connection_ids)
-    return await service.get_rollup_kpis(ids, start_date, end_date, compare_start, compare_end)
+    kpis = await service.get_kpis(connection_id, start_date, end_date, compare_start, compare_end)
+    connection = await connection_service.get_connection(connection_id)
+    if connection:
+        kpis.last_synced_at = connection.last_synced_at
+    return kpis
 
 
-@router.get("/rollup/timeseries_chart")
-async def get_rollup_time_series_chart(
-    connection_ids: str,
+@router.get("/{connection_id}/timeseries", response_model=MetricsTimeSeriesResponse)
+async def get_time_series(
+    connection_id: str,
+    start_date: date,
+    end_date: date,
+    service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
+):
+    points = await service.get_time_series(connection_id, start_date, end_date)
+    return MetricsTimeSeriesResponse(points=points)
+
+
+@router.get("/{connection_id}/timeseries_chart")
+async def get_time_series_chart(
+    connection_id: str,
     start_date: date,
     end_date: date,
     metrics: str = "sessions,users",
     service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
 ):
-    ids = _parse_ids(connection_ids)
-    points = await service.get_time_series_multi(ids, start_date, end_date)
+    """
+    Return time series in chart-widget friendly format.
+    metrics: comma-separated keys (sessions,users,conversions,engagement_rate,bounce_rate,new_users,avg_engagement_time,conversion_rate,conversions_per_1k)
+    """
+    requested = [m.strip() for m in metrics.split(",") if m.strip()]
+    points = await service.get_time_series(connection_id, start_date, end_date)
     if not points:
         return {"categories": [], "series": []}
-    requested = [m.strip() for m in metrics.split(",") if m.strip()]
     categories = [p.date.isoformat() for p in points]
 
     def pick(metric_key):
@@ -158,3 +268,28 @@ async def get_rollup_time_series_chart(
         series.append({"name": key.replace("_", " ").title(), "data": pick(key)})
 
     return {"categories": categories, "series": series}
+
+
+@router.get("/{connection_id}/derived_chart")
+async def get_derived_chart(
+    connection_id: str,
+    start_date: date,
+    end_date: date,
+    metric: str = "sessions",
+    service: Ga4MetricsQueryService = Depends(get_metrics_query_service),
+):
+    """Daily ``metric`` with its precomputed 7/28-day moving averages, chart-widget format."""
+    points = await service.get_time_series(connection_id, start_date, end_date)
+    derived = await service.get_derived_series(connection_id, start_date, end_date)
+    if not points or not hasattr(points[0], metric):
+        return {"categories": [], "series": []}
+    averages = {row["date"]: row["moving_averages"].get(metric) or {} for row in derived}
+    label = metric.replace("_", " ").title()
+    return {
+        "categories": [p.date.isoformat() for p in points],
+        "series": [
+            {"name": label, "data": [getattr(p, metric) for p in points]},
+            {"name": f"{label} (7-day avg)", "data": [averages.get(p.date, {}).get("ma7") for p in points]},
+            {"name": f"{label} (28-day avg)", "data": [averages.get(p.date, {}).get("ma28") for p in points]},
+        ],
+    }
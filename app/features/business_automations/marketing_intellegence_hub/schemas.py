@@ -110,6 +110,32 @@ class MetricsTimeSeriesResponse(BaseModel):
     points: List[MetricsTimeSeriesPoint]
 
 
+class Ga4DimensionMetricPayload(BaseModel):
+    date: date
+    dimension: constr(strip_whitespace=True, max_length=32)
+    dimension_value: constr(max_length=255)
+    sessions: Optional[float] = None
+    users: Optional[float] = None
+    new_users: Optional[float] = None
+    conversions: Optional[float] = None
+    engaged_sessions: Optional[float] = None
+
+
+class MetricsBreakdownItem(BaseModel):
+    dimension_value: str
+    sessions: Optional[float] = None
+    users: Optional[float] = None
+    new_users: Optional[float] = None
+    conversions: Optional[float] = None
+    engaged_sessions: Optional[float] = None
+    share: Optional[float] = None  # share of sessions across returned + other values
+
+
+class MetricsBreakdownResponse(BaseModel):
+    dimension: str
+    items: List[MetricsBreakdownItem]
+
+
 # Insights
 
 class Ga4InsightCreate(BaseModel):
@@ -128,6 +154,8 @@ class Ga4InsightResponse(BaseModel):
     content: str
     source: str
     generated_at: datetime
+    score: Optional[float] = None
+    details: Optional[Dict[str, Any]] = None
 
     class Config:
         orm_mode = True
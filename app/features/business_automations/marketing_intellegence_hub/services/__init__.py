@@ -1,14 +1,18 @@
 from .connections.crud_services import Ga4ConnectionCrudService
 from .metrics.crud_services import Ga4MetricsIngestionService, Ga4MetricsQueryService
+from .metrics.derived_metrics import Ga4DerivedMetricsService
 from .insights.crud_services import Ga4InsightCrudService
 from .reports.crud_services import Ga4ReportCrudService
 from .clients.crud_services import Ga4ClientCrudService
+from .sync import Ga4FleetSyncService
 
 __all__ = [
     "Ga4ConnectionCrudService",
     "Ga4MetricsIngestionService",
     "Ga4MetricsQueryService",
+    "Ga4DerivedMetricsService",
     "Ga4InsightCrudService",
     "Ga4ReportCrudService",
     "Ga4ClientCrudService",
+    "Ga4FleetSyncService",
 ]
@@ -1,4 +1,5 @@
 from .crud_services import Ga4InsightCrudService
 from .insights_service import Ga4InsightsService
+from .anomaly_service import Ga4AnomalyDetectionService
 
-__all__ = ["Ga4InsightCrudService", "Ga4InsightsService"]
+__all__ = ["Ga4InsightCrudService", "Ga4InsightsService", "Ga4AnomalyDetectionService"]
@@ -0,0 +1,352 @@
+"""Portfolio-wide GA4 anomaly detection (seasonal baseline + robust z-scores)."""
+
+from __future__ import annotations
+
+import json
+import time
+import warnings
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import delete
+
+from app.features.core.audit_mixin import AuditContext
+from app.features.core.config import get_settings
+from app.features.core.sqlalchemy_imports import AsyncSession, select, get_logger
+from app.features.core.enhanced_base_service import BaseService
+from app.features.administration.secrets.services import SecretsManagementService
+
+from ...models import Ga4Connection, Ga4DailyMetric, Ga4Insight
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+ANOMALY_METRICS = ("sessions", "conversions", "engagement_rate", "conversion_rate")
+# Metrics whose baseline volume is compared against MIN_BASELINE_VOLUME.
+VOLUME_METRICS = {"sessions", "conversions"}
+# Same-weekday observations in the seasonal baseline.
+SEASONAL_WEEKS = int(getattr(settings, "GA4_ANOMALY_SEASONAL_WEEKS", 8))
+# |robust z| at which a deviation is reported (3.5 is the usual MAD cut-off).
+ZSCORE_THRESHOLD = float(getattr(settings, "GA4_ANOMALY_ZSCORE_THRESHOLD", 3.5))
+# Ignore properties whose baseline is too small for percentages to mean much.
+MIN_BASELINE_VOLUME = float(getattr(settings, "GA4_ANOMALY_MIN_BASELINE_VOLUME", 20))
+# Insights kept per tenant per run; only these are sent to the LLM.
+MAX_INSIGHTS_PER_TENANT = int(getattr(settings, "GA4_ANOMALY_MAX_INSIGHTS", 20))
+LLM_MODEL = getattr(settings, "GA4_ANOMALY_LLM_MODEL", "gpt-4o-mini")
+
+# Scales MAD to a standard deviation for normally distributed data.
+MAD_SCALE = 1.4826
+SUMMARY_TYPE = "anomaly"
+
+Narrator = Callable[[str, List["Anomaly"]], Awaitable[List[str]]]
+
+
+def robust_seasonal_scores(matrix: np.ndarray, eval_days: int, weeks: int = SEASONAL_WEEKS):
+    """
+    Score the last ``eval_days`` columns of a (connections x days) matrix.
+
+    The baseline for each cell is the median of the same weekday over the
+    previous ``weeks`` weeks; spread is the MAD of those values (floored at 5%
+    of the baseline so flat series do not produce infinite scores). NaN cells
+    are missing days. Returns ``(zscores, baselines)`` shaped
+    (connections, eval_days).
+    """
+    connections, days = matrix.shape
+    start = days - eval_days
+    # columns[t, k] is the day k+1 weeks before evaluated day t.
+    columns = np.arange(start, days)[:, None] - 7 * np.arange(1, weeks + 1)[None, :]
+    valid = columns >= 0
+    history = np.where(valid[None, :, :], matrix[:, np.clip(columns, 0, None)], np.nan)
+
+    enough = np.sum(~np.isnan(history), axis=2) >= max(3, weeks // 2)
+    with np.errstate(all="ignore"), warnings.catch_warnings():
+        # All-NaN slices (new properties) are expected and masked below.
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        baseline = np.nanmedian(history, axis=2)
+        mad = np.nanmedian(np.abs(history - baseline[:, :, None]), axis=2) * MAD_SCALE
+        spread = np.maximum(mad, np.abs(baseline) * 0.05)
+        zscores = (matrix[:, start:] - baseline) / spread
+    zscores[~enough | ~np.isfinite(zscores)] = np.nan
+    return zscores, baseline
+
+
+@dataclass
+class Anomaly:
+    tenant_id: str
+    connection_id: str
+    connection_name: str
+    metric: str
+    day: date
+    value: float
+    baseline: float
+    zscore: float
+    narrative: Optional[str] = None
+
+    @property
+    def change_pct(self) -> Optional[float]:
+        if not self.baseline:
+            return None
+        return round((self.value - self.baseline) / self.baseline * 100, 1)
+
+    @property
+    def score(self) -> float:
+        return abs(self.zscore)
+
+    def template_text(self) -> str:
+        direction = "above" if self.zscore > 0 else "below"
+        label = self.metric.replace("_", " ")
+        change = f" ({self.change_pct:+.1f}%)" if self.change_pct is not None else ""
+        return (
+            f"{self.connection_name}: {label} on {self.day:%b %d} was {self.value:,.2f}{change}, "
+            f"{abs(self.zscore):.1f} robust SDs {direction} the usual {self.day:%A}."
+        )
+
+    def details(self) -> Dict[str, Any]:
+        return {
+            "metric": self.metric,
+            "date": self.day.isoformat(),
+            "value": self.value,
+            "baseline": self.baseline,
+            "zscore": round(self.zscore, 3),
+            "change_pct": self.change_pct,
+        }
+
+
+@dataclass
+class AnomalyRunResult:
+    connections: int = 0
+    days: int = 0
+    anomalies: int = 0
+    insights: int = 0
+    narrated: int = 0
+    duration_ms: int = 0
+    tenants: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "connections": self.connections,
+            "days": self.days,
+            "anomalies": self.anomalies,
+            "insights": self.insights,
+            "narrated": self.narrated,
+            "duration_ms": self.duration_ms,
+            "tenants": self.tenants,
+        }
+
+
+class Ga4AnomalyDetectionService(BaseService[Ga4Insight]):
+    """
+    Detect unusual days across every GA4 connection in one pass.
+
+    All active connections' recent daily metrics are read with a single query
+    and pivoted into a (connections x days) matrix per metric; seasonal
+    baselines and robust z-scores are then computed for the whole portfolio
+    with NumPy. Only the strongest deviation per connection is kept, ranked
+    by score, and only those rows are sent to the LLM for narrative text.
+    ``tenant_id=None`` runs across all tenants.
+    """
+
+    def __init__(self, db_session: AsyncSession, tenant_id: Optional[str] = None, narrator: Optional[Narrator] = None):
+        super().__init__(db_session, tenant_id)
+        self.narrator = narrator or self._llm_narrate
+
+    async def load_matrix(self, start: date, end: date):
+        """Return (connection rows, {metric: matrix}) for active connections over [start, end]."""
+        stmt = (
+            select(
+                Ga4DailyMetric.connection_id,
+                Ga4DailyMetric.date,
+                *(getattr(Ga4DailyMetric, metric) for metric in ANOMALY_METRICS),
+            )
+            .join(Ga4Connection, Ga4Connection.id == Ga4DailyMetric.connection_id)
+            .where(
+                Ga4Connection.status == "active",
+                Ga4DailyMetric.date >= start,
+                Ga4DailyMetric.date <= end,
+            )
+        )
+        if self.tenant_id is not None:
+            stmt = stmt.where(Ga4DailyMetric.tenant_id == self.tenant_id)
+        rows = (await self.db.execute(stmt)).all()
+
+        connections_stmt = select(
+            Ga4Connection.id, Ga4Connection.tenant_id, Ga4Connection.client_name,
+            Ga4Connection.property_name, Ga4Connection.property_id,
+        ).where(Ga4Connection.status == "active")
+        if self.tenant_id is not None:
+            connections_stmt = connections_stmt.where(Ga4Connection.tenant_id == self.tenant_id)
+        connections = (await self.db.execute(connections_stmt)).all()
+        return connections, build_matrices(rows, [c[0] for c in connections], start, end)
+
+    async def run(self, as_of: Optional[date] = None, eval_days: int = 1) -> AnomalyRunResult:
+        """
+        Detect anomalies for the ``eval_days`` days ending ``as_of`` (default
+        yesterday, the last complete GA4 day) and store ranked insights.
+        """
+        started = time.monotonic()
+        as_of = as_of or (date.today() - timedelta(days=1))
+        start = as_of - timedelta(days=eval_days - 1 + 7 * SEASONAL_WEEKS)
+        try:
+            connections, matrices = await self.load_matrix(start, as_of)
+            result = AnomalyRunResult(connections=len(connections), days=(as_of - start).days + 1)
+            anomalies = detect_anomalies(connections, matrices, start, eval_days)
+            result.anomalies = len(anomalies)
+            # Reruns replace the whole window, including connections that no longer have anomalies.
+            await self._clear([c[0] for c in connections], as_of, eval_days)
+
+            by_tenant: Dict[str, List[Anomaly]] = {}
+            for anomaly in anomalies:
+                by_tenant.setdefault(anomaly.tenant_id, []).append(anomaly)
+
+            for tenant_id, items in by_tenant.items():
+                ranked = sorted(items, key=lambda a: a.score, reverse=True)[:MAX_INSIGHTS_PER_TENANT]
+                narratives = await self._narrate(tenant_id, ranked)
+                for anomaly, text in zip(ranked, narratives):
+                    anomaly.narrative = text
+                result.narrated += sum(1 for a in ranked if a.narrative)
+                await self._store(tenant_id, ranked)
+                result.insights += len(ranked)
+                result.tenants[tenant_id] = len(ranked)
+
+            result.duration_ms = int((time.monotonic() - started) * 1000)
+            logger.info("GA4 anomaly detection finished", **{k: v for k, v in result.to_dict().items() if k != "tenants"})
+            return result
+        except Exception as exc:
+            await self.handle_error("run", exc)
+
+    async def _clear(self, connection_ids: Sequence[str], as_of: date, eval_days: int) -> None:
+        """Delete the anomaly insights of every processed connection for this run's window."""
+        if not connection_ids:
+            return
+        days = [(as_of - timedelta(days=offset)).isoformat() for offset in range(eval_days)]
+        stmt = delete(Ga4Insight).where(
+            Ga4Insight.summary_type == SUMMARY_TYPE,
+            Ga4Insight.connection_id.in_(list(connection_ids)),
+            Ga4Insight.details["date"].astext.in_(days),
+        )
+        if self.tenant_id is not None:
+            stmt = stmt.where(Ga4Insight.tenant_id == self.tenant_id)
+        await self.db.execute(stmt.execution_options(synchronize_session=False))
+
+    async def _store(self, tenant_id: str, anomalies: List[Anomaly]) -> None:
+        """Insert a tenant's ranked anomaly insights (the window was cleared by ``_clear``)."""
+        audit = AuditContext.system()
+        for anomaly in anomalies:
+            insight = Ga4Insight(
+                tenant_id=tenant_id,
+                connection_id=anomaly.connection_id,
+                period="daily",
+                summary_type=SUMMARY_TYPE,
+                content=anomaly.narrative or anomaly.template_text(),
+                source="ai" if anomaly.narrative else "anomaly",
+                score=round(anomaly.score, 4),
+                details=anomaly.details(),
+            )
+            insight.set_created_by(audit.user_email, audit.user_name)
+            self.db.add(insight)
+        await self.db.flush()
+
+    async def _narrate(self, tenant_id: str, anomalies: List[Anomaly]) -> List[Optional[str]]:
+        if not anomalies:
+            return []
+        try:
+            narratives = await self.narrator(tenant_id, anomalies)
+            if len(narratives) == len(anomalies):
+                return [text.strip() if text and text.strip() else None for text in narratives]
+            logger.warning("Anomaly narratives did not match anomalies", tenant_id=tenant_id)
+        except Exception as exc:
+            logger.warning("Anomaly narration failed, using templates", tenant_id=tenant_id, error=str(exc))
+        return [None] * len(anomalies)
+
+    async def _llm_narrate(self, tenant_id: str, anomalies: List[Anomaly]) -> List[str]:
+        """One OpenAI call per tenant for all of its significant anomalies."""
+        from openai import AsyncOpenAI
+
+        secrets_service = SecretsManagementService(self.db, tenant_id)
+        secret = await secrets_service.get_secret_by_name("OpenAI API Key")
+        if not secret:
+            raise ValueError("OpenAI API key not configured in Secrets Management")
+        secret_value = await secrets_service.get_secret_value(secret_id=secret.id, accessed_by_user=AuditContext.system())
+        if not secret_value or not secret_value.value:
+            raise ValueError("Failed to retrieve OpenAI API key value")
+
+        facts = [{"property": a.connection_name, **a.details()} for a in anomalies]
+        client = AsyncOpenAI(api_key=secret_value.value)
+        response = await client.chat.completions.create(
+            model=LLM_MODEL,
+            temperature=0.3,
+            messages=[
+                {
+                    "role": "system",
+                    "content": (
+                        "You write one-sentence analytics alerts for a marketing agency. "
+                        "Each alert states the property, metric, date and the size of the change "
+                        "versus its usual same-weekday level. No speculation about causes."
+                    ),
+                },
+                {
+                    "role": "user",
+                    "content": (
+                        'Return JSON {"narratives": [...]} with one string per item, same order.\n'
+                        + json.dumps(facts)
+                    ),
+                },
+            ],
+            response_format={"type": "json_object"},
+        )
+        payload = json.loads(response.choices[0].message.content)
+        return [str(text) for text in payload.get("narratives", [])]
+
+
+def build_matrices(rows: Sequence[Sequence[Any]], connection_ids: Sequence[str], start: date, end: date) -> Dict[str, np.ndarray]:
+    """Pivot (connection_id, date, *ANOMALY_METRICS) rows into one NaN-filled matrix per metric."""
+    days = (end - start).days + 1
+    index = {connection_id: position for position, connection_id in enumerate(connection_ids)}
+    matrices = {metric: np.full((len(connection_ids), days), np.nan) for metric in ANOMALY_METRICS}
+    kept = [row for row in rows if row[0] in index]
+    if not kept:
+        return matrices
+    row_index = np.fromiter((index[row[0]] for row in kept), dtype=np.int64, count=len(kept))
+    col_index = np.fromiter(((row[1] - start).days for row in kept), dtype=np.int64, count=len(kept))
+    for position, metric in enumerate(ANOMALY_METRICS):
+        values = np.array([np.nan if row[2 + position] is None else float(row[2 + position]) for row in kept])
+        matrices[metric][row_index, col_index] = values
+    return matrices
+
+
+def detect_anomalies(
+    connections: Sequence[Sequence[Any]],
+    matrices: Dict[str, np.ndarray],
+    start: date,
+    eval_days: int,
+    threshold: float = ZSCORE_THRESHOLD,
+) -> List[Anomaly]:
+    """Strongest significant deviation per connection across all metrics."""
+    best: Dict[int, Anomaly] = {}
+    for metric, matrix in matrices.items():
+        if matrix.size == 0:
+            continue
+        zscores, baselines = robust_seasonal_scores(matrix, eval_days)
+        significant = np.abs(zscores) >= threshold
+        if metric in VOLUME_METRICS:
+            significant &= baselines >= MIN_BASELINE_VOLUME
+        first_eval = matrix.shape[1] - eval_days
+        for row, column in zip(*np.nonzero(significant)):
+            zscore = float(zscores[row, column])
+            current = best.get(int(row))
+            if current is not None and current.score >= abs(zscore):
+                continue
+            connection_id, tenant_id, client_name, property_name, property_id = connections[row]
+            best[int(row)] = Anomaly(
+                tenant_id=tenant_id,
+                connection_id=connection_id,
+                connection_name=client_name or property_name or property_id,
+                metric=metric,
+                day=start + timedelta(days=first_eval + int(column)),
+                value=float(matrix[row, first_eval + column]),
+                baseline=float(baselines[row, column]),
+                zscore=zscore,
+            )
+    return sorted(best.values(), key=lambda a: a.score, reverse=True)
@@ -27,6 +27,22 @@ class Ga4InsightCrudService(BaseService[Ga4Insight]):
         except Exception as exc:
             await self.handle_error("list_insights", exc, connection_id=connection_id)
 
+    async def list_ranked_anomalies(self, limit: int = 50) -> List[Ga4Insight]:
+        """Most significant detected anomalies across the tenant's connections."""
+        try:
+            stmt = select(Ga4Insight).where(Ga4Insight.summary_type == "anomaly")
+            if self.tenant_id is not None:
+                stmt = stmt.where(Ga4Insight.tenant_id == self.tenant_id)
+            # Latest anomaly day first, strongest deviation first within a day.
+            stmt = stmt.order_by(
+                Ga4Insight.details["date"].astext.desc(),
+                Ga4Insight.score.desc().nullslast(),
+            ).limit(limit)
+            result = await self.db.execute(stmt)
+            return list(result.scalars().all())
+        except Exception as exc:
+            await self.handle_error("list_ranked_anomalies", exc)
+
     async def create_insight(self, connection_id: str, payload: Ga4InsightCreate, user=None) -> Ga4Insight:
         try:
             audit = AuditContext.from_user(user) if user else None
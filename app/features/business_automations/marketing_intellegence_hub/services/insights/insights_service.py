@@ -7,6 +7,9 @@ from typing import Optional
 
 from app.features.business_automations.marketing_intellegence_hub.services.metrics.crud_services import Ga4MetricsQueryService
 
+# |z| at which a day is called out as unusual.
+ANOMALY_ZSCORE = 2.0
+
 
 class Ga4InsightsService:
     def __init__(self, metrics_service: Ga4MetricsQueryService):
@@ -41,6 +44,16 @@ class Ga4InsightsService:
         if pct("engagement_rate"):
             parts.append(f"engagement {pct('engagement_rate')}")
 
+        # Flag unusual recent days from the z-scores precomputed at sync time.
+        latest = await self.metrics_service.get_latest_derived(connection_id, end_date)
+        if latest:
+            for key, label in (("conversions", "conversions"), ("sessions", "sessions")):
+                zscore = (latest["changes"].get(key) or {}).get("zscore")
+                if zscore is not None and abs(zscore) >= ANOMALY_ZSCORE:
+                    direction = "above" if zscore > 0 else "below"
+                    parts.append(f"{label} on {latest['date']:%b %d} {abs(zscore):.1f}σ {direction} 28-day norm")
+                    break
+
         if not parts:
             return "No significant change detected."
         return " | ".join(parts)
@@ -2,212 +2,239 @@
 
 from __future__ import annotations
 
+import uuid
 from datetime import date
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
 
-from app.features.core.sqlalchemy_imports import AsyncSession, select, func, and_
+from sqlalchemy import or_, tuple_
+
+from app.features.core.config import get_settings
+from app.features.core.sqlalchemy_imports import AsyncSession, select, func, and_, pg_insert
 from app.features.core.enhanced_base_service import BaseService
 from app.features.core.audit_mixin import AuditContext
 
-from ...models import Ga4DailyMetric
-from ...schemas import Ga4DailyMetricPayload, MetricsKpiResponse, MetricsTimeSeriesPoint
+from .derived_metrics import compute_period_deltas
+from .metrics_cache import MetricsCache, cache_key, get_metrics_cache
+from ...models import Ga4DailyMetric, Ga4DimensionMetric
+from ...schemas import (
+    Ga4DailyMetricPayload,
+    Ga4DimensionMetricPayload,
+    MetricsBreakdownItem,
+    MetricsKpiResponse,
+    MetricsTimeSeriesPoint,
+)
+
+settings = get_settings()
+
+# Rows per INSERT ... ON CONFLICT statement.
+UPSERT_CHUNK_SIZE = int(getattr(settings, "GA4_METRICS_UPSERT_CHUNK_SIZE", 1000))
+# asyncpg/Postgres bind parameter limit per statement.
+MAX_BIND_PARAMS = 32767
+
+KPI_FIELDS = (
+    "sessions",
+    "users",
+    "conversions",
+    "engagement_rate",
+    "bounce_rate",
+    "new_users",
+    "avg_engagement_time",
+    "conversion_rate",
+    "conversions_per_1k",
+)
+# Volumes are summed, rates and durations averaged over the (connection, day) rows.
+KPI_AGGREGATES = {
+    key: func.sum if key in {"sessions", "users", "conversions", "new_users"} else func.avg
+    for key in KPI_FIELDS
+}
+
+DIMENSION_METRIC_FIELDS = ("sessions", "users", "new_users", "conversions", "engaged_sessions")
+DIMENSION_KEY_FIELDS = ("tenant_id", "connection_id", "date", "dimension", "dimension_value")
 
 
 class Ga4MetricsIngestionService(BaseService[Ga4DailyMetric]):
     """Store daily GA4 metrics with derived calculations."""
 
-    def __init__(self, db_session: AsyncSession, tenant_id: Optional[str]):
+    def __init__(self, db_session: AsyncSession, tenant_id: Optional[str], cache: Optional[MetricsCache] = None):
         super().__init__(db_session, tenant_id)
+        self.cache = cache or get_metrics_cache()
 
-    async def upsert_daily_metrics(self, connection_id: str, payloads: Sequence[Ga4DailyMetricPayload], user=None) -> None:
+    async def upsert_daily_metrics(
+        self,
+        connection_id: str,
+        payloads: Sequence[Ga4DailyMetricPayload],
+        user=None,
+        chunk_size: Optional[int] = None,
+    ) -> int:
+        """
+        Insert or update daily metrics with set-based upserts.
+
+        Rows are written with ``INSERT ... ON CONFLICT (tenant_id, connection_id,
+        date) DO UPDATE`` in chunks. Only the fields set on each payload are
+        written, and the update is skipped (``IS DISTINCT FROM`` guard) when
+        none of them changed, so re-syncing identical days touches no rows and
+        leaves the audit columns alone. When a date appears more than once the
+        last payload wins. Callers invalidate cached dashboard aggregates with
+        ``invalidate_cached_metrics`` once the transaction has committed.
+
+        Returns:
+            Number of rows inserted or actually updated
+        """
         try:
+            # One statement cannot touch the same row twice, so dedupe by date first.
+            latest: Dict[date, Dict[str, Any]] = {}
             for payload in payloads:
-                # ensure tenant scope
-                stmt = select(Ga4DailyMetric).where(
-                    Ga4DailyMetric.connection_id == connection_id,
-                    Ga4DailyMetric.tenant_id == self.tenant_id,
-                    Ga4DailyMetric.date == payload.date,
-                )
-                existing = (await self.db.execute(stmt)).scalar_one_or_none()
+                latest[payload.date] = payload.model_dump(exclude_unset=True)
 
-                values = payload.model_dump()
-                if existing:
-                    for key, value in values.items():
-                        setattr(existing, key, value)
-                    metric = existing
-                else:
-                    metric = Ga4DailyMetric(
-                        tenant_id=self.tenant_id,
-                        connection_id=connection_id,
-                        **values,
-                    )
-                    self.db.add(metric)
-
-                if user:
-                    audit = AuditContext.from_user(user)
-                    metric.set_updated_by(audit.user_email, audit.user_name)
-
-            await self.db.flush()
+            audit = AuditContext.from_user(user) if user else None
+            groups: Dict[FrozenSet[str], List[Dict[str, Any]]] = {}
+            for values in latest.values():
+                groups.setdefault(frozenset(values), []).append(values)
+
+            written = 0
+            for fields, rows in groups.items():
+                written += await self._upsert_rows(connection_id, sorted(fields - {"date"}), rows, audit, chunk_size)
+            return written
         except Exception as exc:
             await self.handle_error("upsert_daily_metrics", exc, connection_id=connection_id)
 
+    async def invalidate_cached_metrics(self, connection_ids: Sequence[str]) -> None:
+        """
+        Drop cached dashboard aggregates covering ``connection_ids``.
 
-class Ga4MetricsQueryService(BaseService[Ga4DailyMetric]):
-    """Query KPIs and time series for GA4 metrics."""
+        Call after committing the write: invalidating earlier lets a concurrent
+        read cache the pre-commit rows under the new generation for the whole TTL.
+        """
+        await self.cache.invalidate(list(connection_ids))
 
-    def __init__(self, db_session: AsyncSession, tenant_id: Optional[str]):
-        super().__init__(db_session, tenant_id)
+    async def _upsert_rows(
+        self,
+        connection_id: str,
+        metric_fields: List[str],
+        rows: List[Dict[str, Any]],
+        audit: Optional[AuditContext],
+        chunk_size: Optional[int],
+    ) -> int:
+        audit_values: Dict[str, Any] = {}
+        if audit:
+            audit_values = {"updated_by_email": audit.user_email, "updated_by_name": audit.user_name}
 
-    async def get_kpis(self, connection_id: str, start: date, end: date, compare_start: Optional[date] = None, compare_end: Optional[date] = None) -> MetricsKpiResponse:
-        current = await self._aggregate_range(connection_id, start, end)
-        deltas: Dict[str, float] = {}
-        available_start, available_end = await self._get_available_range(connection_id)
+        columns_per_row = len(metric_fields) + len(audit_values) + 4
+        size = max(1, min(chunk_size or UPSERT_CHUNK_SIZE, MAX_BIND_PARAMS // columns_per_row))
 
-        if compare_start and compare_end:
-            baseline = await self._aggregate_range(connection_id, compare_start, compare_end)
-            deltas = self._compute_deltas(current, baseline)
+        written = 0
+        for offset in range(0, len(rows), size):
+            chunk = [
+                {
+                    "id": str(uuid.uuid4()),
+                    "tenant_id": self.tenant_id,
+                    "connection_id": connection_id,
+                    **values,
+                    **audit_values,
+                }
+                for values in rows[offset:offset + size]
+            ]
+            stmt = pg_insert(Ga4DailyMetric).values(chunk)
+            excluded = stmt.excluded
+            set_: Dict[str, Any] = {field: getattr(excluded, field) for field in metric_fields}
+            set_.update({field: getattr(excluded, field) for field in audit_values})
+            set_["updated_at"] = func.now()
 
-        return MetricsKpiResponse(
-            sessions=current.get("sessions"),
-            users=current.get("users"),
-            conversions=current.get("conversions"),
-            engagement_rate=current.get("engagement_rate"),
-            bounce_rate=current.get("bounce_rate"),
-            new_users=current.get("new_users"),
-            avg_engagement_time=current.get("avg_engagement_time"),
-            conversion_rate=current.get("conversion_rate"),
-            conversions_per_1k=current.get("conversions_per_1k"),
-            deltas=deltas,
-            available_start=available_start,
-            available_end=available_end,
-        )
+            if metric_fields:
+                changed = tuple_(*(getattr(Ga4DailyMetric, field) for field in metric_fields)).is_distinct_from(
+                    tuple_(*(getattr(excluded, field) for field in metric_fields))
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["tenant_id", "connection_id", "date"],
+                    set_=set_,
+                    where=changed,
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=["tenant_id", "connection_id", "date"])
 
-    async def get_time_series(self, connection_id: str, start: date, end: date) -> List[MetricsTimeSeriesPoint]:
+            result = await self.db.execute(stmt.execution_options(synchronize_session=False))
+            written += max(result.rowcount or 0, 0)
+        return written
+
+    async def upsert_dimension_metrics(
+        self,
+        connection_id: str,
+        payloads: Sequence[Ga4DimensionMetricPayload],
+        chunk_size: Optional[int] = None,
+    ) -> int:
+        """
+        Bulk upsert per-dimension daily rows into ga4_dimension_metrics.
+
+        Same set-based approach as ``upsert_daily_metrics``: chunked
+        ``INSERT ... ON CONFLICT DO UPDATE`` on the natural key with an
+        ``IS DISTINCT FROM`` guard, last payload wins for duplicate keys.
+
+        Returns:
+            Number of rows inserted or actually updated
+        """
         try:
-            stmt = select(Ga4DailyMetric).where(
-                Ga4DailyMetric.connection_id == connection_id,
-                Ga4DailyMetric.date >= start,
-                Ga4DailyMetric.date <= end,
-            )
-            if self.tenant_id is not None:
-                stmt = stmt.where(Ga4DailyMetric.tenant_id == self.tenant_id)
-            stmt = stmt.order_by(Ga4DailyMetric.date.asc())
-            result = await self.db.execute(stmt)
-            rows = result.scalars().all()
-            return [
-                MetricsTimeSeriesPoint(
-                    date=row.date,
-                    sessions=float(row.sessions) if row.sessions is not None else None,
-                    users=float(row.users) if row.users is not None else None,
-                    conversions=float(row.conversions) if row.conversions is not None else None,
-                    engagement_rate=float(row.engagement_rate) if row.engagement_rate is not None else None,
-                    bounce_rate=float(row.bounce_rate) if row.bounce_rate is not None else None,
-                    new_users=float(row.new_users) if row.new_users is not None else None,
-                    avg_engagement_time=float(row.avg_engagement_time) if row.avg_engagement_time is not None else None,
-                    conversion_rate=float(row.conversion_rate) if row.conversion_rate is not None else None,
-                    conversions_per_1k=float(row.conversions_per_1k) if row.conversions_per_1k is not None else None,
+            latest: Dict[Tuple[date, str, str], Dict[str, Any]] = {}
+            for payload in payloads:
+                values = payload.model_dump()
+                latest[(payload.date, payload.dimension, payload.dimension_value)] = values
+            rows = list(latest.values())
+
+            columns_per_row = len(DIMENSION_KEY_FIELDS) + len(DIMENSION_METRIC_FIELDS)
+            size = max(1, min(chunk_size or UPSERT_CHUNK_SIZE, MAX_BIND_PARAMS // columns_per_row))
+            written = 0
+            for offset in range(0, len(rows), size):
+                chunk = [
+                    {"tenant_id": self.tenant_id, "connection_id": connection_id, **values}
+                    for values in rows[offset:offset + size]
+                ]
+                stmt = pg_insert(Ga4DimensionMetric).values(chunk)
+                excluded = stmt.excluded
+                set_: Dict[str, Any] = {field: getattr(excluded, field) for field in DIMENSION_METRIC_FIELDS}
+                set_["updated_at"] = func.now()
+                changed = tuple_(*(getattr(Ga4DimensionMetric, field) for field in DIMENSION_METRIC_FIELDS)).is_distinct_from(
+                    tuple_(*(getattr(excluded, field) for field in DIMENSION_METRIC_FIELDS))
                 )
-                for row in rows
-            ]
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=list(DIMENSION_KEY_FIELDS),
+                    set_=set_,
+                    where=changed,
+                )
+                result = await self.db.execute(stmt.execution_options(synchronize_session=False))
+                written += max(result.rowcount or 0, 0)
+            return written
         except Exception as exc:
-            await self.handle_error("get_time_series", exc, connection_id=connection_id)
-
-    async def _aggregate_range(self, connection_id: str, start: date, end: date) -> Dict[str, Optional[float]]:
-        stmt = select(
-            func.sum(Ga4DailyMetric.sessions),
-            func.sum(Ga4DailyMetric.users),
-            func.sum(Ga4DailyMetric.conversions),
-            func.avg(Ga4DailyMetric.engagement_rate),
-            func.avg(Ga4DailyMetric.bounce_rate),
-            func.sum(Ga4DailyMetric.new_users),
-            func.avg(Ga4DailyMetric.avg_engagement_time),
-            func.avg(Ga4DailyMetric.conversion_rate),
-            func.avg(Ga4DailyMetric.conversions_per_1k),
-        ).where(
-            Ga4DailyMetric.connection_id == connection_id,
-            Ga4DailyMetric.date >= start,
-            Ga4DailyMetric.date <= end,
-        )
-        if self.tenant_id is not None:
-            stmt = stmt.where(Ga4DailyMetric.tenant_id == self.tenant_id)
-        result = await self.db.execute(stmt)
-        row = result.one()
-        return {
-            "sessions": float(row[0]) if row[0] is not None else None,
-            "users": float(row[1]) if row[1] is not None else None,
-            "conversions": float(row[2]) if row[2] is not None else None,
-            "engagement_rate": float(row[3]) if row[3] is not None else None,
-            "bounce_rate": float(row[4]) if row[4] is not None else None,
-            "new_users": float(row[5]) if row[5] is not None else None,
-            "avg_engagement_time": float(row[6]) if row[6] is not None else None,
-            "conversion_rate": float(row[7]) if row[7] is not None else None,
-            "conversions_per_1k": float(row[8]) if row[8] is not None else None,
-        }
+            await self.handle_error("upsert_dimension_metrics", exc, connection_id=connection_id)
 
-    def _compute_deltas(self, current: Dict[str, Optional[float]], baseline: Dict[str, Optional[float]]) -> Dict[str, float]:
-        deltas: Dict[str, float] = {}
-        for key in [
-            "sessions",
-            "users",
-            "conversions",
-            "engagement_rate",
-            "bounce_rate",
-            "new_users",
-            "avg_engagement_time",
-            "conversion_rate",
-            "conversions_per_1k",
-        ]:
-            cur = current.get(key)
-            base = baseline.get(key)
-            if cur is None or base in (None, 0):
-                continue
-            deltas[key] = round(((cur - base) / base) * 100, 2)
-        return deltas
-
-    async def _get_available_range(self, connection_id: str) -> Tuple[Optional[date], Optional[date]]:
-        stmt = select(func.min(Ga4DailyMetric.date), func.max(Ga4DailyMetric.date)).where(
-            Ga4DailyMetric.connection_id == connection_id
-        )
-        if self.tenant_id is not None:
-            stmt = stmt.where(Ga4DailyMetric.tenant_id == self.tenant_id)
-        result = await self.db.execute(stmt)
-        row = result.one()
-        min_date = row[0]
-        max_date = row[1]
-        return (min_date, max_date)
+
+class Ga4MetricsQueryService(BaseService[Ga4DailyMetric]):
+    """
+    Query KPIs and time series for GA4 metrics.
+
+    KPIs (current and comparison window), the daily series and per-connection
+    totals for a connection set come from one grouping-sets query with
+    ``FILTER`` aggregates (see ``_snapshot``). Results are cached briefly per
+    (tenant, connection set, ranges) and invalidated by ingestion, so warm
+    dashboard loads do not aggregate in Postgres at all.
+    """
+
+    def __init__(self, db_session: AsyncSession, tenant_id: Optional[str], cache: Optional[MetricsCache] = None):
+        super().__init__(db_session, tenant_id)
+        self.cache = cache or get_metrics_cache()
+
+    async def get_kpis(self, connection_id: str, start: date, end: date, compare_start: Optional[date] = None, compare_end: Optional[date] = None) -> MetricsKpiResponse:
+        snapshot = await self._snapshot([connection_id], start, end, compare_start, compare_end)
+        available_start, available_end = (date.fromisoformat(d) if d else None for d in snapshot["available"])
+        return self._kpi_response(snapshot, available_start, available_end)
+
+    async def get_time_series(self, connection_id: str, start: date, end: date) -> List[MetricsTimeSeriesPoint]:
+        snapshot = await self._snapshot([connection_id], start, end)
+        return self._series_points(snapshot)
 
     async def aggregate_multi(self, connection_ids: List[str], start: date, end: date) -> Dict[str, Optional[float]]:
         if not connection_ids:
             return {}
-        stmt = select(
-            func.sum(Ga4DailyMetric.sessions),
-            func.sum(Ga4DailyMetric.users),
-            func.sum(Ga4DailyMetric.conversions),
-            func.avg(Ga4DailyMetric.engagement_rate),
-            func.avg(Ga4DailyMetric.bounce_rate),
-            func.sum(Ga4DailyMetric.new_users),
-            func.avg(Ga4DailyMetric.avg_engagement_time),
-            func.avg(Ga4DailyMetric.conversion_rate),
-            func.avg(Ga4DailyMetric.conversions_per_1k),
-        ).where(
-            Ga4DailyMetric.connection_id.in_(connection_ids),
-            Ga4DailyMetric.date >= start,
-            Ga4DailyMetric.date <= end,
-        )
-        if self.tenant_id is not None:
-            stmt = stmt.where(Ga4DailyMetric.tenant_id == self.tenant_id)
-        row = (await self.db.execute(stmt)).one()
-        return {
-            "sessions": float(row[0]) if row[0] is not None else None,
-            "users": float(row[1]) if row[1] is not None else None,
-            "conversions": float(row[2]) if row[2] is not None else None,
-            "engagement_rate": float(row[3]) if row[3] is not None else None,
-            "bounce_rate": float(row[4]) if row[4] is not None else None,
-            "new_users": float(row[5]) if row[5] is not None else None,
-            "avg_engagement_time": float(row[6]) if row[6] is not None else None,
-            "conversion_rate": float(row[7]) if row[7] is not None else None,
-            "conversions_per_1k": float(row[8]) if row[8] is not None else None,
-        }
+        snapshot = await self._snapshot(connection_ids, start, end)
+        return snapshot["current"]
 
     async def get_rollup_kpis(
         self,
@@ -217,99 +244,320 @@ class Ga4MetricsQueryService(BaseService[Ga4DailyMetric]):
         compare_start: Optional[date] = None,
         compare_end: Optional[date] = None,
     ) -> MetricsKpiResponse:
-        current = await self.aggregate_multi(connection_ids, start, end)
-        deltas: Dict[str, float] = {}
+        if not connection_ids:
+            return MetricsKpiResponse(**{key: None for key in KPI_FIELDS}, deltas={})
+        snapshot = await self._snapshot(connection_ids, start, end, compare_start, compare_end)
+        return self._kpi_response(snapshot, None, None)
 
-        if compare_start and compare_end:
-            baseline = await self.aggregate_multi(connection_ids, compare_start, compare_end)
-            deltas = self._compute_deltas(current, baseline)
+    async def get_time_series_multi(self, connection_ids: List[str], start: date, end: date) -> List[MetricsTimeSeriesPoint]:
+        if not connection_ids:
+            return []
+        snapshot = await self._snapshot(connection_ids, start, end)
+        return self._series_points(snapshot)
 
+    async def get_top_connections(self, connection_ids: List[str], start: date, end: date, limit: int = 5):
+        """Return top connections by conversions (fallback to sessions)."""
+        if not connection_ids:
+            return []
+        snapshot = await self._snapshot(connection_ids, start, end)
+        ranked = sorted(
+            snapshot["connections"],
+            key=lambda item: (
+                item["conversions"] is None,
+                -(item["conversions"] or 0.0),
+                item["sessions"] is None,
+                -(item["sessions"] or 0.0),
+            ),
+        )
+        return [
+            {
+                "connection_id": item["connection_id"],
+                "conversions": item["conversions"] if item["conversions"] is not None else 0.0,
+                "sessions": item["sessions"] if item["sessions"] is not None else 0.0,
+            }
+            for item in ranked[:limit]
+        ]
+
+    def _kpi_response(self, snapshot: Dict[str, Any], available_start: Optional[date], available_end: Optional[date]) -> MetricsKpiResponse:
+        current = snapshot["current"]
+        compare = snapshot["compare"]
+        deltas = compute_period_deltas(current, compare, KPI_FIELDS) if compare is not None else {}
         return MetricsKpiResponse(
-            sessions=current.get("sessions"),
-            users=current.get("users"),
-            conversions=current.get("conversions"),
-            engagement_rate=current.get("engagement_rate"),
-            bounce_rate=current.get("bounce_rate"),
-            new_users=current.get("new_users"),
-            avg_engagement_time=current.get("avg_engagement_time"),
-            conversion_rate=current.get("conversion_rate"),
-            conversions_per_1k=current.get("conversions_per_1k"),
+            **{key: current.get(key) for key in KPI_FIELDS},
             deltas=deltas,
-            available_start=None,
-            available_end=None,
+            available_start=available_start,
+            available_end=available_end,
         )
 
-    async def get_time_series_multi(self, connection_ids: List[str], start: date, end: date) -> List[MetricsTimeSeriesPoint]:
-        if not connection_ids:
-            return []
+    @staticmethod
+    def _series_points(snapshot: Dict[str, Any]) -> List[MetricsTimeSeriesPoint]:
+        return [
+            MetricsTimeSeriesPoint(date=date.fromisoformat(point["date"]), **{key: point.get(key) for key in KPI_FIELDS})
+            for point in snapshot["series"]
+        ]
+
+    async def _snapshot(
+        self,
+        connection_ids: List[str],
+        start: date,
+        end: date,
+        compare_start: Optional[date] = None,
+        compare_end: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """
+        Everything the dashboards need for a connection set, from one query.
+
+        ``GROUPING SETS ((), (date), (connection_id))`` yields the window totals,
+        the daily series and per-connection totals in one scan; the comparison
+        window is aggregated in the same pass with ``FILTER (WHERE date BETWEEN
+        ...)`` and the available date range comes from index-only subqueries.
+        The JSON-ready result is cached (see metrics_cache).
+        """
+        if not (compare_start and compare_end):
+            compare_start = compare_end = None
+        key = cache_key("ga4_snapshot", self.tenant_id, connection_ids, start, end, compare_start, compare_end)
+        lookup = await self.cache.get(connection_ids, key)
+        if lookup.hit:
+            return lookup.value
+
+        try:
+            snapshot = await self._query_snapshot(connection_ids, start, end, compare_start, compare_end)
+        except Exception as exc:
+            await self.handle_error("snapshot", exc, connection_ids=connection_ids)
+        await self.cache.set(key, snapshot, lookup.generations)
+        return snapshot
+
+    async def _query_snapshot(
+        self,
+        connection_ids: List[str],
+        start: date,
+        end: date,
+        compare_start: Optional[date],
+        compare_end: Optional[date],
+    ) -> Dict[str, Any]:
+        scope = [Ga4DailyMetric.connection_id.in_(connection_ids)]
+        if self.tenant_id is not None:
+            scope.append(Ga4DailyMetric.tenant_id == self.tenant_id)
+
+        in_current = Ga4DailyMetric.date.between(start, end)
+        in_compare = Ga4DailyMetric.date.between(compare_start, compare_end) if compare_start else None
+        available = [
+            select(bound(Ga4DailyMetric.date)).where(*scope).scalar_subquery()
+            for bound in (func.min, func.max)
+        ]
+
+        columns = [
+            func.grouping(Ga4DailyMetric.date),
+            func.grouping(Ga4DailyMetric.connection_id),
+            Ga4DailyMetric.date,
+            Ga4DailyMetric.connection_id,
+            *available,
+            *(KPI_AGGREGATES[key](getattr(Ga4DailyMetric, key)).filter(in_current) for key in KPI_FIELDS),
+        ]
+        if in_compare is not None:
+            columns += [KPI_AGGREGATES[key](getattr(Ga4DailyMetric, key)).filter(in_compare) for key in KPI_FIELDS]
+
         stmt = (
-            select(
+            select(*columns)
+            .where(*scope, or_(in_current, in_compare) if in_compare is not None else in_current)
+            .group_by(func.grouping_sets(
+                tuple_(),
+                tuple_(Ga4DailyMetric.date),
+                tuple_(Ga4DailyMetric.connection_id),
+            ))
+        )
+        rows = (await self.db.execute(stmt)).all()
+
+        def values(row, offset: int) -> Dict[str, Optional[float]]:
+            return {
+                key: float(row[offset + index]) if row[offset + index] is not None else None
+                for index, key in enumerate(KPI_FIELDS)
+            }
+
+        base = 6
+        snapshot: Dict[str, Any] = {
+            "current": {key: None for key in KPI_FIELDS},
+            "compare": {key: None for key in KPI_FIELDS} if in_compare is not None else None,
+            "series": [],
+            "connections": [],
+            "available": [None, None],
+        }
+        for row in rows:
+            by_date, by_connection = row[0], row[1]
+            snapshot["available"] = [row[4].isoformat() if row[4] else None, row[5].isoformat() if row[5] else None]
+            if by_date and by_connection:
+                snapshot["current"] = values(row, base)
+                if in_compare is not None:
+                    snapshot["compare"] = values(row, base + len(KPI_FIELDS))
+            elif not by_date:
+                # Days that only belong to the comparison window are not part of the series.
+                if start <= row[2] <= end:
+                    snapshot["series"].append({"date": row[2].isoformat(), **values(row, base)})
+            else:
+                current = values(row, base)
+                snapshot["connections"].append({
+                    "connection_id": row[3],
+                    "conversions": current["conversions"],
+                    "sessions": current["sessions"],
+                })
+        snapshot["series"].sort(key=lambda point: point["date"])
+        return snapshot
+
+    async def get_derived_series(self, connection_id: str, start: date, end: date) -> List[Dict[str, Any]]:
+        """Precomputed derived values per day (see derived_metrics.Ga4DerivedMetricsService)."""
+        try:
+            stmt = select(
                 Ga4DailyMetric.date,
-                func.sum(Ga4DailyMetric.sessions),
-                func.sum(Ga4DailyMetric.users),
-                func.sum(Ga4DailyMetric.conversions),
-                func.avg(Ga4DailyMetric.engagement_rate),
-                func.avg(Ga4DailyMetric.bounce_rate),
-                func.sum(Ga4DailyMetric.new_users),
-                func.avg(Ga4DailyMetric.avg_engagement_time),
-                func.avg(Ga4DailyMetric.conversion_rate),
-                func.avg(Ga4DailyMetric.conversions_per_1k),
-            )
-            .where(
-                Ga4DailyMetric.connection_id.in_(connection_ids),
+                Ga4DailyMetric.derived_changes,
+                Ga4DailyMetric.derived_moving_averages,
+            ).where(
+                Ga4DailyMetric.connection_id == connection_id,
                 Ga4DailyMetric.date >= start,
                 Ga4DailyMetric.date <= end,
             )
-            .group_by(Ga4DailyMetric.date)
-            .order_by(Ga4DailyMetric.date.asc())
-        )
-        if self.tenant_id is not None:
-            stmt = stmt.where(Ga4DailyMetric.tenant_id == self.tenant_id)
-        result = await self.db.execute(stmt)
-        rows = result.all()
-        return [
-            MetricsTimeSeriesPoint(
-                date=row[0],
-                sessions=float(row[1]) if row[1] is not None else None,
-                users=float(row[2]) if row[2] is not None else None,
-                conversions=float(row[3]) if row[3] is not None else None,
-                engagement_rate=float(row[4]) if row[4] is not None else None,
-                bounce_rate=float(row[5]) if row[5] is not None else None,
-                new_users=float(row[6]) if row[6] is not None else None,
-                avg_engagement_time=float(row[7]) if row[7] is not None else None,
-                conversion_rate=float(row[8]) if row[8] is not None else None,
-                conversions_per_1k=float(row[9]) if row[9] is not None else None,
+            if self.tenant_id is not None:
+                stmt = stmt.where(Ga4DailyMetric.tenant_id == self.tenant_id)
+            rows = (await self.db.execute(stmt.order_by(Ga4DailyMetric.date.asc()))).all()
+            return [
+                {"date": row[0], "changes": row[1] or {}, "moving_averages": row[2] or {}}
+                for row in rows
+            ]
+        except Exception as exc:
+            await self.handle_error("get_derived_series", exc, connection_id=connection_id)
+
+    async def get_latest_derived(self, connection_id: str, as_of: date) -> Optional[Dict[str, Any]]:
+        """Derived values for the most recent computed day on or before ``as_of``."""
+        try:
+            stmt = select(
+                Ga4DailyMetric.date,
+                Ga4DailyMetric.derived_changes,
+                Ga4DailyMetric.derived_moving_averages,
+            ).where(
+                Ga4DailyMetric.connection_id == connection_id,
+                Ga4DailyMetric.date <= as_of,
+                Ga4DailyMetric.derived_changes.isnot(None),
             )
-            for row in rows
+            if self.tenant_id is not None:
+                stmt = stmt.where(Ga4DailyMetric.tenant_id == self.tenant_id)
+            row = (await self.db.execute(stmt.order_by(Ga4DailyMetric.date.desc()).limit(1))).first()
+            if row is None:
+                return None
+            return {"date": row[0], "changes": row[1] or {}, "moving_averages": row[2] or {}}
+        except Exception as exc:
+            await self.handle_error("get_latest_derived", exc, connection_id=connection_id)
+
+    def _dimension_filters(self, connection_ids: List[str], dimension: str, start: date, end: date) -> List[Any]:
+        filters = [
+            Ga4DimensionMetric.connection_id.in_(connection_ids),
+            Ga4DimensionMetric.dimension == dimension,
+            Ga4DimensionMetric.date >= start,
+            Ga4DimensionMetric.date <= end,
         ]
+        if self.tenant_id is not None:
+            filters.append(Ga4DimensionMetric.tenant_id == self.tenant_id)
+        return filters
 
-    async def get_top_connections(self, connection_ids: List[str], start: date, end: date, limit: int = 5):
-        """Return top connections by conversions (fallback to sessions)."""
+    async def get_dimension_breakdown(
+        self,
+        connection_ids: List[str],
+        dimension: str,
+        start: date,
+        end: date,
+        limit: int = 10,
+    ) -> List[MetricsBreakdownItem]:
+        """
+        Totals per dimension value over [start, end], largest by sessions first.
+
+        Values beyond ``limit`` are folded into a single "Other" item so shares
+        always add up to the whole. Aggregated in SQL from ga4_dimension_metrics.
+        """
         if not connection_ids:
             return []
-        stmt = (
-            select(
-                Ga4DailyMetric.connection_id,
-                func.sum(Ga4DailyMetric.conversions),
-                func.sum(Ga4DailyMetric.sessions),
+        try:
+            stmt = (
+                select(
+                    Ga4DimensionMetric.dimension_value,
+                    func.sum(Ga4DimensionMetric.sessions),
+                    func.sum(Ga4DimensionMetric.users),
+                    func.sum(Ga4DimensionMetric.new_users),
+                    func.sum(Ga4DimensionMetric.conversions),
+                    func.sum(Ga4DimensionMetric.engaged_sessions),
+                )
+                .where(*self._dimension_filters(connection_ids, dimension, start, end))
+                .group_by(Ga4DimensionMetric.dimension_value)
+                .order_by(func.sum(Ga4DimensionMetric.sessions).desc().nullslast(), Ga4DimensionMetric.dimension_value)
             )
-            .where(
-                Ga4DailyMetric.connection_id.in_(connection_ids),
-                Ga4DailyMetric.date >= start,
-                Ga4DailyMetric.date <= end,
+            rows = (await self.db.execute(stmt)).all()
+            totals = [
+                [row[0]] + [float(value) if value is not None else None for value in row[1:]]
+                for row in rows
+            ]
+            if len(totals) > limit:
+                head, tail = totals[:limit], totals[limit:]
+                other = ["Other"] + [
+                    sum(row[index] or 0.0 for row in tail) for index in range(1, len(DIMENSION_METRIC_FIELDS) + 1)
+                ]
+                totals = head + [other]
+
+            all_sessions = sum(row[1] or 0.0 for row in totals)
+            return [
+                MetricsBreakdownItem(
+                    dimension_value=row[0],
+                    sessions=row[1],
+                    users=row[2],
+                    new_users=row[3],
+                    conversions=row[4],
+                    engaged_sessions=row[5],
+                    share=round((row[1] or 0.0) / all_sessions, 4) if all_sessions else None,
+                )
+                for row in totals
+            ]
+        except Exception as exc:
+            await self.handle_error("get_dimension_breakdown", exc, dimension=dimension)
+
+    async def get_dimension_time_series(
+        self,
+        connection_ids: List[str],
+        dimension: str,
+        start: date,
+        end: date,
+        metric: str = "sessions",
+        values: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Daily ``metric`` per dimension value in chart-widget format.
+
+        Returns ``{"categories": [dates], "series": [{"name", "data"}]}``;
+        ``values`` restricts the series to the given dimension values.
+        """
+        if not connection_ids or metric not in DIMENSION_METRIC_FIELDS:
+            return {"categories": [], "series": []}
+        try:
+            column = getattr(Ga4DimensionMetric, metric)
+            stmt = (
+                select(Ga4DimensionMetric.date, Ga4DimensionMetric.dimension_value, func.sum(column))
+                .where(*self._dimension_filters(connection_ids, dimension, start, end))
+                .group_by(Ga4DimensionMetric.date, Ga4DimensionMetric.dimension_value)
+                .order_by(Ga4DimensionMetric.date.asc())
             )
-            .group_by(Ga4DailyMetric.connection_id)
-            .order_by(func.sum(Ga4DailyMetric.conversions).desc().nullslast(), func.sum(Ga4DailyMetric.sessions).desc().nullslast())
-            .limit(limit)
-        )
-        if self.tenant_id is not None:
-            stmt = stmt.where(Ga4DailyMetric.tenant_id == self.tenant_id)
-        rows = (await self.db.execute(stmt)).all()
-        return [
-            {
-                "connection_id": row[0],
-                "conversions": float(row[1]) if row[1] is not None else 0.0,
-                "sessions": float(row[2]) if row[2] is not None else 0.0,
+            if values:
+                stmt = stmt.where(Ga4DimensionMetric.dimension_value.in_(values))
+            rows = (await self.db.execute(stmt)).all()
+
+            categories: List[date] = []
+            by_value: Dict[str, Dict[date, Optional[float]]] = {}
+            for day, value, total in rows:
+                if not categories or categories[-1] != day:
+                    categories.append(day)
+                by_value.setdefault(value, {})[day] = float(total) if total is not None else None
+            ordered = values or sorted(by_value, key=lambda key: -sum(v or 0.0 for v in by_value[key].values()))
+            return {
+                "categories": [day.isoformat() for day in categories],
+                "series": [
+                    {"name": value, "data": [by_value.get(value, {}).get(day) for day in categories]}
+                    for value in ordered
+                    if value in by_value
+                ],
             }
-            for row in rows
-        ]
+        except Exception as exc:
+            await self.handle_error("get_dimension_time_series", exc, dimension=dimension)
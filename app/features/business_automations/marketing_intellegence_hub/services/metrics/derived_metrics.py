@@ -0,0 +1,180 @@
+"""Derived GA4 metrics (moving averages, deltas, z-scores) computed at ingestion time."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import update
+
+from app.features.core.sqlalchemy_imports import AsyncSession, select
+from app.features.core.enhanced_base_service import BaseService
+
+from ...models import Ga4DailyMetric
+
+DERIVED_METRICS = ("sessions", "users", "new_users", "conversions", "engagement_rate", "conversion_rate")
+MOVING_AVERAGE_WINDOWS = (7, 28)
+# Trailing days (excluding the current one) used as the z-score baseline.
+ZSCORE_WINDOW = 28
+# Days of history a recomputed day depends on.
+LOOKBACK_DAYS = max(max(MOVING_AVERAGE_WINDOWS), ZSCORE_WINDOW + 1)
+
+
+def _trailing_sums(values: np.ndarray, window: int, include_current: bool = True):
+    """Per-position sum, sum of squares and count of non-NaN values over a trailing window."""
+    present = ~np.isnan(values)
+    filled = np.where(present, values, 0.0)
+    zero = np.zeros(1)
+    csum = np.concatenate([zero, np.cumsum(filled)])
+    csq = np.concatenate([zero, np.cumsum(filled * filled)])
+    ccount = np.concatenate([zero, np.cumsum(present)])
+
+    index = np.arange(1, len(values) + 1)
+    stop = index if include_current else index - 1
+    start = np.maximum(stop - window, 0)
+    return csum[stop] - csum[start], csq[stop] - csq[start], ccount[stop] - ccount[start]
+
+
+def _pct_change(values: np.ndarray, lag: int) -> np.ndarray:
+    previous = np.full_like(values, np.nan)
+    previous[lag:] = values[:-lag]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = (values - previous) / previous * 100.0
+    change[~np.isfinite(change)] = np.nan
+    return change
+
+
+def _clean(value: float, digits: int) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), digits)
+
+
+def compute_derived_metrics(
+    dates: Sequence[date],
+    series: Dict[str, Sequence[Optional[float]]],
+) -> List[Dict[str, Dict[str, Dict[str, Optional[float]]]]]:
+    """
+    Compute derived values for a daily series in one vectorised pass.
+
+    ``dates`` must be ascending; missing days are treated as gaps rather than
+    zeros. Returns one entry per input date with ``changes`` (``dod``/``wow``
+    percent change and ``zscore`` against the previous ZSCORE_WINDOW days) and
+    ``moving_averages`` (``ma7``/``ma28``, requiring at least half the window
+    to be present), each keyed by metric.
+    """
+    if not dates:
+        return []
+    first = dates[0]
+    offsets = np.fromiter(((day - first).days for day in dates), dtype=np.int64, count=len(dates))
+    span = int(offsets[-1]) + 1
+
+    changes: Dict[str, Dict[str, np.ndarray]] = {}
+    averages: Dict[str, Dict[str, np.ndarray]] = {}
+    for metric, raw in series.items():
+        # Scatter onto a contiguous calendar so lags are in days, not rows.
+        values = np.full(span, np.nan)
+        values[offsets] = np.array([np.nan if v is None else float(v) for v in raw], dtype=float)
+
+        averages[metric] = {}
+        for window in MOVING_AVERAGE_WINDOWS:
+            total, _, count = _trailing_sums(values, window)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                mean = total / count
+            mean[count < (window + 1) // 2] = np.nan
+            averages[metric][f"ma{window}"] = mean[offsets]
+
+        total, squares, count = _trailing_sums(values, ZSCORE_WINDOW, include_current=False)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = total / count
+            std = np.sqrt(np.maximum(squares / count - mean * mean, 0.0))
+            zscore = (values - mean) / std
+        zscore[(count < (ZSCORE_WINDOW + 1) // 2) | ~np.isfinite(zscore)] = np.nan
+
+        changes[metric] = {
+            "dod": _pct_change(values, 1)[offsets],
+            "wow": _pct_change(values, 7)[offsets],
+            "zscore": zscore[offsets],
+        }
+
+    results = []
+    for position in range(len(dates)):
+        results.append({
+            "changes": {
+                metric: {key: _clean(column[position], 2 if key != "zscore" else 3) for key, column in columns.items()}
+                for metric, columns in changes.items()
+            },
+            "moving_averages": {
+                metric: {key: _clean(column[position], 4) for key, column in columns.items()}
+                for metric, columns in averages.items()
+            },
+        })
+    return results
+
+
+def compute_period_deltas(
+    current: Dict[str, Optional[float]],
+    baseline: Dict[str, Optional[float]],
+    fields: Sequence[str],
+) -> Dict[str, float]:
+    """
+    Percent change of each field from ``baseline`` to ``current``, in one pass.
+
+    Fields missing from either window, or with a zero baseline, are left out.
+    """
+    values = np.array([np.nan if current.get(key) is None else float(current[key]) for key in fields], dtype=float)
+    base = np.array([np.nan if baseline.get(key) is None else float(baseline[key]) for key in fields], dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = (values - base) / base * 100.0
+    return {key: round(float(value), 2) for key, value in zip(fields, change) if np.isfinite(value)}
+
+
+class Ga4DerivedMetricsService(BaseService[Ga4DailyMetric]):
+    """Fill ``derived_changes`` / ``derived_moving_averages`` on ga4_daily_metrics."""
+
+    def __init__(self, db_session: AsyncSession, tenant_id: Optional[str]):
+        super().__init__(db_session, tenant_id)
+
+    async def recompute(self, connection_id: str, since: Optional[date] = None) -> int:
+        """
+        Recompute derived values for days on or after ``since``.
+
+        Loads ``since - LOOKBACK_DAYS`` onwards so every affected day has its
+        full history, computes with ``compute_derived_metrics`` and writes back
+        only the affected rows with one executemany UPDATE. Days after the
+        synced window are included because their averages and z-scores depend
+        on the restated days. ``since=None`` recomputes the whole series.
+
+        Returns:
+            Number of rows updated
+        """
+        try:
+            columns = [getattr(Ga4DailyMetric, metric) for metric in DERIVED_METRICS]
+            stmt = select(Ga4DailyMetric.id, Ga4DailyMetric.date, *columns).where(
+                Ga4DailyMetric.connection_id == connection_id
+            )
+            if self.tenant_id is not None:
+                stmt = stmt.where(Ga4DailyMetric.tenant_id == self.tenant_id)
+            if since is not None:
+                stmt = stmt.where(Ga4DailyMetric.date >= since - timedelta(days=LOOKBACK_DAYS))
+            rows = (await self.db.execute(stmt.order_by(Ga4DailyMetric.date.asc()))).all()
+            if not rows:
+                return 0
+
+            dates = [row[1] for row in rows]
+            series = {metric: [row[2 + index] for row in rows] for index, metric in enumerate(DERIVED_METRICS)}
+            derived = compute_derived_metrics(dates, series)
+
+            updates = [
+                {
+                    "id": row[0],
+                    "derived_changes": values["changes"],
+                    "derived_moving_averages": values["moving_averages"],
+                }
+                for row, values in zip(rows, derived)
+                if since is None or row[1] >= since
+            ]
+            if updates:
+                await self.db.execute(update(Ga4DailyMetric), updates)
+            return len(updates)
+        except Exception as exc:
+            await self.handle_error("recompute", exc, connection_id=connection_id)
@@ -0,0 +1,200 @@
+"""
+Short-TTL cache for GA4 dashboard aggregates.
+
+Entries are keyed by (tenant, connection set, date ranges) and remember the
+write generation of every connection they cover (generations are per
+connection id, so tenant-scoped and global-admin reads share them). Ingestion bumps the
+generation of the connections it touches, so a cached rollup is discarded
+as soon as any of its connections changes instead of waiting for the TTL.
+Shared through Redis when ``REDIS_URL`` is set (every web worker and the
+Celery sync see the same generations); otherwise an in-process LRU is used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.features.core.config import get_settings
+from app.features.core.sqlalchemy_imports import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+CACHE_TTL_SECONDS = float(getattr(settings, "GA4_METRICS_CACHE_TTL_SECONDS", 60))
+# In-process entries kept before the least recently used are dropped.
+MAX_LOCAL_ENTRIES = 1024
+# Generation keys outlive any entry that could reference them.
+GENERATION_TTL_SECONDS = 86400
+
+
+def cache_key(kind: str, tenant_id: Optional[str], connection_ids: Iterable[str], *parts: Any) -> str:
+    """Stable key for a query over a connection set (order of ids does not matter)."""
+    ids = ",".join(sorted(set(connection_ids)))
+    digest = hashlib.sha1(f"{ids}|{'|'.join(str(part) for part in parts)}".encode()).hexdigest()
+    return f"{kind}:{tenant_id or 'global'}:{digest}"
+
+
+@dataclass
+class CacheLookup:
+    """Result of a lookup; ``generations`` must be passed back to ``set`` on a miss."""
+
+    value: Optional[Any]
+    generations: List[int]
+
+    @property
+    def hit(self) -> bool:
+        return self.value is not None
+
+
+class MetricsCache(ABC):
+    """Cache for JSON-serialisable aggregate results."""
+
+    def __init__(self, ttl_seconds: float = CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    async def get(self, connection_ids: Sequence[str], key: str) -> CacheLookup:
+        """
+        Look up a value; misses when absent, expired or any connection changed
+        since it was stored.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, generations: List[int]) -> None:
+        """
+        Store a value computed after a lookup that returned ``generations``.
+
+        Using the lookup-time generations means a write that lands while the
+        value is being computed leaves the stored entry already stale.
+        """
+
+    @abstractmethod
+    async def invalidate(self, connection_ids: Sequence[str]) -> None:
+        """Mark every cached value covering any of ``connection_ids`` as stale."""
+
+
+class InMemoryMetricsCache(MetricsCache):
+    """Per-process cache (development, tests, single-worker deployments)."""
+
+    def __init__(self, ttl_seconds: float = CACHE_TTL_SECONDS, max_entries: int = MAX_LOCAL_ENTRIES, clock=time.monotonic):
+        super().__init__(ttl_seconds)
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, List[int], Any]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    def _generation_vector(self, connection_ids: Sequence[str]) -> List[int]:
+        return [self._generations.get(cid, 0) for cid in sorted(set(connection_ids))]
+
+    async def get(self, connection_ids, key):
+        current = self._generation_vector(connection_ids)
+        entry = self._entries.get(key)
+        if entry is None:
+            return CacheLookup(None, current)
+        expires_at, generations, value = entry
+        if expires_at <= self.clock() or generations != current:
+            del self._entries[key]
+            return CacheLookup(None, current)
+        self._entries.move_to_end(key)
+        return CacheLookup(value, current)
+
+    async def set(self, key, value, generations):
+        self._entries[key] = (self.clock() + self.ttl_seconds, list(generations), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, connection_ids):
+        for cid in set(connection_ids):
+            self._generations[cid] = self._generations.get(cid, 0) + 1
+
+
+class RedisMetricsCache(MetricsCache):
+    """
+    Cache shared by every worker through Redis.
+
+    A read is one pipelined round trip (entry + connection generations).
+    Redis errors fail open: reads miss and writes/invalidations are skipped,
+    so the dashboards fall back to querying Postgres.
+    """
+
+    def __init__(self, key_prefix: str = "ga4:metrics", ttl_seconds: float = CACHE_TTL_SECONDS, redis_url: Optional[str] = None):
+        super().__init__(ttl_seconds)
+        self.key_prefix = key_prefix
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self._redis = None
+
+    async def _get_redis(self):
+        """Lazy initialization of Redis connection."""
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    def _generation_keys(self, connection_ids: Sequence[str]) -> List[str]:
+        return [f"{self.key_prefix}:gen:{cid}" for cid in sorted(set(connection_ids))]
+
+    async def get(self, connection_ids, key):
+        try:
+            client = await self._get_redis()
+            generation_keys = self._generation_keys(connection_ids)
+            pipe = client.pipeline(transaction=False)
+            pipe.get(f"{self.key_prefix}:entry:{key}")
+            if generation_keys:
+                pipe.mget(generation_keys)
+            results = await pipe.execute()
+            current = [int(value or 0) for value in results[1]] if generation_keys else []
+            if results[0] is None:
+                return CacheLookup(None, current)
+            entry = json.loads(results[0])
+            if entry["generations"] != current:
+                return CacheLookup(None, current)
+            return CacheLookup(entry["value"], current)
+        except Exception as e:
+            logger.error(f"Redis metrics cache get error: {e}")
+            # Unknown generations: never matches a real vector, so nothing stale is stored.
+            return CacheLookup(None, [-1])
+
+    async def set(self, key, value, generations):
+        if generations == [-1]:
+            return
+        try:
+            client = await self._get_redis()
+            payload = json.dumps({"generations": list(generations), "value": value})
+            await client.set(f"{self.key_prefix}:entry:{key}", payload, px=int(self.ttl_seconds * 1000))
+        except Exception as e:
+            logger.error(f"Redis metrics cache set error: {e}")
+
+    async def invalidate(self, connection_ids):
+        try:
+            client = await self._get_redis()
+            pipe = client.pipeline(transaction=False)
+            for generation_key in self._generation_keys(connection_ids):
+                pipe.incr(generation_key)
+                pipe.expire(generation_key, GENERATION_TTL_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis metrics cache invalidate error: {e}")
+
+
+_cache: Optional[MetricsCache] = None
+
+
+def get_metrics_cache() -> MetricsCache:
+    """
+    Return the process-wide metrics cache.
+
+    Uses Redis when ``REDIS_URL`` is configured so invalidations from the
+    Celery sync reach every web worker; otherwise falls back to memory.
+    """
+    global _cache
+    if _cache is None:
+        _cache = RedisMetricsCache() if os.getenv("REDIS_URL") else InMemoryMetricsCache()
+    return _cache
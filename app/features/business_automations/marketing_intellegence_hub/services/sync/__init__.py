@@ -0,0 +1,3 @@
+from .fleet_sync_service import Ga4FleetSyncService, PropertyQuotaTracker, month_windows, sync_range
+
+__all__ = ["Ga4FleetSyncService", "PropertyQuotaTracker", "month_windows", "sync_range"]
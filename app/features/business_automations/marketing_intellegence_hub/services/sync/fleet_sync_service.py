@@ -0,0 +1,410 @@
+"""Scheduled GA4 fleet sync with incremental watermarks and batched reports."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.features.core.config import get_settings
+from app.features.core.database import get_async_session
+from app.features.core.sqlalchemy_imports import get_logger, select
+
+from ...clients.ga4_client import BREAKDOWN_DIMENSIONS, MAX_REPORTS_PER_BATCH, DateWindow, Ga4BatchResult, Ga4Client
+from ...ga4_credentials import load_ga4_credentials
+from ...models import Ga4Connection
+from ...schemas import Ga4DailyMetricPayload, Ga4DimensionMetricPayload
+from ..connections.crud_services import Ga4ConnectionCrudService
+from ..metrics.crud_services import Ga4MetricsIngestionService
+from ..metrics.derived_metrics import Ga4DerivedMetricsService
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Days before the watermark that are re-fetched because GA4 restates recent data.
+DEFAULT_RESTATEMENT_DAYS = int(getattr(settings, "GA4_SYNC_RESTATEMENT_DAYS", 3))
+# History pulled for a connection that has never been synced.
+DEFAULT_INITIAL_BACKFILL_DAYS = int(getattr(settings, "GA4_SYNC_INITIAL_BACKFILL_DAYS", 90))
+# Blocking GA4 calls in flight at once across the whole fleet.
+DEFAULT_SYNC_WORKERS = int(getattr(settings, "GA4_SYNC_MAX_WORKERS", 4))
+# Stop calling a property once fewer hourly/daily tokens than this remain.
+MIN_REMAINING_TOKENS = int(getattr(settings, "GA4_SYNC_MIN_REMAINING_TOKENS", 100))
+# Also load channel/device/geo rows into ga4_dimension_metrics.
+SYNC_BREAKDOWNS = bool(getattr(settings, "GA4_SYNC_BREAKDOWNS", True))
+# How long a property is skipped after GA4 reports its quota as exhausted.
+QUOTA_COOLDOWN_SECONDS = 3600
+
+ClientFactory = Callable[[Ga4Connection, Dict[str, Any], Dict[str, Any]], Any]
+
+
+def month_windows(start: date, end: date) -> List[DateWindow]:
+    """Split [start, end] into calendar-month windows (inclusive bounds)."""
+    windows: List[DateWindow] = []
+    cursor = start
+    while cursor <= end:
+        next_month = (cursor.replace(day=1) + timedelta(days=32)).replace(day=1)
+        window_end = min(end, next_month - timedelta(days=1))
+        windows.append((cursor, window_end))
+        cursor = window_end + timedelta(days=1)
+    return windows
+
+
+def sync_range(
+    last_synced_at: Optional[datetime],
+    today: date,
+    restatement_days: int = DEFAULT_RESTATEMENT_DAYS,
+    initial_backfill_days: int = DEFAULT_INITIAL_BACKFILL_DAYS,
+) -> DateWindow:
+    """Date range to fetch for a connection given its watermark."""
+    if last_synced_at is None:
+        return today - timedelta(days=initial_backfill_days - 1), today
+    start = min(last_synced_at.date(), today) - timedelta(days=restatement_days)
+    return start, today
+
+
+class PropertyQuotaTracker:
+    """
+    Track the GA4 token quota reported for each property.
+
+    Updated from the ``property_quota`` block returned with every report and
+    consulted before each batch so a property close to its hourly or daily
+    limit is left for the next run instead of failing mid-sync. Thread-safe:
+    batches for different properties run on pool threads concurrently.
+    """
+
+    def __init__(self, min_remaining: int = MIN_REMAINING_TOKENS, clock: Callable[[], float] = time.monotonic):
+        self.min_remaining = min_remaining
+        self.clock = clock
+        self._quota: Dict[str, Dict[str, Optional[int]]] = {}
+        self._blocked_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, property_id: str, quota: Dict[str, Optional[int]]) -> None:
+        if not quota:
+            return
+        with self._lock:
+            self._quota[property_id] = dict(quota)
+            remaining = [quota.get("tokens_per_hour"), quota.get("tokens_per_day")]
+            if any(value is not None and value < self.min_remaining for value in remaining):
+                self._blocked_until[property_id] = self.clock() + QUOTA_COOLDOWN_SECONDS
+
+    def mark_exhausted(self, property_id: str, cooldown_seconds: float = QUOTA_COOLDOWN_SECONDS) -> None:
+        with self._lock:
+            self._blocked_until[property_id] = self.clock() + cooldown_seconds
+
+    def can_request(self, property_id: str) -> bool:
+        with self._lock:
+            blocked_until = self._blocked_until.get(property_id)
+            if blocked_until is None:
+                return True
+            if self.clock() >= blocked_until:
+                del self._blocked_until[property_id]
+                self._quota.pop(property_id, None)
+                return True
+            return False
+
+    def snapshot(self, property_id: str) -> Dict[str, Optional[int]]:
+        with self._lock:
+            return dict(self._quota.get(property_id, {}))
+
+
+# Shared by every fleet run in this worker process so cooldowns outlive a run.
+_quota_tracker = PropertyQuotaTracker()
+
+
+def _discard_result(future: asyncio.Future) -> None:
+    """Retrieve an abandoned prefetch's outcome so its error is not logged as unhandled."""
+    if not future.cancelled():
+        future.exception()
+
+
+def _is_quota_error(exc: Exception) -> bool:
+    return type(exc).__name__ in {"ResourceExhausted", "TooManyRequests", "FakeGa4QuotaExhausted"}
+
+
+@dataclass
+class ConnectionSyncResult:
+    connection_id: str
+    tenant_id: str
+    property_id: str
+    status: str
+    start: Optional[date] = None
+    end: Optional[date] = None
+    rows: int = 0
+    batches: int = 0
+    breakdown_rows: int = 0
+    derived_rows: int = 0
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "connection_id": self.connection_id,
+            "tenant_id": self.tenant_id,
+            "property_id": self.property_id,
+            "status": self.status,
+            "start": self.start.isoformat() if self.start else None,
+            "end": self.end.isoformat() if self.end else None,
+            "rows": self.rows,
+            "batches": self.batches,
+            "breakdown_rows": self.breakdown_rows,
+            "derived_rows": self.derived_rows,
+            "error": self.error,
+        }
+
+
+class Ga4FleetSyncService:
+    """
+    Refresh GA4 daily metrics for every active connection.
+
+    Each connection is fetched from its ``last_synced_at`` watermark (minus a
+    restatement window) to today, in calendar-month windows grouped into
+    batchRunReports calls. When breakdowns are enabled the same windows are
+    fetched again split by channel/device/geo into ga4_dimension_metrics, and
+    derived metrics are recomputed from the start of the window. The
+    blocking Google client runs on a bounded thread pool; each connection is
+    written in its own session so one failing property never rolls back the
+    others.
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        client_factory: Optional[ClientFactory] = None,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
+        restatement_days: int = DEFAULT_RESTATEMENT_DAYS,
+        initial_backfill_days: int = DEFAULT_INITIAL_BACKFILL_DAYS,
+        quota_tracker: Optional[PropertyQuotaTracker] = None,
+        today: Optional[Callable[[], date]] = None,
+        sync_breakdowns: bool = SYNC_BREAKDOWNS,
+    ):
+        self.session_factory = session_factory or get_async_session()
+        self.client_factory = client_factory or self._default_client_factory
+        self.max_workers = max(1, max_workers)
+        self.restatement_days = restatement_days
+        self.initial_backfill_days = initial_backfill_days
+        self.quota_tracker = quota_tracker or _quota_tracker
+        self.today = today or date.today
+        self.sync_breakdowns = sync_breakdowns
+
+    @staticmethod
+    def _default_client_factory(connection: Ga4Connection, tokens: Dict[str, Any], creds: Dict[str, Any]) -> Ga4Client:
+        return Ga4Client.from_tokens(
+            access_token=tokens.get("access_token"),
+            refresh_token=tokens["refresh_token"],
+            client_id=creds["client_id"],
+            client_secret=creds["client_secret"],
+            access_token_expires_at=tokens.get("access_token_expires_at"),
+        )
+
+    async def sync_fleet(self, tenant_id: Optional[str] = None) -> Dict[str, Any]:
+        """Sync all active connections (optionally for one tenant) and return a summary."""
+        started = time.monotonic()
+        async with self.session_factory() as db:
+            stmt = select(Ga4Connection.id).where(Ga4Connection.status == "active")
+            if tenant_id is not None:
+                stmt = stmt.where(Ga4Connection.tenant_id == tenant_id)
+            connection_ids = list((await db.execute(stmt)).scalars().all())
+            creds = await load_ga4_credentials(db) if connection_ids else {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ga4-sync")
+        semaphore = asyncio.Semaphore(self.max_workers)
+        try:
+            async def run(connection_id: str) -> ConnectionSyncResult:
+                async with semaphore:
+                    return await self.sync_connection(connection_id, creds, executor)
+
+            results = await asyncio.gather(*(run(connection_id) for connection_id in connection_ids))
+        finally:
+            executor.shutdown(wait=False)
+
+        status_counts: Dict[str, int] = {}
+        for result in results:
+            status_counts[result.status] = status_counts.get(result.status, 0) + 1
+        summary = {
+            "connections": len(results),
+            "rows": sum(result.rows for result in results),
+            "batches": sum(result.batches for result in results),
+            "status_counts": status_counts,
+            "duration_ms": int((time.monotonic() - started) * 1000),
+            "results": [result.to_dict() for result in results],
+        }
+        logger.info(
+            "GA4 fleet sync finished",
+            connections=summary["connections"],
+            rows=summary["rows"],
+            batches=summary["batches"],
+            status_counts=status_counts,
+            duration_ms=summary["duration_ms"],
+        )
+        return summary
+
+    async def sync_connection(
+        self,
+        connection_id: str,
+        creds: Dict[str, Any],
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> ConnectionSyncResult:
+        """Fetch and store new days for one connection, advancing its watermark."""
+        async with self.session_factory() as db:
+            connection = await db.get(Ga4Connection, connection_id)
+            if connection is None:
+                return ConnectionSyncResult(connection_id, "", "", status="missing")
+
+            result = ConnectionSyncResult(connection.id, connection.tenant_id, connection.property_id, status="ok")
+            connection_service = Ga4ConnectionCrudService(db, connection.tenant_id)
+            ingestion_service = Ga4MetricsIngestionService(db, connection.tenant_id)
+            try:
+                tokens = await connection_service.get_tokens(connection.id)
+                if not tokens or not tokens.get("refresh_token"):
+                    result.status = "no_tokens"
+                    return result
+
+                client = self.client_factory(connection, tokens, creds)
+                result.start, result.end = sync_range(
+                    connection.last_synced_at, self.today(), self.restatement_days, self.initial_backfill_days
+                )
+                windows = month_windows(result.start, result.end)
+
+                async def store(batch: Ga4BatchResult) -> None:
+                    payloads = [Ga4DailyMetricPayload(**row) for row in batch.rows if row.get("date")]
+                    if payloads:
+                        await ingestion_service.upsert_daily_metrics(connection.id, payloads)
+                    result.rows += len(payloads)
+                    result.batches += 1
+
+                completed_through = await self.fetch_windows(
+                    client, connection.property_id, windows, store, executor
+                )
+
+                if completed_through is not None and self.sync_breakdowns:
+                    async def store_breakdowns(batch: Ga4BatchResult) -> None:
+                        payloads = [Ga4DimensionMetricPayload(**row) for row in batch.rows if row.get("date")]
+                        if payloads:
+                            await ingestion_service.upsert_dimension_metrics(connection.id, payloads)
+                        result.breakdown_rows += len(payloads)
+
+                    breakdown_windows = [
+                        (start, min(end, completed_through)) for start, end in windows if start <= completed_through
+                    ]
+                    breakdowns_through = await self.fetch_windows(
+                        client,
+                        connection.property_id,
+                        breakdown_windows,
+                        store_breakdowns,
+                        executor,
+                        fetch=client.batch_fetch_breakdowns,
+                        group_size=max(1, MAX_REPORTS_PER_BATCH // len(BREAKDOWN_DIMENSIONS)),
+                    )
+                    # The watermark only moves past days that have both daily and breakdown rows.
+                    if breakdowns_through is None or breakdowns_through < completed_through:
+                        completed_through = breakdowns_through
+
+                if result.rows:
+                    # Moving averages, deltas and z-scores for the restated window onwards.
+                    derived_service = Ga4DerivedMetricsService(db, connection.tenant_id)
+                    result.derived_rows = await derived_service.recompute(connection.id, result.start)
+
+                if completed_through is None:
+                    result.status = "quota_deferred"
+                    # Keep any daily rows already written; the watermark stays put.
+                    await db.commit()
+                    await self._invalidate_cache(ingestion_service, connection.id, result)
+                    return result
+                if completed_through < result.end:
+                    # Partially synced: resume from the last complete window next run.
+                    result.status = "quota_deferred"
+                    connection.last_synced_at = datetime.combine(completed_through, datetime.min.time())
+                else:
+                    connection.last_synced_at = datetime.utcnow()
+
+                token_data = client.current_token_data()
+                if token_data.get("access_token"):
+                    await connection_service.upsert_tokens(
+                        connection.id,
+                        {
+                            "refresh_token": tokens["refresh_token"],
+                            "access_token": token_data["access_token"],
+                            "access_token_expires_at": token_data["access_token_expires_at"],
+                        },
+                    )
+                await db.commit()
+                await self._invalidate_cache(ingestion_service, connection.id, result)
+                return result
+            except Exception as exc:
+                await db.rollback()
+                result.status = "error"
+                result.error = str(exc)
+                logger.warning(
+                    "GA4 connection sync failed",
+                    connection_id=connection_id,
+                    property_id=result.property_id,
+                    error=str(exc),
+                )
+                return result
+
+    @staticmethod
+    async def _invalidate_cache(ingestion_service: Ga4MetricsIngestionService, connection_id: str, result: ConnectionSyncResult) -> None:
+        if result.rows:
+            await ingestion_service.invalidate_cached_metrics([connection_id])
+
+    async def fetch_windows(
+        self,
+        client,
+        property_id: str,
+        windows: Sequence[DateWindow],
+        on_batch: Callable[[Ga4BatchResult], Any],
+        executor: Optional[ThreadPoolExecutor] = None,
+        fetch: Optional[Callable[[str, List[DateWindow]], Ga4BatchResult]] = None,
+        group_size: int = MAX_REPORTS_PER_BATCH,
+    ) -> Optional[date]:
+        """
+        Fetch windows in batchRunReports-sized groups on the thread pool.
+
+        ``fetch`` defaults to ``client.batch_fetch_daily_metrics``; pass
+        ``client.batch_fetch_breakdowns`` (with a smaller ``group_size``, since
+        it sends one report per dimension) for breakdown rows. The next
+        group is requested before ``on_batch`` is awaited for the current one,
+        so rows are written while that request is in flight (never more than
+        one group ahead). Returns the end date of the last window written, or
+        None if the property was out of quota before the first.
+        """
+        loop = asyncio.get_running_loop()
+        fetch = fetch or client.batch_fetch_daily_metrics
+        groups = [list(windows[offset:offset + group_size]) for offset in range(0, len(windows), group_size)]
+
+        def request(group: List[DateWindow]) -> Optional[asyncio.Future]:
+            if not self.quota_tracker.can_request(property_id):
+                logger.info("GA4 property quota low, deferring", property_id=property_id,
+                            quota=self.quota_tracker.snapshot(property_id))
+                return None
+            return loop.run_in_executor(executor, fetch, property_id, group)
+
+        completed_through: Optional[date] = None
+        in_flight = request(groups[0]) if groups else None
+        for index, group in enumerate(groups):
+            if in_flight is None:
+                break
+            try:
+                batch = await in_flight
+            except Exception as exc:
+                if not _is_quota_error(exc):
+                    raise
+                self.quota_tracker.mark_exhausted(property_id)
+                logger.info("GA4 property quota exhausted", property_id=property_id, error=str(exc))
+                break
+            self.quota_tracker.record(property_id, batch.quota)
+            # Request the next group before writing this one, so the GA4 round
+            # trip overlaps the database write.
+            in_flight = request(groups[index + 1]) if index + 1 < len(groups) else None
+            try:
+                await on_batch(batch)
+            except BaseException:
+                if in_flight is not None:
+                    in_flight.add_done_callback(_discard_result)
+                raise
+            completed_through = group[-1][1]
+        return completed_through
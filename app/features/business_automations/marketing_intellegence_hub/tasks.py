@@ -0,0 +1,75 @@
+"""
+Celery tasks for the Marketing Intelligence Hub.
+
+Runs the scheduled GA4 fleet sync so dashboards stay fresh without users
+having to click "sync" on every connection, and the daily portfolio
+anomaly detection over the synced metrics.
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import structlog
+
+from app.features.core.celery_app import celery_app
+from app.features.core.database import get_async_session
+from app.features.business_automations.marketing_intellegence_hub.services.metrics.derived_metrics import (
+    Ga4DerivedMetricsService,
+)
+from app.features.business_automations.marketing_intellegence_hub.services.insights import Ga4AnomalyDetectionService
+from app.features.business_automations.marketing_intellegence_hub.services.sync import Ga4FleetSyncService
+
+logger = structlog.get_logger(__name__)
+
+
+def _run_async(coro):
+    """Utility to run async code inside a Celery task."""
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
+@celery_app.task(bind=True, soft_time_limit=3300, time_limit=3600)
+def sync_ga4_fleet_task(self, tenant_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Celery entrypoint for the GA4 fleet sync (scheduled by beat).
+
+    Not auto-retried: connections that fail or run out of quota keep their
+    watermark and are picked up by the next scheduled run.
+    """
+    logger.info("Starting GA4 fleet sync", tenant_id=tenant_id)
+    summary = _run_async(Ga4FleetSyncService().sync_fleet(tenant_id=tenant_id))
+    # Per-connection details can be large; the counts are enough for the result backend.
+    summary.pop("results", None)
+    return summary
+
+
+@celery_app.task(bind=True)
+def recompute_ga4_derived_metrics_task(self, connection_id: str, tenant_id: str) -> Dict[str, Any]:
+    """Recompute derived metrics over a connection's full history (backfill / repair)."""
+
+    async def run() -> int:
+        async with get_async_session()() as db:
+            updated = await Ga4DerivedMetricsService(db, tenant_id).recompute(connection_id)
+            await db.commit()
+            return updated
+
+    updated = _run_async(run())
+    logger.info("Recomputed GA4 derived metrics", connection_id=connection_id, rows=updated)
+    return {"connection_id": connection_id, "rows": updated}
+
+
+@celery_app.task(bind=True, soft_time_limit=600, time_limit=900)
+def detect_ga4_anomalies_task(self, tenant_id: Optional[str] = None) -> Dict[str, Any]:
+    """Portfolio anomaly detection (scheduled by beat after the daily data has landed)."""
+
+    async def run() -> Dict[str, Any]:
+        async with get_async_session()() as db:
+            result = await Ga4AnomalyDetectionService(db, tenant_id).run()
+            await db.commit()
+            return result.to_dict()
+
+    return _run_async(run())
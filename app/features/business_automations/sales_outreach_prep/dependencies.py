@@ -10,6 +10,7 @@ from app.features.core.route_imports import *
 from app.features.business_automations.sales_outreach_prep.services.campaigns import CampaignCrudService
 from app.features.business_automations.sales_outreach_prep.services.companies import CompanyCrudService
 from app.features.business_automations.sales_outreach_prep.services.prospects import ProspectCrudService
+from app.features.business_automations.sales_outreach_prep.services.entity_resolution_service import EntityResolutionService
 
 logger = get_logger(__name__)
 
@@ -65,3 +66,20 @@ def get_prospect_service(
         ProspectCrudService instance
     """
     return ProspectCrudService(db, tenant_id)
+
+
+def get_entity_resolution_service(
+    db: AsyncSession = Depends(get_db),
+    tenant_id: str = Depends(tenant_dependency)
+) -> EntityResolutionService:
+    """
+    Get entity resolution service instance.
+
+    Args:
+        db: Database session
+        tenant_id: Current tenant ID
+
+    Returns:
+        EntityResolutionService instance
+    """
+    return EntityResolutionService(db, tenant_id)
@@ -137,7 +137,11 @@ class Company(Base, AuditMixin):
 
     # Core fields
     name = Column(String(255), nullable=False)
+    # Normalized name for entity resolution ("ACME, Inc." -> "acme"), see utils.entity_resolution
+    name_key = Column(String(255), nullable=True)
     domain = Column(String(255), nullable=True)  # Primary domain (e.g., "acme.com")
+    # Bare lowercase host of domain for lookups ("https://www.Acme.com/" -> "acme.com")
+    domain_key = Column(String(255), nullable=True)
     alternate_domains = Column(JSON, default=list)  # Additional domains as list
 
     # Company details
@@ -166,6 +170,15 @@ class Company(Base, AuditMixin):
     __table_args__ = (
         Index('idx_companies_tenant_name', 'tenant_id', 'name'),
         Index('idx_companies_domain', 'domain'),
+        Index('idx_companies_tenant_name_key', 'tenant_id', 'name_key'),
+        Index('idx_companies_tenant_domain_key', 'tenant_id', 'domain_key'),
+        # Trigram index for fuzzy name search and matching (requires pg_trgm)
+        Index(
+            'idx_companies_name_key_trgm',
+            'name_key',
+            postgresql_using='gin',
+            postgresql_ops={'name_key': 'gin_trgm_ops'}
+        ),
     )
 
     def to_dict(self):
@@ -325,6 +338,10 @@ class Prospect(Base, AuditMixin):
     discovered_via = Column(String(100), nullable=True)  # firecrawl, manual, csv_import
     discovery_query = Column(String(500), nullable=True)  # Search query used
 
+    # De-duplication key within a campaign (see prospect_dedupe_key)
+    dedupe_key = Column(String(64), nullable=True)
+    # Values: li:<md5 of normalized LinkedIn URL>, fp:<md5 of name|company_id>
+
     # Relationships
     campaign = relationship("Campaign", back_populates="prospects")
     company = relationship("Company", back_populates="prospects")
@@ -337,6 +354,7 @@ class Prospect(Base, AuditMixin):
         Index('idx_prospects_email', 'email'),
         Index('idx_prospects_status', 'status', 'enrichment_status'),
         Index('idx_prospects_tenant_campaign', 'tenant_id', 'campaign_id'),
+        Index('idx_prospects_dedupe', 'tenant_id', 'campaign_id', 'dedupe_key', unique=True),
     )
 
     def to_dict(self):
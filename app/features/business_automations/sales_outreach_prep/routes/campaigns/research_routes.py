@@ -5,15 +5,20 @@ Handles:
 - POST /{campaign_id}/start-research - Start AI research discovery for campaign
 - POST /{campaign_id}/approve-organization - Approve single organization from research
 - POST /{campaign_id}/approve-all-organizations - Approve all organizations and start discovery
+
+Approved organizations and imported prospects are resolved against existing
+records first, so "ACME, Inc." reuses the tenant's "Acme Inc" company.
 """
 
 from app.features.core.route_imports import *
 from app.features.business_automations.sales_outreach_prep.dependencies import (
     get_campaign_service,
-    get_company_service
+    get_company_service,
+    get_entity_resolution_service
 )
 from app.features.business_automations.sales_outreach_prep.services.campaigns import CampaignCrudService
 from app.features.business_automations.sales_outreach_prep.services.companies import CompanyCrudService
+from app.features.business_automations.sales_outreach_prep.services.entity_resolution_service import EntityResolutionService
 from app.features.business_automations.sales_outreach_prep.tasks import discover_prospects_task
 
 logger = get_logger(__name__)
@@ -95,12 +100,13 @@ async def approve_organization(
     db: AsyncSession = Depends(get_db),
     campaign_service: CampaignCrudService = Depends(get_campaign_service),
     company_service: CompanyCrudService = Depends(get_company_service),
+    resolver: EntityResolutionService = Depends(get_entity_resolution_service),
     current_user: User = Depends(get_current_user)
 ):
     """
     Approve single organization from AI research results.
 
-    Creates Company record and optionally triggers contact discovery.
+    Creates Company record (or reuses a matching one) and optionally triggers contact discovery.
 
     Args:
         campaign_id: Campaign ID
@@ -108,6 +114,7 @@ async def approve_organization(
         db: Database session
         campaign_service: Campaign service
         company_service: Company service
+        resolver: Entity resolution service
         current_user: Current user
 
     Returns:
@@ -148,17 +155,29 @@ async def approve_organization(
             "description": org.get("context", "")
         }
 
-        company = await company_service.create_company(company_data, current_user)
+        # Reuse an existing company with the same domain or a matching name
+        [resolution] = await resolver.resolve_companies([company_data])
+        company = None
+        if resolution.company_id:
+            company = await company_service.get_company_by_id(resolution.company_id)
+        if company is None:
+            company = await company_service.create_company(company_data, current_user)
 
-        # Link company to campaign
+        # Link company to campaign (once)
+        from sqlalchemy import select
         from app.features.business_automations.sales_outreach_prep.models import CampaignCompany
-        campaign_company = CampaignCompany(
-            campaign_id=campaign_id,
-            company_id=company.id,
-            research_status="approved",
-            ai_insights=[f"Discovered via AI research: {org.get('source', 'unknown')}"]
+        link_stmt = select(CampaignCompany.id).where(
+            CampaignCompany.campaign_id == campaign_id,
+            CampaignCompany.company_id == company.id
         )
-        db.add(campaign_company)
+        if (await db.execute(link_stmt)).first() is None:
+            campaign_company = CampaignCompany(
+                campaign_id=campaign_id,
+                company_id=company.id,
+                research_status="approved",
+                ai_insights=[f"Discovered via AI research: {org.get('source', 'unknown')}"]
+            )
+            db.add(campaign_company)
 
         await commit_transaction(db, "approve_organization")
 
@@ -198,12 +217,14 @@ async def approve_all_organizations(
     db: AsyncSession = Depends(get_db),
     campaign_service: CampaignCrudService = Depends(get_campaign_service),
     company_service: CompanyCrudService = Depends(get_company_service),
+    resolver: EntityResolutionService = Depends(get_entity_resolution_service),
     current_user: User = Depends(get_current_user)
 ):
     """
     Approve all organizations from AI research results.
 
     Creates Company records for all organizations and optionally starts contact discovery.
+    Organizations matching an existing company (or each other) share one record.
 
     Args:
         campaign_id: Campaign ID
@@ -211,6 +232,7 @@ async def approve_all_organizations(
         db: Database session
         campaign_service: Campaign service
         company_service: Company service
+        resolver: Entity resolution service
         current_user: Current user
 
     Returns:
@@ -229,34 +251,49 @@ async def approve_all_organizations(
         organizations = campaign.research_data.get("organizations", [])
         approved_companies = []
 
-        # Create Company records for all organizations
+        companies_data = []
         for org in organizations:
+            # Extract domain from website URL
+            domain = None
+            if org.get("website"):
+                try:
+                    from urllib.parse import urlparse
+                    parsed = urlparse(org["website"])
+                    domain = parsed.netloc.replace("www.", "")
+                except Exception as e:
+                    logger.warning("Failed to parse domain", url=org.get("website"), error=str(e))
+
+            companies_data.append({
+                "name": org.get("name", "Unknown Organization"),
+                "website_url": org.get("website"),
+                "domain": domain,
+                "description": org.get("context", "")
+            })
+
+        # Match all organizations against existing companies (and each other) in one pass
+        resolutions = await resolver.resolve_companies(companies_data)
+
+        from sqlalchemy import select
+        from app.features.business_automations.sales_outreach_prep.models import CampaignCompany
+        linked_stmt = select(CampaignCompany.company_id).where(CampaignCompany.campaign_id == campaign_id)
+        linked_company_ids = set((await db.execute(linked_stmt)).scalars().all())
+        created_by_cluster = {}
+
+        # Create Company records for organizations without a match
+        for org, company_data, resolution in zip(organizations, companies_data, resolutions):
             try:
-                # Extract domain from website URL
-                domain = None
-                if org.get("website"):
-                    try:
-                        from urllib.parse import urlparse
-                        parsed = urlparse(org["website"])
-                        domain = parsed.netloc.replace("www.", "")
-                    except Exception as e:
-                        logger.warning("Failed to parse domain", url=org.get("website"), error=str(e))
-
-                # Create Company
-                company_data = {
-                    "name": org.get("name", "Unknown Organization"),
-                    "website_url": org.get("website"),
-                    "domain": domain,
-                    "description": org.get("context", "")
-                }
-
-                company = await company_service.create_company(company_data, current_user)
+                company_id = resolution.company_id or created_by_cluster.get(resolution.cluster)
+                if company_id is None:
+                    company = await company_service.create_company(company_data, current_user)
+                    company_id = created_by_cluster[resolution.cluster] = company.id
+
+                if company_id in linked_company_ids:
+                    continue
 
                 # Link to campaign
-                from app.features.business_automations.sales_outreach_prep.models import CampaignCompany
                 campaign_company = CampaignCompany(
                     campaign_id=campaign_id,
-                    company_id=company.id,
+                    company_id=company_id,
                     research_status="approved",
                     ai_insights=[
                         f"Discovered via AI research: {org.get('source', 'unknown')}",
@@ -264,14 +301,16 @@ async def approve_all_organizations(
                     ]
                 )
                 db.add(campaign_company)
+                linked_company_ids.add(company_id)
 
-                approved_companies.append(company.id)
+                approved_companies.append(company_id)
 
                 logger.info(
                     "Organization approved (batch)",
                     campaign_id=campaign_id,
-                    company_id=company.id,
-                    org_name=org.get("name")
+                    company_id=company_id,
+                    org_name=org.get("name"),
+                    matched_existing=bool(resolution.company_id)
                 )
 
             except Exception as e:
@@ -322,18 +361,21 @@ async def import_all_prospects(
     db: AsyncSession = Depends(get_db),
     campaign_service: CampaignCrudService = Depends(get_campaign_service),
     company_service: CompanyCrudService = Depends(get_company_service),
+    resolver: EntityResolutionService = Depends(get_entity_resolution_service),
     current_user: User = Depends(get_current_user)
 ):
     """
     Import all prospects from AI research results.
 
-    Creates Company and Prospect records from research_data.prospects.
+    Creates Company and Prospect records from research_data.prospects,
+    reusing matching companies and skipping prospects already in the campaign.
 
     Args:
         campaign_id: Campaign ID
         db: Database session
         campaign_service: Campaign service
         company_service: Company service
+        resolver: Entity resolution service
         current_user: Current user
 
     Returns:
@@ -356,9 +398,7 @@ async def import_all_prospects(
         prospect_service = ProspectCrudService(db, campaign.tenant_id)
 
         companies_created = 0
-        prospects_created = 0
-        prospects_skipped = 0
-        companies_cache = {}  # Cache companies by name to avoid duplicates
+        prospect_rows = []
 
         logger.info(
             "Starting prospect import",
@@ -366,123 +406,55 @@ async def import_all_prospects(
             total_prospects=len(prospects_data)
         )
 
+        # Resolve every prospect's company in one pass: existing companies are
+        # reused, and spellings of the same new company share one record
+        company_candidates = []
         for prospect_data in prospects_data:
+            website_url = prospect_data.get("company_website")
+            domain = None
+            if website_url:
+                try:
+                    domain = urlparse(website_url).netloc.replace("www.", "")
+                except Exception:
+                    pass
+            company_candidates.append({
+                "name": prospect_data.get("company_name", "Unknown Company"),
+                "website_url": website_url,
+                "domain": domain
+            })
+        resolutions = await resolver.resolve_companies(company_candidates)
+        created_by_cluster = {}
+
+        for prospect_data, company_data, resolution in zip(prospects_data, company_candidates, resolutions):
             try:
-                company_name = prospect_data.get("company_name", "Unknown Company")
-
                 logger.debug(
                     "Processing prospect",
                     name=prospect_data.get("full_name"),
-                    company=company_name
+                    company=company_data["name"]
                 )
 
                 # Get or create company
-                if company_name in companies_cache:
-                    company = companies_cache[company_name]
-                else:
-                    # Check if company already exists by name
-                    from sqlalchemy import select
-                    from app.features.business_automations.sales_outreach_prep.models import Company
-
-                    stmt = select(Company).where(
-                        Company.name == company_name,
-                        Company.tenant_id == campaign.tenant_id
+                company_id = resolution.company_id or created_by_cluster.get(resolution.cluster)
+                if company_id is None:
+                    company = await company_service.create_company(company_data, current_user)
+                    company_id = created_by_cluster[resolution.cluster] = company.id
+                    companies_created += 1
+
+                    logger.info(
+                        "Company created from AI research",
+                        company_id=company.id,
+                        company_name=company_data["name"]
                     )
-                    result = await db.execute(stmt)
-                    company = result.scalar_one_or_none()
-
-                    if not company:
-                        # Extract domain from website
-                        domain = None
-                        website_url = prospect_data.get("company_website")
-                        if website_url:
-                            try:
-                                parsed = urlparse(website_url)
-                                domain = parsed.netloc.replace("www.", "")
-                            except Exception:
-                                pass
-
-                        # Create new company
-                        company_create_data = {
-                            "name": company_name,
-                            "website_url": website_url,
-                            "domain": domain
-                        }
-
-                        company = await company_service.create_company(
-                            company_create_data,
-                            current_user
-                        )
-                        companies_created += 1
-
-                        logger.info(
-                            "Company created from AI research",
-                            company_id=company.id,
-                            company_name=company_name
-                        )
-
-                    # Cache it
-                    companies_cache[company_name] = company
-
-                # Check if prospect already exists (by LinkedIn URL or name + campaign)
-                from app.features.business_automations.sales_outreach_prep.models import Prospect
-
-                linkedin_url = prospect_data.get("linkedin_url")
-                full_name = prospect_data.get("full_name", "Unknown")
-
-                # Try to find existing prospect
-                existing_prospect = None
-                if linkedin_url:
-                    # Check by LinkedIn URL (most reliable)
-                    stmt = select(Prospect).where(
-                        Prospect.linkedin_url == linkedin_url,
-                        Prospect.campaign_id == campaign_id
-                    )
-                    result = await db.execute(stmt)
-                    existing_prospect = result.scalar_one_or_none()
-
-                if not existing_prospect:
-                    # Check by full name + campaign (fallback)
-                    stmt = select(Prospect).where(
-                        Prospect.full_name == full_name,
-                        Prospect.campaign_id == campaign_id
-                    )
-                    result = await db.execute(stmt)
-                    existing_prospect = result.scalar_one_or_none()
-
-                if existing_prospect:
-                    logger.debug(
-                        "Prospect already exists, skipping",
-                        prospect_id=existing_prospect.id,
-                        name=full_name
-                    )
-                    prospects_skipped += 1
-                    continue  # Skip this prospect
 
-                # Create new prospect
-                prospect_create_data = {
+                prospect_rows.append({
                     "campaign_id": campaign_id,
-                    "company_id": company.id,
-                    "full_name": full_name,
+                    "company_id": company_id,
+                    "full_name": prospect_data.get("full_name", "Unknown"),
                     "job_title": prospect_data.get("job_title"),
-                    "linkedin_url": linkedin_url,
+                    "linkedin_url": prospect_data.get("linkedin_url"),
                     "discovered_via": "ai_research",
                     "discovery_query": f"AI Research: {campaign.research_prompt[:100]}"
-                }
-
-                prospect = await prospect_service.create_prospect(
-                    prospect_create_data,
-                    user=current_user
-                )
-
-                prospects_created += 1
-
-                logger.debug(
-                    "Prospect imported",
-                    prospect_id=prospect.id,
-                    name=prospect.full_name,
-                    company=company_name
-                )
+                })
 
             except Exception as e:
                 logger.warning(
@@ -492,6 +464,14 @@ async def import_all_prospects(
                 )
                 continue
 
+        # Near-duplicates of campaign prospects are dropped here; exact repeats
+        # are also skipped by bulk_create_prospects' ON CONFLICT DO NOTHING
+        candidate_count = len(prospect_rows)
+        prospect_rows, _ = await resolver.filter_new_prospects(campaign_id, prospect_rows)
+        created_ids = await prospect_service.bulk_create_prospects(prospect_rows, user=current_user)
+        prospects_created = len(created_ids)
+        prospects_skipped = candidate_count - prospects_created
+
         await commit_transaction(db, "import_all_prospects")
 
         # Update campaign stats
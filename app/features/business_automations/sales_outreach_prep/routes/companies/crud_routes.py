@@ -4,13 +4,18 @@ Company CRUD API routes for Sales Outreach Prep.
 Handles:
 - GET /api/list - List companies (for Tabulator)
 - GET /api/search - Search companies by name (for autocomplete)
+- GET /api/merge-suggestions - Companies that look like duplicates
 - GET /{company_id} - Get company details
 - DELETE /{company_id} - Delete company
 """
 
 from app.features.core.route_imports import *
-from app.features.business_automations.sales_outreach_prep.dependencies import get_company_service
+from app.features.business_automations.sales_outreach_prep.dependencies import (
+    get_company_service,
+    get_entity_resolution_service
+)
 from app.features.business_automations.sales_outreach_prep.services.companies import CompanyCrudService
+from app.features.business_automations.sales_outreach_prep.services.entity_resolution_service import EntityResolutionService
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -89,6 +94,32 @@ async def search_companies_api(
         raise HTTPException(status_code=500, detail="Failed to search companies")
 
 
+@router.get("/api/merge-suggestions")
+async def company_merge_suggestions_api(
+    limit: int = Query(100, ge=1, le=500),
+    service: EntityResolutionService = Depends(get_entity_resolution_service),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Suggest companies to merge (same domain or near-identical name).
+
+    Args:
+        limit: Max suggestions
+        service: Entity resolution service
+        current_user: Current user
+
+    Returns:
+        JSON list of merge suggestions (canonical_id, duplicate_ids, score, reason)
+    """
+    try:
+        suggestions = await service.company_merge_suggestions(limit=limit)
+        return [suggestion.to_dict() for suggestion in suggestions]
+
+    except Exception as e:
+        handle_route_error("company_merge_suggestions_api", e)
+        raise HTTPException(status_code=500, detail="Failed to build merge suggestions")
+
+
 @router.get("/{company_id}")
 async def get_company(
     company_id: str,
@@ -3,6 +3,7 @@ Prospect CRUD API routes for Sales Outreach Prep.
 
 Handles:
 - GET /api/list - List prospects (for Tabulator)
+- GET /api/merge-suggestions - Prospects in a campaign that look like duplicates
 - GET /{prospect_id} - Get prospect details
 - DELETE /{prospect_id} - Delete prospect
 - POST /bulk/update-status - Bulk update prospect status
@@ -10,8 +11,12 @@ Handles:
 
 from typing import List
 from app.features.core.route_imports import *
-from app.features.business_automations.sales_outreach_prep.dependencies import get_prospect_service
+from app.features.business_automations.sales_outreach_prep.dependencies import (
+    get_entity_resolution_service,
+    get_prospect_service
+)
 from app.features.business_automations.sales_outreach_prep.services.prospects import ProspectCrudService
+from app.features.business_automations.sales_outreach_prep.services.entity_resolution_service import EntityResolutionService
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -71,6 +76,34 @@ async def list_prospects_api(
         raise HTTPException(status_code=500, detail="Failed to list prospects")
 
 
+@router.get("/api/merge-suggestions")
+async def prospect_merge_suggestions_api(
+    campaign_id: str = Query(...),
+    limit: int = Query(100, ge=1, le=500),
+    service: EntityResolutionService = Depends(get_entity_resolution_service),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Suggest prospects to merge within a campaign.
+
+    Args:
+        campaign_id: Campaign ID
+        limit: Max suggestions
+        service: Entity resolution service
+        current_user: Current user
+
+    Returns:
+        JSON list of merge suggestions (canonical_id, duplicate_ids, score, reason)
+    """
+    try:
+        suggestions = await service.prospect_merge_suggestions(campaign_id, limit=limit)
+        return [suggestion.to_dict() for suggestion in suggestions]
+
+    except Exception as e:
+        handle_route_error("prospect_merge_suggestions_api", e)
+        raise HTTPException(status_code=500, detail="Failed to build merge suggestions")
+
+
 @router.get("/{prospect_id}")
 async def get_prospect(
     prospect_id: str,
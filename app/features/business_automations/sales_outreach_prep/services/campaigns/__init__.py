@@ -1,5 +1,13 @@
 """Campaign services for Sales Outreach Prep."""
 
 from .crud_services import CampaignCrudService
+from .progress_channel import (
+    campaign_snapshot,
+    get_campaign_progress_channel,
+)
 
-__all__ = ["CampaignCrudService"]
+__all__ = [
+    "CampaignCrudService",
+    "campaign_snapshot",
+    "get_campaign_progress_channel",
+]
@@ -0,0 +1,120 @@
+"""
+Campaign progress channel for Sales Outreach Prep.
+
+Discovery, enrichment and AI research tasks publish campaign change events
+here instead of the SSE endpoint polling the database. Events are kept in
+a short per-campaign log with monotonically increasing ids, so a client
+that reconnects with ``Last-Event-ID`` resumes where it left off.
+
+The log is a core event log (see ``app.features.core.event_streams``):
+a Redis stream when ``REDIS_URL`` is set (Celery workers and web workers
+see the same events); otherwise an in-process log, which only reaches
+streams served by the publishing process (development).
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, AsyncIterator, Dict, Optional
+
+from app.features.core.config import get_settings
+from app.features.core.event_streams import (
+    HEARTBEAT_MESSAGE,
+    INITIAL_EVENT_ID,
+    EventLog,
+    InMemoryEventLog,
+    RedisEventLog,
+    format_sse,
+    retry_message,
+)
+
+settings = get_settings()
+
+# Seconds between heartbeats on an idle stream (also the longest blocking read)
+HEARTBEAT_SECONDS = float(getattr(settings, "SALES_CAMPAIGN_STREAM_HEARTBEAT_SECONDS", 15))
+# Events kept per campaign for Last-Event-ID resumption
+MAX_EVENTS_PER_CAMPAIGN = 200
+# Event types after which the stream is closed
+TERMINAL_EVENTS = ("complete", "error")
+
+
+def campaign_snapshot(campaign) -> Dict[str, Any]:
+    """Row fields streamed to the campaigns table (research_data is fetched on completion)."""
+    return {
+        "id": campaign.id,
+        "status": campaign.status,
+        "discovery_type": campaign.discovery_type,
+        "total_prospects": campaign.total_prospects or 0,
+        "enriched_prospects": campaign.enriched_prospects or 0,
+    }
+
+
+def is_research_complete(snapshot: Dict[str, Any]) -> bool:
+    """Terminal state for AI research campaigns (status moves from draft to active)."""
+    return snapshot.get("discovery_type") == "ai_research" and snapshot.get("status") == "active"
+
+
+async def campaign_event_stream(
+    channel: EventLog,
+    campaign_id: str,
+    snapshot: Optional[Dict[str, Any]],
+    cursor: str,
+    heartbeat_seconds: float = HEARTBEAT_SECONDS
+) -> AsyncIterator[str]:
+    """
+    Yield SSE messages for a campaign from the progress channel.
+
+    A fresh connection first receives ``snapshot`` (read from the database
+    after ``cursor`` was taken, so nothing published in between is lost);
+    a resumed one (``snapshot`` None, ``cursor`` = Last-Event-ID) only
+    replays what it missed. Progress events carry only fields that differ
+    from what this stream already sent; idle periods produce heartbeat
+    comments so proxies keep the connection open.
+    """
+    sent: Dict[str, Any] = {}
+    yield retry_message()
+
+    if snapshot is not None:
+        sent.update(snapshot)
+        yield format_sse("progress", snapshot, cursor if cursor != INITIAL_EVENT_ID else None)
+        if is_research_complete(snapshot):
+            yield format_sse("complete", {"campaign_id": campaign_id, "status": snapshot.get("status")})
+            return
+
+    while True:
+        events = await channel.read(campaign_id, cursor, timeout=heartbeat_seconds)
+        if not events:
+            yield HEARTBEAT_MESSAGE
+            continue
+
+        for event in events:
+            cursor = event.id
+            if event.event == "progress":
+                changes = {key: value for key, value in event.data.items() if sent.get(key) != value}
+                if not changes:
+                    continue
+                sent.update(changes)
+                yield format_sse("progress", {"id": campaign_id, **changes}, event.id)
+            else:
+                yield format_sse(event.event, event.data, event.id)
+                if event.event in TERMINAL_EVENTS:
+                    return
+
+
+_channel: Optional[EventLog] = None
+
+
+def get_campaign_progress_channel() -> EventLog:
+    """
+    Return the process-wide campaign progress channel.
+
+    Uses Redis when ``REDIS_URL`` is configured so events published by
+    Celery tasks reach every web worker; otherwise falls back to memory.
+    """
+    global _channel
+    if _channel is None:
+        if os.getenv("REDIS_URL"):
+            _channel = RedisEventLog("sales:campaign_events", max_events=MAX_EVENTS_PER_CAMPAIGN)
+        else:
+            _channel = InMemoryEventLog(max_events=MAX_EVENTS_PER_CAMPAIGN)
+    return _channel
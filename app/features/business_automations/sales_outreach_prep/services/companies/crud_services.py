@@ -13,6 +13,10 @@ from typing import Dict, List, Optional, Tuple, Any
 from app.features.core.sqlalchemy_imports import *
 from app.features.core.enhanced_base_service import BaseService
 from app.features.business_automations.sales_outreach_prep.models import Company
+from app.features.business_automations.sales_outreach_prep.utils.entity_resolution import (
+    normalize_company_name,
+    normalize_domain
+)
 
 logger = get_logger(__name__)
 
@@ -99,18 +103,42 @@ class CompanyCrudService(BaseService[Company]):
             await self.handle_error("get_company_by_id", e, company_id=company_id)
             raise
 
+    async def get_companies_by_ids(self, company_ids: List[str]) -> List[Company]:
+        """
+        Get several companies in one query (tenant-scoped).
+
+        Args:
+            company_ids: Company IDs (unknown or other-tenant IDs are skipped)
+
+        Returns:
+            List of Company objects
+        """
+        try:
+            if not company_ids:
+                return []
+            stmt = self.create_base_query(Company).where(Company.id.in_(set(company_ids)))
+            result = await self.db.execute(stmt)
+            return list(result.scalars().all())
+        except Exception as e:
+            await self.handle_error("get_companies_by_ids", e, count=len(company_ids))
+            raise
+
     async def get_company_by_domain(self, domain: str) -> Optional[Company]:
         """
         Get company by domain (tenant-scoped).
 
         Args:
-            domain: Company domain (e.g., 'acme.com')
+            domain: Company domain or URL (e.g., 'acme.com', 'https://www.Acme.com/')
 
         Returns:
             Company object or None
         """
         try:
-            stmt = self.create_base_query(Company).where(Company.domain == domain)
+            # Matches on the normalized domain key, however the domain was entered
+            domain = normalize_domain(domain)
+            if not domain:
+                return None
+            stmt = self.create_base_query(Company).where(Company.domain_key == domain).limit(1)
             result = await self.db.execute(stmt)
             company = result.scalar_one_or_none()
 
@@ -144,9 +172,11 @@ class CompanyCrudService(BaseService[Company]):
             if not self.tenant_id or self.tenant_id == "global":
                 raise ValueError("Tenant ID is required for creating companies")
 
+            domain_key = normalize_domain(data.get('domain'))
+
             # Check for duplicate domain
-            if data.get('domain'):
-                existing = await self.get_company_by_domain(data['domain'])
+            if domain_key:
+                existing = await self.get_company_by_domain(domain_key)
                 if existing:
                     raise ValueError(f"Company with domain {data['domain']} already exists")
 
@@ -154,7 +184,9 @@ class CompanyCrudService(BaseService[Company]):
             company = Company(
                 tenant_id=self.tenant_id,
                 name=data.get('name'),
+                name_key=normalize_company_name(data.get('name')),
                 domain=data.get('domain'),
+                domain_key=domain_key,
                 alternate_domains=data.get('alternate_domains', []),
                 industry=data.get('industry'),
                 headquarters=data.get('headquarters'),
@@ -220,9 +252,11 @@ class CompanyCrudService(BaseService[Company]):
                 logger.warning("Company not found for update", company_id=company_id)
                 return None
 
+            domain_key = normalize_domain(data.get('domain'))
+
             # Check for duplicate domain if changing
-            if 'domain' in data and data['domain'] != company.domain:
-                existing = await self.get_company_by_domain(data['domain'])
+            if domain_key and domain_key != company.domain_key:
+                existing = await self.get_company_by_domain(domain_key)
                 if existing and existing.id != company_id:
                     raise ValueError(f"Company with domain {data['domain']} already exists")
 
@@ -235,6 +269,10 @@ class CompanyCrudService(BaseService[Company]):
             ]:
                 if field in data:
                     setattr(company, field, data[field])
+            if 'name' in data:
+                company.name_key = normalize_company_name(company.name)
+            if 'domain' in data:
+                company.domain_key = domain_key
 
             # Update audit fields
             if user:
@@ -310,6 +348,10 @@ class CompanyCrudService(BaseService[Company]):
         """
         Search companies by name (for autocomplete/typeahead).
 
+        Matches on the normalized name key, so "ACME, Inc." finds "Acme Inc";
+        substring and trigram-similar names both use the pg_trgm index and
+        the closest names come first.
+
         Args:
             name_query: Partial company name
             limit: Max results
@@ -318,12 +360,15 @@ class CompanyCrudService(BaseService[Company]):
             List of matching companies
         """
         try:
-            stmt = (
-                self.create_base_query(Company)
-                .where(Company.name.ilike(f"%{name_query}%"))
-                .order_by(Company.name.asc())
-                .limit(limit)
-            )
+            key = normalize_company_name(name_query)
+            stmt = self.create_base_query(Company)
+            if key:
+                stmt = stmt.where(
+                    or_(Company.name_key.ilike(f"%{key}%"), Company.name_key.op("%")(key))
+                ).order_by(func.similarity(Company.name_key, key).desc(), Company.name.asc())
+            else:
+                stmt = stmt.where(Company.name.ilike(f"%{name_query}%")).order_by(Company.name.asc())
+            stmt = stmt.limit(limit)
 
             result = await self.db.execute(stmt)
             companies = list(result.scalars().all())
@@ -0,0 +1,272 @@
+"""
+Entity resolution service for Sales Outreach Prep.
+
+Resolves incoming companies and prospects (from discovery and AI research
+imports) against what the tenant already has, and reports near-duplicates
+already stored as merge suggestions. Existing records are loaded as a
+narrow projection (id, key, identifiers) in one query and matched in
+memory through a token-blocked index, so a batch costs one round trip
+and no pairwise comparison; see utils.entity_resolution. A single
+candidate only loads its own neighbours through the trigram index, and
+a discovery run builds its prospect index once and extends it as rows
+are inserted.
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.features.core.sqlalchemy_imports import *
+from app.features.core.enhanced_base_service import BaseService
+from app.features.business_automations.sales_outreach_prep.models import Company, Prospect
+from app.features.business_automations.sales_outreach_prep.services.prospects.crud_services import (
+    normalize_linkedin_url
+)
+from app.features.business_automations.sales_outreach_prep.utils.entity_resolution import (
+    COMPANY_MATCH_THRESHOLD,
+    PERSON_MATCH_THRESHOLD,
+    BlockingIndex,
+    MergeSuggestion,
+    ResolutionRecord,
+    cluster_records,
+    company_record,
+    prospect_record
+)
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CompanyResolution:
+    """
+    Where one company candidate belongs.
+
+    ``company_id`` is the matching existing company, or None for a new
+    one; candidates describing the same new company share a ``cluster``.
+    """
+
+    company_id: Optional[str]
+    cluster: str
+    score: float
+    reason: Optional[str] = None
+
+
+class EntityResolutionService(BaseService[Company]):
+    """Match companies and prospects against existing records (tenant-scoped)."""
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        tenant_id: Optional[str] = None,
+        company_threshold: float = COMPANY_MATCH_THRESHOLD,
+        person_threshold: float = PERSON_MATCH_THRESHOLD
+    ):
+        super().__init__(db_session, tenant_id)
+        self.company_threshold = company_threshold
+        self.person_threshold = person_threshold
+        # Ids for candidate records, unique across calls sharing an index
+        self._new_ids = itertools.count()
+
+    def _new_id(self) -> str:
+        return f"new:{next(self._new_ids)}"
+
+    async def _company_records(self, near: Optional[ResolutionRecord] = None) -> List:
+        """
+        Projection of the tenant's companies, oldest first.
+
+        Args:
+            near: Only load companies sharing its domain or trigram-similar to
+                its name key (``name_key % :key``, served by the pg_trgm index)
+        """
+        stmt = self.create_base_query(Company).with_only_columns(
+            Company.id, Company.name, Company.name_key, Company.domain_key
+        ).order_by(Company.created_at.asc(), Company.id.asc())
+        if near is not None:
+            conditions = [
+                Company.domain_key == identifier.split(":", 1)[1]
+                for identifier in near.identifiers if identifier.startswith("domain:")
+            ]
+            if near.key:
+                conditions.append(Company.name_key.op("%")(near.key))
+            if not conditions:
+                return []
+            stmt = stmt.where(or_(*conditions))
+        rows = (await self.db.execute(stmt)).all()
+        return [company_record(row.id, row.name, row.domain_key, row.name_key) for row in rows]
+
+    async def _prospect_records(self, campaign_id: str) -> List:
+        """Projection of a campaign's prospects, oldest first."""
+        stmt = self.create_base_query(Prospect).with_only_columns(
+            Prospect.id, Prospect.full_name, Prospect.company_id, Prospect.linkedin_url, Prospect.email
+        ).where(Prospect.campaign_id == campaign_id).order_by(Prospect.created_at.asc(), Prospect.id.asc())
+        rows = (await self.db.execute(stmt)).all()
+        return [
+            prospect_record(
+                row.id,
+                row.full_name,
+                row.company_id,
+                normalize_linkedin_url(row.linkedin_url),
+                row.email
+            )
+            for row in rows
+        ]
+
+    async def resolve_companies(self, candidates: Sequence[Dict[str, Any]]) -> List[CompanyResolution]:
+        """
+        Resolve company candidates (``name`` and optional ``domain``/``website_url``).
+
+        A single candidate is matched against its trigram neighbours only;
+        larger batches load the tenant's companies once.
+
+        Args:
+            candidates: Company data dicts, e.g. from AI research results
+
+        Returns:
+            One CompanyResolution per candidate, in order
+        """
+        try:
+            records = [
+                company_record(
+                    self._new_id(),
+                    candidate.get("name"),
+                    candidate.get("domain") or candidate.get("website_url")
+                )
+                for candidate in candidates
+            ]
+            index = BlockingIndex(self.company_threshold)
+            near = records[0] if len(records) == 1 else None
+            for existing in await self._company_records(near):
+                index.add(existing)
+
+            resolutions: List[CompanyResolution] = []
+            for record in records:
+                found = index.match(record)
+                if found is None:
+                    # Unknown company: later candidates may still match it
+                    index.add(record)
+                    resolutions.append(CompanyResolution(None, record.id, 0.0))
+                elif found.record.id.startswith("new:"):
+                    resolutions.append(CompanyResolution(None, found.record.id, found.score, found.reason))
+                else:
+                    resolutions.append(
+                        CompanyResolution(found.record.id, found.record.id, found.score, found.reason)
+                    )
+
+            logger.info(
+                "Resolved company candidates",
+                candidates=len(candidates),
+                matched=sum(1 for resolution in resolutions if resolution.company_id),
+                new=len({resolution.cluster for resolution in resolutions if not resolution.company_id}),
+                tenant_id=self.tenant_id
+            )
+            return resolutions
+
+        except Exception as e:
+            await self.handle_error("resolve_companies", e, count=len(candidates))
+            raise
+
+    async def prospect_index(self, campaign_id: str) -> BlockingIndex:
+        """
+        Index of a campaign's prospects for repeated ``filter_new_prospects`` calls.
+
+        Args:
+            campaign_id: Campaign ID
+
+        Returns:
+            BlockingIndex loaded with the campaign's prospects
+        """
+        try:
+            index = BlockingIndex(self.person_threshold)
+            for record in await self._prospect_records(campaign_id):
+                index.add(record)
+            return index
+        except Exception as e:
+            await self.handle_error("prospect_index", e, campaign_id=campaign_id)
+            raise
+
+    async def filter_new_prospects(
+        self,
+        campaign_id: str,
+        rows: Sequence[Dict[str, Any]],
+        index: Optional[BlockingIndex] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Drop prospect rows that match an existing campaign prospect or an earlier row.
+
+        Catches what the exact dedupe key misses: the same LinkedIn profile
+        or email, or a near-identical name ("Jane Doe, MBA") at the same company.
+
+        Args:
+            campaign_id: Campaign the rows will be created in
+            rows: Prospect data dicts for bulk_create_prospects
+            index: Index from ``prospect_index`` shared across calls; kept rows
+                are added to it, so later calls see them without a reload
+
+        Returns:
+            Tuple of (rows to create, number of rows dropped as duplicates)
+        """
+        try:
+            if index is None:
+                index = await self.prospect_index(campaign_id)
+
+            kept: List[Dict[str, Any]] = []
+            for row in rows:
+                record = prospect_record(
+                    self._new_id(),
+                    row.get("full_name"),
+                    row.get("company_id"),
+                    normalize_linkedin_url(row.get("linkedin_url")),
+                    row.get("email")
+                )
+                if index.match(record) is None:
+                    index.add(record)
+                    kept.append(row)
+
+            skipped = len(rows) - len(kept)
+            if skipped:
+                logger.info(
+                    "Dropped duplicate prospect candidates",
+                    campaign_id=campaign_id,
+                    candidates=len(rows),
+                    skipped=skipped
+                )
+            return kept, skipped
+
+        except Exception as e:
+            await self.handle_error("filter_new_prospects", e, campaign_id=campaign_id, count=len(rows))
+            raise
+
+    async def company_merge_suggestions(self, limit: int = 100) -> List[MergeSuggestion]:
+        """
+        Groups of existing companies that look like one organization.
+
+        Args:
+            limit: Max suggestions (largest groups first)
+
+        Returns:
+            MergeSuggestion list; the oldest company of each group is canonical
+        """
+        try:
+            suggestions = cluster_records(await self._company_records(), self.company_threshold)
+            return suggestions[:limit]
+        except Exception as e:
+            await self.handle_error("company_merge_suggestions", e)
+            raise
+
+    async def prospect_merge_suggestions(self, campaign_id: str, limit: int = 100) -> List[MergeSuggestion]:
+        """
+        Groups of prospects in a campaign that look like one person.
+
+        Args:
+            campaign_id: Campaign ID
+            limit: Max suggestions (largest groups first)
+
+        Returns:
+            MergeSuggestion list; the oldest prospect of each group is canonical
+        """
+        try:
+            suggestions = cluster_records(await self._prospect_records(campaign_id), self.person_threshold)
+            return suggestions[:limit]
+        except Exception as e:
+            await self.handle_error("prospect_merge_suggestions", e, campaign_id=campaign_id)
+            raise
@@ -0,0 +1,479 @@
+"""
+Market mapping service for Sales Outreach Prep.
+
+Async port of the original ``market_mapper.py`` script:
+1. Asks OpenAI for the competitive landscape around a company
+2. Looks up each competitor's domains (OpenAI, cached per company name)
+3. Searches LinkedIn executives for every company x country pair (Firecrawl)
+4. Finds executive emails (Hunter.io, paced by a token bucket)
+5. Streams the result into an Excel workbook
+
+Steps 2 and 3 run concurrently on a TaskGraph under per-provider limits;
+dataframe transforms are vectorized; the workbook is written with
+openpyxl's write-only mode, so rows go to disk as they are appended.
+"""
+
+import asyncio
+import json
+import re
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+from app.features.core.config import get_settings
+from app.features.core.sqlalchemy_imports import get_logger
+from app.features.core.utils.external_api_clients import OpenAIClient
+from app.features.business_automations.sales_outreach_prep.utils.entity_resolution import normalize_company_name
+from app.features.business_automations.sales_outreach_prep.utils.firecrawl_client import FirecrawlClient
+from app.features.business_automations.sales_outreach_prep.utils.hunter_client import HunterClient
+from app.features.business_automations.sales_outreach_prep.utils.rate_limiter import get_token_bucket
+from app.features.business_automations.sales_outreach_prep.utils.task_graph import TaskGraph
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Concurrent Firecrawl searches / OpenAI calls within one market map
+SEARCH_CONCURRENCY = int(getattr(settings, "SALES_MARKET_MAP_SEARCH_CONCURRENCY", 5))
+OPENAI_CONCURRENCY = int(getattr(settings, "SALES_MARKET_MAP_OPENAI_CONCURRENCY", 3))
+# Seconds before one search or domain lookup is abandoned
+NODE_TIMEOUT_SECONDS = float(getattr(settings, "SALES_MARKET_MAP_NODE_TIMEOUT_SECONDS", 60))
+# Executives whose email lookups run at once (Hunter's token bucket caps the rate)
+EMAIL_CONCURRENCY = int(getattr(settings, "SALES_MARKET_MAP_EMAIL_CONCURRENCY", 8))
+HUNTER_REQUESTS_PER_SECOND = float(getattr(settings, "HUNTER_REQUESTS_PER_SECOND", 15))
+# Company domains change rarely; lookups are reused across runs for this long
+DOMAIN_CACHE_TTL_SECONDS = float(getattr(settings, "SALES_MARKET_MAP_DOMAIN_CACHE_SECONDS", 86400))
+# Companies whose domains are kept before the least recently used are dropped
+DOMAIN_CACHE_MAX_ENTRIES = int(getattr(settings, "SALES_MARKET_MAP_DOMAIN_CACHE_MAX_ENTRIES", 2048))
+
+MARKET_DATA_COLUMNS = [
+    "Company name",
+    "Short description",
+    "Estimated market size",
+    "Product Breadth",
+    "Innovation Score",
+    "Completeness of Vision",
+    "Ability to Execute",
+]
+EXECUTIVE_COLUMNS = ["Company", "Name", "Title", "Region", "Domain", "Email", "Source", "Snippet"]
+NOT_FOUND = "N/A"
+
+_TITLE_FROM_SNIPPET = re.compile(
+    r"\b(?:I am an? (?P<a>.+?) with|I work as (?P<b>.+?) at|serving as (?P<c>.+?) at|currently an? (?P<d>.+?) at)\b",
+    re.IGNORECASE,
+)
+_CREDENTIALS = re.compile(r"\b(?:CFA|PhD|MBA|MD|Esq|CPA)\b", re.IGNORECASE)
+
+# normalized company name -> (expires_at, domains), least recently used first
+_domain_cache: "OrderedDict[str, Tuple[float, List[str]]]" = OrderedDict()
+
+
+def _cached_domains(key: str) -> Optional[List[str]]:
+    entry = _domain_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del _domain_cache[key]
+        return None
+    _domain_cache.move_to_end(key)
+    return entry[1]
+
+
+def _cache_domains(key: str, domains: List[str]) -> None:
+    _domain_cache[key] = (time.monotonic() + DOMAIN_CACHE_TTL_SECONDS, domains)
+    _domain_cache.move_to_end(key)
+    while len(_domain_cache) > DOMAIN_CACHE_MAX_ENTRIES:
+        _domain_cache.popitem(last=False)
+
+
+@dataclass
+class MarketMap:
+    """Result of one market mapping run."""
+
+    company_name: str
+    market_data: pd.DataFrame
+    summary: str
+    insights: List[str]
+    executives: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=EXECUTIVE_COLUMNS))
+    stats: Dict[str, Any] = field(default_factory=dict)
+
+
+def parse_market_response(content: str, company_name: str) -> Tuple[pd.DataFrame, str, List[str]]:
+    """
+    Split the landscape response into competitors, summary and insights.
+
+    The subject company is appended as the last row for comparison.
+
+    Raises:
+        ValueError: If the response does not follow the requested format
+    """
+    try:
+        json_part, _, rest = content.partition("Executive Summary:")
+        summary, _, insights_part = rest.partition("AI Insights:")
+        competitors = json.loads(json_part[json_part.find("["):json_part.rfind("]") + 1])
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Error parsing market landscape response: {e}") from e
+
+    df = pd.DataFrame(competitors)
+    df.columns = [str(column).strip().lower() for column in df.columns]
+    df = df.rename(columns={column.lower(): column for column in MARKET_DATA_COLUMNS})
+    subject = pd.DataFrame([{
+        "Company name": company_name,
+        "Short description": "Subject of analysis",
+        "Estimated market size": "High",
+        "Product Breadth": "Broad",
+        "Innovation Score": 7,
+        "Completeness of Vision": 8,
+        "Ability to Execute": 8,
+    }])
+    df = pd.concat([df.reindex(columns=MARKET_DATA_COLUMNS), subject], ignore_index=True)
+
+    insights = [line.strip("- ").strip() for line in insights_part.strip().splitlines() if line.strip()]
+    return df, summary.strip(), insights
+
+
+def jitter_duplicate_points(
+    df: pd.DataFrame,
+    x_col: str,
+    y_col: str,
+    rng: Optional[np.random.Generator] = None,
+    spread: float = 0.3,
+) -> pd.DataFrame:
+    """Nudge every repeat of an (x, y) point by up to ``spread`` so chart labels don't overlap."""
+    rng = rng or np.random.default_rng()
+    df = df.copy()
+    df[[x_col, y_col]] = df[[x_col, y_col]].astype(float)
+    repeated = df.duplicated(subset=[x_col, y_col], keep="first").to_numpy()
+    count = int(repeated.sum())
+    if count:
+        df.loc[repeated, [x_col, y_col]] += rng.uniform(-spread, spread, size=(count, 2)).round(2)
+    return df
+
+
+def clean_full_names(names: pd.Series) -> pd.Series:
+    """Drop everything after a comma and credentials such as MBA or PhD."""
+    cleaned = names.fillna("").astype(str).str.replace(r",.*$", "", regex=True)
+    cleaned = cleaned.str.replace(_CREDENTIALS, "", regex=True)
+    return cleaned.str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+def titles_from_snippets(snippets: pd.Series) -> pd.Series:
+    """Job titles phrased in profile snippets ("I work as X at ..."), else empty."""
+    extracted = snippets.fillna("").astype(str).str.extract(_TITLE_FROM_SNIPPET)
+    return extracted.bfill(axis=1).iloc[:, 0].fillna("").str.strip()
+
+
+def build_executives_frame(profiles: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+    """Tabulate raw profiles (``company``, ``country`` plus Firecrawl fields) in one pass."""
+    if not profiles:
+        return pd.DataFrame(columns=EXECUTIVE_COLUMNS)
+    raw = pd.DataFrame.from_records(profiles)
+    raw = raw.reindex(columns=["company", "country", "full_name", "job_title", "linkedin_url", "linkedin_snippet"])
+    executives = pd.DataFrame({
+        "Company": raw["company"],
+        "Name": raw["full_name"].fillna("").astype(str).str.strip(),
+        "Title": raw["job_title"].fillna("").astype(str).str.strip(),
+        "Region": raw["country"],
+        "Domain": NOT_FOUND,
+        "Email": NOT_FOUND,
+        "Source": raw["linkedin_url"],
+        "Snippet": raw["linkedin_snippet"].fillna(""),
+    })
+    missing_title = executives["Title"] == ""
+    executives.loc[missing_title, "Title"] = titles_from_snippets(executives.loc[missing_title, "Snippet"])
+    return executives.drop_duplicates(subset=["Company", "Source"], ignore_index=True)
+
+
+def parse_domains(content: str, limit: int = 5) -> List[str]:
+    """Plausible domains from a "- domain.com" list response."""
+    domains = []
+    for line in (content or "").splitlines():
+        domain = line.strip().strip("- ").strip().lower()
+        if (
+            "." in domain
+            and len(domain) > 3
+            and not domain.startswith(".")
+            and not domain.endswith(".")
+            and len(domain.split(".")[0]) >= 2
+            and " " not in domain
+            and not any(marker in domain for marker in (".....", "----", "xxxxx"))
+        ):
+            domains.append(domain)
+    return list(dict.fromkeys(domains))[:limit]
+
+
+def write_market_map_workbook(market_map: MarketMap, path: Optional[str] = None) -> str:
+    """
+    Stream the market map into an .xlsx file with openpyxl's write-only mode.
+
+    Args:
+        market_map: Result of MarketMappingService.build_market_map
+        path: Output path (default: a new temporary file)
+
+    Returns:
+        Path of the written workbook
+    """
+    if path is None:
+        with tempfile.NamedTemporaryFile(prefix="market_map_", suffix=".xlsx", delete=False) as handle:
+            path = handle.name
+
+    workbook = Workbook(write_only=True)
+
+    summary_sheet = workbook.create_sheet("Executive Summary")
+    summary_sheet.append(["Executive Summary"])
+    summary_sheet.append([market_map.summary])
+    summary_sheet.append([])
+    summary_sheet.append(["AI Insights"])
+    for insight in market_map.insights:
+        summary_sheet.append([f"- {insight}"])
+
+    for title, frame in (("Market Data", market_map.market_data), ("Executives", market_map.executives)):
+        sheet = workbook.create_sheet(title)
+        sheet.append(list(frame.columns))
+        # NaN is not a valid cell value; object dtype lets None through
+        for row in frame.astype(object).where(frame.notna(), None).itertuples(index=False, name=None):
+            sheet.append(row)
+
+    workbook.save(path)
+    logger.info(
+        "Market map workbook written",
+        path=path,
+        companies=len(market_map.market_data),
+        executives=len(market_map.executives)
+    )
+    return path
+
+
+class MarketMappingService:
+    """
+    Build market maps: competitors, executives and their emails.
+
+    Clients are passed in (see ``from_secrets``) so one service instance
+    can run several maps with shared connections. Use it as an async
+    context manager (or call ``aclose``) to release the Hunter.io
+    connection pool when done.
+    """
+
+    def __init__(
+        self,
+        openai_client: OpenAIClient,
+        firecrawl_client: FirecrawlClient,
+        hunter_client: Optional[HunterClient] = None,
+        search_concurrency: int = SEARCH_CONCURRENCY,
+        openai_concurrency: int = OPENAI_CONCURRENCY,
+        email_concurrency: int = EMAIL_CONCURRENCY,
+        node_timeout: float = NODE_TIMEOUT_SECONDS,
+    ):
+        self.openai_client = openai_client
+        self.firecrawl_client = firecrawl_client
+        self.hunter_client = hunter_client
+        self.search_concurrency = search_concurrency
+        self.openai_concurrency = openai_concurrency
+        self.email_concurrency = max(1, email_concurrency)
+        self.node_timeout = node_timeout
+
+    async def __aenter__(self) -> "MarketMappingService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the Hunter.io client's connection pool."""
+        if self.hunter_client is not None:
+            await self.hunter_client.aclose()
+
+    @classmethod
+    async def from_secrets(cls, db, tenant_id: str, current_user=None) -> "MarketMappingService":
+        """
+        Build the service with API keys from Secrets Management.
+
+        The service owns the clients it creates; close it with ``async with``
+        or ``aclose``.
+
+        Raises:
+            ValueError: If the OpenAI or Firecrawl key is missing (Hunter.io is optional)
+        """
+        from app.features.business_automations.sales_outreach_prep.utils.secrets_helper import (
+            get_firecrawl_api_key,
+            get_hunter_api_key,
+            get_openai_api_key
+        )
+
+        openai_key = await get_openai_api_key(db, tenant_id, current_user)
+        firecrawl_key = await get_firecrawl_api_key(db, tenant_id, current_user)
+        if not openai_key or not firecrawl_key:
+            raise ValueError("OpenAI and Firecrawl API keys must be configured in Secrets Management")
+        hunter_key = await get_hunter_api_key(db, tenant_id, current_user)
+        hunter = HunterClient(api_key=hunter_key, rate_limiter=get_token_bucket("hunter", hunter_key, HUNTER_REQUESTS_PER_SECOND)) if hunter_key else None
+        return cls(OpenAIClient(api_key=openai_key, default_model="gpt-4o"), FirecrawlClient(api_key=firecrawl_key), hunter)
+
+    async def fetch_market_data(self, company_name: str) -> Tuple[pd.DataFrame, str, List[str]]:
+        """Competitors (plus the subject company), executive summary and insights."""
+        prompt = f"""
+You are a senior market analyst.
+
+Part 1: Provide a JSON list of 5–10 competitors (direct or indirect) to {company_name}.
+Each object should include:
+- Company name
+- Short description (max 25 words)
+- Estimated market size: "Low", "Medium", or "High"
+- Product breadth: "Niche", "Moderate", or "Broad"
+- Innovation score: 1–10
+- Completeness of vision: 1–10
+- Ability to execute: 1–10
+
+Part 2: Provide an executive summary (150 words max) of the market landscape, labeled "Executive Summary:"
+Part 3: Provide 3–5 bullet-point insights labeled "AI Insights:".
+Each insight should highlight non-obvious patterns, outliers, disruptors, or strategic risks. Avoid generic observations.
+"""
+        content = await self.openai_client.chat_completion(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7
+        )
+        return parse_market_response(content, company_name)
+
+    async def lookup_domains(self, company_name: str) -> List[str]:
+        """Official domains for a company (cached per normalized name across runs)."""
+        key = normalize_company_name(company_name) or company_name.strip().lower()
+        cached = _cached_domains(key)
+        if cached is not None:
+            return cached
+
+        prompt = f"""
+You are a corporate domain name expert with access to factual company information.
+
+For the company "{company_name}", list ONLY the official website domains the company actively uses.
+Focus ONLY on primary corporate, consumer brand and major division domains, and common short aliases.
+
+IMPORTANT CONSTRAINTS:
+- Return between 1-5 domains maximum
+- Only include domains you're highly confident actually exist
+- Do NOT include subdomains, social media, third-party, or partner domains
+- If unsure, include fewer domains rather than guessing
+
+Format your response EXACTLY like this without ANY additional text:
+- domain1.com
+- domain2.com
+"""
+        content = await self.openai_client.chat_completion(
+            messages=[
+                {"role": "system", "content": "You provide factual domain information only."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.1
+        )
+        domains = parse_domains(content)
+        _cache_domains(key, domains)
+        return domains
+
+    async def build_market_map(
+        self,
+        company_name: str,
+        roles: Sequence[str],
+        countries: Sequence[str],
+        max_results_per_search: int = 20,
+    ) -> MarketMap:
+        """
+        Map the market around ``company_name``.
+
+        Args:
+            company_name: Subject company
+            roles: Job titles to search for (e.g. ["VP", "Director", "Chief"])
+            countries: Locations to search executives in
+            max_results_per_search: Profiles per company x country search
+
+        Returns:
+            MarketMap with competitors, summary, insights and executives
+        """
+        started = time.monotonic()
+        market_data, summary, insights = await self.fetch_market_data(company_name)
+        competitors = [name for name in market_data["Company name"].iloc[:-1].dropna().unique() if name]
+
+        graph = TaskGraph(
+            {"firecrawl": self.search_concurrency, "openai": self.openai_concurrency},
+            timeout=self.node_timeout
+        )
+        profiles: List[Dict[str, Any]] = []
+        domains_by_company: Dict[str, List[str]] = {}
+
+        def collect_profiles(company: str, country: str):
+            def handle(results):
+                for result in results or []:
+                    profiles.append({**result, "company": company, "country": country})
+            return handle
+
+        def collect_domains(company: str):
+            def handle(domains):
+                domains_by_company[company] = domains or []
+            return handle
+
+        for company in competitors:
+            if self.hunter_client is not None:
+                graph.spawn(
+                    "openai",
+                    ("domains", normalize_company_name(company) or company),
+                    lambda company=company: self.lookup_domains(company),
+                    then=collect_domains(company)
+                )
+            for country in countries:
+                graph.spawn(
+                    "firecrawl",
+                    (company, country),
+                    lambda company=company, country=country: self.firecrawl_client.search_linkedin_profiles(
+                        company_name=company,
+                        job_titles=list(roles) or None,
+                        location=country,
+                        max_results=max_results_per_search
+                    ),
+                    then=collect_profiles(company, country)
+                )
+        graph_stats = await graph.join()
+
+        executives = build_executives_frame(profiles)
+        emails_found = await self._find_emails(executives, domains_by_company)
+
+        stats = {
+            "competitors": len(competitors),
+            "searches": len(competitors) * len(countries),
+            "executives": len(executives),
+            "emails_found": emails_found,
+            "duration_seconds": round(time.monotonic() - started, 2),
+            **graph_stats.to_dict(),
+        }
+        logger.info("Market map built", company=company_name, **stats)
+        return MarketMap(company_name, market_data, summary, insights, executives, stats)
+
+    async def _find_emails(self, executives: pd.DataFrame, domains_by_company: Dict[str, List[str]]) -> int:
+        """Fill Email/Domain in place, trying each company domain in order; returns emails found."""
+        if self.hunter_client is None or executives.empty:
+            return 0
+
+        names = clean_full_names(executives["Name"]).str.split(n=1, expand=True).reindex(columns=[0, 1]).fillna("")
+        semaphore = asyncio.Semaphore(self.email_concurrency)
+
+        async def lookup(first_name: str, last_name: str, domains: List[str]) -> Tuple[str, str]:
+            if not first_name or not last_name:
+                return NOT_FOUND, NOT_FOUND
+            async with semaphore:
+                for domain in domains:
+                    try:
+                        found = await self.hunter_client.find_email(first_name, last_name, domain)
+                    except Exception as e:
+                        logger.warning("Email lookup failed", domain=domain, error=str(e))
+                        continue
+                    if found and found.get("email"):
+                        return found["email"], domain
+            return NOT_FOUND, NOT_FOUND
+
+        results = await asyncio.gather(*(
+            lookup(first, last, domains_by_company.get(company, []))
+            for first, last, company in zip(names[0], names[1], executives["Company"])
+        ))
+        executives[["Email", "Domain"]] = pd.DataFrame(results, index=executives.index, columns=["Email", "Domain"])
+        return int((executives["Email"] != NOT_FOUND).sum())
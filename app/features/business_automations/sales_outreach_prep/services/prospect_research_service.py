@@ -16,10 +16,11 @@ Example workflows:
 - Association members: association → member directory
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Awaitable
 from datetime import datetime
 import json
 
+from app.features.core.config import get_settings
 from app.features.core.sqlalchemy_imports import get_logger
 from app.features.core.utils.external_api_clients import (
     get_openai_client_from_secret,
@@ -27,8 +28,19 @@ from app.features.core.utils.external_api_clients import (
     OpenAIClient,
     FirecrawlClient
 )
+from app.features.business_automations.sales_outreach_prep.utils.task_graph import TaskGraph
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+# Concurrent calls per provider within one research run
+FIRECRAWL_CONCURRENCY = int(getattr(settings, "SALES_RESEARCH_FIRECRAWL_CONCURRENCY", 5))
+OPENAI_CONCURRENCY = int(getattr(settings, "SALES_RESEARCH_OPENAI_CONCURRENCY", 3))
+# Seconds before a single search/scrape/extraction is abandoned
+RESEARCH_NODE_TIMEOUT_SECONDS = float(getattr(settings, "SALES_RESEARCH_NODE_TIMEOUT_SECONDS", 45))
+
+# Callback receiving prospects as each search branch finishes
+ProspectsCallback = Callable[[List[Dict[str, Any]]], Awaitable[None]]
 
 
 class ProspectResearchService:
@@ -276,6 +288,93 @@ Analyze this and determine the best search strategy."""
             logger.exception("Failed to determine workflow strategy")
             raise
 
+    def _new_graph(self) -> TaskGraph:
+        """Task graph for one research run, limited per provider."""
+        return TaskGraph(
+            {"firecrawl": FIRECRAWL_CONCURRENCY, "openai": OPENAI_CONCURRENCY},
+            timeout=RESEARCH_NODE_TIMEOUT_SECONDS
+        )
+
+    def _search_node(self, graph: TaskGraph, query: str, limit: int, then) -> None:
+        """Spawn a Firecrawl search (identical query/limit pairs run once per graph)."""
+        graph.spawn(
+            "firecrawl",
+            ("search", query, limit),
+            lambda: self.firecrawl_client.search(query=query, limit=limit),
+            then=then
+        )
+
+    def _spawn_venue_research(
+        self,
+        graph: TaskGraph,
+        research_plan: Dict[str, Any],
+        on_organization: Callable[[Dict[str, Any]], Any]
+    ) -> None:
+        """
+        Spawn the venues → events → organizer nodes of venue research.
+
+        Each venue's event search starts as soon as its venue search returns,
+        and each event page is scraped and handed to OpenAI as soon as its
+        event search returns; ``on_organization`` is called per organizer found.
+        """
+        search_queries = research_plan.get("search_queries", [])
+        venues: List[Dict[str, Any]] = []
+
+        def on_page(event: Dict[str, Any], venue: Dict[str, Any]):
+            def handle(page_content):
+                if not page_content:
+                    return
+                markdown = page_content.get("markdown", "")
+                # Use OpenAI to extract organizer from page content
+                graph.spawn(
+                    "openai",
+                    ("organizer", event.get("url")),
+                    lambda: self._extract_organizer_from_content(
+                        markdown[:2000],  # First 2000 chars
+                        event.get("title"),
+                        venue["name"]
+                    ),
+                    then=lambda org: on_organization(org) if org else None
+                )
+            return handle
+
+        def on_events(venue: Dict[str, Any]):
+            def handle(event_results):
+                # Step 3: For each event, try to identify organizer
+                for event in event_results or []:
+                    url = event.get("url")
+                    if not url:
+                        continue
+                    graph.spawn(
+                        "firecrawl",
+                        ("scrape", url),
+                        lambda url=url: self.firecrawl_client.scrape(url=url, formats=["markdown"]),
+                        then=on_page(event, venue)
+                    )
+            return handle
+
+        def on_venues(query: str):
+            def handle(search_results):
+                if search_results is None:
+                    return
+                logger.info("Venue search completed", query=query, results=len(search_results))
+                # Step 2: For each venue, search for events
+                for result in search_results:
+                    if len(venues) >= 10:  # Limit to top 10 venues
+                        break
+                    venue = {
+                        "name": result.get("title", "Unknown venue"),
+                        "url": result.get("url"),
+                        "snippet": result.get("snippet", "")
+                    }
+                    venues.append(venue)
+                    self._search_node(graph, f"{venue['name']} corporate events awards", 3, on_events(venue))
+            return handle
+
+        # Step 1: Search for venues
+        for query in search_queries[:3]:  # Limit to first 3 queries
+            self._search_node(graph, query, 5, on_venues(query))
+
     async def venue_research_workflow(
         self,
         research_plan: Dict[str, Any]
@@ -301,86 +400,20 @@ Analyze this and determine the best search strategy."""
         if not self.firecrawl_client:
             raise ValueError("Firecrawl client not initialized. Call _init_clients() first.")
 
-        organizations = []
-        search_queries = research_plan.get("search_queries", [])
-
         logger.info(
             "Starting venue research workflow",
-            num_queries=len(search_queries)
+            num_queries=len(research_plan.get("search_queries", []))
         )
 
-        # Step 1: Search for venues
-        venues = []
-        for query in search_queries[:3]:  # Limit to first 3 queries
-            try:
-                search_results = await self.firecrawl_client.search(
-                    query=query,
-                    limit=5
-                )
-
-                for result in search_results:
-                    venues.append({
-                        "name": result.get("title", "Unknown venue"),
-                        "url": result.get("url"),
-                        "snippet": result.get("snippet", "")
-                    })
-
-                logger.info(f"Venue search completed", query=query, results=len(search_results))
-
-            except Exception as e:
-                logger.warning(f"Venue search failed", query=query, error=str(e))
-                continue
-
-        # Step 2: For each venue, search for events
-        for venue in venues[:10]:  # Limit to top 10 venues
-            event_query = f"{venue['name']} corporate events awards"
-
-            try:
-                event_results = await self.firecrawl_client.search(
-                    query=event_query,
-                    limit=3
-                )
-
-                # Step 3: For each event, try to identify organizer
-                for event in event_results:
-                    try:
-                        # Scrape event page to find organizer
-                        page_content = await self.firecrawl_client.scrape(
-                            url=event.get("url"),
-                            formats=["markdown"]
-                        )
-
-                        markdown = page_content.get("markdown", "")
-
-                        # Use OpenAI to extract organizer from page content
-                        org = await self._extract_organizer_from_content(
-                            markdown[:2000],  # First 2000 chars
-                            event.get("title"),
-                            venue["name"]
-                        )
-
-                        if org:
-                            organizations.append(org)
-
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to extract organizer",
-                            event=event.get("title"),
-                            error=str(e)
-                        )
-                        continue
-
-            except Exception as e:
-                logger.warning(
-                    "Event search failed",
-                    venue=venue["name"],
-                    error=str(e)
-                )
-                continue
+        organizations: List[Dict[str, Any]] = []
+        graph = self._new_graph()
+        self._spawn_venue_research(graph, research_plan, organizations.append)
+        stats = await graph.join()
 
         logger.info(
             "Venue research workflow completed",
-            organizations_found=len(organizations)
+            organizations_found=len(organizations),
+            **stats.to_dict()
         )
 
         return organizations
@@ -401,7 +434,6 @@ Analyze this and determine the best search strategy."""
         if not self.firecrawl_client:
             raise ValueError("Firecrawl client not initialized. Call _init_clients() first.")
 
-        organizations = []
         search_queries = research_plan.get("search_queries", [])
 
         logger.info(
@@ -409,53 +441,79 @@ Analyze this and determine the best search strategy."""
             num_queries=len(search_queries)
         )
 
-        for query in search_queries[:5]:  # Limit to 5 queries
-            try:
-                search_results = await self.firecrawl_client.search(
-                    query=query,
-                    limit=10
-                )
+        # Searches run concurrently; results are kept in query order
+        results_by_query: Dict[int, List[Dict[str, Any]]] = {}
 
-                for result in search_results:
-                    # Try to extract organization from search result
-                    org = {
+        def collect(index: int, query: str):
+            def handle(search_results):
+                if search_results is None:
+                    return
+                results_by_query[index] = [
+                    {
                         "name": result.get("title", "Unknown organization"),
                         "website": result.get("url"),
                         "context": result.get("snippet", ""),
                         "source": "direct_search",
                         "confidence": "medium"
                     }
+                    for result in search_results
+                ]
+                logger.info("Direct search completed", query=query, results=len(search_results))
+            return handle
 
-                    organizations.append(org)
-
-                logger.info(
-                    "Direct search completed",
-                    query=query,
-                    results=len(search_results)
-                )
+        graph = self._new_graph()
+        for index, query in enumerate(search_queries[:5]):  # Limit to 5 queries
+            self._search_node(graph, query, 10, collect(index, query))
+        stats = await graph.join()
 
-            except Exception as e:
-                logger.warning(f"Direct search failed", query=query, error=str(e))
-                continue
+        organizations = [org for index in sorted(results_by_query) for org in results_by_query[index]]
 
         logger.info(
             "Direct search workflow completed",
-            organizations_found=len(organizations)
+            organizations_found=len(organizations),
+            **stats.to_dict()
         )
 
         return organizations
 
+    def _spawn_linkedin_searches(
+        self,
+        graph: TaskGraph,
+        queries: List[str],
+        max_results_per_query: int,
+        on_prospects: ProspectsCallback
+    ) -> None:
+        """Spawn LinkedIn searches; ``on_prospects`` receives each query's parsed prospects."""
+        def handle_results(query: str):
+            async def handle(results):
+                if results is None:
+                    return
+                prospects = [
+                    prospect for prospect in (self._parse_linkedin_profile(result, query) for result in results)
+                    if prospect
+                ]
+                logger.info("LinkedIn search completed", query=query, prospects_found=len(prospects))
+                if prospects:
+                    await on_prospects(prospects)
+            return handle
+
+        for query in queries[:5]:  # Limit to 5 queries
+            self._search_node(graph, query, max_results_per_query, handle_results(query))
+
     async def _search_linkedin_for_prospects(
         self,
         queries: List[str],
-        max_results_per_query: int = 10
+        max_results_per_query: int = 10,
+        on_prospects: Optional[ProspectsCallback] = None
     ) -> List[Dict[str, Any]]:
         """
-        Execute LinkedIn searches and extract prospect information.
+        Execute LinkedIn searches concurrently and extract prospect information.
 
         Args:
             queries: LinkedIn search queries
             max_results_per_query: Max results per query
+            on_prospects: Optional callback receiving each query's prospects
+                as soon as that search finishes
 
         Returns:
             List of prospects:
@@ -475,37 +533,21 @@ Analyze this and determine the best search strategy."""
         if not self.firecrawl_client:
             raise ValueError("Firecrawl client not initialized.")
 
-        prospects = []
-
-        for query in queries[:5]:  # Limit to 5 queries
-            try:
-                logger.info(f"LinkedIn search", query=query)
-
-                # Use Firecrawl to search (it can handle LinkedIn)
-                results = await self.firecrawl_client.search(
-                    query=query,
-                    limit=max_results_per_query
-                )
-
-                for result in results:
-                    # Parse LinkedIn profile from search result
-                    prospect = self._parse_linkedin_profile(result, query)
-                    if prospect:
-                        prospects.append(prospect)
+        prospects: List[Dict[str, Any]] = []
 
-                logger.info(
-                    "LinkedIn search completed",
-                    query=query,
-                    prospects_found=len(results)
-                )
+        async def collect(found: List[Dict[str, Any]]) -> None:
+            prospects.extend(found)
+            if on_prospects:
+                await on_prospects(found)
 
-            except Exception as e:
-                logger.warning(f"LinkedIn search failed", query=query, error=str(e))
-                continue
+        graph = self._new_graph()
+        self._spawn_linkedin_searches(graph, queries, max_results_per_query, collect)
+        stats = await graph.join()
 
         logger.info(
             "LinkedIn prospect search completed",
-            total_prospects=len(prospects)
+            total_prospects=len(prospects),
+            **stats.to_dict()
         )
 
         return prospects
@@ -623,13 +665,15 @@ Analyze this and determine the best search strategy."""
 
     async def _direct_contacts_workflow(
         self,
-        strategy: Dict[str, Any]
+        strategy: Dict[str, Any],
+        on_prospects: Optional[ProspectsCallback] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute direct contact search workflow (role-based or company-specific).
 
         Args:
             strategy: Strategy from _determine_workflow_strategy()
+            on_prospects: Optional callback receiving prospects as searches finish
 
         Returns:
             List of prospects
@@ -647,23 +691,32 @@ Analyze this and determine the best search strategy."""
         )
 
         # Search LinkedIn
-        prospects = await self._search_linkedin_for_prospects(linkedin_queries)
+        prospects = await self._search_linkedin_for_prospects(linkedin_queries, on_prospects=on_prospects)
 
         return prospects
 
     async def _unknown_orgs_then_contacts_workflow(
         self,
-        strategy: Dict[str, Any]
+        strategy: Dict[str, Any],
+        on_prospects: Optional[ProspectsCallback] = None
     ) -> List[Dict[str, Any]]:
         """
         Execute multi-step workflow: discover organizations → find contacts.
 
+        Runs as one task graph: contact searches for an organization start
+        as soon as that organization is extracted, while other venues and
+        events are still being researched.
+
         Args:
             strategy: Strategy from _determine_workflow_strategy()
+            on_prospects: Optional callback receiving prospects as searches finish
 
         Returns:
             List of prospects
         """
+        if not self.firecrawl_client:
+            raise ValueError("Firecrawl client not initialized.")
+
         logger.info("Starting multi-step workflow: organizations → contacts")
 
         # Step 1: Discover organizations using existing logic
@@ -675,43 +728,44 @@ Analyze this and determine the best search strategy."""
             "reasoning": strategy.get("reasoning")
         }
 
-        # Execute venue or direct search to find orgs
-        organizations = await self.venue_research_workflow(research_plan)
-
-        if not organizations:
-            logger.warning("No organizations found in multi-step workflow")
-            return []
-
-        logger.info(f"Discovered {len(organizations)} organizations")
-
-        # Step 2: For each organization, search for contacts
-        prospects = []
+        prospects: List[Dict[str, Any]] = []
+        organizations: Dict[str, Dict[str, Any]] = {}
         target_roles = strategy.get("target_roles", ["CEO", "Operations Manager", "Director"])
+        graph = self._new_graph()
 
-        for org in organizations[:10]:  # Limit to 10 orgs
+        # Step 2: For each organization, search for contacts
+        def on_organization(org: Dict[str, Any]) -> None:
             org_name = org.get("name", "Unknown")
-
-            # Generate LinkedIn queries for this org
-            queries = [
-                f"{role} {org_name}" for role in target_roles[:3]
-            ]
+            if org_name in organizations or len(organizations) >= 10:  # Limit to 10 orgs
+                return
+            organizations[org_name] = org
 
             logger.info(f"Searching contacts at {org_name}")
 
-            # Search for contacts at this organization
-            org_prospects = await self._search_linkedin_for_prospects(queries, max_results_per_query=5)
+            async def on_org_prospects(found: List[Dict[str, Any]]) -> None:
+                # Add organization context to prospects
+                for prospect in found:
+                    prospect["company_website"] = org.get("website")
+                    prospect["discovered_via_org"] = org_name
+                prospects.extend(found)
+                if on_prospects:
+                    await on_prospects(found)
 
-            # Add organization context to prospects
-            for prospect in org_prospects:
-                prospect["company_website"] = org.get("website")
-                prospect["discovered_via_org"] = org_name
+            # Generate LinkedIn queries for this org
+            queries = [f"{role} {org_name}" for role in target_roles[:3]]
+            self._spawn_linkedin_searches(graph, queries, 5, on_org_prospects)
 
-            prospects.extend(org_prospects)
+        self._spawn_venue_research(graph, research_plan, on_organization)
+        stats = await graph.join()
+
+        if not organizations:
+            logger.warning("No organizations found in multi-step workflow")
 
         logger.info(
             "Multi-step workflow completed",
             organizations_found=len(organizations),
-            prospects_found=len(prospects)
+            prospects_found=len(prospects),
+            **stats.to_dict()
         )
 
         return prospects
@@ -903,11 +957,34 @@ Return JSON array of cleaned organizations with same structure."""
 
         return result
 
+    def _prospect_result(
+        self,
+        prompt: str,
+        strategy: Dict[str, Any],
+        prospects: List[Dict[str, Any]],
+        completed: bool
+    ) -> Dict[str, Any]:
+        """Build the research_prospects payload (partial while searches are running)."""
+        return {
+            "prompt": prompt,
+            "strategy": strategy,
+            "prospects": prospects,
+            "metadata": {
+                "total_prospects": len(prospects),
+                "strategy_used": strategy.get("strategy"),
+                "target_company": strategy.get("target_company"),
+                "geography": strategy.get("geography"),
+                "partial": not completed
+            },
+            "completed_at": datetime.now().isoformat() if completed else None
+        }
+
     async def research_prospects(
         self,
         prompt: str,
         db_session,
-        accessed_by_user=None
+        accessed_by_user=None,
+        on_progress: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
     ) -> Dict[str, Any]:
         """
         NEW: Complete AI research workflow that returns prospects directly.
@@ -921,6 +998,9 @@ Return JSON array of cleaned organizations with same structure."""
             prompt: Natural language research goal
             db_session: Database session for secrets retrieval
             accessed_by_user: User accessing secrets (for audit trail)
+            on_progress: Optional callback receiving the partial result
+                (same shape, ``metadata.partial`` set) each time a search
+                branch adds prospects
 
         Returns:
             {
@@ -960,27 +1040,22 @@ Return JSON array of cleaned organizations with same structure."""
 
         # Step 3: Execute workflow based on strategy
         strategy_type = strategy.get("strategy")
+        found: List[Dict[str, Any]] = []
+
+        async def stream(new_prospects: List[Dict[str, Any]]) -> None:
+            found.extend(new_prospects)
+            if on_progress:
+                await on_progress(self._prospect_result(prompt, strategy, list(found), completed=False))
 
         if strategy_type == "unknown_orgs_then_contacts":
             # Multi-step: Discover orgs → find contacts
-            prospects = await self._unknown_orgs_then_contacts_workflow(strategy)
+            prospects = await self._unknown_orgs_then_contacts_workflow(strategy, on_prospects=stream)
         else:
             # Direct search (role-based or company-specific)
-            prospects = await self._direct_contacts_workflow(strategy)
+            prospects = await self._direct_contacts_workflow(strategy, on_prospects=stream)
 
         # Build final result
-        result = {
-            "prompt": prompt,
-            "strategy": strategy,
-            "prospects": prospects,
-            "metadata": {
-                "total_prospects": len(prospects),
-                "strategy_used": strategy_type,
-                "target_company": strategy.get("target_company"),
-                "geography": strategy.get("geography")
-            },
-            "completed_at": datetime.now().isoformat()
-        }
+        result = self._prospect_result(prompt, strategy, prospects, completed=True)
 
         logger.info(
             "AI prospect research completed",
@@ -1,5 +1,6 @@
 """Prospect services for Sales Outreach Prep."""
 
 from .crud_services import ProspectCrudService
+from .enrichment_service import EnrichmentProgress, ProspectEnrichmentService
 
-__all__ = ["ProspectCrudService"]
+__all__ = ["ProspectCrudService", "ProspectEnrichmentService", "EnrichmentProgress"]
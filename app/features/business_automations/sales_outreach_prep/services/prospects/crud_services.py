@@ -8,7 +8,10 @@ Follows platform best practices:
 - Proper error handling with handle_error()
 """
 
+import hashlib
+import re
 from typing import Dict, List, Optional, Tuple, Any
+from uuid import uuid4
 
 from app.features.core.sqlalchemy_imports import *
 from app.features.core.enhanced_base_service import BaseService
@@ -16,6 +19,59 @@ from app.features.business_automations.sales_outreach_prep.models import Prospec
 
 logger = get_logger(__name__)
 
+# Rows per multi-row INSERT in bulk_create_prospects
+PROSPECT_INSERT_BATCH_SIZE = 500
+
+
+def normalize_linkedin_url(url: Optional[str]) -> Optional[str]:
+    """
+    Normalize a LinkedIn profile URL for de-duplication.
+
+    Drops scheme, country/www subdomain, query string, fragment and trailing
+    slash, and lowercases: ``https://uk.linkedin.com/in/Ada/?trk=x`` and
+    ``linkedin.com/in/ada`` normalize to the same value. Mirrored in SQL by
+    the ``sales_prospect_dedupe_key`` migration backfill.
+    """
+    if not url or not url.strip():
+        return None
+    value = url.strip().lower()
+    value = re.sub(r"^[a-z]+://", "", value)
+    value = re.sub(r"^([a-z0-9-]+\.)*linkedin\.com", "linkedin.com", value)
+    value = re.split(r"[?#]", value, maxsplit=1)[0]
+    return value.rstrip("/")
+
+
+def prospect_dedupe_key(
+    linkedin_url: Optional[str],
+    full_name: Optional[str],
+    company_id: Optional[str]
+) -> str:
+    """
+    Key identifying a person within a campaign.
+
+    Uses the normalized LinkedIn URL when there is one, otherwise a
+    fingerprint of the whitespace/case-normalized name and company.
+    """
+    normalized_url = normalize_linkedin_url(linkedin_url)
+    if normalized_url:
+        return "li:" + hashlib.md5(normalized_url.encode()).hexdigest()
+    name = " ".join((full_name or "").split()).lower()
+    return "fp:" + hashlib.md5(f"{name}|{company_id or ''}".encode()).hexdigest()
+
+
+def _split_full_name(data: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Return (full_name, first_name, last_name), splitting full_name when needed."""
+    full_name = data.get('full_name') or ''
+    first_name = data.get('first_name')
+    last_name = data.get('last_name')
+
+    if not first_name or not last_name:
+        parts = full_name.split(' ', 1)
+        first_name = parts[0] if len(parts) > 0 else ''
+        last_name = parts[1] if len(parts) > 1 else ''
+
+    return full_name, first_name, last_name
+
 
 class ProspectCrudService(BaseService[Prospect]):
     """Service for managing prospects in sales campaigns."""
@@ -131,6 +187,26 @@ class ProspectCrudService(BaseService[Prospect]):
             await self.handle_error("get_prospect_by_id", e, prospect_id=prospect_id)
             raise
 
+    async def get_prospects_by_ids(self, prospect_ids: List[str]) -> List[Prospect]:
+        """
+        Get several prospects in one query (tenant-scoped).
+
+        Args:
+            prospect_ids: Prospect IDs (unknown or other-tenant IDs are skipped)
+
+        Returns:
+            List of Prospect objects
+        """
+        try:
+            if not prospect_ids:
+                return []
+            stmt = self.create_base_query(Prospect).where(Prospect.id.in_(set(prospect_ids)))
+            result = await self.db.execute(stmt)
+            return list(result.scalars().all())
+        except Exception as e:
+            await self.handle_error("get_prospects_by_ids", e, count=len(prospect_ids))
+            raise
+
     async def create_prospect(self, data: Dict[str, Any], user) -> Prospect:
         """
         Create a new prospect.
@@ -163,14 +239,7 @@ class ProspectCrudService(BaseService[Prospect]):
                 raise ValueError(f"Campaign {campaign_id} not found or access denied")
 
             # Split full_name into first/last if provided
-            full_name = data.get('full_name', '')
-            first_name = data.get('first_name')
-            last_name = data.get('last_name')
-
-            if not first_name or not last_name:
-                parts = full_name.split(' ', 1)
-                first_name = parts[0] if len(parts) > 0 else ''
-                last_name = parts[1] if len(parts) > 1 else ''
+            full_name, first_name, last_name = _split_full_name(data)
 
             # Create prospect object
             prospect = Prospect(
@@ -194,6 +263,9 @@ class ProspectCrudService(BaseService[Prospect]):
                 notes=data.get('notes'),
                 discovered_via=data.get('discovered_via', 'manual'),
                 discovery_query=data.get('discovery_query'),
+                dedupe_key=prospect_dedupe_key(
+                    data.get('linkedin_url'), full_name, data.get('company_id')
+                ),
             )
 
             # Set audit fields
@@ -227,6 +299,122 @@ class ProspectCrudService(BaseService[Prospect]):
             await self.handle_error("create_prospect", e, name=data.get('full_name'))
             raise
 
+    async def bulk_create_prospects(
+        self,
+        items: List[Dict[str, Any]],
+        user,
+        batch_size: int = PROSPECT_INSERT_BATCH_SIZE
+    ) -> List[str]:
+        """
+        Create many prospects, skipping people already in their campaign.
+
+        Campaigns are validated with one query for the whole call, then each
+        batch is a single multi-row ``INSERT ... ON CONFLICT DO NOTHING
+        RETURNING id`` against the (tenant_id, campaign_id, dedupe_key)
+        unique index, so re-running discovery never duplicates a profile.
+        Items without a name are skipped.
+
+        Args:
+            items: Prospect data dicts (same keys as create_prospect)
+            user: Current user for audit trail (None for background tasks)
+            batch_size: Rows per INSERT statement
+
+        Returns:
+            IDs of the prospects actually inserted
+
+        Raises:
+            ValueError: If tenant_id is missing or a campaign is not found
+        """
+        try:
+            if not self.tenant_id or self.tenant_id == "global":
+                raise ValueError("Tenant ID is required for creating prospects")
+
+            campaign_ids = {item.get('campaign_id') for item in items}
+            if None in campaign_ids or '' in campaign_ids:
+                raise ValueError("Campaign ID is required")
+            if not campaign_ids:
+                return []
+
+            found_stmt = select(Campaign.id).where(
+                Campaign.id.in_(campaign_ids),
+                Campaign.tenant_id == self.tenant_id
+            )
+            found = set((await self.db.execute(found_stmt)).scalars().all())
+            missing = campaign_ids - found
+            if missing:
+                raise ValueError(f"Campaign {sorted(missing)[0]} not found or access denied")
+
+            rows = []
+            seen = set()
+            for item in items:
+                full_name, first_name, last_name = _split_full_name(item)
+                if not full_name.strip():
+                    logger.debug("Skipping prospect without a name", item=item)
+                    continue
+
+                dedupe_key = prospect_dedupe_key(item.get('linkedin_url'), full_name, item.get('company_id'))
+                if (item['campaign_id'], dedupe_key) in seen:
+                    continue
+                seen.add((item['campaign_id'], dedupe_key))
+
+                rows.append({
+                    "id": str(uuid4()),
+                    "tenant_id": self.tenant_id,
+                    "campaign_id": item['campaign_id'],
+                    "company_id": item.get('company_id'),
+                    "full_name": full_name,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "job_title": item.get('job_title'),
+                    "seniority_level": item.get('seniority_level'),
+                    "location": item.get('location'),
+                    "region": item.get('region'),
+                    "email": item.get('email'),
+                    "phone": item.get('phone'),
+                    "linkedin_url": item.get('linkedin_url'),
+                    "linkedin_snippet": item.get('linkedin_snippet'),
+                    "enrichment_status": item.get('enrichment_status', 'not_started'),
+                    "status": item.get('status', 'new'),
+                    "tags": item.get('tags', []),
+                    "notes": item.get('notes'),
+                    "discovered_via": item.get('discovered_via', 'manual'),
+                    "discovery_query": item.get('discovery_query'),
+                    "dedupe_key": dedupe_key,
+                    "created_by_email": getattr(user, 'email', None),
+                    "created_by_name": getattr(user, 'name', None),
+                })
+
+            created_ids: List[str] = []
+            for start in range(0, len(rows), batch_size):
+                stmt = (
+                    pg_insert(Prospect)
+                    .values(rows[start:start + batch_size])
+                    .on_conflict_do_nothing(index_elements=['tenant_id', 'campaign_id', 'dedupe_key'])
+                    .returning(Prospect.id)
+                )
+                result = await self.db.execute(stmt)
+                created_ids.extend(result.scalars().all())
+
+            self.log_operation("prospect_bulk_creation", {
+                "campaign_ids": sorted(campaign_ids),
+                "submitted": len(items),
+                "created": len(created_ids)
+            })
+
+            logger.info(
+                "Prospects bulk created",
+                submitted=len(items),
+                created=len(created_ids),
+                skipped=len(items) - len(created_ids),
+                tenant_id=self.tenant_id
+            )
+
+            return created_ids
+
+        except Exception as e:
+            await self.handle_error("bulk_create_prospects", e, count=len(items))
+            raise
+
     async def update_prospect(
         self,
         prospect_id: str,
@@ -262,6 +450,11 @@ class ProspectCrudService(BaseService[Prospect]):
                 if field in data:
                     setattr(prospect, field, data[field])
 
+            if {'linkedin_url', 'full_name', 'company_id'} & data.keys():
+                prospect.dedupe_key = prospect_dedupe_key(
+                    prospect.linkedin_url, prospect.full_name, prospect.company_id
+                )
+
             # Update audit fields
             if user:
                 prospect.updated_by = user.id
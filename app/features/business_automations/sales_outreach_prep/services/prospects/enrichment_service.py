@@ -0,0 +1,228 @@
+"""
+Concurrent email enrichment for Sales Outreach Prep.
+
+Company domains for the whole batch are loaded in one query, Hunter.io
+lookups run concurrently (bounded by a semaphore, paced by the client's
+token bucket), and results are written back in bulk every ``flush_every``
+completions: one INSERT for the enrichment logs, one executemany UPDATE
+for the prospects and one increment of the campaign's enriched counter,
+which the campaign progress stream picks up.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.features.core.config import get_settings
+from app.features.core.sqlalchemy_imports import *
+from app.features.core.enhanced_base_service import BaseService
+from app.features.business_automations.sales_outreach_prep.models import Campaign, EnrichmentLog, Prospect
+from app.features.business_automations.sales_outreach_prep.services.companies import CompanyCrudService
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Hunter.io lookups in flight at once (the token bucket still caps the rate).
+ENRICHMENT_CONCURRENCY = int(getattr(settings, "SALES_ENRICHMENT_CONCURRENCY", 8))
+# Completed lookups buffered before they are written back.
+ENRICHMENT_FLUSH_EVERY = int(getattr(settings, "SALES_ENRICHMENT_FLUSH_EVERY", 25))
+
+
+@dataclass
+class EnrichmentOutcome:
+    """Result of one Hunter.io lookup, pending write-back."""
+
+    prospect_id: str
+    attempted_at: datetime
+    completed_at: datetime
+    email_data: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def enriched(self) -> bool:
+        return bool(self.email_data and self.email_data.get("email"))
+
+
+@dataclass
+class EnrichmentProgress:
+    """Running totals reported after every flush."""
+
+    campaign_id: str
+    total: int
+    enriched: int = 0
+    failed: int = 0
+    skipped: int = 0
+    flushes: int = 0
+
+    @property
+    def processed(self) -> int:
+        return self.enriched + self.failed
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "campaign_id": self.campaign_id,
+            "total": self.total,
+            "processed": self.processed,
+            "enriched": self.enriched,
+            "failed": self.failed,
+            "skipped": self.skipped,
+        }
+
+
+def _split_name(prospect: Prospect) -> tuple:
+    parts = (prospect.full_name or "").split()
+    first_name = prospect.first_name or (parts[0] if parts else "")
+    last_name = prospect.last_name or (parts[-1] if parts else "")
+    return first_name, last_name
+
+
+class ProspectEnrichmentService(BaseService[Prospect]):
+    """Enrich a batch of prospects with Hunter.io emails."""
+
+    def __init__(
+        self,
+        db_session: AsyncSession,
+        tenant_id: Optional[str] = None,
+        concurrency: int = ENRICHMENT_CONCURRENCY,
+        flush_every: int = ENRICHMENT_FLUSH_EVERY,
+    ):
+        super().__init__(db_session, tenant_id)
+        self.concurrency = max(1, concurrency)
+        self.flush_every = max(1, flush_every)
+
+    async def enrich(
+        self,
+        campaign_id: str,
+        prospects: List[Prospect],
+        hunter,
+        on_progress: Optional[Callable[[EnrichmentProgress], Awaitable[None]]] = None,
+    ) -> EnrichmentProgress:
+        """
+        Find emails for ``prospects`` and write the results back in bulk.
+
+        Prospects without a company domain are skipped (left ``not_started``).
+        Prospects where no email is found keep their status too, so a later
+        run retries them; their attempt is still logged.
+
+        Args:
+            campaign_id: Campaign the prospects belong to
+            prospects: Prospects to enrich
+            hunter: HunterClient (or anything with an async ``find_email``)
+            on_progress: Awaited after every flush, e.g. to commit so the
+                campaign stream sees the new counts
+
+        Returns:
+            Final EnrichmentProgress
+        """
+        try:
+            progress = EnrichmentProgress(campaign_id=campaign_id, total=len(prospects))
+
+            company_ids = [prospect.company_id for prospect in prospects if prospect.company_id]
+            companies = await CompanyCrudService(self.db, self.tenant_id).get_companies_by_ids(company_ids)
+            domains = {company.id: company.domain for company in companies if company.domain}
+
+            eligible = [prospect for prospect in prospects if domains.get(prospect.company_id)]
+            progress.skipped = len(prospects) - len(eligible)
+            if not eligible:
+                return progress
+
+            by_id = {prospect.id: prospect for prospect in eligible}
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def lookup(prospect: Prospect) -> EnrichmentOutcome:
+                first_name, last_name = _split_name(prospect)
+                async with semaphore:
+                    attempted_at = datetime.now()
+                    try:
+                        email_data = await hunter.find_email(
+                            first_name=first_name,
+                            last_name=last_name,
+                            domain=domains[prospect.company_id],
+                        )
+                        return EnrichmentOutcome(prospect.id, attempted_at, datetime.now(), email_data=email_data)
+                    except Exception as e:
+                        return EnrichmentOutcome(prospect.id, attempted_at, datetime.now(), error=str(e))
+
+            tasks = [asyncio.create_task(lookup(prospect)) for prospect in eligible]
+            pending: List[EnrichmentOutcome] = []
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    pending.append(await next_done)
+                    if len(pending) >= self.flush_every:
+                        await self._flush(campaign_id, pending, by_id, progress, on_progress)
+                        pending = []
+                if pending:
+                    await self._flush(campaign_id, pending, by_id, progress, on_progress)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            logger.info("Prospect enrichment batch completed", **progress.to_dict())
+            return progress
+
+        except Exception as e:
+            await self.handle_error("enrich", e, campaign_id=campaign_id)
+            raise
+
+    async def _flush(
+        self,
+        campaign_id: str,
+        outcomes: List[EnrichmentOutcome],
+        by_id: Dict[str, Prospect],
+        progress: EnrichmentProgress,
+        on_progress: Optional[Callable[[EnrichmentProgress], Awaitable[None]]],
+    ) -> None:
+        """Write one buffer of outcomes: log rows, prospect updates, campaign counter."""
+        logs = []
+        updates = []
+        for outcome in outcomes:
+            log = {
+                "tenant_id": self.tenant_id or by_id[outcome.prospect_id].tenant_id,
+                "prospect_id": outcome.prospect_id,
+                "enrichment_type": "email",
+                "provider": "hunter.io",
+                "attempted_at": outcome.attempted_at,
+                "completed_at": outcome.completed_at,
+                "status": "failed",
+                "confidence_score": None,
+                "result_data": None,
+                "error_message": None,
+            }
+            if outcome.enriched:
+                email_data = outcome.email_data
+                log.update(status="success", confidence_score=email_data.get("confidence"), result_data=email_data)
+                prospect = by_id[outcome.prospect_id]
+                updates.append({
+                    "id": outcome.prospect_id,
+                    "email": email_data["email"],
+                    "email_confidence": email_data.get("confidence"),
+                    "email_status": email_data.get("status"),
+                    "enrichment_status": "enriched",
+                    "enrichment_source": "hunter.io",
+                    "enriched_at": outcome.completed_at,
+                    # Same promotion as update_prospect_enrichment: new -> enriched.
+                    "status": "enriched" if prospect.status == "new" else prospect.status,
+                })
+            else:
+                log["error_message"] = outcome.error or "No email found"
+            logs.append(log)
+
+        await self.db.execute(insert(EnrichmentLog), logs)
+        if updates:
+            await self.db.execute(update(Prospect), updates)
+            campaign_stmt = (
+                update(Campaign)
+                .where(Campaign.id == campaign_id)
+                .values(enriched_prospects=Campaign.enriched_prospects + len(updates))
+            )
+            if self.tenant_id is not None:
+                campaign_stmt = campaign_stmt.where(Campaign.tenant_id == self.tenant_id)
+            await self.db.execute(campaign_stmt)
+
+        progress.enriched += len(updates)
+        progress.failed += len(outcomes) - len(updates)
+        progress.flushes += 1
+        logger.info("Enrichment results written", **progress.to_dict())
+
+        if on_progress is not None:
+            await on_progress(progress)
@@ -98,9 +98,15 @@ window.initializeCampaignsTable = function () {
                 }
             });
 
-            eventSource.onerror = (error) => {
-                console.error("[EventSource] Error for campaign", campaignId, ":", error);
-                closeStream(campaignId);
+            eventSource.onerror = (event) => {
+                // Server-sent error events carry data; a dropped connection does not and
+                // EventSource reconnects on its own, resuming from Last-Event-ID.
+                if (event.data || eventSource.readyState === EventSource.CLOSED) {
+                    console.error("[EventSource] Error for campaign", campaignId, ":", event.data || event);
+                    closeStream(campaignId);
+                } else {
+                    console.warn("[EventSource] Connection lost for campaign, reconnecting:", campaignId);
+                }
             };
 
             campaignStreams[campaignId] = eventSource;
@@ -114,11 +120,13 @@ window.initializeCampaignsTable = function () {
     function refreshActiveStreams(data) {
         console.log("🔍 [refreshActiveStreams] Processing", data?.length || 0, "campaigns");
 
-        // Open EventSource streams for AI research campaigns without research_data (running)
+        // Open EventSource streams for AI research campaigns still running
+        // (no research_data yet, or only partial results stored so far)
         (data || []).forEach((item) => {
-            console.log("🔍 Campaign:", item.id, "| Type:", item.discovery_type, "| Has research_data:", !!item.research_data);
+            const researchPartial = !!(item.research_data && item.research_data.metadata && item.research_data.metadata.partial);
+            console.log("🔍 Campaign:", item.id, "| Type:", item.discovery_type, "| Has research_data:", !!item.research_data, "| Partial:", researchPartial);
 
-            if (item.discovery_type === 'ai_research' && !item.research_data) {
+            if (item.discovery_type === 'ai_research' && (!item.research_data || researchPartial)) {
                 console.log("✅ Opening stream for AI research campaign:", item.id);
                 openStream(item.id);
             } else if (item.research_data) {
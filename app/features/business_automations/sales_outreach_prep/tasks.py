@@ -7,30 +7,53 @@ Handles:
 - Campaign statistics updates
 """
 
+import asyncio
 from typing import Optional, List, Dict, Any
-from datetime import datetime
 
 from app.features.core.celery_app import celery_app
+from app.features.core.config import get_settings
 from app.features.core.database import async_session
 from app.features.core.sqlalchemy_imports import get_logger
 
 from app.features.business_automations.sales_outreach_prep.models import (
     Campaign,
     Company,
-    Prospect,
-    EnrichmentLog
+    Prospect
+)
+from app.features.business_automations.sales_outreach_prep.services.campaigns import (
+    CampaignCrudService,
+    campaign_snapshot,
+    get_campaign_progress_channel
 )
-from app.features.business_automations.sales_outreach_prep.services.campaigns import CampaignCrudService
 from app.features.business_automations.sales_outreach_prep.services.companies import CompanyCrudService
-from app.features.business_automations.sales_outreach_prep.services.prospects import ProspectCrudService
+from app.features.business_automations.sales_outreach_prep.services.entity_resolution_service import EntityResolutionService
+from app.features.business_automations.sales_outreach_prep.services.prospects import (
+    EnrichmentProgress,
+    ProspectCrudService,
+    ProspectEnrichmentService
+)
 from app.features.business_automations.sales_outreach_prep.utils import (
     FirecrawlClient,
     HunterClient,
+    TaskGraph,
     get_firecrawl_api_key,
-    get_hunter_api_key
+    get_hunter_api_key,
+    get_token_bucket
 )
 
 logger = get_logger(__name__)
+settings = get_settings()
+
+# Hunter.io account limit, shared across workers through Redis when configured
+HUNTER_REQUESTS_PER_SECOND = float(getattr(settings, "HUNTER_REQUESTS_PER_SECOND", 15))
+# Company searches in flight during discovery, and the timeout for each
+DISCOVERY_FIRECRAWL_CONCURRENCY = int(getattr(settings, "SALES_DISCOVERY_FIRECRAWL_CONCURRENCY", 5))
+DISCOVERY_SEARCH_TIMEOUT_SECONDS = float(getattr(settings, "SALES_DISCOVERY_SEARCH_TIMEOUT_SECONDS", 60))
+
+
+async def _publish_campaign_event(campaign_id: str, data: Dict[str, Any], event: str = "progress") -> None:
+    """Push a campaign change to the progress stream (never fails the task)."""
+    await get_campaign_progress_channel().publish(campaign_id, event, data)
 
 
 async def _ai_research_discovery(db, campaign, campaign_service) -> Dict[str, Any]:
@@ -65,12 +88,29 @@ async def _ai_research_discovery(db, campaign, campaign_service) -> Dict[str, An
     try:
         # Initialize research service
         research_service = ProspectResearchService(tenant_id=tenant_id)
+        write_lock = asyncio.Lock()
+
+        async def store_partial_results(partial: Dict[str, Any]) -> None:
+            # Branches finish concurrently; store each partial result so the
+            # campaign shows prospects while the remaining searches run
+            async with write_lock:
+                await db.execute(
+                    update(Campaign)
+                    .where(Campaign.id == campaign_id)
+                    .values(research_data=partial)
+                )
+                await db.commit()
+                await _publish_campaign_event(campaign_id, {
+                    "id": campaign_id,
+                    "research_prospects": len(partial.get("prospects", []))
+                })
 
         # Run NEW AI research workflow that returns prospects directly
         research_result = await research_service.research_prospects(
             prompt=campaign.research_prompt,
             db_session=db,
-            accessed_by_user=None  # Background task
+            accessed_by_user=None,  # Background task
+            on_progress=store_partial_results
         )
 
         # Store research results in campaign.research_data and update status to active
@@ -86,6 +126,12 @@ async def _ai_research_discovery(db, campaign, campaign_service) -> Dict[str, An
         await db.commit()
 
         prospects_found = len(research_result.get("prospects", []))
+        await _publish_campaign_event(campaign_id, {
+            "id": campaign_id,
+            "status": "active",
+            "research_prospects": prospects_found
+        })
+        await _publish_campaign_event(campaign_id, {"campaign_id": campaign_id, "status": "active"}, event="complete")
         strategy_used = research_result.get("metadata", {}).get("strategy_used", "unknown")
 
         logger.info(
@@ -113,6 +159,7 @@ async def _ai_research_discovery(db, campaign, campaign_service) -> Dict[str, An
             "AI research discovery failed",
             campaign_id=campaign_id
         )
+        await _publish_campaign_event(campaign_id, {"campaign_id": campaign_id, "error": str(e)}, event="error")
         return {
             "success": False,
             "error": str(e)
@@ -183,11 +230,7 @@ async def _discover_prospects_async(
 
             if company_ids:
                 # Search specific companies
-                companies = []
-                for company_id in company_ids:
-                    company = await company_service.get_company_by_id(company_id)
-                    if company:
-                        companies.append(company)
+                companies = await company_service.get_companies_by_ids(company_ids)
             else:
                 # Search all companies (limited for MVP)
                 companies, _ = await company_service.list_companies(limit=50)
@@ -205,86 +248,94 @@ async def _discover_prospects_async(
             # Initialize Firecrawl client
             firecrawl = FirecrawlClient(api_key=firecrawl_api_key)
 
+            resolver = EntityResolutionService(db, tenant_id)
+            # Loaded once per run; each branch's kept rows are added as they are inserted
+            prospect_index = await resolver.prospect_index(campaign_id)
+            # Continuations share the session, so writes take turns
+            write_lock = asyncio.Lock()
+            write_errors: List[Exception] = []
+            prospects_found = 0
             total_prospects = 0
             companies_searched = 0
 
-            # Search each company
+            # Build search criteria from campaign
+            job_titles = None
+            if campaign.target_roles:
+                job_titles = [role.strip() for role in campaign.target_roles.split(',')]
+
+            def store_results(company):
+                async def handle(results):
+                    nonlocal companies_searched, prospects_found, total_prospects
+                    if results is None:
+                        logger.error("Failed to search company", company=company.name)
+                        return
+                    companies_searched += 1
+                    rows = [
+                        {
+                            "campaign_id": campaign_id,
+                            "company_id": company.id,
+                            "full_name": result.get("full_name"),
+                            "job_title": result.get("job_title"),
+                            "linkedin_url": result.get("linkedin_url"),
+                            "linkedin_snippet": result.get("linkedin_snippet"),
+                            "discovered_via": "firecrawl",
+                            "discovery_query": f"{company.name} {job_titles if job_titles else ''}"[:500],
+                        }
+                        for result in results
+                    ]
+                    prospects_found += len(rows)
+                    if not rows:
+                        return
+                    async with write_lock:
+                        if write_errors:
+                            return
+                        try:
+                            # Drop near-duplicates of campaign prospects (same email/profile, or the
+                            # same name at the same company), including ones stored by earlier branches
+                            new_rows, _ = await resolver.filter_new_prospects(campaign_id, rows, prospect_index)
+                            # INSERT ... ON CONFLICT DO NOTHING; profiles already in the campaign are skipped
+                            created_ids = await prospect_service.bulk_create_prospects(new_rows, user=None)
+                            if created_ids:
+                                await campaign_service.update_campaign_stats(campaign_id)
+                            await db.commit()
+                        except Exception as e:
+                            await db.rollback()
+                            write_errors.append(e)
+                            return
+                        total_prospects += len(created_ids)
+                        if created_ids:
+                            # Each company's prospects reach the campaign as soon as its search resolves
+                            await _publish_campaign_event(campaign_id, campaign_snapshot(campaign))
+                return handle
+
+            # Search companies concurrently (bounded per provider, per-search timeout)
+            graph = TaskGraph({"firecrawl": DISCOVERY_FIRECRAWL_CONCURRENCY}, timeout=DISCOVERY_SEARCH_TIMEOUT_SECONDS)
             for company in companies:
-                try:
-                    logger.info(
-                        "Searching for prospects",
-                        campaign_id=campaign_id,
-                        company_name=company.name
-                    )
-
-                    # Build search criteria from campaign
-                    job_titles = None
-                    if campaign.target_roles:
-                        job_titles = [role.strip() for role in campaign.target_roles.split(',')]
-
-                    # Search LinkedIn profiles
-                    results = await firecrawl.search_linkedin_profiles(
+                logger.info(
+                    "Searching for prospects",
+                    campaign_id=campaign_id,
+                    company_name=company.name
+                )
+                graph.spawn(
+                    "firecrawl",
+                    company.name.strip().lower(),
+                    lambda company=company: firecrawl.search_linkedin_profiles(
                         company_name=company.name,
                         job_titles=job_titles,
                         location=campaign.target_geography,
                         max_results=max_results_per_company
-                    )
-
-                    # Create prospect records
-                    for result in results:
-                        try:
-                            prospect_data = {
-                                "campaign_id": campaign_id,
-                                "company_id": company.id,
-                                "full_name": result.get("full_name"),
-                                "job_title": result.get("job_title"),
-                                "linkedin_url": result.get("linkedin_url"),
-                                "linkedin_snippet": result.get("linkedin_snippet"),
-                                "discovered_via": "firecrawl",
-                                "discovery_query": f"{company.name} {job_titles if job_titles else ''}",
-                            }
-
-                            prospect = await prospect_service.create_prospect(
-                                prospect_data,
-                                user=None  # Background task
-                            )
-
-                            total_prospects += 1
-
-                            logger.info(
-                                "Prospect created",
-                                prospect_id=prospect.id,
-                                name=prospect.full_name
-                            )
-
-                        except Exception as e:
-                            logger.error(
-                                "Failed to create prospect",
-                                company=company.name,
-                                result=result,
-                                error=str(e)
-                            )
-
-                    companies_searched += 1
-
-                except Exception as e:
-                    logger.error(
-                        "Failed to search company",
-                        company=company.name,
-                        error=str(e)
-                    )
-
-            # Commit transaction
-            await db.commit()
-
-            # Update campaign stats
-            await campaign_service.update_campaign_stats(campaign_id)
-            await db.commit()
+                    ),
+                    then=store_results(company)
+                )
+            await graph.join()
+            if write_errors:
+                raise write_errors[0]
 
             logger.info(
                 "Prospect discovery completed",
                 campaign_id=campaign_id,
                 companies_searched=companies_searched,
+                prospects_found=prospects_found,
                 prospects_created=total_prospects
             )
 
@@ -292,7 +343,8 @@ async def _discover_prospects_async(
                 "success": True,
                 "campaign_id": campaign_id,
                 "companies_searched": companies_searched,
-                "prospects_created": total_prospects
+                "prospects_created": total_prospects,
+                "duplicates_skipped": prospects_found - total_prospects
             }
 
             # Optionally trigger auto-enrichment
@@ -384,11 +436,7 @@ async def _enrich_prospects_async(
 
             # Get prospects to enrich
             if prospect_ids:
-                prospects = []
-                for prospect_id in prospect_ids:
-                    prospect = await prospect_service.get_prospect_by_id(prospect_id)
-                    if prospect:
-                        prospects.append(prospect)
+                prospects = await prospect_service.get_prospects_by_ids(prospect_ids)
             else:
                 # Auto-select prospects ready for enrichment
                 prospects = await prospect_service.get_prospects_for_enrichment(
@@ -406,111 +454,36 @@ async def _enrich_prospects_async(
                 logger.error("Hunter.io API key not configured", campaign_id=campaign_id)
                 return {"success": False, "error": "Hunter.io API key not configured in secrets management"}
 
-            # Initialize Hunter.io client
-            hunter = HunterClient(api_key=hunter_api_key)
-
-            enriched_count = 0
-            failed_count = 0
-
-            # Enrich each prospect
-            for prospect in prospects:
-                try:
-                    # Need company domain for email finding
-                    if not prospect.company_id:
-                        logger.debug(
-                            "Prospect has no company, skipping enrichment",
-                            prospect_id=prospect.id
-                        )
-                        continue
-
-                    # Get company
-                    company_service = CompanyCrudService(db, tenant_id)
-                    company = await company_service.get_company_by_id(prospect.company_id)
-
-                    if not company or not company.domain:
-                        logger.debug(
-                            "Company has no domain, skipping enrichment",
-                            prospect_id=prospect.id,
-                            company_id=prospect.company_id
-                        )
-                        continue
-
-                    # Log enrichment attempt
-                    log = EnrichmentLog(
-                        tenant_id=tenant_id,
-                        prospect_id=prospect.id,
-                        enrichment_type="email",
-                        provider="hunter.io",
-                        status="in_progress",
-                        attempted_at=datetime.now()
-                    )
-                    db.add(log)
-                    await db.flush()
-
-                    # Find email
-                    email_data = await hunter.find_email(
-                        first_name=prospect.first_name or prospect.full_name.split()[0],
-                        last_name=prospect.last_name or prospect.full_name.split()[-1],
-                        domain=company.domain
-                    )
-
-                    if email_data and email_data.get("email"):
-                        # Update prospect with email
-                        enrichment_result = {
-                            "email": email_data["email"],
-                            "email_confidence": email_data.get("confidence"),
-                            "email_status": email_data.get("status"),
-                            "enrichment_status": "enriched",
-                            "enrichment_source": "hunter.io"
-                        }
-
-                        await prospect_service.update_prospect_enrichment(
-                            prospect.id,
-                            enrichment_result
-                        )
-
-                        # Update log
-                        log.status = "success"
-                        log.completed_at = datetime.now()
-                        log.confidence_score = email_data.get("confidence")
-                        log.result_data = email_data
-
-                        enriched_count += 1
-
-                        logger.info(
-                            "Prospect enriched",
-                            prospect_id=prospect.id,
-                            email=email_data["email"],
-                            confidence=email_data.get("confidence")
-                        )
-
-                    else:
-                        # No email found
-                        log.status = "failed"
-                        log.completed_at = datetime.now()
-                        log.error_message = "No email found"
-
-                        failed_count += 1
-
-                        logger.info(
-                            "No email found for prospect",
-                            prospect_id=prospect.id
-                        )
-
-                except Exception as e:
-                    failed_count += 1
-                    logger.error(
-                        "Failed to enrich prospect",
-                        prospect_id=prospect.id,
-                        error=str(e)
-                    )
+            enriched_before = campaign.enriched_prospects or 0
+
+            async def commit_progress(progress: EnrichmentProgress) -> None:
+                # Commit each flush and push the new count to the campaign stream
+                await db.commit()
+                await _publish_campaign_event(campaign_id, {
+                    "id": campaign_id,
+                    "enriched_prospects": enriched_before + progress.enriched
+                })
+
+            # Concurrent lookups paced by Hunter.io's plan limit, written back in bulk
+            enrichment_service = ProspectEnrichmentService(db, tenant_id)
+            async with HunterClient(
+                api_key=hunter_api_key,
+                rate_limiter=get_token_bucket("hunter", hunter_api_key, HUNTER_REQUESTS_PER_SECOND)
+            ) as hunter:
+                progress = await enrichment_service.enrich(
+                    campaign_id,
+                    prospects,
+                    hunter,
+                    on_progress=commit_progress
+                )
 
-            # Commit transaction
-            await db.commit()
+            enriched_count = progress.enriched
+            failed_count = progress.failed
 
-            # Update campaign stats
+            # Recount exactly once the batch is done
             await campaign_service.update_campaign_stats(campaign_id)
             await db.commit()
+            await _publish_campaign_event(campaign_id, campaign_snapshot(campaign))
 
             logger.info(
                 "Prospect enrichment completed",
@@ -524,6 +497,7 @@ async def _enrich_prospects_async(
                 "campaign_id": campaign_id,
                 "enriched": enriched_count,
                 "failed": failed_count,
+                "skipped": progress.skipped,
                 "total_processed": enriched_count + failed_count
             }
 
@@ -3,6 +3,8 @@
 from .firecrawl_client import FirecrawlClient
 from .hunter_client import HunterClient
 from .openai_client import OpenAIAnalyzer
+from .rate_limiter import RedisTokenBucket, TokenBucket, get_token_bucket
+from .task_graph import TaskGraph
 from .secrets_helper import (
     get_firecrawl_api_key,
     get_hunter_api_key,
@@ -13,7 +15,11 @@ __all__ = [
     "FirecrawlClient",
     "HunterClient",
     "OpenAIAnalyzer",
+    "RedisTokenBucket",
+    "TaskGraph",
+    "TokenBucket",
     "get_firecrawl_api_key",
     "get_hunter_api_key",
-    "get_openai_api_key"
+    "get_openai_api_key",
+    "get_token_bucket"
 ]
@@ -0,0 +1,255 @@
+"""
+Entity resolution primitives for companies and prospects.
+
+Names are reduced to normalized keys ("ACME, Inc." and "Acme Inc" both
+become ``acme``) and compared with pg_trgm-style trigram similarity.
+Instead of comparing every candidate with every record, records are
+grouped into blocks by name token (and scope, e.g. the prospect's
+company); a candidate is only scored against records sharing one of its
+blocks, and blocks so common they carry no signal are skipped. Strong
+identifiers (domain, LinkedIn URL, email) match outright.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# Company name similarity (0-1) at which two names are the same organization
+COMPANY_MATCH_THRESHOLD = 0.75
+# Person names must be closer: the same name at the same company
+PERSON_MATCH_THRESHOLD = 0.85
+# Blocks larger than this are too generic to narrow anything down
+MAX_BLOCK_SIZE = 200
+
+# Trailing legal-form tokens dropped from company keys. Mirrored in SQL by
+# the sales_company_name_key migration backfill; keep the two in sync.
+LEGAL_SUFFIXES = (
+    "inc", "incorporated", "llc", "llp", "lp", "ltd", "limited", "corp",
+    "corporation", "co", "company", "plc", "gmbh", "ag", "sa", "bv", "nv",
+    "pty", "pc", "group", "holdings",
+)
+_LEGAL_SUFFIX_RE = re.compile(r"( (" + "|".join(LEGAL_SUFFIXES) + r"))+$")
+
+# Post-nominals dropped from person keys ("Jane Doe, MBA" is "jane doe")
+PERSON_SUFFIXES = ("jr", "sr", "ii", "iii", "iv", "mba", "phd", "md", "cpa", "pmp", "esq", "cfa")
+_PERSON_SUFFIX_RE = re.compile(r"( (" + "|".join(PERSON_SUFFIXES) + r"))+$")
+
+
+def _simplify(value: Optional[str]) -> str:
+    value = (value or "").lower().replace("&", " and ")
+    return re.sub(r"[^a-z0-9]+", " ", value).strip()
+
+
+def normalize_company_name(name: Optional[str]) -> str:
+    """Normalized company key: lowercase alphanumerics, legal suffixes removed."""
+    return _LEGAL_SUFFIX_RE.sub("", _simplify(name)).strip()
+
+
+def normalize_person_name(name: Optional[str]) -> str:
+    """Normalized person key: lowercase alphanumerics, post-nominals removed."""
+    return _PERSON_SUFFIX_RE.sub("", _simplify(name)).strip()
+
+
+def normalize_domain(value: Optional[str]) -> Optional[str]:
+    """Bare lowercase host from a domain or URL (``https://www.Acme.com/x`` -> ``acme.com``)."""
+    if not value or not value.strip():
+        return None
+    host = value.strip().lower()
+    host = re.sub(r"^[a-z]+://", "", host)
+    host = re.split(r"[/?#:]", host, maxsplit=1)[0]
+    host = re.sub(r"^www\d*\.", "", host).rstrip(".")
+    return host or None
+
+
+def trigrams(key: str) -> Set[str]:
+    """Trigrams of each word padded like pg_trgm (two spaces before, one after)."""
+    grams: Set[str] = set()
+    for word in key.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: str, b: str) -> float:
+    """pg_trgm ``similarity()``: shared trigrams over all trigrams of both keys."""
+    if a == b:
+        return 1.0 if a else 0.0
+    grams_a, grams_b = trigrams(a), trigrams(b)
+    union = grams_a | grams_b
+    return len(grams_a & grams_b) / len(union) if union else 0.0
+
+
+@dataclass
+class ResolutionRecord:
+    """
+    One entity known to the matcher.
+
+    ``key`` is the normalized name; ``scope`` restricts fuzzy matches to
+    records with the same scope (prospects only match within a company);
+    ``identifiers`` are strong keys such as ``domain:acme.com`` that match
+    regardless of name or scope.
+    """
+
+    id: str
+    key: str
+    scope: Optional[str] = None
+    identifiers: Tuple[str, ...] = ()
+
+
+@dataclass
+class MergeSuggestion:
+    """Records that appear to be one entity; ``canonical_id`` is kept."""
+
+    canonical_id: str
+    duplicate_ids: List[str]
+    score: float
+    reason: str
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "canonical_id": self.canonical_id,
+            "duplicate_ids": self.duplicate_ids,
+            "score": round(self.score, 3),
+            "reason": self.reason,
+        }
+
+
+@dataclass
+class _Match:
+    record: ResolutionRecord
+    score: float
+    reason: str
+
+
+class BlockingIndex:
+    """
+    Token-blocked index of records for fast near-duplicate lookup.
+
+    ``match`` costs the size of the candidate's blocks rather than the size
+    of the index, so resolving n candidates against m records is roughly
+    O((n + m) log m) for realistic name distributions.
+    """
+
+    def __init__(self, threshold: float, max_block_size: int = MAX_BLOCK_SIZE):
+        self.threshold = threshold
+        self.max_block_size = max_block_size
+        self._blocks: Dict[Tuple[Optional[str], str], List[ResolutionRecord]] = {}
+        self._identifiers: Dict[str, ResolutionRecord] = {}
+        self._exact: Dict[Tuple[Optional[str], str], ResolutionRecord] = {}
+
+    @staticmethod
+    def block_keys(key: str) -> Set[str]:
+        """Each token of the key plus its first four characters."""
+        keys = {f"p:{key[:4]}"} if key else set()
+        keys.update(f"t:{token}" for token in key.split() if len(token) > 1)
+        return keys
+
+    def add(self, record: ResolutionRecord) -> None:
+        self.alias(record.identifiers, record)
+        if record.key:
+            self._exact.setdefault((record.scope, record.key), record)
+        for block in self.block_keys(record.key):
+            self._blocks.setdefault((record.scope, block), []).append(record)
+
+    def alias(self, identifiers: Iterable[str], record: ResolutionRecord) -> None:
+        """Make strong identifiers resolve to ``record`` (first registration wins)."""
+        for identifier in identifiers:
+            self._identifiers.setdefault(identifier, record)
+
+    def match(self, record: ResolutionRecord) -> Optional[_Match]:
+        """Best existing record for ``record`` at or above the threshold."""
+        for identifier in record.identifiers:
+            existing = self._identifiers.get(identifier)
+            if existing is not None and existing.id != record.id:
+                return _Match(existing, 1.0, identifier.split(":", 1)[0])
+        if not record.key:
+            return None
+        exact = self._exact.get((record.scope, record.key))
+        if exact is not None and exact.id != record.id:
+            return _Match(exact, 1.0, "name")
+
+        seen: Set[str] = set()
+        best: Optional[_Match] = None
+        for block in sorted(self.block_keys(record.key)):
+            members = self._blocks.get((record.scope, block), ())
+            if len(members) > self.max_block_size:
+                continue
+            for other in members:
+                if other.id == record.id or other.id in seen:
+                    continue
+                seen.add(other.id)
+                score = similarity(record.key, other.key)
+                if score >= self.threshold and (best is None or score > best.score):
+                    best = _Match(other, score, "name")
+        return best
+
+
+def cluster_records(
+    records: Sequence[ResolutionRecord],
+    threshold: float,
+    max_block_size: int = MAX_BLOCK_SIZE,
+) -> List[MergeSuggestion]:
+    """
+    Group near-duplicate records; the first record of each group is canonical.
+
+    Records are indexed one by one in the given order (pass them oldest
+    first) and each is matched against those already indexed, so every
+    group is anchored on its earliest record.
+    """
+    index = BlockingIndex(threshold, max_block_size)
+    canonical: Dict[str, str] = {}
+    groups: Dict[str, MergeSuggestion] = {}
+
+    for record in records:
+        found = index.match(record)
+        if found is None:
+            canonical[record.id] = record.id
+            index.add(record)
+            continue
+        root = canonical[found.record.id]
+        canonical[record.id] = root
+        group = groups.setdefault(root, MergeSuggestion(root, [], found.score, found.reason))
+        group.duplicate_ids.append(record.id)
+        group.score = min(group.score, found.score)
+        if found.reason != group.reason:
+            group.reason = "mixed"
+        # Duplicates still carry identifiers the canonical record may lack
+        index.alias(record.identifiers, found.record)
+
+    return sorted(groups.values(), key=lambda group: (-len(group.duplicate_ids), group.canonical_id))
+
+
+def company_record(
+    record_id: str,
+    name: Optional[str],
+    domain: Optional[str] = None,
+    name_key: Optional[str] = None,
+) -> ResolutionRecord:
+    """Resolution record for a company (or a company candidate)."""
+    normalized_domain = normalize_domain(domain)
+    return ResolutionRecord(
+        id=record_id,
+        key=name_key if name_key is not None else normalize_company_name(name),
+        identifiers=(f"domain:{normalized_domain}",) if normalized_domain else (),
+    )
+
+
+def prospect_record(
+    record_id: str,
+    full_name: Optional[str],
+    company_id: Optional[str] = None,
+    linkedin_key: Optional[str] = None,
+    email: Optional[str] = None,
+) -> ResolutionRecord:
+    """Resolution record for a prospect, scoped to its company."""
+    identifiers: List[str] = []
+    if linkedin_key:
+        identifiers.append(f"linkedin:{linkedin_key}")
+    if email and email.strip():
+        identifiers.append(f"email:{email.strip().lower()}")
+    return ResolutionRecord(
+        id=record_id,
+        key=normalize_person_name(full_name),
+        scope=company_id or "",
+        identifiers=tuple(identifiers),
+    )
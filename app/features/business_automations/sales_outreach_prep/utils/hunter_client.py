@@ -8,27 +8,100 @@ and validate professional email addresses for prospects.
 import httpx
 from typing import Optional, Dict, Any
 from app.features.core.sqlalchemy_imports import get_logger
+from .rate_limiter import RedisTokenBucket, TokenBucket, get_token_bucket
 
 logger = get_logger(__name__)
 
+# Hunter.io allows 15 requests/second on the Email Finder endpoint.
+DEFAULT_REQUESTS_PER_SECOND = 15.0
+# Retries of a throttled (429) request before giving up on it.
+DEFAULT_MAX_RETRIES = 3
+# Wait used when a 429 carries no usable Retry-After header.
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+
+def _retry_after_seconds(response: httpx.Response) -> float:
+    """Seconds to wait according to a 429 response's Retry-After header."""
+    try:
+        return max(float(response.headers.get("Retry-After", DEFAULT_RETRY_AFTER_SECONDS)), 0.0)
+    except ValueError:
+        return DEFAULT_RETRY_AFTER_SECONDS
+
 
 class HunterClient:
     """Client for Hunter.io email finding and verification."""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "https://api.hunter.io/v2",
+        rate_limiter: Optional[TokenBucket | RedisTokenBucket] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ):
         """
         Initialize Hunter.io client.
 
+        Requests share one connection pool for the client's lifetime; use it
+        as an async context manager (or call ``aclose``) to release it.
+
         Args:
             api_key: Hunter.io API key from secrets management
+            base_url: API root (overridden in tests to point at a stub server)
+            rate_limiter: Token bucket shared by concurrent callers (defaults to
+                the account's bucket from ``get_token_bucket``)
+            max_retries: Retries of a 429 response, honouring Retry-After
         """
         self.api_key = api_key
-        self.base_url = "https://api.hunter.io/v2"
+        self.base_url = base_url.rstrip("/")
         self.timeout = 15.0
+        self.rate_limiter = rate_limiter or get_token_bucket("hunter", api_key or "", DEFAULT_REQUESTS_PER_SECOND)
+        self.max_retries = max_retries
+        self._client: Optional[httpx.AsyncClient] = None
 
         if not self.api_key:
             logger.warning("Hunter.io API key not provided")
 
+    async def __aenter__(self) -> "HunterClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Lazy initialization of the shared HTTP client."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        GET an endpoint under the rate limit and return the JSON body.
+
+        A 429 pauses the shared bucket for the provider's Retry-After before
+        retrying, so every concurrent caller backs off together.
+
+        Raises:
+            httpx.HTTPStatusError: On non-429 errors or once retries run out
+        """
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire()
+            response = await self._get_client().get(f"{self.base_url}/{path}", params=params)
+            if response.status_code == 429 and attempt < self.max_retries:
+                attempt += 1
+                wait = _retry_after_seconds(response)
+                logger.warning("Hunter.io rate limited, backing off", path=path, retry_after=wait, attempt=attempt)
+                await self.rate_limiter.pause(wait)
+                continue
+            response.raise_for_status()
+            return response.json()
+
     async def find_email(
         self,
         first_name: str,
@@ -77,14 +150,7 @@ class HunterClient:
                 domain=domain
             )
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/email-finder",
-                    params=params
-                )
-
-                response.raise_for_status()
-                data = response.json()
+            data = await self._get("email-finder", params)
 
             # Parse response
             if data.get("data") and data["data"].get("email"):
@@ -163,14 +229,7 @@ class HunterClient:
 
             logger.info("Verifying email", email=email)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/email-verifier",
-                    params=params
-                )
-
-                response.raise_for_status()
-                data = response.json()
+            data = await self._get("email-verifier", params)
 
             # Parse response
             if data.get("data"):
@@ -232,14 +291,7 @@ class HunterClient:
 
             logger.info("Getting domain info", domain=domain)
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/domain-search",
-                    params=params
-                )
-
-                response.raise_for_status()
-                data = response.json()
+            data = await self._get("domain-search", params)
 
             # Parse response
             if data.get("data"):
@@ -0,0 +1,214 @@
+"""
+Token bucket for provider API rate limits.
+
+Shared by every concurrent request to one provider so a burst of
+coroutines stays inside the plan's requests-per-second limit, and a
+``Retry-After`` from the provider pauses all of them rather than just the
+request that was throttled.
+
+Provider limits are per account, not per process: with several Celery
+workers each holding its own bucket the account would see N times the
+rate. ``get_token_bucket`` therefore returns a Redis-backed bucket (one
+Lua script per operation, on the Redis clock) when ``REDIS_URL`` is set,
+and an in-process bucket otherwise.
+"""
+
+import asyncio
+import hashlib
+import os
+import random
+import time
+from typing import Any, Callable, Dict, Optional
+
+from app.features.core.sqlalchemy_imports import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bound for a single sleep while waiting for a shared token.
+MAX_WAIT_STEP_SECONDS = 1.0
+# Idle buckets disappear from Redis after this long.
+BUCKET_TTL_SECONDS = 3600
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` tokens per second, bursts up to ``capacity``."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], "asyncio.Future"] = asyncio.sleep,
+    ):
+        """
+        Initialize the bucket (starts full).
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to ``rate``)
+            clock: Monotonic clock, injectable for tests
+            sleep: Sleep coroutine, injectable for tests
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available (and any provider pause has passed), then take it."""
+        async with self._lock:
+            while True:
+                now = self.clock()
+                if now < self._paused_until:
+                    await self.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await self.sleep((1.0 - self._tokens) / self.rate)
+
+    async def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (e.g. after a 429 with Retry-After)."""
+        now = self.clock()
+        self._paused_until = max(self._paused_until, now + max(seconds, 0.0))
+        # Tokens accrued during the pause would otherwise release a burst right after it.
+        self._tokens = 0.0
+        self._updated = self._paused_until
+
+
+# Shared prelude: load and refill the bucket using the Redis server clock.
+# ARGV: rate (tokens/second), capacity
+_LUA_PRELUDE = """
+local bucket = KEYS[1]
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', bucket, 'tokens', 'ts', 'paused_until')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+local paused_until = tonumber(state[3]) or 0
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local function persist(at)
+  redis.call('HSET', bucket, 'tokens', tokens, 'ts', at, 'paused_until', paused_until)
+  redis.call('EXPIRE', bucket, """ + str(BUCKET_TTL_SECONDS) + """)
+end
+"""
+
+_LUA_ACQUIRE = _LUA_PRELUDE + """
+if now < paused_until then
+  return tostring(paused_until - now)
+end
+if tokens >= 1 then
+  tokens = tokens - 1
+  persist(now)
+  return '0'
+end
+persist(now)
+return tostring((1 - tokens) / rate)
+"""
+
+# ARGV: rate, capacity, pause seconds
+_LUA_PAUSE = _LUA_PRELUDE + """
+paused_until = math.max(paused_until, now + math.max(tonumber(ARGV[3]), 0))
+-- Tokens accrued during the pause would otherwise release a burst right after it.
+tokens = 0
+persist(paused_until)
+return 1
+"""
+
+
+class RedisTokenBucket:
+    """
+    Token bucket shared by every process through Redis.
+
+    Same interface as ``TokenBucket``. Redis errors fail open (the request
+    goes ahead), matching the rest of the rate limiting code; the provider's
+    own 429s still pause the bucket.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        rate: float,
+        capacity: Optional[float] = None,
+        redis_url: Optional[str] = None,
+        sleep: Callable[[float], "asyncio.Future"] = asyncio.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.key = key
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(rate, 1.0))
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self.sleep = sleep
+        self._redis = None
+        self._scripts: Dict[str, Any] = {}
+
+    async def _get_redis(self):
+        """Lazy initialization of Redis connection and scripts."""
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+            self._scripts["acquire"] = self._redis.register_script(_LUA_ACQUIRE)
+            self._scripts["pause"] = self._redis.register_script(_LUA_PAUSE)
+        return self._redis
+
+    async def _run(self, name: str, *args: Any):
+        await self._get_redis()
+        return await self._scripts[name](keys=[self.key], args=[self.rate, self.capacity, *args])
+
+    async def try_acquire(self) -> float:
+        """Take a token if one is free; returns 0 when granted, else the suggested wait."""
+        try:
+            return float(await self._run("acquire"))
+        except Exception as e:
+            logger.error(f"Redis token bucket acquire error: {e}")
+            return 0.0
+
+    async def acquire(self) -> None:
+        """Wait until a shared token is available, then take it."""
+        while True:
+            wait = await self.try_acquire()
+            if wait <= 0:
+                return
+            # Jitter keeps waiting processes from retrying in lockstep.
+            await self.sleep(min(wait, MAX_WAIT_STEP_SECONDS) + random.uniform(0, 0.01))
+
+    async def pause(self, seconds: float) -> None:
+        """Stop handing out tokens to every process for ``seconds``."""
+        try:
+            await self._run("pause", seconds)
+        except Exception as e:
+            logger.error(f"Redis token bucket pause error: {e}")
+
+
+def get_token_bucket(provider: str, account_key: str, rate: float, capacity: Optional[float] = None):
+    """
+    Return a bucket for one provider account.
+
+    Redis-backed when ``REDIS_URL`` is set, so every worker process draws
+    from the same ``rate``; otherwise an in-process bucket (development,
+    single worker).
+
+    Args:
+        provider: Provider name used in the Redis key (e.g. ``"hunter"``)
+        account_key: API key of the account; only a hash of it is stored
+        rate: Account limit in requests per second
+        capacity: Maximum burst size (defaults to ``rate``)
+    """
+    if os.getenv("REDIS_URL"):
+        fingerprint = hashlib.sha256(account_key.encode("utf-8")).hexdigest()[:16]
+        return RedisTokenBucket(f"rate_limit:{provider}:{fingerprint}", rate, capacity)
+    return TokenBucket(rate, capacity)
@@ -0,0 +1,142 @@
+"""
+Small async task-graph executor for research workflows.
+
+Nodes are provider calls (a Firecrawl search, a scrape, an OpenAI
+extraction). Each node runs under its provider's concurrency limit and a
+per-node timeout; its continuation runs as soon as it finishes and may
+spawn further nodes, so independent branches of a workflow proceed
+without waiting on each other. Identical nodes (same provider and key)
+run once per graph and share their result.
+"""
+
+import asyncio
+import inspect
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+from app.features.core.sqlalchemy_imports import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TIMEOUT_SECONDS = 45.0
+
+
+@dataclass
+class TaskGraphStats:
+    """Counters for one graph run."""
+
+    started: int = 0
+    deduplicated: int = 0
+    failed: int = 0
+    timed_out: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "started": self.started,
+            "deduplicated": self.deduplicated,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+        }
+
+
+class TaskGraph:
+    """
+    Run provider calls concurrently with per-provider limits.
+
+    Usage::
+
+        graph = TaskGraph({"firecrawl": 5, "openai": 3})
+        graph.spawn("firecrawl", ("search", query), lambda: client.search(query), then=handle)
+        await graph.join()
+
+    A node that fails or times out yields ``None`` to its continuation,
+    so one bad branch never stops the others.
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[Dict[str, int]] = None,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        default_concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        self.concurrency = dict(concurrency or {})
+        self.timeout = timeout
+        self.default_concurrency = default_concurrency
+        self.stats = TaskGraphStats()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._results: Dict[tuple, asyncio.Future] = {}
+        self._pending: Set[asyncio.Task] = set()
+
+    def _semaphore(self, provider: str) -> asyncio.Semaphore:
+        if provider not in self._semaphores:
+            limit = self.concurrency.get(provider, self.default_concurrency)
+            self._semaphores[provider] = asyncio.Semaphore(max(1, limit))
+        return self._semaphores[provider]
+
+    def _track(self, coro: Awaitable[Any]) -> None:
+        task = asyncio.ensure_future(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def spawn(
+        self,
+        provider: str,
+        key: Hashable,
+        call: Callable[[], Awaitable[Any]],
+        then: Optional[Callable[[Any], Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Schedule ``call`` as a node unless an identical node already exists.
+
+        Args:
+            provider: Concurrency bucket (e.g. "firecrawl", "openai")
+            key: Identity of the call within the provider (e.g. the query)
+            call: Zero-argument coroutine factory doing the provider call
+            then: Continuation receiving the result (or None on failure);
+                may be sync or async and may spawn more nodes
+            timeout: Seconds before the call is abandoned (default: graph timeout)
+        """
+        node_key = (provider, key)
+        result = self._results.get(node_key)
+        if result is None:
+            result = asyncio.get_running_loop().create_future()
+            self._results[node_key] = result
+            self._track(self._run_node(provider, key, call, result, timeout or self.timeout))
+        else:
+            self.stats.deduplicated += 1
+        if then is not None:
+            self._track(self._continue(result, then))
+
+    async def _run_node(self, provider, key, call, result: asyncio.Future, timeout: float) -> None:
+        value = None
+        async with self._semaphore(provider):
+            self.stats.started += 1
+            try:
+                value = await asyncio.wait_for(call(), timeout=timeout)
+            except asyncio.TimeoutError:
+                self.stats.timed_out += 1
+                logger.warning("Research node timed out", provider=provider, key=str(key), timeout=timeout)
+            except Exception as e:
+                self.stats.failed += 1
+                logger.warning("Research node failed", provider=provider, key=str(key), error=str(e))
+        result.set_result(value)
+
+    async def _continue(self, result: asyncio.Future, then: Callable[[Any], Any]) -> None:
+        try:
+            outcome = then(await result)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception as e:
+            logger.warning("Research continuation failed", error=str(e), exc_info=True)
+
+    async def join(self) -> TaskGraphStats:
+        """Wait until every node and continuation (including ones spawned meanwhile) is done."""
+        try:
+            while self._pending:
+                await asyncio.gather(*list(self._pending))
+        finally:
+            for task in list(self._pending):
+                task.cancel()
+        return self.stats
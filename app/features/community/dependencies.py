@@ -14,6 +14,8 @@ from .services import (
     GroupPostCrudService,
     GroupCommentCrudService,
     MessageCrudService,
+    CommunitySearchService,
+    CommunityDashboardService,
     EventCrudService,
     PollCrudService,
     PollVoteCrudService,
@@ -142,3 +144,19 @@ async def get_content_engagement_service(
 ) -> ContentEngagementCrudService:
     # Engagement aggregated hub-wide.
     return ContentEngagementCrudService(session, tenant_id=None)
+
+
+async def get_search_service(
+    session: AsyncSession = Depends(get_db),
+    tenant_id: str = Depends(tenant_dependency),
+) -> CommunitySearchService:
+    # Hub-wide entities are searched globally; members stay tenant-scoped.
+    return CommunitySearchService(session, tenant_id)
+
+
+async def get_dashboard_service(
+    session: AsyncSession = Depends(get_db),
+    tenant_id: str = Depends(tenant_dependency),
+) -> CommunityDashboardService:
+    # Members and partners are counted per tenant; content is hub-wide.
+    return CommunityDashboardService(session, tenant_id)
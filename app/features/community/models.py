@@ -10,7 +10,7 @@ consistent with the wider platform.
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Any, Dict
 
 from sqlalchemy import (
@@ -22,13 +22,21 @@ from sqlalchemy import (
     DateTime,
     Boolean,
     Integer,
+    BigInteger,
     Float,
+    Date,
+    LargeBinary,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship, backref
 
 from app.features.core.database import Base
 from app.features.core.audit_mixin import AuditMixin
+from app.features.core.full_text_search import (
+    search_vector_column,
+    search_vector_index,
+    trigram_index,
+)
 
 
 class Member(Base, AuditMixin):
@@ -51,6 +59,7 @@ class Member(Base, AuditMixin):
     location = Column(String(255), nullable=True)
     specialties = Column(JSONB, nullable=False, default=list)  # Stored as array-like JSON
     tags = Column(JSONB, nullable=False, default=list)
+    search_vector = search_vector_column(("name", "A"), ("email", "A"), ("location", "B"), ("bio", "C"))
 
     user = relationship("User", backref="community_member", lazy="joined", uselist=False)
     # Selectin loading avoids async lazy-load errors when serializing partner_name
@@ -59,6 +68,9 @@ class Member(Base, AuditMixin):
     __table_args__ = (
         Index("ix_members_tenant_email_unique", "tenant_id", "email", unique=True),
         Index("ix_members_tenant_name", "tenant_id", "name"),
+        search_vector_index("ix_members_search_vector"),
+        trigram_index("ix_members_name_trgm", "name"),
+        trigram_index("ix_members_email_trgm", "email"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -98,10 +110,15 @@ class Partner(Base, AuditMixin):
     offer = Column(Text, nullable=True)
     website = Column(String(500), nullable=True)
     category = Column(String(100), nullable=True)
+    search_vector = search_vector_column(
+        ("name", "A"), ("category", "B"), ("offer", "B"), ("description", "C")
+    )
 
     __table_args__ = (
         Index("ix_partners_tenant_name_unique", "tenant_id", "name", unique=True),
         Index("ix_partners_tenant_category", "tenant_id", "category"),
+        search_vector_index("ix_partners_search_vector"),
+        trigram_index("ix_partners_name_trgm", "name"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -133,9 +150,12 @@ class Group(Base, AuditMixin):
     name = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     owner_id = Column(String(36), nullable=True)
+    search_vector = search_vector_column(("name", "A"), ("description", "B"))
 
     __table_args__ = (
         Index("ix_groups_tenant_name", "tenant_id", "name"),
+        search_vector_index("ix_groups_search_vector"),
+        trigram_index("ix_groups_name_trgm", "name"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -165,6 +185,7 @@ class GroupPost(Base, AuditMixin):
     __table_args__ = (
         Index("ix_group_posts_group_id", "group_id"),
         Index("ix_group_posts_tenant_id", "tenant_id"),
+        Index("ix_group_posts_group_feed", "group_id", "created_at", "id"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -193,6 +214,7 @@ class GroupComment(Base, AuditMixin):
 
     __table_args__ = (
         Index("ix_group_comments_post_id", "post_id"),
+        Index("ix_group_comments_post_created", "post_id", "created_at", "id"),
         Index("ix_group_comments_tenant_id", "tenant_id"),
     )
 
@@ -256,10 +278,15 @@ class Event(Base, AuditMixin):
     location = Column(String(255), nullable=True)
     url = Column(String(500), nullable=True)
     category = Column(String(100), nullable=True)
+    search_vector = search_vector_column(
+        ("title", "A"), ("category", "B"), ("location", "B"), ("description", "C")
+    )
 
     __table_args__ = (
         Index("ix_events_tenant_id", "tenant_id"),
         Index("ix_events_start_date", "start_date"),
+        search_vector_index("ix_events_search_vector"),
+        trigram_index("ix_events_title_trgm", "title"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -287,6 +314,9 @@ class Thread(Base):
     tenant_id = Column(String(64), nullable=False, index=True)
     created_by = Column(String(36), nullable=False)
     created_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    # Maintained by MessageCrudService.create_message
+    last_message_id = Column(String(36), nullable=True)
+    last_message_at = Column(DateTime(timezone=True), nullable=True)
 
     def __repr__(self) -> str:
         return f"<Thread id={self.id} tenant={self.tenant_id}>"
@@ -301,9 +331,17 @@ class ThreadParticipant(Base):
     thread_id = Column(String(36), ForeignKey("threads.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     joined_at = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
+    # Per-participant inbox index, maintained by create_message / mark_read:
+    # the thread's recency copied here so "my threads by recency" is one
+    # index scan, plus this participant's read marker and unread count.
+    last_message_at = Column(DateTime(timezone=True), nullable=True)
+    last_read_message_id = Column(String(36), nullable=True)
+    last_read_at = Column(DateTime(timezone=True), nullable=True)
+    unread_count = Column(Integer, nullable=False, default=0, server_default="0")
 
     __table_args__ = (
         Index("ix_thread_participants_thread_user_unique", "thread_id", "user_id", unique=True),
+        Index("ix_thread_participants_user_recent", "user_id", "last_message_at", "thread_id"),
     )
 
 
@@ -383,6 +421,25 @@ class PollVote(Base, AuditMixin):
     )
 
 
+class PollVoteCounter(Base):
+    """
+    Running vote count for a poll option, split across a few shard rows so
+    concurrent voters do not all queue on one row lock. An option's total is
+    the sum of its shards.
+    """
+
+    __tablename__ = "poll_vote_counters"
+
+    option_id = Column(String(36), ForeignKey("poll_options.id", ondelete="CASCADE"), primary_key=True)
+    shard = Column(Integer, primary_key=True)
+    poll_id = Column(String(36), ForeignKey("polls.id", ondelete="CASCADE"), nullable=False)
+    count = Column(BigInteger, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_poll_vote_counters_poll_id", "poll_id"),
+    )
+
+
 class CommunityContent(Base, AuditMixin):
     """Long-form article or guide within the content hub."""
 
@@ -392,15 +449,21 @@ class CommunityContent(Base, AuditMixin):
     tenant_id = Column(String(64), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     body_md = Column(Text, nullable=False)
+    # Rendered once on write; body_hash is the SHA-256 of the body_md it came from
+    body_html = Column(Text, nullable=True)
+    body_hash = Column(String(64), nullable=True)
     tags = Column(JSONB, nullable=False, default=list)
     category = Column(String(100), nullable=True)
     author_id = Column(String(36), nullable=True, index=True)
     published_at = Column(DateTime(timezone=True), nullable=True)
     hero_image_url = Column(String(500), nullable=True)
+    search_vector = search_vector_column(("title", "A"), ("category", "B"), ("body_md", "C"))
 
     __table_args__ = (
         Index("ix_community_content_tenant_category", "tenant_id", "category"),
         Index("ix_community_content_published", "published_at"),
+        search_vector_index("ix_community_content_search_vector"),
+        trigram_index("ix_community_content_title_trgm", "title"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -433,10 +496,13 @@ class PodcastEpisode(Base, AuditMixin):
     host = Column(String(255), nullable=True)
     published_at = Column(DateTime(timezone=True), nullable=True)
     categories = Column(JSONB, nullable=False, default=list)
+    search_vector = search_vector_column(("title", "A"), ("host", "B"), ("description", "C"))
 
     __table_args__ = (
         Index("ix_community_podcasts_tenant_title", "tenant_id", "title"),
         Index("ix_community_podcasts_published", "published_at"),
+        search_vector_index("ix_community_podcasts_search_vector"),
+        trigram_index("ix_community_podcasts_title_trgm", "title"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -468,10 +534,13 @@ class VideoResource(Base, AuditMixin):
     category = Column(String(100), nullable=True)
     duration_minutes = Column(Float, nullable=True)
     published_at = Column(DateTime(timezone=True), nullable=True)
+    search_vector = search_vector_column(("title", "A"), ("category", "B"), ("description", "C"))
 
     __table_args__ = (
         Index("ix_community_videos_tenant_category", "tenant_id", "category"),
         Index("ix_community_videos_published", "published_at"),
+        search_vector_index("ix_community_videos_search_vector"),
+        trigram_index("ix_community_videos_title_trgm", "title"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -502,10 +571,15 @@ class NewsItem(Base, AuditMixin):
     summary = Column(Text, nullable=True)
     publish_date = Column(DateTime(timezone=True), nullable=True)
     category = Column(String(100), nullable=True)
+    search_vector = search_vector_column(
+        ("headline", "A"), ("source", "B"), ("category", "B"), ("summary", "C")
+    )
 
     __table_args__ = (
         Index("ix_community_news_tenant_category", "tenant_id", "category"),
         Index("ix_community_news_publish_date", "publish_date"),
+        search_vector_index("ix_community_news_search_vector"),
+        trigram_index("ix_community_news_headline_trgm", "headline"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -553,3 +627,48 @@ class ContentEngagement(Base, AuditMixin):
         }
         data.update(self.get_audit_info())
         return data
+
+
+# Engagement rollups, maintained by the engagement ingest flusher. Rows for
+# ENGAGEMENT_ALL_TIME hold a tenant's running totals so the all-time summary
+# is a fixed-size read; every other day is a calendar day in UTC.
+ENGAGEMENT_ALL_TIME = date(1, 1, 1)
+
+
+class ContentEngagementCounter(Base):
+    """Running count of one action on one content item."""
+
+    __tablename__ = "community_engagement_counters"
+
+    tenant_id = Column(String(64), primary_key=True)
+    content_id = Column(
+        String(36), ForeignKey("community_content.id", ondelete="CASCADE"), primary_key=True
+    )
+    action = Column(String(64), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+    last_occurred_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_community_engagement_counters_content", "content_id"),
+    )
+
+
+class ContentEngagementDaily(Base):
+    """Count of one action across a tenant's content for one day."""
+
+    __tablename__ = "community_engagement_daily"
+
+    tenant_id = Column(String(64), primary_key=True)
+    day = Column(Date, primary_key=True)
+    action = Column(String(64), primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+
+
+class ContentEngagementMemberSketch(Base):
+    """HyperLogLog registers of the members who engaged on one day."""
+
+    __tablename__ = "community_engagement_member_sketches"
+
+    tenant_id = Column(String(64), primary_key=True)
+    day = Column(Date, primary_key=True)
+    registers = Column(LargeBinary, nullable=False)
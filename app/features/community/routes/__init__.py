@@ -10,6 +10,7 @@ from .messages import router as messages_router
 from .events import router as events_router
 from .polls import router as polls_router
 from .content import router as content_router
+from .search import router as search_router
 
 router = APIRouter(tags=["Community"])
 
@@ -22,5 +23,6 @@ router.include_router(messages_router)
 router.include_router(events_router)
 router.include_router(polls_router)
 router.include_router(content_router)
+router.include_router(search_router)
 
 __all__ = ["router"]
@@ -405,22 +405,32 @@ async def delete_news_api(
 @router.post(
     "/api/articles/{content_id}/engagement",
     response_model=ContentEngagementResponse,
-    status_code=201,
+    status_code=202,
     summary="Record content engagement",
-    description="Record a member engagement action (view, like, share) against an article.",
+    description=(
+        "Queue a member engagement action (view, like, share) against an article. "
+        "Events are written in batches, so counts catch up within a flush interval."
+    ),
 )
 async def record_engagement_api(
     content_id: str,
     payload: ContentEngagementCreate,
+    tenant_id: str = Depends(tenant_dependency),
     current_user: User = Depends(get_current_user),
     service: ContentEngagementCrudService = Depends(get_content_engagement_service),
 ):
     """Record engagement on an article."""
+    # The flush drops events for unknown content, so reject them while the caller can still see it
+    if not await service.content_exists(content_id):
+        raise HTTPException(status_code=404, detail="Content not found")
     data = payload.model_dump()
     data["content_id"] = content_id
-    engagement = await service.record_engagement(data, current_user)
-    if not engagement:
-        raise HTTPException(status_code=500, detail="Failed to record engagement")
+    # The hub-wide service has no tenant of its own; attribute the event to the caller's
+    data["tenant_id"] = tenant_id
+    try:
+        engagement = await service.record_engagement(data, current_user)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     return ContentEngagementResponse.model_validate(engagement, from_attributes=True)
 
 
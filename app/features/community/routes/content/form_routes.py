@@ -1,14 +1,11 @@
 """Form routes for community content hub (articles, podcasts, videos, news)."""
 
-import markdown
 from datetime import datetime, timezone
 from types import SimpleNamespace
 from typing import Dict, List, Optional
 
 from pydantic import ValidationError
 
-import markdown
-
 from app.features.auth.dependencies import get_admin_user
 from app.features.core.validation import FormHandler
 from app.features.core.route_imports import (
@@ -48,6 +45,7 @@ from ...services import (
     VideoCrudService,
     NewsCrudService,
 )
+from ...services.content.articles.rendering import preview_cache, render_article_html
 
 router = APIRouter()
 
@@ -234,11 +232,11 @@ async def content_article_view_partial(
     article = await content_service.get_by_id(content_id)
     if not article:
         return HTMLResponse("<div class='p-3'>Article not found.</div>", status_code=404)
-    raw_body = article.body_md or ""
-    body_html = raw_body
-    if "<" not in raw_body:
-        body_html = markdown.markdown(raw_body, extensions=["extra", "sane_lists"])
     article_ns = article.to_dict()
+    # Rendered on write; only rows never saved through the service lack it
+    body_html = article.body_html
+    if body_html is None:
+        body_html = render_article_html(article.body_md)
     article_ns["body_html"] = body_html
     return templates.TemplateResponse(
         "community/content/partials/article_view.html",
@@ -255,7 +253,7 @@ async def content_article_preview(
     form_handler = FormHandler(request)
     await form_handler.parse_form()
     body = form_handler.form_data.get("body_md", "")
-    rendered = markdown.markdown(body or "", extensions=["extra", "tables", "fenced_code"]) if body else ""
+    rendered = await preview_cache.render(body) if body else ""
 
     context = {
         "request": request,
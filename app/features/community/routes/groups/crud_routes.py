@@ -45,6 +45,7 @@ from ...services import (
     GroupPostCrudService,
     GroupCommentCrudService,
 )
+from ...services.groups import FeedComment, FeedPost
 
 router = APIRouter()
 
@@ -67,29 +68,30 @@ async def _fetch_author_map(db: AsyncSession, author_ids: set[str]) -> dict[str,
     return {user.id: (user.name or user.email or user.id) for user in result.scalars().all()}
 
 
-def _comment_view_model(comment, author_map: dict[str, str], current_user: User):
+def _comment_view_model(comment: FeedComment, current_user: User):
     return SimpleNamespace(
         id=comment.id,
         post_id=comment.post_id,
         content=comment.content,
         author_id=comment.author_id,
-        author_name=author_map.get(comment.author_id) or (comment.author_id or "Unknown"),
+        author_name=comment.author_name or (comment.author_id or "Unknown"),
         created_at=comment.created_at,
         can_edit=_can_edit(comment.author_id, current_user),
         can_delete=_can_edit(comment.author_id, current_user),
     )
 
 
-def _post_view_model(post, comments, author_map: dict[str, str], current_user: User):
+def _post_view_model(post: FeedPost, current_user: User):
     return SimpleNamespace(
         id=post.id,
         group_id=post.group_id,
         title=post.title,
         content=post.content,
         author_id=post.author_id,
-        author_name=author_map.get(post.author_id) or (post.author_id or "Unknown"),
+        author_name=post.author_name or (post.author_id or "Unknown"),
         created_at=post.created_at,
-        comments=comments,
+        comments=[_comment_view_model(comment, current_user) for comment in post.comments],
+        comment_total=post.comment_total,
         can_edit=_can_edit(post.author_id, current_user),
         can_delete=_can_edit(post.author_id, current_user),
     )
@@ -98,52 +100,18 @@ def _post_view_model(post, comments, author_map: dict[str, str], current_user: U
 async def _build_feed(
     group_id: str,
     post_service: GroupPostCrudService,
-    comment_service: GroupCommentCrudService,
-    db: AsyncSession,
     current_user: User,
     limit: int = 20,
-    offset: int = 0,
+    cursor: Optional[str] = None,
 ):
-    """Load posts + comments for a group with author metadata."""
-    posts, total = await post_service.list_posts(group_id=group_id, limit=limit, offset=offset)
-    author_ids: set[str] = set()
-    comments_map: dict[str, list] = {}
-
-    for post in posts:
-        comments, _ = await comment_service.list_comments(post_id=post.id, limit=100, offset=0)
-        comments_map[post.id] = comments
-        if post.author_id:
-            author_ids.add(post.author_id)
-        for comment in comments:
-            if comment.author_id:
-                author_ids.add(comment.author_id)
-
-    author_map = await _fetch_author_map(db, author_ids)
-
-    post_views = []
-    for post in posts:
-        comment_views = [
-            _comment_view_model(comment, author_map, current_user) for comment in comments_map.get(post.id, [])
-        ]
-        post_views.append(_post_view_model(post, comment_views, author_map, current_user))
-
-    return post_views, total
-
-
-async def _load_post_view(
-    post,
-    comment_service: GroupCommentCrudService,
-    db: AsyncSession,
-    current_user: User,
-):
-    comments, _ = await comment_service.list_comments(post_id=post.id, limit=100, offset=0)
-    author_ids = {post.author_id} if post.author_id else set()
-    for comment in comments:
-        if comment.author_id:
-            author_ids.add(comment.author_id)
-    author_map = await _fetch_author_map(db, author_ids)
-    comment_views = [_comment_view_model(comment, author_map, current_user) for comment in comments]
-    return _post_view_model(post, comment_views, author_map, current_user)
+    """Load a feed page (posts, latest comments, authors) and the cursor of the next page."""
+    page = await post_service.load_feed(group_id, limit=limit, cursor=cursor)
+    return [_post_view_model(post, current_user) for post in page.posts], page.next_cursor
+
+
+async def _load_post_view(post_id: str, post_service: GroupPostCrudService, current_user: User):
+    post = await post_service.load_feed_post(post_id)
+    return _post_view_model(post, current_user) if post else None
 
 
 # --- HTMX form submissions ---
@@ -398,27 +366,28 @@ async def update_group_post_form(
 async def group_feed_partial(
     request: Request,
     group_id: str,
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(default=None),
     current_user: User = Depends(get_current_user),
     group_service: GroupCrudService = Depends(get_group_service),
     post_service: GroupPostCrudService = Depends(get_group_post_service),
-    comment_service: GroupCommentCrudService = Depends(get_group_comment_service),
 ):
     group = await group_service.get_by_id(group_id)
     if not group:
         return HTMLResponse("<div class='alert alert-danger mb-0'>Group not found.</div>", status_code=404)
 
-    posts, total = await _build_feed(group_id, post_service, comment_service, db, current_user)
+    posts, next_cursor = await _build_feed(group_id, post_service, current_user, cursor=cursor)
     context = {
         "request": request,
         "group": group,
         "posts": posts,
+        "next_cursor": next_cursor,
         "post_errors": None,
         "post_form_data": None,
         "can_moderate": _is_moderator(current_user),
-        "post_total": total,
     }
-    return templates.TemplateResponse("community/groups/partials/feed.html", context)
+    # "Load more" requests only need the next page of cards
+    template = "feed_page.html" if cursor else "feed.html"
+    return templates.TemplateResponse(f"community/groups/partials/{template}", context)
 
 
 @router.post("/{group_id}/posts/partials", response_class=HTMLResponse)
@@ -429,7 +398,6 @@ async def create_group_post_inline(
     current_user: User = Depends(get_current_user),
     group_service: GroupCrudService = Depends(get_group_service),
     post_service: GroupPostCrudService = Depends(get_group_post_service),
-    comment_service: GroupCommentCrudService = Depends(get_group_comment_service),
 ):
     group = await group_service.get_by_id(group_id)
     if not group:
@@ -447,47 +415,39 @@ async def create_group_post_inline(
         payload = GroupPostCreate(**raw_data)
     except ValidationError as exc:
         errors = {err["loc"][0]: [err["msg"]] for err in exc.errors()}
-        posts, total = await _build_feed(group_id, post_service, comment_service, db, current_user)
         context = {
             "request": request,
             "group": group,
-            "posts": posts,
             "post_errors": errors,
             "post_form_data": SimpleNamespace(**raw_data),
-            "can_moderate": _is_moderator(current_user),
-            "post_total": total,
         }
-        return templates.TemplateResponse("community/groups/partials/feed.html", context, status_code=400)
+        headers = {"HX-Retarget": "#group-post-composer", "HX-Reswap": "outerHTML"}
+        return templates.TemplateResponse(
+            "community/groups/partials/post_composer.html",
+            context,
+            status_code=400,
+            headers=headers,
+        )
 
-    await post_service.create_post(payload.model_dump(), current_user)
+    post = await post_service.create_post(payload.model_dump(), current_user)
     await commit_transaction(db, "create_group_post_inline")
 
-    posts, total = await _build_feed(group_id, post_service, comment_service, db, current_user)
-    context = {
-        "request": request,
-        "group": group,
-        "posts": posts,
-        "post_errors": None,
-        "post_form_data": None,
-        "can_moderate": _is_moderator(current_user),
-        "post_total": total,
-    }
-    return templates.TemplateResponse("community/groups/partials/feed.html", context)
+    # Only the new card goes back; the composer prepends it to the feed
+    post_view = await _load_post_view(post.id, post_service, current_user)
+    context = {"request": request, "post": post_view, "can_moderate": _is_moderator(current_user)}
+    return templates.TemplateResponse("community/groups/partials/post_card.html", context)
 
 
 @router.get("/posts/{post_id}/partials", response_class=HTMLResponse)
 async def get_post_card_partial(
     request: Request,
     post_id: str,
-    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     post_service: GroupPostCrudService = Depends(get_group_post_service),
-    comment_service: GroupCommentCrudService = Depends(get_group_comment_service),
 ):
-    post = await post_service.get_by_id(post_id)
-    if not post:
+    post_view = await _load_post_view(post_id, post_service, current_user)
+    if not post_view:
         return HTMLResponse("<div class='alert alert-danger mb-0'>Post not found.</div>", status_code=404)
-    post_view = await _load_post_view(post, comment_service, db, current_user)
     context = {"request": request, "post": post_view, "can_moderate": _is_moderator(current_user)}
     return templates.TemplateResponse("community/groups/partials/post_card.html", context)
 
@@ -523,7 +483,6 @@ async def update_post_partial(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     post_service: GroupPostCrudService = Depends(get_group_post_service),
-    comment_service: GroupCommentCrudService = Depends(get_group_comment_service),
 ):
     post = await post_service.get_by_id(post_id)
     if not post:
@@ -556,7 +515,7 @@ async def update_post_partial(
         return HTMLResponse("<div class='alert alert-danger mb-0'>Post not found.</div>", status_code=404)
 
     await commit_transaction(db, "update_post_partial")
-    post_view = await _load_post_view(updated_post, comment_service, db, current_user)
+    post_view = await _load_post_view(updated_post.id, post_service, current_user)
     context = {"request": request, "post": post_view, "can_moderate": _is_moderator(current_user)}
     return templates.TemplateResponse("community/groups/partials/post_card.html", context)
 
@@ -568,7 +527,6 @@ async def delete_post_partial(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     post_service: GroupPostCrudService = Depends(get_group_post_service),
-    comment_service: GroupCommentCrudService = Depends(get_group_comment_service),
 ):
     post = await post_service.get_by_id(post_id)
     if not post:
@@ -580,15 +538,15 @@ async def delete_post_partial(
     await post_service.delete_post(post_id)
     await commit_transaction(db, "delete_post_partial")
 
-    posts, total = await _build_feed(post.group_id, post_service, comment_service, db, current_user)
+    posts, next_cursor = await _build_feed(post.group_id, post_service, current_user)
     context = {
         "request": request,
         "group": SimpleNamespace(id=post.group_id),
         "posts": posts,
+        "next_cursor": next_cursor,
         "post_errors": None,
         "post_form_data": None,
         "can_moderate": _is_moderator(current_user),
-        "post_total": total,
     }
     return templates.TemplateResponse("community/groups/partials/feed.html", context)
 
@@ -617,7 +575,7 @@ async def create_comment_partial(
         payload = GroupCommentCreate(**raw_data)
     except ValidationError as exc:
         errors = {err["loc"][0]: [err["msg"]] for err in exc.errors()}
-        post_view = await _load_post_view(post, comment_service, db, current_user)
+        post_view = await _load_post_view(post.id, post_service, current_user)
         context = {
             "request": request,
             "post": post_view,
@@ -630,7 +588,7 @@ async def create_comment_partial(
     await comment_service.create_comment(payload.model_dump(), current_user)
     await commit_transaction(db, "create_comment_partial")
 
-    post_view = await _load_post_view(post, comment_service, db, current_user)
+    post_view = await _load_post_view(post.id, post_service, current_user)
     context = {"request": request, "post": post_view, "can_moderate": _is_moderator(current_user)}
     return templates.TemplateResponse("community/groups/partials/comment_list.html", context)
 
@@ -693,7 +651,7 @@ async def update_comment_partial(
         return HTMLResponse("<div class='alert alert-danger mb-0'>Comment not found.</div>", status_code=404)
 
     await commit_transaction(db, "update_comment_partial")
-    post_view = await _load_post_view(post, comment_service, db, current_user)
+    post_view = await _load_post_view(post.id, post_service, current_user)
     context = {"request": request, "post": post_view, "can_moderate": _is_moderator(current_user)}
     return templates.TemplateResponse("community/groups/partials/comment_list.html", context)
 
@@ -720,7 +678,7 @@ async def delete_comment_partial(
     await comment_service.delete_comment(comment_id)
     await commit_transaction(db, "delete_comment_partial")
 
-    post_view = await _load_post_view(post, comment_service, db, current_user)
+    post_view = await _load_post_view(post.id, post_service, current_user)
     context = {"request": request, "post": post_view, "can_moderate": _is_moderator(current_user)}
     return templates.TemplateResponse("community/groups/partials/comment_list.html", context)
 
@@ -2,8 +2,10 @@ from fastapi import APIRouter
 from .form_routes import router as form_router
 from .crud_routes import router as crud_router
 from .recipient_routes import router as recipient_router
+from .stream_routes import router as stream_router
 
 router = APIRouter(prefix="/messages", tags=["community-messages"])
 router.include_router(form_router)
 router.include_router(crud_router)
 router.include_router(recipient_router)
+router.include_router(stream_router)
@@ -8,7 +8,10 @@ from app.features.core.route_imports import (
     Depends,
     HTTPException,
     Query,
+    AsyncSession,
+    commit_transaction,
     get_current_user,
+    get_db,
     User,
 )
 
@@ -54,6 +57,7 @@ async def fetch_thread_api(
 @router.post("/api", response_model=MessageResponse, status_code=201)
 async def send_message_api(
     payload: MessageCreate,
+    db: AsyncSession = Depends(get_db),
     service: MessageCrudService = Depends(get_message_service),
     current_user: User = Depends(get_current_user),
 ):
@@ -61,16 +65,23 @@ async def send_message_api(
     message = await service.create_message(payload.model_dump(), sender_id=current_user.id)
     if not message:
         raise HTTPException(status_code=500, detail="Failed to send message")
+    await commit_transaction(db, "send_message_api")
+    await service.notify_message(message)
     return MessageResponse.model_validate(message, from_attributes=True)
 
 
 @router.post("/api/mark-read")
 async def mark_read_api(
     message_ids: list[str] = Body(default=[]),
+    db: AsyncSession = Depends(get_db),
     service: MessageCrudService = Depends(get_message_service),
+    current_user: User = Depends(get_current_user),
 ):
     """Mark messages as read."""
-    await service.mark_read(message_ids)
+    thread_ids = await service.mark_read(message_ids, reader_id=current_user.id)
+    await commit_transaction(db, "mark_read_api")
+    for thread_id in thread_ids:
+        await service.notify_read(thread_id, current_user.id)
     return {"status": "ok"}
 
 
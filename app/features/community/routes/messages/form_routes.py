@@ -84,6 +84,7 @@ async def send_message_form(
     try:
         message = await message_service.create_message(payload.model_dump(), sender_id=current_user.id)
         await commit_transaction(db, "create_message_form")
+        await message_service.notify_message(message)
     except ValueError as exc:
         await db.rollback()
         context = {
@@ -168,6 +169,7 @@ async def create_new_thread(
         thread = await message_service.create_thread(payload.recipient_ids, created_by=current_user.id)
         msg = await message_service.create_message({"thread_id": thread.id, "content": payload.content}, sender_id=current_user.id)
         await commit_transaction(db, "create_message_form")
+        await message_service.notify_message(msg)
         messages = await message_service.fetch_thread(thread_id=thread.id, member_id=current_user.id)
         participant_ids = await message_service.participants_for_thread(thread.id)
         names = await message_service._user_map(participant_ids)
@@ -252,14 +254,41 @@ async def select_recipient(
 @router.get("/partials/conversations", response_class=HTMLResponse)
 async def conversation_rail(
     request: Request,
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     message_service: MessageCrudService = Depends(get_message_service),
 ):
-    """Render the left-rail conversation list."""
-    conversations = await message_service.list_conversation_summaries(member_id=current_user.id, limit=50)
+    """Render the left-rail conversation list (or, with a cursor, its next page)."""
+    page = await message_service.load_inbox(member_id=current_user.id, limit=50, cursor=cursor)
+    template = "conversation_items.html" if cursor else "conversation_list.html"
     return templates.TemplateResponse(
-        "community/messages/partials/conversation_list.html",
-        {"request": request, "conversations": conversations, "current_member_id": current_user.id},
+        f"community/messages/partials/{template}",
+        {
+            "request": request,
+            "conversations": page.conversations,
+            "next_cursor": page.next_cursor,
+            "current_member_id": current_user.id,
+        },
+    )
+
+
+@router.get("/partials/conversations/{thread_id}", response_class=HTMLResponse)
+async def conversation_row(
+    thread_id: str,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    message_service: MessageCrudService = Depends(get_message_service),
+):
+    """Render one conversation row (live inbox updates swap it in place)."""
+    page = await message_service.load_inbox(member_id=current_user.id, limit=1, thread_id=thread_id)
+    return templates.TemplateResponse(
+        "community/messages/partials/conversation_items.html",
+        {
+            "request": request,
+            "conversations": page.conversations,
+            "next_cursor": None,
+            "current_member_id": current_user.id,
+        },
     )
 
 
@@ -273,6 +302,10 @@ async def thread_view(
 ):
     """Render a thread with composer."""
     messages = await message_service.fetch_thread(thread_id=thread_id, member_id=current_user.id)
+    if messages:
+        await message_service.mark_thread_read(thread_id, current_user.id)
+        await commit_transaction(db, "mark_thread_read")
+        await message_service.notify_read(thread_id, current_user.id)
     participant_ids = await message_service.participants_for_thread(thread_id)
     names = await message_service._user_map(participant_ids)
     participants_label = ", ".join([names.get(pid, {}).get("name") or pid for pid in participant_ids])
@@ -315,8 +348,9 @@ async def thread_reply(
         return templates.TemplateResponse("community/messages/partials/thread.html", context, status_code=400)
 
     try:
-        await message_service.create_message(payload.model_dump(), sender_id=current_user.id)
+        message = await message_service.create_message(payload.model_dump(), sender_id=current_user.id)
         await commit_transaction(db, "reply_message_form")
+        await message_service.notify_message(message)
     except Exception as exc:
         await db.rollback()
         messages = await message_service.fetch_thread(thread_id=thread_id, member_id=current_user.id)
@@ -0,0 +1,81 @@
+"""
+Live inbox routes for community messages.
+
+Handles:
+- GET /stream - Server-Sent Events for the current member's inbox
+- POST /threads/{thread_id}/typing - typing signal (coalesced server-side)
+
+Events are published by the message routes after commit through the inbox
+channel; the stream reads the member's conversation partners once and holds
+no database session while open.
+"""
+
+from fastapi.responses import StreamingResponse
+
+from app.features.core.route_imports import (
+    APIRouter,
+    Depends,
+    Request,
+    Response,
+    AsyncSession,
+    get_current_user,
+    get_db,
+    get_logger,
+    User,
+)
+
+from ...dependencies import get_message_service
+from ...services import MessageCrudService
+from ...services.messages import get_inbox_channel
+from ...services.messages.inbox_channel import inbox_event_stream, publish_typing
+
+logger = get_logger(__name__)
+router = APIRouter()
+
+
+@router.get("/stream")
+async def stream_inbox(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    message_service: MessageCrudService = Depends(get_message_service),
+):
+    """
+    Server-Sent Events endpoint for the member's inbox.
+
+    Delivers message, read, typing and presence events. A reconnect carrying
+    ``Last-Event-ID`` replays what it missed; a fresh connection starts from
+    now (the conversation list itself is rendered by the rail partial).
+    """
+    channel = get_inbox_channel()
+    cursor = request.headers.get("last-event-id") or await channel.latest_id(current_user.id)
+    partners = await message_service.conversation_partners(current_user.id)
+    # Return the connection to the pool; the stream itself only reads the channel
+    await db.close()
+
+    logger.info("Starting inbox stream", user_id=current_user.id, partners=len(partners))
+    return StreamingResponse(
+        inbox_event_stream(channel, current_user.id, partners, cursor),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
+
+
+@router.post("/threads/{thread_id}/typing", status_code=204)
+async def thread_typing(
+    thread_id: str,
+    current_user: User = Depends(get_current_user),
+    message_service: MessageCrudService = Depends(get_message_service),
+):
+    """Tell the other participants the member is typing (at most once per window)."""
+    participant_ids = await message_service.participants_for_thread(thread_id)
+    if current_user.id in participant_ids:
+        await publish_typing(get_inbox_channel(), thread_id, current_user.id, participant_ids)
+    return Response(status_code=204)
+
+
+__all__ = ["router"]
@@ -14,11 +14,7 @@ from ..dependencies import (
     get_event_service,
     get_poll_service,
     get_message_service,
-    get_article_service,
-    get_podcast_service,
-    get_video_service,
-    get_news_service,
-    get_content_engagement_service,
+    get_dashboard_service,
 )
 from ..services import (
     MemberCrudService,
@@ -27,30 +23,12 @@ from ..services import (
     EventCrudService,
     PollCrudService,
     MessageCrudService,
-    ArticleCrudService,
-    PodcastCrudService,
-    VideoCrudService,
-    NewsCrudService,
-    ContentEngagementCrudService,
+    CommunityDashboardService,
 )
 
 router = APIRouter(tags=["community-pages"])
 
 
-async def _community_dashboard_context(
-    member_service: MemberCrudService,
-    partner_service: PartnerCrudService,
-) -> dict:
-    """Build context for the community landing page."""
-    member_count = await member_service.count_all()
-    partner_count = await partner_service.count_all()
-
-    return {
-        "member_count": member_count,
-        "partner_count": partner_count,
-    }
-
-
 def _summarize_copy(value: str | None, limit: int = 140) -> str:
     if not value:
         return ""
@@ -60,45 +38,38 @@ def _summarize_copy(value: str | None, limit: int = 140) -> str:
     return value[: limit - 1].rstrip() + "…"
 
 
-async def _build_announcements(
-    event_service: EventCrudService,
-    poll_service: PollCrudService,
-    article_service: ArticleCrudService,
-    news_service: NewsCrudService,
-) -> list[dict]:
+def _build_announcements(snapshot: dict) -> list[dict]:
     announcements: list[dict] = []
 
-    events, _ = await event_service.list_events(limit=1, offset=0)
-    if events:
-        event = events[0]
+    if snapshot["events"]:
+        event = snapshot["events"][0]
         meta_value = None
-        if getattr(event, "start_date", None):
-            meta_value = event.start_date.strftime("%b %d")
+        if event.get("start_date"):
+            meta_value = event["start_date"].strftime("%b %d")
         announcements.append(
             {
                 "label": "Upcoming Event",
                 "icon": "ti ti-calendar-event",
-                "title": event.title,
-                "body": _summarize_copy(event.description),
+                "title": event["title"],
+                "body": _summarize_copy(event.get("description")),
                 "meta": meta_value,
                 "link": "/features/community/events",
                 "link_text": "View calendar",
             }
         )
 
-    polls, _ = await poll_service.list_polls(limit=1, offset=0)
-    if polls:
-        poll = polls[0]
+    if snapshot["polls"]:
+        poll = snapshot["polls"][0]
         meta_value = None
-        if getattr(poll, "expires_at", None):
-            meta_value = poll.expires_at.strftime("%b %d")
-        option_count = len(getattr(poll, "options", []) or [])
+        if poll.get("expires_at"):
+            meta_value = poll["expires_at"].strftime("%b %d")
+        option_count = int(poll.get("option_count") or 0)
         body = f"{option_count} option{'s' if option_count != 1 else ''} • Cast your vote"
         announcements.append(
             {
                 "label": "Open Poll",
                 "icon": "ti ti-ballot",
-                "title": poll.question,
+                "title": poll["question"],
                 "body": body,
                 "meta": meta_value,
                 "link": "/features/community/polls",
@@ -106,33 +77,31 @@ async def _build_announcements(
             }
         )
 
-    articles, _ = await article_service.list_articles(limit=1, offset=0)
-    if articles:
-        article = articles[0]
+    if snapshot["articles"]:
+        article = snapshot["articles"][0]
         announcements.append(
             {
                 "label": "New Insight",
                 "icon": "ti ti-article",
-                "title": article.title,
-                "body": _summarize_copy(article.body_md),
-                "meta": article.category,
+                "title": article["title"],
+                "body": _summarize_copy(article.get("excerpt")),
+                "meta": article.get("category"),
                 "link": "/features/community/content",
                 "link_text": "Read article",
             }
         )
 
-    news_items, _ = await news_service.list_news(limit=1, offset=0)
-    if news_items:
-        news = news_items[0]
-        meta_value = news.source or news.category
+    if snapshot["news_items"]:
+        news = snapshot["news_items"][0]
+        meta_value = news.get("source") or news.get("category")
         announcements.append(
             {
                 "label": "Industry News",
                 "icon": "ti ti-speakerphone",
-                "title": news.headline,
-                "body": _summarize_copy(news.summary),
+                "title": news["headline"],
+                "body": _summarize_copy(news.get("summary")),
                 "meta": meta_value,
-                "link": news.url,
+                "link": news["url"],
                 "link_text": "Open article",
             }
         )
@@ -144,31 +113,20 @@ async def _build_announcements(
 async def community_home(
     request: Request,
     current_user: User = Depends(get_current_user),
-    member_service: MemberCrudService = Depends(get_member_service),
-    partner_service: PartnerCrudService = Depends(get_partner_service),
-    event_service: EventCrudService = Depends(get_event_service),
-    poll_service: PollCrudService = Depends(get_poll_service),
-    article_service: ArticleCrudService = Depends(get_article_service),
-    news_service: NewsCrudService = Depends(get_news_service),
+    dashboard_service: CommunityDashboardService = Depends(get_dashboard_service),
 ):
     """Render the community landing page with high-level metrics."""
-    context = await _community_dashboard_context(member_service, partner_service)
-    announcements = await _build_announcements(
-        event_service=event_service,
-        poll_service=poll_service,
-        article_service=article_service,
-        news_service=news_service,
-    )
-    context.update(
-        {
-            "request": request,
-            "user": current_user,
-            "page_title": "Community Hub",
-            "page_description": "Connect with peers, partners, and shared insights.",
-            "page_icon": "users",
-            "announcements": announcements,
-        }
-    )
+    snapshot = await dashboard_service.get_snapshot()
+    context = {
+        "request": request,
+        "user": current_user,
+        "page_title": "Community Hub",
+        "page_description": "Connect with peers, partners, and shared insights.",
+        "page_icon": "users",
+        "member_count": snapshot["member_count"],
+        "partner_count": snapshot["partner_count"],
+        "announcements": _build_announcements(snapshot),
+    }
     return templates.TemplateResponse("community/index.html", context)
 
 
@@ -327,32 +285,24 @@ async def content_page(
     request: Request,
     tab: str | None = None,
     current_user: User = Depends(get_current_user),
-    content_service: ArticleCrudService = Depends(get_article_service),
-    podcast_service: PodcastCrudService = Depends(get_podcast_service),
-    video_service: VideoCrudService = Depends(get_video_service),
-    news_service: NewsCrudService = Depends(get_news_service),
-    engagement_service: ContentEngagementCrudService = Depends(get_content_engagement_service),
+    dashboard_service: CommunityDashboardService = Depends(get_dashboard_service),
 ):
-    articles, article_total = await content_service.list_articles(limit=5, offset=0)
-    podcasts, podcast_total = await podcast_service.list_podcasts(limit=5, offset=0)
-    videos, video_total = await video_service.list_videos(limit=5, offset=0)
-    news_items, news_total = await news_service.list_news(limit=5, offset=0)
-    engagement_summary = await engagement_service.get_summary()
+    snapshot = await dashboard_service.get_snapshot()
 
     return templates.TemplateResponse(
         "community/content/dashboard.html",
         {
             "request": request,
             "user": current_user,
-            "articles": articles,
-            "podcasts": podcasts,
-            "videos": videos,
-            "news_items": news_items,
-            "article_total": article_total,
-            "podcast_total": podcast_total,
-            "video_total": video_total,
-            "news_total": news_total,
-            "engagement_summary": engagement_summary,
+            "articles": snapshot["articles"],
+            "podcasts": snapshot["podcasts"],
+            "videos": snapshot["videos"],
+            "news_items": snapshot["news_items"],
+            "article_total": snapshot["article_total"],
+            "podcast_total": snapshot["podcast_total"],
+            "video_total": snapshot["video_total"],
+            "news_total": snapshot["news_total"],
+            "engagement_summary": snapshot["engagement_summary"],
             "active_tab": tab or "overview",
             "page_title": "Content & Learning Hub",
             "page_description": "Publish articles, podcasts, videos, and curated news for your advisors.",
@@ -1,7 +1,9 @@
 from fastapi import APIRouter
 from .form_routes import router as form_router
 from .crud_routes import router as crud_router
+from .stream_routes import router as stream_router
 
 router = APIRouter(prefix="/polls", tags=["community-polls"])
 router.include_router(form_router)
 router.include_router(crud_router)
+router.include_router(stream_router)
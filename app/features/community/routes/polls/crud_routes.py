@@ -32,6 +32,7 @@ from ...schemas import (
     PollVoteResponse,
 )
 from ...services import PollCrudService, PollVoteCrudService
+from ...services.polls import schedule_results_push
 
 router = APIRouter()
 
@@ -264,6 +265,7 @@ async def cast_vote_api(
         member_id=current_user.id if current_user else None,
     )
     await commit_transaction(db, "cast_vote_api")
+    await schedule_results_push(poll_id)
     return PollVoteResponse.model_validate(vote, from_attributes=True)
 
 
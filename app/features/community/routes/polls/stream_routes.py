@@ -0,0 +1,61 @@
+"""
+Live results routes for community polls.
+
+Handles:
+- GET /api/{poll_id}/stream - Server-Sent Events with the poll's vote totals
+
+Totals are pushed by the vote route through the poll results channel (at
+most once per debounce window); the stream sends the current totals once
+on connect and holds no database session while open.
+"""
+
+from fastapi.responses import StreamingResponse
+
+from app.features.core.route_imports import (
+    APIRouter,
+    Depends,
+    Request,
+    AsyncSession,
+    get_current_user,
+    get_db,
+    User,
+)
+
+from ...dependencies import get_poll_vote_service
+from ...services import PollVoteCrudService
+from ...services.polls import get_poll_results_channel
+from ...services.polls.live_results import poll_results_stream, results_payload
+
+router = APIRouter()
+
+
+@router.get("/api/{poll_id}/stream")
+async def stream_poll_results(
+    poll_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    vote_service: PollVoteCrudService = Depends(get_poll_vote_service),
+):
+    """Server-Sent Events endpoint for an open poll's results."""
+    channel = get_poll_results_channel()
+    cursor = request.headers.get("last-event-id")
+    initial = None
+    if not cursor:
+        cursor = await channel.latest_id(poll_id)
+        initial = results_payload(poll_id, await vote_service.vote_summary(poll_id))
+    # Return the connection to the pool; the stream itself only reads the channel
+    await db.close()
+
+    return StreamingResponse(
+        poll_results_stream(channel, poll_id, cursor, initial),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
+
+
+__all__ = ["router"]
@@ -0,0 +1,5 @@
+from fastapi import APIRouter
+from .crud_routes import router as crud_router
+
+router = APIRouter(prefix="/search", tags=["community-search"])
+router.include_router(crud_router)
@@ -0,0 +1,46 @@
+"""Community-wide search API."""
+
+from collections import Counter
+from typing import List, Optional
+
+from app.features.core.route_imports import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    JSONResponse,
+    Query,
+    get_current_user,
+    handle_route_error,
+    User,
+)
+
+from ...dependencies import get_search_service
+from ...services import CommunitySearchService
+from ...services.search import COMMUNITY_SEARCH_TARGETS
+
+router = APIRouter()
+
+
+@router.get("/api", response_class=JSONResponse)
+async def community_search_api(
+    q: str = Query(..., min_length=1, max_length=200),
+    kinds: Optional[List[str]] = Query(default=None),
+    per_kind: int = Query(default=5, ge=1, le=25),
+    current_user: User = Depends(get_current_user),
+    search_service: CommunitySearchService = Depends(get_search_service),
+):
+    """Ranked, highlighted matches across articles, podcasts, videos, news, events, groups and members."""
+    unknown = sorted(set(kinds or ()) - set(COMMUNITY_SEARCH_TARGETS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown search kinds: {', '.join(unknown)}")
+
+    try:
+        hits = await search_service.search_community(q, kinds=kinds, per_kind=per_kind)
+        return {
+            "query": q,
+            "results": [hit.to_dict() for hit in hits],
+            "counts": dict(Counter(hit.kind for hit in hits)),
+        }
+    except Exception as exc:
+        handle_route_error("community_search_api", exc)
+        raise HTTPException(status_code=500, detail="Search failed")
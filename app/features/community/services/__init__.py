@@ -4,6 +4,8 @@ from .groups import GroupCrudService, GroupPostCrudService, GroupCommentCrudServ
 from .events import EventCrudService
 from .polls import PollCrudService, PollVoteCrudService
 from .messages import MessageCrudService
+from .search import CommunitySearchService
+from .dashboard import CommunityDashboardService
 from .content import (
     ArticleCrudService,
     PodcastCrudService,
@@ -23,6 +25,8 @@ __all__ = [
     "PollCrudService",
     "PollVoteCrudService",
     "MessageCrudService",
+    "CommunitySearchService",
+    "CommunityDashboardService",
     "ArticleCrudService",
     "PodcastCrudService",
     "VideoCrudService",
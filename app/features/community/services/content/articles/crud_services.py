@@ -4,11 +4,14 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from app.features.core.sqlalchemy_imports import AsyncSession, func, or_, select
+from app.features.core.sqlalchemy_imports import AsyncSession, func, select
 from app.features.core.audit_mixin import AuditContext
 from app.features.core.enhanced_base_service import BaseService
+from app.features.core.full_text_search import search_match, search_rank
 from app.features.community.models import CommunityContent
 from app.features.community.services.content.tenant_mixins import ContentTenantMixin
+from app.features.community.services.dashboard.dashboard_cache import invalidate_hub_dashboards_after_commit
+from .rendering import apply_rendered_body
 
 
 class ArticleCrudService(ContentTenantMixin, BaseService[CommunityContent]):
@@ -39,19 +42,18 @@ class ArticleCrudService(ContentTenantMixin, BaseService[CommunityContent]):
             if tags:
                 filters.append(CommunityContent.tags.contains(list(tags)))
 
+            fuzzy_columns = (CommunityContent.title,)
             if search:
-                like = f"%{search.lower()}%"
-                filters.append(
-                    or_(
-                        func.lower(CommunityContent.title).like(like),
-                        func.lower(CommunityContent.body_md).like(like),
-                    )
-                )
+                filters.append(search_match(CommunityContent.search_vector, search, fuzzy_columns))
 
             stmt = select(CommunityContent)
             if filters:
                 stmt = stmt.where(*filters)
 
+            if search:
+                stmt = stmt.order_by(
+                    search_rank(CommunityContent.search_vector, search, fuzzy_columns).desc()
+                )
             stmt = stmt.order_by(
                 CommunityContent.published_at.desc().nullslast(),
                 CommunityContent.created_at.desc(),
@@ -77,12 +79,14 @@ class ArticleCrudService(ContentTenantMixin, BaseService[CommunityContent]):
             audit = AuditContext.from_user(user) if user else None
 
             item = CommunityContent(tenant_id=tenant_id, **data)
+            apply_rendered_body(item)
             if audit:
                 item.set_created_by(audit.user_email, audit.user_name)
 
             self.db.add(item)
             await self.db.flush()
             await self.db.refresh(item)
+            invalidate_hub_dashboards_after_commit(self.db)
             return item
         except Exception as exc:
             await self.handle_error("create_article", exc)
@@ -95,6 +99,7 @@ class ArticleCrudService(ContentTenantMixin, BaseService[CommunityContent]):
         try:
             for key, value in (payload or {}).items():
                 setattr(item, key, value)
+            apply_rendered_body(item)
 
             if user:
                 audit = AuditContext.from_user(user)
@@ -102,6 +107,7 @@ class ArticleCrudService(ContentTenantMixin, BaseService[CommunityContent]):
 
             await self.db.flush()
             await self.db.refresh(item)
+            invalidate_hub_dashboards_after_commit(self.db)
             return item
         except Exception as exc:
             await self.handle_error("update_article", exc, content_id=content_id)
@@ -112,4 +118,5 @@ class ArticleCrudService(ContentTenantMixin, BaseService[CommunityContent]):
             return False
         await self.db.delete(item)
         await self.db.flush()
+        invalidate_hub_dashboards_after_commit(self.db)
         return True
@@ -0,0 +1,85 @@
+"""
+Markdown rendering for content hub articles.
+
+Article HTML is rendered once, when the body is written, and stored on the
+row next to the SHA-256 of the markdown it came from; the article view only
+reads the stored HTML. Editor previews go through a bounded LRU cache keyed
+by the same hash, and bodies above ``COMMUNITY_ARTICLE_PREVIEW_OFFLOAD_CHARS``
+are rendered in a worker thread so a long article cannot stall the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+import markdown
+
+from app.features.core.config import get_settings
+from app.features.community.models import CommunityContent
+
+settings = get_settings()
+
+# "extra" already includes tables and fenced code blocks
+ARTICLE_MARKDOWN_EXTENSIONS = ("extra", "sane_lists")
+# Rendered previews kept in memory
+PREVIEW_CACHE_SIZE = int(getattr(settings, "COMMUNITY_ARTICLE_PREVIEW_CACHE_SIZE", 256))
+# Bodies at least this long are rendered off the event loop
+PREVIEW_OFFLOAD_CHARS = int(getattr(settings, "COMMUNITY_ARTICLE_PREVIEW_OFFLOAD_CHARS", 20_000))
+
+
+def article_body_hash(body: Optional[str]) -> str:
+    """Hex SHA-256 of an article body."""
+    return hashlib.sha256((body or "").encode()).hexdigest()
+
+
+def render_article_html(body: Optional[str]) -> str:
+    """Render an article body; bodies that already contain HTML are kept as-is."""
+    body = body or ""
+    if "<" in body:
+        return body
+    return markdown.markdown(body, extensions=list(ARTICLE_MARKDOWN_EXTENSIONS))
+
+
+def apply_rendered_body(article: CommunityContent) -> None:
+    """Refresh the stored HTML when the article's markdown has changed."""
+    body_hash = article_body_hash(article.body_md)
+    if article.body_hash != body_hash or article.body_html is None:
+        article.body_html = render_article_html(article.body_md)
+        article.body_hash = body_hash
+
+
+class PreviewRenderCache:
+    """Least-recently-used map of body hash to rendered HTML."""
+
+    def __init__(self, max_entries: int = PREVIEW_CACHE_SIZE, offload_chars: int = PREVIEW_OFFLOAD_CHARS):
+        self.max_entries = max_entries
+        self.offload_chars = offload_chars
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def render(self, body: str) -> str:
+        """Return the HTML for ``body``, rendering it only on a cache miss."""
+        key = article_body_hash(body)
+        cached = self._entries.get(key)
+        if cached is not None:
+            self._entries.move_to_end(key)
+            return cached
+
+        if len(body) >= self.offload_chars:
+            html = await asyncio.to_thread(render_article_html, body)
+        else:
+            html = render_article_html(body)
+
+        self._entries[key] = html
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return html
+
+
+preview_cache = PreviewRenderCache()
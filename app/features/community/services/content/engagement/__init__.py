@@ -1,3 +1,4 @@
 from .crud_services import ContentEngagementCrudService
+from .ingest import EngagementBuffer, get_engagement_buffer
 
-__all__ = ["ContentEngagementCrudService"]
+__all__ = ["ContentEngagementCrudService", "EngagementBuffer", "get_engagement_buffer"]
@@ -1,15 +1,28 @@
-"""Engagement services for content hub."""
+"""Engagement services for content hub.
+
+Events are written through the buffered ingest path (see ``ingest``); counts
+and summaries are read from the rollup tables it maintains.
+"""
 
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timezone
 
 from app.features.core.sqlalchemy_imports import AsyncSession, func, select
 from app.features.core.audit_mixin import AuditContext
 from app.features.core.enhanced_base_service import BaseService
-from app.features.community.models import ContentEngagement
+from app.features.community.models import (
+    ENGAGEMENT_ALL_TIME,
+    CommunityContent,
+    ContentEngagement,
+    ContentEngagementCounter,
+    ContentEngagementDaily,
+    ContentEngagementMemberSketch,
+)
 from app.features.community.services.content.tenant_mixins import ContentTenantMixin
+from .ingest import EngagementBuffer, EngagementEvent, get_engagement_buffer
+from .sketch import MemberSketch
 
 
 class ContentEngagementCrudService(ContentTenantMixin, BaseService[ContentEngagement]):
@@ -21,23 +34,36 @@ class ContentEngagementCrudService(ContentTenantMixin, BaseService[ContentEngage
     async def get_by_id(self, engagement_id: str) -> Optional[ContentEngagement]:
         return await super().get_by_id(ContentEngagement, engagement_id)
 
-    async def record_engagement(self, payload: Dict[str, Any], user=None) -> ContentEngagement:
-        try:
-            data = dict(payload)
-            tenant_id = self._resolve_tenant_id(data)
-            data.pop("tenant_id", None)
-
-            engagement = ContentEngagement(tenant_id=tenant_id, **data)
-            if user:
-                audit = AuditContext.from_user(user)
-                engagement.set_created_by(audit.user_email, audit.user_name)
-
-            self.db.add(engagement)
-            await self.db.flush()
-            await self.db.refresh(engagement)
-            return engagement
-        except Exception as exc:
-            await self.handle_error("record_engagement", exc)
+    async def content_exists(self, content_id: str) -> bool:
+        """Whether ``content_id`` names an existing content item (primary key lookup)."""
+        stmt = select(CommunityContent.id).where(CommunityContent.id == content_id).limit(1)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
+    async def record_engagement(
+        self,
+        payload: Dict[str, Any],
+        user=None,
+        buffer: Optional[EngagementBuffer] = None,
+    ) -> EngagementEvent:
+        """Queue an engagement event; it is written with the next buffer flush."""
+        data = dict(payload)
+        event = EngagementEvent(
+            tenant_id=self._resolve_tenant_id(data),
+            content_id=data["content_id"],
+            action=data.get("action") or "view",
+            member_id=data.get("member_id"),
+            metadata=data.get("metadata") or {},
+            occurred_at=data.get("occurred_at") or datetime.now(timezone.utc),
+        )
+        if user:
+            audit = AuditContext.from_user(user)
+            event.created_by_email, event.created_by_name = audit.user_email, audit.user_name
+
+        if buffer is None:
+            buffer = get_engagement_buffer()
+        buffer.add(event)
+        return event
 
     async def list_engagement_for_content(
         self, content_id: str, limit: int = 100, offset: int = 0
@@ -53,46 +79,64 @@ class ContentEngagementCrudService(ContentTenantMixin, BaseService[ContentEngage
             result = await self.db.execute(stmt)
             items = list(result.scalars().all())
 
-            count_stmt = select(func.count(ContentEngagement.id)).where(*filters)
-            total = (await self.db.execute(count_stmt)).scalar_one()
-            return items, int(total or 0)
+            counts = await self.get_content_counts(content_id)
+            return items, sum(counts.values())
         except Exception as exc:
             await self.handle_error("list_engagement_for_content", exc, content_id=content_id)
 
+    async def get_content_counts(self, content_id: str) -> Dict[str, int]:
+        """Per-action engagement counts for one content item."""
+        stmt = select(
+            ContentEngagementCounter.action,
+            func.sum(ContentEngagementCounter.count),
+        ).where(ContentEngagementCounter.content_id == content_id)
+        if self.tenant_id is not None:
+            stmt = stmt.where(ContentEngagementCounter.tenant_id == self.tenant_id)
+        stmt = stmt.group_by(ContentEngagementCounter.action)
+        result = await self.db.execute(stmt)
+        return {action: int(count or 0) for action, count in result.all()}
+
     async def get_summary(self, since: Optional[datetime] = None) -> Dict[str, Any]:
-        """Return aggregated engagement stats for dashboard use."""
+        """
+        Return aggregated engagement stats for dashboard use.
+
+        Without ``since`` this reads each tenant's all-time rollup rows; with
+        it, the daily rows from that (UTC) day on. ``unique_members`` is a
+        HyperLogLog estimate merged from the matching per-day sketches.
+        """
         try:
-            filters = []
+            counter_filters = []
+            sketch_filters = []
             if self.tenant_id is not None:
-                filters.append(ContentEngagement.tenant_id == self.tenant_id)
-            if since is not None:
-                filters.append(ContentEngagement.occurred_at >= since)
-
-            stmt = select(
-                ContentEngagement.action,
-                func.count(ContentEngagement.id),
+                counter_filters.append(ContentEngagementDaily.tenant_id == self.tenant_id)
+                sketch_filters.append(ContentEngagementMemberSketch.tenant_id == self.tenant_id)
+            if since is None:
+                counter_filters.append(ContentEngagementDaily.day == ENGAGEMENT_ALL_TIME)
+                sketch_filters.append(ContentEngagementMemberSketch.day == ENGAGEMENT_ALL_TIME)
+            else:
+                if since.tzinfo is not None:
+                    since = since.astimezone(timezone.utc)
+                counter_filters.append(ContentEngagementDaily.day >= since.date())
+                sketch_filters.append(ContentEngagementMemberSketch.day >= since.date())
+
+            stmt = (
+                select(ContentEngagementDaily.action, func.sum(ContentEngagementDaily.count))
+                .where(*counter_filters)
+                .group_by(ContentEngagementDaily.action)
             )
-            if filters:
-                stmt = stmt.where(*filters)
-            stmt = stmt.group_by(ContentEngagement.action)
-
             result = await self.db.execute(stmt)
-            rows = result.all()
-            actions = {row[0]: int(row[1]) for row in rows}
+            actions = {row[0]: int(row[1] or 0) for row in result.all()}
 
             total_actions = sum(actions.values())
 
-            unique_stmt = select(func.count(func.distinct(ContentEngagement.member_id))).where(
-                ContentEngagement.member_id.isnot(None)
-            )
-            if filters:
-                unique_stmt = unique_stmt.where(*filters)
-
-            unique_members = (await self.db.execute(unique_stmt)).scalar_one() or 0
+            sketch_stmt = select(ContentEngagementMemberSketch.registers).where(*sketch_filters)
+            sketch = MemberSketch()
+            for registers in (await self.db.execute(sketch_stmt)).scalars().all():
+                sketch.merge(registers)
 
             return {
                 "total_actions": int(total_actions),
-                "unique_members": int(unique_members),
+                "unique_members": sketch.estimate(),
                 "actions": actions,
             }
         except Exception as exc:
@@ -0,0 +1,307 @@
+"""
+Buffered ingestion for content hub engagement events.
+
+Recording a view, like or share only appends to an in-process buffer. A
+background flusher drains it every ``COMMUNITY_ENGAGEMENT_FLUSH_MS`` (or as
+soon as a full batch is waiting) and, in one transaction per batch:
+
+- appends the events to ``community_content_engagement`` with one
+  multi-row INSERT;
+- adds the batch's counts to the per-content and per-day counter tables
+  (plus the tenant's all-time row) with ``INSERT ... ON CONFLICT DO UPDATE``;
+- merges the batch's members into the per-day HyperLogLog sketches.
+
+Readers never touch the event log, so the hub summary costs the same no
+matter how many events have been recorded. Events still in the buffer are
+not yet counted, and a worker that dies loses at most one flush interval.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from app.features.core.config import get_settings
+from app.features.core.database import get_async_session
+from app.features.core.sqlalchemy_imports import (
+    AsyncSession,
+    func,
+    get_logger,
+    insert,
+    pg_insert,
+    select,
+    update,
+)
+from sqlalchemy import tuple_
+
+from app.features.community.models import (
+    ENGAGEMENT_ALL_TIME,
+    CommunityContent,
+    ContentEngagement,
+    ContentEngagementCounter,
+    ContentEngagementDaily,
+    ContentEngagementMemberSketch,
+)
+from .sketch import MemberSketch
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Longest an event waits in the buffer before it is written
+FLUSH_INTERVAL_SECONDS = float(getattr(settings, "COMMUNITY_ENGAGEMENT_FLUSH_MS", 250)) / 1000
+# Events per INSERT/transaction; a full batch is flushed without waiting
+BATCH_SIZE = int(getattr(settings, "COMMUNITY_ENGAGEMENT_BATCH_SIZE", 500))
+# Oldest events are dropped beyond this many (e.g. while the database is down)
+MAX_BUFFERED_EVENTS = int(getattr(settings, "COMMUNITY_ENGAGEMENT_MAX_BUFFERED", 50_000))
+# Flush attempts per event before it is dropped
+MAX_FLUSH_ATTEMPTS = 3
+
+
+@dataclass
+class EngagementEvent:
+    """One engagement action waiting to be written."""
+
+    tenant_id: str
+    content_id: str
+    action: str
+    member_id: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_by_email: Optional[str] = None
+    created_by_name: Optional[str] = None
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    attempts: int = 0
+
+    @property
+    def day(self) -> date:
+        occurred_at = self.occurred_at
+        if occurred_at.tzinfo is None:
+            occurred_at = occurred_at.replace(tzinfo=timezone.utc)
+        return occurred_at.astimezone(timezone.utc).date()
+
+
+def _rollup_days(event: EngagementEvent) -> Tuple[date, date]:
+    return event.day, ENGAGEMENT_ALL_TIME
+
+
+async def _existing_content_ids(session: AsyncSession, content_ids: Sequence[str]) -> set:
+    result = await session.execute(select(CommunityContent.id).where(CommunityContent.id.in_(content_ids)))
+    return set(result.scalars().all())
+
+
+async def write_engagement_batch(session: AsyncSession, events: Sequence[EngagementEvent]) -> int:
+    """
+    Append ``events`` and advance every rollup in the caller's transaction.
+
+    Events for content that no longer exists are skipped so one stale id
+    cannot fail the batch. Upserts run in key order so concurrent flushers
+    lock rollup rows in the same order. Returns the number of events written.
+    """
+    if not events:
+        return 0
+
+    known = await _existing_content_ids(session, sorted({event.content_id for event in events}))
+    events = [event for event in events if event.content_id in known]
+    if not events:
+        return 0
+
+    await session.execute(
+        insert(ContentEngagement),
+        [
+            {
+                "id": event.id,
+                "tenant_id": event.tenant_id,
+                "content_id": event.content_id,
+                "member_id": event.member_id,
+                "action": event.action,
+                "engagement_metadata": event.metadata or {},
+                "occurred_at": event.occurred_at,
+                "created_by_email": event.created_by_email,
+                "created_by_name": event.created_by_name,
+            }
+            for event in events
+        ],
+    )
+
+    content_counts: Counter = Counter()
+    last_seen: Dict[Tuple[str, str, str], datetime] = {}
+    daily_counts: Counter = Counter()
+    sketches: Dict[Tuple[str, date], MemberSketch] = {}
+    for event in events:
+        key = (event.tenant_id, event.content_id, event.action)
+        content_counts[key] += 1
+        last_seen[key] = max(last_seen.get(key, event.occurred_at), event.occurred_at)
+        for day in _rollup_days(event):
+            daily_counts[(event.tenant_id, day, event.action)] += 1
+            if event.member_id:
+                sketches.setdefault((event.tenant_id, day), MemberSketch()).add(event.member_id)
+
+    counter_insert = pg_insert(ContentEngagementCounter).values([
+        {
+            "tenant_id": tenant_id,
+            "content_id": content_id,
+            "action": action,
+            "count": content_counts[(tenant_id, content_id, action)],
+            "last_occurred_at": last_seen[(tenant_id, content_id, action)],
+        }
+        for tenant_id, content_id, action in sorted(content_counts)
+    ])
+    await session.execute(
+        counter_insert.on_conflict_do_update(
+            index_elements=["tenant_id", "content_id", "action"],
+            set_={
+                "count": ContentEngagementCounter.count + counter_insert.excluded.count,
+                "last_occurred_at": func.greatest(
+                    ContentEngagementCounter.last_occurred_at, counter_insert.excluded.last_occurred_at
+                ),
+            },
+        )
+    )
+
+    daily_insert = pg_insert(ContentEngagementDaily).values([
+        {"tenant_id": tenant_id, "day": day, "action": action, "count": daily_counts[(tenant_id, day, action)]}
+        for tenant_id, day, action in sorted(daily_counts)
+    ])
+    await session.execute(
+        daily_insert.on_conflict_do_update(
+            index_elements=["tenant_id", "day", "action"],
+            set_={"count": ContentEngagementDaily.count + daily_insert.excluded.count},
+        )
+    )
+
+    if sketches:
+        await _merge_member_sketches(session, sketches)
+
+    return len(events)
+
+
+async def _merge_member_sketches(
+    session: AsyncSession, sketches: Dict[Tuple[str, date], MemberSketch]
+) -> None:
+    """Fold batch sketches into the stored ones under a row lock."""
+    keys = sorted(sketches)
+    # Make sure every row exists so the locking read below sees it
+    await session.execute(
+        pg_insert(ContentEngagementMemberSketch)
+        .values([
+            {"tenant_id": tenant_id, "day": day, "registers": MemberSketch().to_bytes()}
+            for tenant_id, day in keys
+        ])
+        .on_conflict_do_nothing(index_elements=["tenant_id", "day"])
+    )
+    result = await session.execute(
+        select(
+            ContentEngagementMemberSketch.tenant_id,
+            ContentEngagementMemberSketch.day,
+            ContentEngagementMemberSketch.registers,
+        )
+        .where(tuple_(ContentEngagementMemberSketch.tenant_id, ContentEngagementMemberSketch.day).in_(keys))
+        .order_by(ContentEngagementMemberSketch.tenant_id, ContentEngagementMemberSketch.day)
+        .with_for_update()
+    )
+    for row in result.all():
+        merged = sketches[(row.tenant_id, row.day)].merge(row.registers)
+        await session.execute(
+            update(ContentEngagementMemberSketch)
+            .where(
+                ContentEngagementMemberSketch.tenant_id == row.tenant_id,
+                ContentEngagementMemberSketch.day == row.day,
+            )
+            .values(registers=merged.to_bytes())
+        )
+
+
+class EngagementBuffer:
+    """In-process queue of engagement events drained by a background flusher."""
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Any]] = None,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        batch_size: int = BATCH_SIZE,
+        max_buffered: int = MAX_BUFFERED_EVENTS,
+    ):
+        self._session_factory = session_factory
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_buffered = max_buffered
+        self._events: Deque[EngagementEvent] = deque()
+        self._batch_ready = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def add(self, event: EngagementEvent) -> None:
+        """Queue an event; never waits on the database."""
+        if len(self._events) >= self.max_buffered:
+            dropped = self._events.popleft()
+            logger.warning("Engagement buffer full, dropping oldest event", event_id=dropped.id)
+        self._events.append(event)
+        if len(self._events) >= self.batch_size:
+            self._batch_ready.set()
+        if not self._closed and (self._task is None or self._task.done()):
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        # Exits once the buffer is empty; the next add() starts it again
+        while self._events and not self._closed:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write everything buffered now; failed batches are retried on the next flush."""
+        written = 0
+        async with self._flush_lock:
+            while self._events:
+                batch = [self._events.popleft() for _ in range(min(self.batch_size, len(self._events)))]
+                try:
+                    session_factory = self._session_factory or get_async_session()
+                    async with session_factory() as session:
+                        written += await write_engagement_batch(session, batch)
+                        await session.commit()
+                except Exception:
+                    logger.exception("Failed to flush engagement events", events=len(batch))
+                    retry = [event for event in batch if event.attempts + 1 < MAX_FLUSH_ATTEMPTS]
+                    for event in retry:
+                        event.attempts += 1
+                    if len(retry) < len(batch):
+                        logger.error("Dropping engagement events after repeated failures", events=len(batch) - len(retry))
+                    self._events.extendleft(reversed(retry))
+                    break
+        return written
+
+    async def close(self) -> None:
+        """Stop the flusher and write whatever is still buffered."""
+        self._closed = True
+        self._batch_ready.set()
+        if self._task is not None:
+            await self._task
+        await self.flush()
+
+
+_buffer: Optional[EngagementBuffer] = None
+
+
+def get_engagement_buffer() -> EngagementBuffer:
+    """Return the process-wide engagement buffer."""
+    global _buffer
+    if _buffer is None:
+        _buffer = EngagementBuffer()
+    return _buffer
+
+
+async def close_engagement_buffer() -> None:
+    """Flush and stop the process-wide buffer (application shutdown)."""
+    if _buffer is not None:
+        await _buffer.close()
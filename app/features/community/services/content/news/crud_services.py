@@ -9,6 +9,7 @@ from app.features.core.audit_mixin import AuditContext
 from app.features.core.enhanced_base_service import BaseService
 from app.features.community.models import NewsItem
 from app.features.community.services.content.tenant_mixins import ContentTenantMixin
+from app.features.community.services.dashboard.dashboard_cache import invalidate_hub_dashboards_after_commit
 
 
 class NewsCrudService(ContentTenantMixin, BaseService[NewsItem]):
@@ -59,6 +60,7 @@ class NewsCrudService(ContentTenantMixin, BaseService[NewsItem]):
             self.db.add(news)
             await self.db.flush()
             await self.db.refresh(news)
+            invalidate_hub_dashboards_after_commit(self.db)
             return news
         except Exception as exc:
             await self.handle_error("create_news", exc)
@@ -78,6 +80,7 @@ class NewsCrudService(ContentTenantMixin, BaseService[NewsItem]):
 
             await self.db.flush()
             await self.db.refresh(news)
+            invalidate_hub_dashboards_after_commit(self.db)
             return news
         except Exception as exc:
             await self.handle_error("update_news", exc, news_id=news_id)
@@ -88,4 +91,5 @@ class NewsCrudService(ContentTenantMixin, BaseService[NewsItem]):
             return False
         await self.db.delete(news)
         await self.db.flush()
+        invalidate_hub_dashboards_after_commit(self.db)
         return True
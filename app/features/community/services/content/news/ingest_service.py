@@ -11,6 +11,7 @@ from app.features.core.sqlalchemy_imports import AsyncSession
 from app.features.core.utils.external_api_clients import get_firecrawl_client_from_secret
 from app.features.community.models import NewsItem
 from app.features.core.audit_mixin import AuditContext
+from app.features.community.services.dashboard.dashboard_cache import invalidate_hub_dashboards_after_commit
 
 
 WEALTH_QUERY = "financial advisor wealth management United States latest news"
@@ -78,6 +79,8 @@ class NewsIngestService:
             items.append(news)
 
         await self.db.flush()
+        if items:
+            invalidate_hub_dashboards_after_commit(self.db)
         return items
 
     async def _existing_urls(self) -> Set[str]:
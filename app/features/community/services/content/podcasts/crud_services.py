@@ -9,6 +9,7 @@ from app.features.core.audit_mixin import AuditContext
 from app.features.core.enhanced_base_service import BaseService
 from app.features.community.models import PodcastEpisode
 from app.features.community.services.content.tenant_mixins import ContentTenantMixin
+from app.features.community.services.dashboard.dashboard_cache import invalidate_hub_dashboards_after_commit
 
 
 class PodcastCrudService(ContentTenantMixin, BaseService[PodcastEpisode]):
@@ -59,6 +60,7 @@ class PodcastCrudService(ContentTenantMixin, BaseService[PodcastEpisode]):
             self.db.add(episode)
             await self.db.flush()
             await self.db.refresh(episode)
+            invalidate_hub_dashboards_after_commit(self.db)
             return episode
         except Exception as exc:
             await self.handle_error("create_podcast", exc)
@@ -78,6 +80,7 @@ class PodcastCrudService(ContentTenantMixin, BaseService[PodcastEpisode]):
 
             await self.db.flush()
             await self.db.refresh(episode)
+            invalidate_hub_dashboards_after_commit(self.db)
             return episode
         except Exception as exc:
             await self.handle_error("update_podcast", exc, episode_id=episode_id)
@@ -88,4 +91,5 @@ class PodcastCrudService(ContentTenantMixin, BaseService[PodcastEpisode]):
             return False
         await self.db.delete(episode)
         await self.db.flush()
+        invalidate_hub_dashboards_after_commit(self.db)
         return True
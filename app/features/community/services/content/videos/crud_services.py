@@ -9,6 +9,7 @@ from app.features.core.audit_mixin import AuditContext
 from app.features.core.enhanced_base_service import BaseService
 from app.features.community.models import VideoResource
 from app.features.community.services.content.tenant_mixins import ContentTenantMixin
+from app.features.community.services.dashboard.dashboard_cache import invalidate_hub_dashboards_after_commit
 
 
 class VideoCrudService(ContentTenantMixin, BaseService[VideoResource]):
@@ -59,6 +60,7 @@ class VideoCrudService(ContentTenantMixin, BaseService[VideoResource]):
             self.db.add(resource)
             await self.db.flush()
             await self.db.refresh(resource)
+            invalidate_hub_dashboards_after_commit(self.db)
             return resource
         except Exception as exc:
             await self.handle_error("create_video", exc)
@@ -78,6 +80,7 @@ class VideoCrudService(ContentTenantMixin, BaseService[VideoResource]):
 
             await self.db.flush()
             await self.db.refresh(resource)
+            invalidate_hub_dashboards_after_commit(self.db)
             return resource
         except Exception as exc:
             await self.handle_error("update_video", exc, video_id=video_id)
@@ -88,4 +91,5 @@ class VideoCrudService(ContentTenantMixin, BaseService[VideoResource]):
             return False
         await self.db.delete(resource)
         await self.db.flush()
+        invalidate_hub_dashboards_after_commit(self.db)
         return True
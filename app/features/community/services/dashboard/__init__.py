@@ -0,0 +1,21 @@
+from .dashboard_cache import (
+    DashboardCache,
+    get_dashboard_cache,
+    invalidate_after_commit,
+    invalidate_hub_dashboards,
+    invalidate_hub_dashboards_after_commit,
+    invalidate_tenant_dashboard,
+    invalidate_tenant_dashboard_after_commit,
+)
+from .dashboard_services import CommunityDashboardService
+
+__all__ = [
+    "CommunityDashboardService",
+    "DashboardCache",
+    "get_dashboard_cache",
+    "invalidate_after_commit",
+    "invalidate_hub_dashboards",
+    "invalidate_hub_dashboards_after_commit",
+    "invalidate_tenant_dashboard",
+    "invalidate_tenant_dashboard_after_commit",
+]
@@ -0,0 +1,251 @@
+"""
+Short-TTL cache for community dashboard snapshots.
+
+A snapshot covers two write scopes: the hub-wide content (articles, media,
+news, events, polls) shared by every tenant, and the tenant's own members
+and partners. Entries remember the write generation of both scopes when
+they were looked up; CRUD writes bump the generation of the scope they
+touch once their transaction commits, so a cached snapshot is discarded
+on the next read instead of waiting for the TTL. Shared through Redis
+when ``REDIS_URL`` is set (every web worker sees the same generations);
+otherwise an in-process map is used.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.util import await_only
+
+from app.features.core.config import get_settings
+from app.features.core.sqlalchemy_imports import AsyncSession, get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+CACHE_TTL_SECONDS = float(getattr(settings, "COMMUNITY_DASHBOARD_CACHE_TTL_SECONDS", 30))
+# In-process snapshots kept before the least recently used are dropped
+MAX_LOCAL_ENTRIES = 512
+# Generation keys outlive any entry that could reference them
+GENERATION_TTL_SECONDS = 86400
+
+HUB_SCOPE = "hub"
+GLOBAL_TENANT = "global"
+# Session.info key holding the scopes to invalidate when the session commits
+PENDING_SCOPES_KEY = "community_dashboard_pending_scopes"
+
+
+def tenant_scope(tenant_id: Optional[str]) -> str:
+    return f"tenant:{tenant_id or GLOBAL_TENANT}"
+
+
+def snapshot_scopes(tenant_id: Optional[str]) -> List[str]:
+    """Write scopes a tenant's snapshot depends on."""
+    return [HUB_SCOPE, tenant_scope(tenant_id)]
+
+
+@dataclass
+class CacheLookup:
+    """Result of a lookup; ``generations`` must be passed back to ``set`` on a miss."""
+
+    value: Optional[Dict[str, Any]]
+    generations: List[int]
+
+    @property
+    def hit(self) -> bool:
+        return self.value is not None
+
+
+class DashboardCache(ABC):
+    """Cache for JSON-serialisable dashboard snapshots, one per tenant."""
+
+    def __init__(self, ttl_seconds: float = CACHE_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    async def get(self, tenant_id: Optional[str]) -> CacheLookup:
+        """Look up a snapshot; misses when absent, expired or either scope changed."""
+
+    @abstractmethod
+    async def set(self, tenant_id: Optional[str], value: Dict[str, Any], generations: List[int]) -> None:
+        """
+        Store a snapshot computed after a lookup that returned ``generations``,
+        so a write that lands while it is computed leaves it already stale.
+        """
+
+    @abstractmethod
+    async def invalidate(self, scopes: Sequence[str]) -> None:
+        """Mark every snapshot depending on any of ``scopes`` as stale."""
+
+
+class InMemoryDashboardCache(DashboardCache):
+    """Per-process cache (development, tests, single-worker deployments)."""
+
+    def __init__(self, ttl_seconds: float = CACHE_TTL_SECONDS, max_entries: int = MAX_LOCAL_ENTRIES, clock=time.monotonic):
+        super().__init__(ttl_seconds)
+        self.max_entries = max_entries
+        self.clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, List[int], Dict[str, Any]]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    async def get(self, tenant_id):
+        key = tenant_scope(tenant_id)
+        current = [self._generations.get(scope, 0) for scope in snapshot_scopes(tenant_id)]
+        entry = self._entries.get(key)
+        if entry is None:
+            return CacheLookup(None, current)
+        expires_at, generations, value = entry
+        if expires_at <= self.clock() or generations != current:
+            del self._entries[key]
+            return CacheLookup(None, current)
+        self._entries.move_to_end(key)
+        return CacheLookup(value, current)
+
+    async def set(self, tenant_id, value, generations):
+        key = tenant_scope(tenant_id)
+        self._entries[key] = (self.clock() + self.ttl_seconds, list(generations), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def invalidate(self, scopes):
+        for scope in set(scopes):
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+
+
+class RedisDashboardCache(DashboardCache):
+    """
+    Cache shared by every worker through Redis.
+
+    A read is one pipelined round trip (entry + scope generations). Redis
+    errors fail open: reads miss and writes/invalidations are skipped, so
+    the dashboards fall back to querying Postgres.
+    """
+
+    def __init__(self, key_prefix: str = "community:dashboard", ttl_seconds: float = CACHE_TTL_SECONDS, redis_url: Optional[str] = None):
+        super().__init__(ttl_seconds)
+        self.key_prefix = key_prefix
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self._redis = None
+
+    async def _get_redis(self):
+        """Lazy initialization of Redis connection."""
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    async def get(self, tenant_id):
+        try:
+            client = await self._get_redis()
+            pipe = client.pipeline(transaction=False)
+            pipe.get(f"{self.key_prefix}:entry:{tenant_scope(tenant_id)}")
+            pipe.mget([f"{self.key_prefix}:gen:{scope}" for scope in snapshot_scopes(tenant_id)])
+            raw_entry, raw_generations = await pipe.execute()
+            current = [int(value or 0) for value in raw_generations]
+            if raw_entry is None:
+                return CacheLookup(None, current)
+            entry = json.loads(raw_entry)
+            if entry["generations"] != current:
+                return CacheLookup(None, current)
+            return CacheLookup(entry["value"], current)
+        except Exception as e:
+            logger.error(f"Redis dashboard cache get error: {e}")
+            # Unknown generations: never matches a real vector, so nothing stale is stored.
+            return CacheLookup(None, [-1])
+
+    async def set(self, tenant_id, value, generations):
+        if generations == [-1]:
+            return
+        try:
+            client = await self._get_redis()
+            payload = json.dumps({"generations": list(generations), "value": value}, default=str)
+            await client.set(
+                f"{self.key_prefix}:entry:{tenant_scope(tenant_id)}", payload, px=int(self.ttl_seconds * 1000)
+            )
+        except Exception as e:
+            logger.error(f"Redis dashboard cache set error: {e}")
+
+    async def invalidate(self, scopes):
+        try:
+            client = await self._get_redis()
+            pipe = client.pipeline(transaction=False)
+            for scope in sorted(set(scopes)):
+                pipe.incr(f"{self.key_prefix}:gen:{scope}")
+                pipe.expire(f"{self.key_prefix}:gen:{scope}", GENERATION_TTL_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            logger.error(f"Redis dashboard cache invalidate error: {e}")
+
+
+_cache: Optional[DashboardCache] = None
+
+
+def get_dashboard_cache() -> DashboardCache:
+    """
+    Return the process-wide dashboard cache.
+
+    Uses Redis when ``REDIS_URL`` is configured so invalidations reach every
+    web worker; otherwise falls back to memory.
+    """
+    global _cache
+    if _cache is None:
+        _cache = RedisDashboardCache() if os.getenv("REDIS_URL") else InMemoryDashboardCache()
+    return _cache
+
+
+async def invalidate_hub_dashboards() -> None:
+    """Hub-wide content changed: every tenant's snapshot is stale."""
+    await get_dashboard_cache().invalidate([HUB_SCOPE])
+
+
+async def invalidate_tenant_dashboard(tenant_id: Optional[str]) -> None:
+    """A tenant's members or partners changed (the global admin view counts them too)."""
+    await get_dashboard_cache().invalidate([tenant_scope(tenant_id), tenant_scope(None)])
+
+
+def invalidate_after_commit(session: AsyncSession, scopes: Sequence[str]) -> None:
+    """
+    Invalidate ``scopes`` once ``session``'s transaction commits.
+
+    Bumping a generation before the commit would let a concurrent read cache
+    the pre-write data under the new generation until the TTL expires. A
+    rollback drops the pending scopes.
+    """
+    sync_session = session.sync_session
+    sync_session.info.setdefault(PENDING_SCOPES_KEY, set()).update(scopes)
+    if not event.contains(sync_session, "after_commit", _invalidate_pending):
+        event.listen(sync_session, "after_commit", _invalidate_pending)
+        event.listen(sync_session, "after_soft_rollback", _discard_pending)
+
+
+def invalidate_hub_dashboards_after_commit(session: AsyncSession) -> None:
+    invalidate_after_commit(session, [HUB_SCOPE])
+
+
+def invalidate_tenant_dashboard_after_commit(session: AsyncSession, tenant_id: Optional[str]) -> None:
+    invalidate_after_commit(session, [tenant_scope(tenant_id), tenant_scope(None)])
+
+
+def _invalidate_pending(sync_session) -> None:
+    scopes = sync_session.info.pop(PENDING_SCOPES_KEY, None)
+    if not scopes:
+        return
+    # Runs inside AsyncSession.commit's greenlet, so the commit returns after the bump
+    try:
+        await_only(get_dashboard_cache().invalidate(sorted(scopes)))
+    except Exception as e:
+        logger.error(f"Dashboard cache invalidation after commit failed: {e}")
+
+
+def _discard_pending(sync_session, previous_transaction) -> None:
+    # A savepoint rollback leaves the outer transaction's writes pending
+    if previous_transaction.parent is None:
+        sync_session.info.pop(PENDING_SCOPES_KEY, None)
@@ -0,0 +1,221 @@
+"""Aggregated snapshot behind the community landing and content hub pages."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+from sqlalchemy import String, literal, literal_column, true
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
+
+from app.features.core.sqlalchemy_imports import AsyncSession, func, select
+from app.features.core.enhanced_base_service import BaseService
+from app.features.community.models import (
+    ENGAGEMENT_ALL_TIME,
+    CommunityContent,
+    ContentEngagementDaily,
+    ContentEngagementMemberSketch,
+    Event,
+    Member,
+    NewsItem,
+    Partner,
+    PodcastEpisode,
+    Poll,
+    PollOption,
+    VideoResource,
+)
+from app.features.community.services.content.engagement.sketch import MemberSketch
+from .dashboard_cache import DashboardCache, get_dashboard_cache
+
+# Items per "latest" list on the content hub page
+LATEST_ITEMS = 5
+# Characters of an article body kept for its announcement blurb
+EXCERPT_CHARS = 280
+# Projection fields holding timestamps (serialised as ISO strings in the cache)
+DATETIME_FIELDS = ("published_at", "publish_date", "start_date", "expires_at")
+
+EMPTY_ARRAY = literal_column("'[]'::jsonb", JSONB)
+EMPTY_OBJECT = literal_column("'{}'::jsonb", JSONB)
+
+
+def _counted(name: str, model, *filters):
+    return select(func.count(model.id).label(name)).where(*filters).cte(f"{name}_cte")
+
+
+def _latest(name: str, columns: Dict[str, Any], order_by: Sequence[Any], limit: int):
+    """One-row CTE holding a JSON array of the newest rows, in ``order_by`` order."""
+    ranked = (
+        select(
+            *(column.label(key) for key, column in columns.items()),
+            func.row_number().over(order_by=order_by).label("position"),
+        )
+        .order_by(*order_by)
+        .limit(limit)
+        .subquery(f"{name}_rows")
+    )
+    item = func.jsonb_build_object(*(arg for key in columns for arg in (literal(key, String), ranked.c[key])))
+    return select(
+        func.coalesce(
+            func.jsonb_agg(aggregate_order_by(item, ranked.c.position)), EMPTY_ARRAY, type_=JSONB
+        ).label(name)
+    ).cte(f"{name}_cte")
+
+
+def _hydrate(item: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if item is None:
+        return None
+    item = dict(item)
+    for field in DATETIME_FIELDS:
+        if isinstance(item.get(field), str):
+            item[field] = datetime.fromisoformat(item[field])
+    return item
+
+
+class CommunityDashboardService(BaseService[Any]):
+    """
+    Counters and "latest item" projections for the community dashboards.
+
+    Everything comes from one multi-CTE statement per tenant. Members and
+    partners are counted for the service's tenant; content, events and
+    polls are hub-wide, like their CRUD services. Snapshots are cached for
+    a short TTL and invalidated by the CRUD services' writes.
+    """
+
+    def __init__(self, db_session: AsyncSession, tenant_id: Optional[str], cache: Optional[DashboardCache] = None):
+        super().__init__(db_session, tenant_id)
+        self.cache = cache or get_dashboard_cache()
+
+    def build_snapshot_query(self):
+        member_filters = [Member.tenant_id == self.tenant_id] if self.tenant_id is not None else []
+        partner_filters = [Partner.tenant_id == self.tenant_id] if self.tenant_id is not None else []
+
+        option_count = (
+            select(func.count(PollOption.id)).where(PollOption.poll_id == Poll.id).scalar_subquery()
+        )
+        engagement_actions = (
+            select(ContentEngagementDaily.action, func.sum(ContentEngagementDaily.count).label("total"))
+            .where(ContentEngagementDaily.day == ENGAGEMENT_ALL_TIME)
+            .group_by(ContentEngagementDaily.action)
+            .subquery("engagement_action_rows")
+        )
+
+        ctes = [
+            _counted("member_count", Member, *member_filters),
+            _counted("partner_count", Partner, *partner_filters),
+            _counted("article_total", CommunityContent),
+            _counted("podcast_total", PodcastEpisode),
+            _counted("video_total", VideoResource),
+            _counted("news_total", NewsItem),
+            _latest(
+                "articles",
+                {
+                    "id": CommunityContent.id,
+                    "title": CommunityContent.title,
+                    "category": CommunityContent.category,
+                    "published_at": CommunityContent.published_at,
+                    "excerpt": func.substr(CommunityContent.body_md, 1, EXCERPT_CHARS),
+                },
+                [CommunityContent.published_at.desc().nullslast(), CommunityContent.created_at.desc()],
+                LATEST_ITEMS,
+            ),
+            _latest(
+                "podcasts",
+                {"id": PodcastEpisode.id, "title": PodcastEpisode.title, "published_at": PodcastEpisode.published_at},
+                [PodcastEpisode.published_at.desc().nullslast(), PodcastEpisode.created_at.desc()],
+                LATEST_ITEMS,
+            ),
+            _latest(
+                "videos",
+                {"id": VideoResource.id, "title": VideoResource.title, "published_at": VideoResource.published_at},
+                [VideoResource.published_at.desc().nullslast(), VideoResource.created_at.desc()],
+                LATEST_ITEMS,
+            ),
+            _latest(
+                "news_items",
+                {
+                    "id": NewsItem.id,
+                    "headline": NewsItem.headline,
+                    "summary": NewsItem.summary,
+                    "source": NewsItem.source,
+                    "category": NewsItem.category,
+                    "url": NewsItem.url,
+                    "publish_date": NewsItem.publish_date,
+                },
+                [NewsItem.publish_date.desc().nullslast(), NewsItem.created_at.desc()],
+                LATEST_ITEMS,
+            ),
+            _latest(
+                "events",
+                {
+                    "id": Event.id,
+                    "title": Event.title,
+                    "description": Event.description,
+                    "start_date": Event.start_date,
+                },
+                [Event.start_date.asc()],
+                1,
+            ),
+            _latest(
+                "polls",
+                {
+                    "id": Poll.id,
+                    "question": Poll.question,
+                    "expires_at": Poll.expires_at,
+                    "option_count": option_count,
+                },
+                [Poll.created_at.desc()],
+                1,
+            ),
+            select(
+                func.coalesce(
+                    func.jsonb_object_agg(engagement_actions.c.action, engagement_actions.c.total),
+                    EMPTY_OBJECT,
+                    type_=JSONB,
+                ).label("engagement_actions")
+            ).cte("engagement_actions_cte"),
+            select(func.array_agg(ContentEngagementMemberSketch.registers).label("engagement_sketches"))
+            .where(ContentEngagementMemberSketch.day == ENGAGEMENT_ALL_TIME)
+            .cte("engagement_sketches_cte"),
+        ]
+
+        # Every CTE is a single row, so joining them on TRUE yields one row
+        source = ctes[0]
+        for cte in ctes[1:]:
+            source = source.join(cte, true())
+        return select(*(column for cte in ctes for column in cte.c)).select_from(source)
+
+    async def _load_snapshot(self) -> Dict[str, Any]:
+        row = (await self.db.execute(self.build_snapshot_query())).one()
+        snapshot = dict(row._mapping)
+
+        sketch = MemberSketch()
+        for registers in snapshot.pop("engagement_sketches") or []:
+            sketch.merge(registers)
+        actions = {action: int(total or 0) for action, total in (snapshot.pop("engagement_actions") or {}).items()}
+        snapshot["engagement_summary"] = {
+            "total_actions": sum(actions.values()),
+            "unique_members": sketch.estimate(),
+            "actions": actions,
+        }
+        return snapshot
+
+    async def get_snapshot(self) -> Dict[str, Any]:
+        """
+        Return counters, latest items and the engagement summary.
+
+        List items are dicts (timestamps as datetimes), so templates can use
+        them like the ORM rows they replace.
+        """
+        try:
+            lookup = await self.cache.get(self.tenant_id)
+            snapshot = lookup.value
+            if not lookup.hit:
+                snapshot = await self._load_snapshot()
+                await self.cache.set(self.tenant_id, snapshot, lookup.generations)
+
+            hydrated = dict(snapshot)
+            for key in ("articles", "podcasts", "videos", "news_items", "events", "polls"):
+                hydrated[key] = [_hydrate(item) for item in snapshot.get(key) or []]
+            return hydrated
+        except Exception as exc:
+            await self.handle_error("get_snapshot", exc)
@@ -9,6 +9,7 @@ from app.features.core.sqlalchemy_imports import AsyncSession, func, select
 from app.features.core.audit_mixin import AuditContext
 from app.features.core.enhanced_base_service import BaseService
 from app.features.community.models import Event
+from app.features.community.services.dashboard.dashboard_cache import invalidate_hub_dashboards_after_commit
 
 
 class EventCrudService(BaseService[Event]):
@@ -81,6 +82,7 @@ class EventCrudService(BaseService[Event]):
             self.db.add(event)
             await self.db.flush()
             await self.db.refresh(event)
+            invalidate_hub_dashboards_after_commit(self.db)
             return event
         except Exception as exc:
             await self.handle_error("create_event", exc)
@@ -101,6 +103,7 @@ class EventCrudService(BaseService[Event]):
                 event.set_updated_by(audit_ctx.user_email, audit_ctx.user_name)
             await self.db.flush()
             await self.db.refresh(event)
+            invalidate_hub_dashboards_after_commit(self.db)
             return event
         except Exception as exc:
             await self.handle_error("update_event", exc, event_id=event_id)
@@ -112,4 +115,5 @@ class EventCrudService(BaseService[Event]):
             return False
         await self.db.delete(event)
         await self.db.flush()
+        invalidate_hub_dashboards_after_commit(self.db)
         return True
@@ -1,7 +1,17 @@
-from .crud_services import GroupCrudService, GroupPostCrudService, GroupCommentCrudService
+from .crud_services import (
+    GroupCrudService,
+    GroupPostCrudService,
+    GroupCommentCrudService,
+    FeedPage,
+    FeedPost,
+    FeedComment,
+)
 
 __all__ = [
     "GroupCrudService",
     "GroupPostCrudService",
     "GroupCommentCrudService",
+    "FeedPage",
+    "FeedPost",
+    "FeedComment",
 ]
@@ -2,13 +2,91 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from uuid import uuid4
 
-from app.features.core.sqlalchemy_imports import AsyncSession, func, or_, select
+from sqlalchemy import tuple_
+from sqlalchemy.orm import aliased
+
+from app.features.core.sqlalchemy_imports import AsyncSession, and_, func, select
 from app.features.core.audit_mixin import AuditContext
 from app.features.core.enhanced_base_service import BaseService
+from app.features.core.full_text_search import search_match, search_rank
 from app.features.community.models import Group, GroupPost, GroupComment
+from app.features.community.services.keyset import decode_cursor, encode_cursor
+from app.features.auth.models import User
+
+# Latest comments shown under each post in the group feed
+FEED_COMMENTS_PER_POST = 3
+# Comments loaded when a single post is expanded
+POST_COMMENT_LIMIT = 100
+
+
+@dataclass
+class FeedComment:
+    """Comment row as rendered in the group feed."""
+
+    id: str
+    post_id: str
+    author_id: Optional[str]
+    author_name: Optional[str]
+    content: str
+    created_at: Optional[datetime]
+
+
+@dataclass
+class FeedPost:
+    """Post with its latest comments and total comment count."""
+
+    id: str
+    group_id: str
+    author_id: Optional[str]
+    author_name: Optional[str]
+    title: Optional[str]
+    content: str
+    created_at: Optional[datetime]
+    comment_total: int = 0
+    comments: List[FeedComment] = field(default_factory=list)
+
+
+@dataclass
+class FeedPage:
+    """One page of the group feed; ``next_cursor`` is None on the last page."""
+
+    posts: List[FeedPost]
+    next_cursor: Optional[str] = None
+
+
+def fold_feed_rows(rows: Sequence[Any]) -> List[FeedPost]:
+    """Group flat post x comment rows (posts in feed order) into FeedPosts."""
+    posts: Dict[str, FeedPost] = {}
+    for row in rows:
+        post = posts.get(row.post_id)
+        if post is None:
+            post = posts[row.post_id] = FeedPost(
+                id=row.post_id,
+                group_id=row.group_id,
+                author_id=row.post_author_id,
+                author_name=row.post_author_name,
+                title=row.title,
+                content=row.post_content,
+                created_at=row.post_created_at,
+                comment_total=int(row.comment_total or 0),
+            )
+        if row.comment_id is not None:
+            post.comments.append(
+                FeedComment(
+                    id=row.comment_id,
+                    post_id=row.post_id,
+                    author_id=row.comment_author_id,
+                    author_name=row.comment_author_name,
+                    content=row.comment_content,
+                    created_at=row.comment_created_at,
+                )
+            )
+    return list(posts.values())
 
 
 class GroupCrudService(BaseService[Group]):
@@ -35,14 +113,16 @@ class GroupCrudService(BaseService[Group]):
             if self.tenant_id is not None:
                 filters.append(Group.tenant_id == self.tenant_id)
 
+            fuzzy_columns = (Group.name,)
             if search:
-                like = f"%{search.lower()}%"
-                filters.append(or_(func.lower(Group.name).like(like), func.lower(Group.description).like(like)))
+                filters.append(search_match(Group.search_vector, search, fuzzy_columns))
 
             if filters:
                 stmt = stmt.where(*filters)
                 count_stmt = count_stmt.where(*filters)
 
+            if search:
+                stmt = stmt.order_by(search_rank(Group.search_vector, search, fuzzy_columns).desc())
             stmt = stmt.order_by(func.lower(Group.name)).offset(offset).limit(limit)
 
             result = await self.db.execute(stmt)
@@ -155,6 +235,138 @@ class GroupPostCrudService(BaseService[GroupPost]):
         except Exception as exc:
             await self.handle_error("list_posts", exc, group_id=group_id)
 
+    def _feed_query(self, posts_stmt, comments_per_post: int):
+        """
+        Posts from ``posts_stmt`` with their latest comments and authors in one statement.
+
+        Comments are ranked newest-first per post with a window function; only
+        the top ``comments_per_post`` are joined back, while ``count(*) over``
+        still carries each post's full comment total.
+        """
+        page = posts_stmt.cte("feed_posts")
+
+        comment_filters = [GroupComment.post_id.in_(select(page.c.id))]
+        if self.tenant_id is not None:
+            comment_filters.append(GroupComment.tenant_id == self.tenant_id)
+        ranked = (
+            select(
+                GroupComment.id,
+                GroupComment.post_id,
+                GroupComment.author_id,
+                GroupComment.content,
+                GroupComment.created_at,
+                func.row_number().over(
+                    partition_by=GroupComment.post_id,
+                    order_by=(GroupComment.created_at.desc(), GroupComment.id.desc()),
+                ).label("position"),
+                func.count().over(partition_by=GroupComment.post_id).label("total"),
+            )
+            .where(*comment_filters)
+            .subquery("feed_comments")
+        )
+
+        post_author = aliased(User)
+        comment_author = aliased(User)
+        return (
+            select(
+                page.c.id.label("post_id"),
+                page.c.group_id,
+                page.c.author_id.label("post_author_id"),
+                func.coalesce(post_author.name, post_author.email).label("post_author_name"),
+                page.c.title,
+                page.c.content.label("post_content"),
+                page.c.created_at.label("post_created_at"),
+                ranked.c.total.label("comment_total"),
+                ranked.c.id.label("comment_id"),
+                ranked.c.author_id.label("comment_author_id"),
+                func.coalesce(comment_author.name, comment_author.email).label("comment_author_name"),
+                ranked.c.content.label("comment_content"),
+                ranked.c.created_at.label("comment_created_at"),
+            )
+            .select_from(page)
+            .outerjoin(post_author, post_author.id == page.c.author_id)
+            .outerjoin(ranked, and_(ranked.c.post_id == page.c.id, ranked.c.position <= comments_per_post))
+            .outerjoin(comment_author, comment_author.id == ranked.c.author_id)
+            .order_by(
+                page.c.created_at.desc(),
+                page.c.id.desc(),
+                ranked.c.created_at.asc(),
+                ranked.c.id.asc(),
+            )
+        )
+
+    async def load_feed(
+        self,
+        group_id: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        comments_per_post: int = FEED_COMMENTS_PER_POST,
+    ) -> FeedPage:
+        """
+        Return a page of a group's posts, newest first, in a single query.
+
+        Pages are keyed on (created_at, id) rather than OFFSET, so each page
+        costs the same however deep the reader scrolls and posts created in
+        the meantime do not shift later pages.
+        """
+        try:
+            filters = [GroupPost.group_id == group_id]
+            if self.tenant_id is not None:
+                filters.append(GroupPost.tenant_id == self.tenant_id)
+            after = decode_cursor(cursor)
+            if after is not None:
+                filters.append(tuple_(GroupPost.created_at, GroupPost.id) < tuple_(*after))
+
+            # One extra post tells us whether another page exists
+            posts_stmt = (
+                select(
+                    GroupPost.id,
+                    GroupPost.group_id,
+                    GroupPost.author_id,
+                    GroupPost.title,
+                    GroupPost.content,
+                    GroupPost.created_at,
+                )
+                .where(*filters)
+                .order_by(GroupPost.created_at.desc(), GroupPost.id.desc())
+                .limit(limit + 1)
+            )
+            result = await self.db.execute(self._feed_query(posts_stmt, comments_per_post))
+            posts = fold_feed_rows(result.all())
+
+            next_cursor = None
+            if len(posts) > limit:
+                posts = posts[:limit]
+                last = posts[-1]
+                next_cursor = encode_cursor(last.created_at, last.id)
+            return FeedPage(posts=posts, next_cursor=next_cursor)
+        except Exception as exc:
+            await self.handle_error("load_feed", exc, group_id=group_id)
+
+    async def load_feed_post(
+        self,
+        post_id: str,
+        comments_per_post: int = POST_COMMENT_LIMIT,
+    ) -> Optional[FeedPost]:
+        """Return one post shaped like a feed entry (same single query)."""
+        try:
+            filters = [GroupPost.id == post_id]
+            if self.tenant_id is not None:
+                filters.append(GroupPost.tenant_id == self.tenant_id)
+            posts_stmt = select(
+                GroupPost.id,
+                GroupPost.group_id,
+                GroupPost.author_id,
+                GroupPost.title,
+                GroupPost.content,
+                GroupPost.created_at,
+            ).where(*filters)
+            result = await self.db.execute(self._feed_query(posts_stmt, comments_per_post))
+            posts = fold_feed_rows(result.all())
+            return posts[0] if posts else None
+        except Exception as exc:
+            await self.handle_error("load_feed_post", exc, post_id=post_id)
+
     async def create_post(self, payload: Dict[str, Any], user) -> GroupPost:
         """Create a group post."""
         try:
@@ -0,0 +1,26 @@
+"""Opaque keyset cursors for newest-first community listings."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+def encode_cursor(sort_value: datetime, row_id: str) -> str:
+    """Cursor for the (timestamp, id) of the last row of a page."""
+    raw = f"{sort_value.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, str]]:
+    """Inverse of encode_cursor; None for a missing or malformed cursor."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        sort_value, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(sort_value), row_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from app.features.core.sqlalchemy_imports import AsyncSession, func, or_, select
+from app.features.core.sqlalchemy_imports import AsyncSession, func, select
 from sqlalchemy.orm import selectinload
 from app.features.core.audit_mixin import AuditContext
 from app.features.core.enhanced_base_service import BaseService
+from app.features.core.full_text_search import search_match, search_rank
 from app.features.community.models import Member, Partner
+from app.features.community.services.dashboard.dashboard_cache import invalidate_tenant_dashboard_after_commit
 
 
 class MemberCrudService(BaseService[Member]):
@@ -42,14 +44,9 @@ class MemberCrudService(BaseService[Member]):
             if self.tenant_id is not None:
                 filters.append(Member.tenant_id == self.tenant_id)
 
+            fuzzy_columns = (Member.name, Member.email)
             if search:
-                like = f"%{search.lower()}%"
-                filters.append(
-                    or_(
-                        func.lower(Member.name).like(like),
-                        func.lower(Member.email).like(like),
-                    )
-                )
+                filters.append(search_match(Member.search_vector, search, fuzzy_columns))
 
             if tags:
                 filters.append(Member.tags.contains(list(tags)))
@@ -61,6 +58,8 @@ class MemberCrudService(BaseService[Member]):
             if filters:
                 stmt = stmt.where(*filters)
 
+            if search:
+                stmt = stmt.order_by(search_rank(Member.search_vector, search, fuzzy_columns).desc())
             stmt = stmt.order_by(func.lower(Member.name)).offset(offset).limit(limit)
             result = await self.db.execute(stmt)
             items = list(result.scalars().all())
@@ -104,6 +103,7 @@ class MemberCrudService(BaseService[Member]):
             self.db.add(member)
             await self.db.flush()
             await self.db.refresh(member)
+            invalidate_tenant_dashboard_after_commit(self.db, member.tenant_id)
             return member
         except Exception as exc:
             await self.handle_error("create_member", exc)
@@ -183,6 +183,7 @@ class MemberCrudService(BaseService[Member]):
             return False
         await self.db.delete(member)
         await self.db.flush()
+        invalidate_tenant_dashboard_after_commit(self.db, member.tenant_id)
         return True
 
     async def _email_exists(self, email: Optional[str], tenant_id: str, exclude_id: Optional[str] = None) -> bool:
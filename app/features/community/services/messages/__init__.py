@@ -1,3 +1,4 @@
-from .crud_services import MessageCrudService
+from .crud_services import InboxPage, MessageCrudService
+from .inbox_channel import InboxChannel, get_inbox_channel
 
-__all__ = ["MessageCrudService"]
+__all__ = ["InboxPage", "MessageCrudService", "InboxChannel", "get_inbox_channel"]
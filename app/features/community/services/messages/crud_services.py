@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 from datetime import datetime
 
-from app.features.core.sqlalchemy_imports import AsyncSession, and_, func, or_, select
+from sqlalchemy import case, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import aliased
+
+from app.features.core.sqlalchemy_imports import AsyncSession, and_, func, or_, select, update
 from app.features.core.enhanced_base_service import BaseService
 from app.features.community.models import Message, Member, Thread, ThreadParticipant
+from app.features.community.services.keyset import decode_cursor, encode_cursor
+from app.features.community.services.messages.inbox_channel import InboxChannel, get_inbox_channel
 from app.features.auth.models import User
 
 CROSS_TENANT_ID = "community"
 
 
+@dataclass
+class InboxPage:
+    """One page of a member's conversation rail; ``next_cursor`` is None on the last page."""
+
+    conversations: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
+
+
 class MessageCrudService(BaseService[Message]):
     """Service managing direct messages."""
 
@@ -23,10 +38,14 @@ class MessageCrudService(BaseService[Message]):
     async def get_by_id(self, message_id: str) -> Optional[Message]:
         return await super().get_by_id(Message, message_id)
 
-    async def _threads_for_user(self, user_id: str) -> List[str]:
-        stmt = select(ThreadParticipant.thread_id).where(ThreadParticipant.user_id == user_id)
-        result = await self.db.execute(stmt)
-        return [row[0] for row in result.all()]
+    async def _is_participant(self, thread_id: Optional[str], user_id: str) -> bool:
+        if not thread_id:
+            return False
+        stmt = select(ThreadParticipant.id).where(
+            ThreadParticipant.thread_id == thread_id,
+            ThreadParticipant.user_id == user_id,
+        )
+        return (await self.db.execute(stmt)).first() is not None
 
     async def create_thread(self, participant_ids: List[str], created_by: str) -> Thread:
         participant_set = set(participant_ids or [])
@@ -86,46 +105,160 @@ class MessageCrudService(BaseService[Message]):
             return provided
         return ":".join(sorted([sender_id, recipient_id]))
 
-    async def list_conversation_summaries(
+    async def load_inbox(
         self,
         member_id: str,
         limit: int = 50,
-    ) -> List[Dict[str, str]]:
-        """Return latest message per thread for the member (rail view)."""
+        cursor: Optional[str] = None,
+        thread_id: Optional[str] = None,
+    ) -> InboxPage:
+        """
+        Return the member's threads, most recent first, in a single query.
+
+        Reads the per-participant thread index (recency, unread count) kept
+        by create_message, joins the last message, and aggregates participant
+        names in a correlated subquery, so the cost does not grow with message
+        history. Pages are keyed on (last_message_at, thread_id); ``thread_id``
+        narrows the result to one row (live inbox updates).
+        """
         try:
-            thread_ids = await self._threads_for_user(member_id)
-            if not thread_ids:
-                return []
-            msg_stmt = (
-                select(Message)
-                .where(Message.thread_id.in_(thread_ids))
-                .order_by(Message.thread_id, Message.created_at.desc())
+            others = aliased(ThreadParticipant)
+            participant_ids = (
+                select(func.array_agg(aggregate_order_by(others.user_id, others.joined_at)))
+                .where(others.thread_id == ThreadParticipant.thread_id)
+                .scalar_subquery()
             )
-            result = await self.db.execute(msg_stmt)
-            messages = list(result.scalars().all())
-
-            latest_by_thread: Dict[str, Message] = {}
-            for msg in messages:
-                if msg.thread_id not in latest_by_thread:
-                    latest_by_thread[msg.thread_id] = msg
-            thread_summaries = []
-            for tid, msg in latest_by_thread.items():
-                participant_ids = await self.participants_for_thread(tid)
-                others = [p for p in participant_ids if p != member_id]
-                names = await self._user_map(others + [msg.sender_id])
-                thread_summaries.append(
-                    {
-                        "thread_id": tid,
-                        "last_message": msg.content,
-                        "last_sender_id": msg.sender_id,
-                        "participants": [names.get(pid, {}).get("name") or pid for pid in participant_ids],
-                        "created_at": msg.created_at,
-                    }
+            participant_names = (
+                select(
+                    func.array_agg(
+                        aggregate_order_by(
+                            func.coalesce(User.name, User.email, others.user_id),
+                            others.joined_at,
+                        )
+                    )
                 )
-            thread_summaries.sort(key=lambda x: x["created_at"] or datetime.min, reverse=True)
-            return thread_summaries[:limit]
+                .select_from(others)
+                .outerjoin(User, User.id == others.user_id)
+                .where(others.thread_id == ThreadParticipant.thread_id)
+                .scalar_subquery()
+            )
+
+            filters = [
+                ThreadParticipant.user_id == member_id,
+                ThreadParticipant.last_message_at.is_not(None),
+            ]
+            if thread_id:
+                filters.append(ThreadParticipant.thread_id == thread_id)
+            after = decode_cursor(cursor)
+            if after is not None:
+                filters.append(
+                    tuple_(ThreadParticipant.last_message_at, ThreadParticipant.thread_id) < tuple_(*after)
+                )
+
+            stmt = (
+                select(
+                    ThreadParticipant.thread_id,
+                    ThreadParticipant.last_message_at,
+                    ThreadParticipant.unread_count,
+                    Message.content.label("last_message"),
+                    Message.sender_id.label("last_sender_id"),
+                    participant_names.label("participants"),
+                    participant_ids.label("participant_ids"),
+                )
+                .join(Thread, Thread.id == ThreadParticipant.thread_id)
+                .outerjoin(Message, Message.id == Thread.last_message_id)
+                .where(*filters)
+                .order_by(ThreadParticipant.last_message_at.desc(), ThreadParticipant.thread_id.desc())
+                .limit(limit + 1)
+            )
+            rows = (await self.db.execute(stmt)).all()
+
+            conversations = [
+                {
+                    "thread_id": row.thread_id,
+                    "last_message": row.last_message,
+                    "last_sender_id": row.last_sender_id,
+                    "participants": list(row.participants or []),
+                    "participant_ids": list(row.participant_ids or []),
+                    "created_at": row.last_message_at,
+                    "unread_count": int(row.unread_count or 0),
+                }
+                for row in rows[:limit]
+            ]
+            next_cursor = None
+            if len(rows) > limit:
+                last = conversations[-1]
+                next_cursor = encode_cursor(last["created_at"], last["thread_id"])
+            return InboxPage(conversations=conversations, next_cursor=next_cursor)
         except Exception as exc:
-            await self.handle_error("list_conversation_summaries", exc, member_id=member_id)
+            await self.handle_error("load_inbox", exc, member_id=member_id)
+
+    async def list_conversation_summaries(
+        self,
+        member_id: str,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """Return latest message per thread for the member (rail view)."""
+        page = await self.load_inbox(member_id, limit=limit)
+        return page.conversations
+
+    async def conversation_partners(self, user_id: str) -> List[str]:
+        """Everyone who shares a thread with the member (presence fan-out)."""
+        my_threads = select(ThreadParticipant.thread_id).where(ThreadParticipant.user_id == user_id)
+        stmt = (
+            select(ThreadParticipant.user_id)
+            .where(ThreadParticipant.thread_id.in_(my_threads), ThreadParticipant.user_id != user_id)
+            .distinct()
+        )
+        result = await self.db.execute(stmt)
+        return [row[0] for row in result.all()]
+
+    async def notify_message(self, message: Message, channel: Optional[InboxChannel] = None) -> None:
+        """
+        Push a committed message to every participant's inbox stream.
+
+        Call after commit: each recipient's event carries their unread count
+        as stored, so an open inbox updates that thread's row in place.
+        """
+        channel = channel or get_inbox_channel()
+        stmt = select(ThreadParticipant.user_id, ThreadParticipant.unread_count).where(
+            ThreadParticipant.thread_id == message.thread_id
+        )
+        for row in (await self.db.execute(stmt)).all():
+            await channel.publish(
+                row.user_id,
+                "message",
+                {
+                    "thread_id": message.thread_id,
+                    "message_id": message.id,
+                    "sender_id": message.sender_id,
+                    "created_at": message.created_at,
+                    "unread_count": int(row.unread_count or 0),
+                },
+            )
+
+    async def notify_read(self, thread_id: str, reader_id: str, channel: Optional[InboxChannel] = None) -> None:
+        """Push a read receipt for ``reader_id`` to the thread's participants (call after commit)."""
+        channel = channel or get_inbox_channel()
+        stmt = select(
+            ThreadParticipant.user_id,
+            ThreadParticipant.last_read_message_id,
+            ThreadParticipant.last_read_at,
+        ).where(ThreadParticipant.thread_id == thread_id)
+        rows = (await self.db.execute(stmt)).all()
+        reader = next((row for row in rows if row.user_id == reader_id), None)
+        if reader is None:
+            return
+        await channel.publish_many(
+            [row.user_id for row in rows],
+            "read",
+            {
+                "thread_id": thread_id,
+                "user_id": reader_id,
+                "last_read_message_id": reader.last_read_message_id,
+                "read_at": reader.last_read_at,
+            },
+        )
 
     async def _user_map(self, user_ids: List[str]) -> Dict[str, Dict[str, str]]:
         if not user_ids:
@@ -148,8 +281,7 @@ class MessageCrudService(BaseService[Message]):
         """Return chronological messages in a thread."""
         try:
             # Ensure membership
-            participant_threads = await self._threads_for_user(member_id)
-            if thread_id not in participant_threads:
+            if not await self._is_participant(thread_id, member_id):
                 return []
 
             stmt = (
@@ -172,8 +304,7 @@ class MessageCrudService(BaseService[Message]):
                 raise ValueError("thread_id is required for messaging")
 
             # Validate membership
-            participant_threads = await self._threads_for_user(sender_id)
-            if thread_id not in participant_threads:
+            if not await self._is_participant(thread_id, sender_id):
                 raise ValueError("Sender is not a participant of this thread")
 
             message = Message(
@@ -189,15 +320,76 @@ class MessageCrudService(BaseService[Message]):
 
             self.db.add(message)
             await self.db.flush()
+            await self._record_message(message)
             await self.db.refresh(message)
             return message
         except Exception as exc:
             await self.handle_error("create_message", exc)
 
-    async def mark_read(self, message_ids: List[str]) -> None:
-        """Mark selected messages as read."""
+    async def _record_message(self, message: Message) -> None:
+        """Advance the thread index for a new message, in the caller's transaction."""
+        sent_at = message.created_at
+        await self.db.execute(
+            update(Thread)
+            .where(
+                Thread.id == message.thread_id,
+                or_(Thread.last_message_at.is_(None), Thread.last_message_at <= sent_at),
+            )
+            .values(last_message_id=message.id, last_message_at=sent_at)
+        )
+        # Increments happen in SQL so concurrent senders cannot lose counts
+        is_sender = ThreadParticipant.user_id == message.sender_id
+        await self.db.execute(
+            update(ThreadParticipant)
+            .where(ThreadParticipant.thread_id == message.thread_id)
+            .values(
+                last_message_at=func.greatest(
+                    func.coalesce(ThreadParticipant.last_message_at, sent_at), sent_at
+                ),
+                unread_count=case((is_sender, 0), else_=ThreadParticipant.unread_count + 1),
+                last_read_message_id=case((is_sender, message.id), else_=ThreadParticipant.last_read_message_id),
+                last_read_at=case((is_sender, sent_at), else_=ThreadParticipant.last_read_at),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def _advance_read_marker(self, thread_id: str, reader_id: str, read_at: datetime) -> None:
+        """Move a participant's read marker forward to ``read_at`` and recount unread."""
+        latest_read = (
+            select(Message.id)
+            .where(Message.thread_id == thread_id, Message.created_at <= read_at)
+            .order_by(Message.created_at.desc(), Message.id.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        unread = (
+            select(func.count(Message.id))
+            .where(
+                Message.thread_id == thread_id,
+                Message.created_at > read_at,
+                Message.sender_id != reader_id,
+            )
+            .scalar_subquery()
+        )
+        await self.db.execute(
+            update(ThreadParticipant)
+            .where(
+                ThreadParticipant.thread_id == thread_id,
+                ThreadParticipant.user_id == reader_id,
+                or_(ThreadParticipant.last_read_at.is_(None), ThreadParticipant.last_read_at < read_at),
+            )
+            .values(last_read_message_id=latest_read, last_read_at=read_at, unread_count=unread)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_read(self, message_ids: List[str], reader_id: Optional[str] = None) -> List[str]:
+        """
+        Mark selected messages as read (and advance ``reader_id``'s read markers).
+
+        Returns the ids of the threads the messages belong to.
+        """
         if not message_ids:
-            return
+            return []
         try:
             stmt = (
                 select(Message)
@@ -206,12 +398,40 @@ class MessageCrudService(BaseService[Message]):
             if self.tenant_id is not None:
                 stmt = stmt.where(Message.tenant_id == self.tenant_id)
             result = await self.db.execute(stmt)
+            read_upto: Dict[str, datetime] = {}
             for message in result.scalars().all():
                 message.is_read = True
+                if message.thread_id and (
+                    message.thread_id not in read_upto or message.created_at > read_upto[message.thread_id]
+                ):
+                    read_upto[message.thread_id] = message.created_at
             await self.db.flush()
+
+            if reader_id:
+                for thread_id, read_at in read_upto.items():
+                    await self._advance_read_marker(thread_id, reader_id, read_at)
+            return list(read_upto)
         except Exception as exc:
             await self.handle_error("mark_read", exc)
 
+    async def mark_thread_read(self, thread_id: str, reader_id: str) -> None:
+        """Mark everything in a thread as read for one participant."""
+        try:
+            await self.db.execute(
+                update(ThreadParticipant)
+                .where(ThreadParticipant.thread_id == thread_id, ThreadParticipant.user_id == reader_id)
+                .values(
+                    unread_count=0,
+                    last_read_message_id=select(Thread.last_message_id)
+                    .where(Thread.id == thread_id)
+                    .scalar_subquery(),
+                    last_read_at=select(Thread.last_message_at).where(Thread.id == thread_id).scalar_subquery(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+        except Exception as exc:
+            await self.handle_error("mark_thread_read", exc, thread_id=thread_id)
+
     async def delete_message(self, message_id: str) -> bool:
         message = await self.get_by_id(message_id)
         if not message:
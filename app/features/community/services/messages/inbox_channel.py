@@ -0,0 +1,307 @@
+"""
+Per-user inbox channel for community direct messages.
+
+Message, read-receipt, typing and presence events are appended to a short
+per-user log with monotonically increasing ids; each open inbox holds an
+SSE stream on its member's log and reconnects with ``Last-Event-ID``.
+
+Typing and presence are ephemeral and coalesced on the server: a signal is
+only fanned out when no identical signal went out in the last few seconds
+(a shared claim key), and a stream collapses a backlog of them to the
+newest per thread and sender before writing.
+
+The per-user logs are core event logs (see
+``app.features.core.event_streams``). Backed by Redis streams and keys
+when ``REDIS_URL`` is set, so events and connection counts are shared by
+every uvicorn worker; otherwise an in-process log is used (development,
+single worker).
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from abc import abstractmethod
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from app.features.core.config import get_settings
+from app.features.core.event_streams import (
+    HEARTBEAT_MESSAGE,
+    EventLog,
+    InMemoryEventLog,
+    RedisEventLog,
+    StreamEvent,
+    format_sse,
+    retry_message,
+)
+from app.features.core.sqlalchemy_imports import get_logger
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Seconds between heartbeats on an idle stream (also the longest blocking read)
+HEARTBEAT_SECONDS = float(getattr(settings, "COMMUNITY_INBOX_HEARTBEAT_SECONDS", 15))
+# At most one typing signal per thread and sender in this window
+TYPING_COALESCE_SECONDS = float(getattr(settings, "COMMUNITY_INBOX_TYPING_SECONDS", 3))
+# Presence is re-announced once per window while a member has a stream open
+PRESENCE_TTL_SECONDS = int(getattr(settings, "COMMUNITY_INBOX_PRESENCE_SECONDS", 60))
+# Events kept per member for Last-Event-ID resumption
+MAX_EVENTS_PER_USER = 200
+# Events that only describe current state; a newer one replaces an older one
+EPHEMERAL_EVENTS = ("typing", "presence")
+
+
+class InboxChannel(EventLog):
+    """Per-user event logs plus the shared state used for coalescing and presence."""
+
+    @abstractmethod
+    async def claim(self, key: str, ttl: float) -> bool:
+        """True if ``key`` was free (and is now held for ``ttl`` seconds)."""
+
+    @abstractmethod
+    async def release(self, key: str) -> None:
+        """Drop a claim before it expires."""
+
+    @abstractmethod
+    async def connect(self, user_id: str) -> int:
+        """Register an open stream; returns the member's open stream count."""
+
+    @abstractmethod
+    async def disconnect(self, user_id: str) -> int:
+        """Unregister an open stream; returns the remaining count."""
+
+    @abstractmethod
+    async def online(self, user_ids: Iterable[str]) -> Set[str]:
+        """Members among ``user_ids`` with at least one open stream."""
+
+    async def refresh_presence(self, user_id: str) -> None:
+        """Keep a long-lived stream counted as online (no-op unless connections expire)."""
+
+    async def publish_many(self, user_ids: Iterable[str], event: str, data: Dict[str, Any]) -> None:
+        for user_id in dict.fromkeys(user_ids):
+            await self.publish(user_id, event, data)
+
+
+class InMemoryInboxChannel(InMemoryEventLog, InboxChannel):
+    """Per-process channel (development, tests, single-worker deployments)."""
+
+    def __init__(self, max_events: int = MAX_EVENTS_PER_USER):
+        super().__init__(max_events)
+        self._claims: Dict[str, float] = {}
+        self._connections: Dict[str, int] = {}
+
+    async def claim(self, key, ttl):
+        now = time.monotonic()
+        if self._claims.get(key, 0) > now:
+            return False
+        self._claims[key] = now + ttl
+        return True
+
+    async def release(self, key):
+        self._claims.pop(key, None)
+
+    async def connect(self, user_id):
+        self._connections[user_id] = self._connections.get(user_id, 0) + 1
+        return self._connections[user_id]
+
+    async def disconnect(self, user_id):
+        remaining = max(self._connections.get(user_id, 0) - 1, 0)
+        if remaining:
+            self._connections[user_id] = remaining
+        else:
+            self._connections.pop(user_id, None)
+        return remaining
+
+    async def online(self, user_ids):
+        return {user_id for user_id in user_ids if self._connections.get(user_id)}
+
+
+class RedisInboxChannel(RedisEventLog, InboxChannel):
+    """
+    Channel shared through Redis: one capped stream per member, ``SET NX``
+    claims for coalescing and expiring counters for open streams.
+
+    Redis errors fail soft: events are dropped with an error log and reads
+    behave like an idle stream, so the inbox falls back to its manual
+    refresh instead of the request failing.
+    """
+
+    def __init__(
+        self,
+        key_prefix: str = "community:inbox",
+        max_events: int = MAX_EVENTS_PER_USER,
+        redis_url: Optional[str] = None,
+    ):
+        super().__init__(key_prefix, max_events=max_events, redis_url=redis_url)
+
+    def _key(self, kind: str, name: str) -> str:
+        return f"{self.key_prefix}:{kind}:{name}"
+
+    def _stream_key(self, user_id: str) -> str:
+        return self._key("events", user_id)
+
+    async def claim(self, key, ttl):
+        try:
+            client = await self._get_redis()
+            return bool(await client.set(self._key("claim", key), "1", nx=True, px=max(int(ttl * 1000), 1)))
+        except Exception as e:
+            logger.error("Inbox claim failed", key=key, error=str(e))
+            return False
+
+    async def release(self, key):
+        try:
+            client = await self._get_redis()
+            await client.delete(self._key("claim", key))
+        except Exception as e:
+            logger.error("Inbox claim release failed", key=key, error=str(e))
+
+    async def connect(self, user_id):
+        try:
+            client = await self._get_redis()
+            key = self._key("online", user_id)
+            pipe = client.pipeline(transaction=True)
+            pipe.incr(key)
+            # A worker that dies without disconnecting cannot pin a member online
+            pipe.expire(key, PRESENCE_TTL_SECONDS * 2)
+            results = await pipe.execute()
+            return int(results[0])
+        except Exception as e:
+            logger.error("Inbox connect failed", user_id=user_id, error=str(e))
+            return 0
+
+    async def disconnect(self, user_id):
+        try:
+            client = await self._get_redis()
+            key = self._key("online", user_id)
+            remaining = int(await client.decr(key))
+            if remaining <= 0:
+                await client.delete(key)
+            return max(remaining, 0)
+        except Exception as e:
+            logger.error("Inbox disconnect failed", user_id=user_id, error=str(e))
+            return 0
+
+    async def refresh_presence(self, user_id: str) -> None:
+        try:
+            client = await self._get_redis()
+            await client.expire(self._key("online", user_id), PRESENCE_TTL_SECONDS * 2)
+        except Exception as e:
+            logger.error("Inbox presence refresh failed", user_id=user_id, error=str(e))
+
+    async def online(self, user_ids):
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return set()
+        try:
+            client = await self._get_redis()
+            counts = await client.mget([self._key("online", user_id) for user_id in user_ids])
+        except Exception as e:
+            logger.error("Inbox presence lookup failed", error=str(e))
+            return set()
+        return {user_id for user_id, count in zip(user_ids, counts) if count and int(count) > 0}
+
+
+async def publish_typing(
+    channel: InboxChannel,
+    thread_id: str,
+    user_id: str,
+    recipients: Sequence[str],
+    window: float = TYPING_COALESCE_SECONDS,
+) -> bool:
+    """
+    Fan a typing signal out to the other participants, at most once per window.
+
+    Returns False when an identical signal was already sent within the window.
+    """
+    if not await channel.claim(f"typing:{thread_id}:{user_id}", window):
+        return False
+    data = {"thread_id": thread_id, "user_id": user_id, "expires_in": window * 2}
+    await channel.publish_many([r for r in recipients if r != user_id], "typing", data)
+    return True
+
+
+async def publish_presence(
+    channel: InboxChannel,
+    user_id: str,
+    partners: Sequence[str],
+    online: bool,
+) -> bool:
+    """Tell a member's conversation partners they came online (coalesced) or went offline."""
+    key = f"presence:{user_id}"
+    if online and not await channel.claim(key, PRESENCE_TTL_SECONDS / 2):
+        return False
+    if not online:
+        # The next stream to open announces the member again right away
+        await channel.release(key)
+    await channel.publish_many([p for p in partners if p != user_id], "presence", {"user_id": user_id, "online": online})
+    return True
+
+
+def coalesce_events(events: Sequence[StreamEvent]) -> List[StreamEvent]:
+    """Keep every message/read event but only the newest typing/presence event per subject."""
+    latest: Dict[Tuple[str, Any, Any], int] = {}
+    for position, event in enumerate(events):
+        if event.event in EPHEMERAL_EVENTS:
+            latest[(event.event, event.data.get("thread_id"), event.data.get("user_id"))] = position
+    return [
+        event
+        for position, event in enumerate(events)
+        if event.event not in EPHEMERAL_EVENTS
+        or latest[(event.event, event.data.get("thread_id"), event.data.get("user_id"))] == position
+    ]
+
+
+async def inbox_event_stream(
+    channel: InboxChannel,
+    user_id: str,
+    partners: Sequence[str],
+    cursor: str,
+    heartbeat_seconds: float = HEARTBEAT_SECONDS,
+) -> AsyncIterator[str]:
+    """
+    Yield SSE messages for one member's inbox.
+
+    Opens with a roster of the conversation partners online, announces the member
+    to them, then relays the member's events (ephemeral ones coalesced)
+    with heartbeat comments while idle. Closing the last open stream
+    announces the member offline.
+    """
+    await channel.connect(user_id)
+    try:
+        yield retry_message()
+        yield format_sse("roster", {"online": sorted(await channel.online(partners))})
+
+        announced_at = None
+        while True:
+            now = time.monotonic()
+            if announced_at is None or now - announced_at >= PRESENCE_TTL_SECONDS / 2:
+                await channel.refresh_presence(user_id)
+                await publish_presence(channel, user_id, partners, online=True)
+                announced_at = now
+
+            events = await channel.read(user_id, cursor, timeout=heartbeat_seconds)
+            if not events:
+                yield HEARTBEAT_MESSAGE
+                continue
+            cursor = events[-1].id
+            for event in coalesce_events(events):
+                yield format_sse(event.event, event.data, event.id)
+    finally:
+        if await channel.disconnect(user_id) == 0:
+            await publish_presence(channel, user_id, partners, online=False)
+
+
+_channel: Optional[InboxChannel] = None
+
+
+def get_inbox_channel() -> InboxChannel:
+    """
+    Return the process-wide inbox channel.
+
+    Uses Redis when ``REDIS_URL`` is configured so every uvicorn worker
+    sees the same events; otherwise falls back to memory.
+    """
+    global _channel
+    if _channel is None:
+        _channel = RedisInboxChannel() if os.getenv("REDIS_URL") else InMemoryInboxChannel()
+    return _channel
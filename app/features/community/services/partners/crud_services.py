@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Tuple
 
-from app.features.core.sqlalchemy_imports import AsyncSession, func, or_, select
+from app.features.core.sqlalchemy_imports import AsyncSession, func, select
 from app.features.core.audit_mixin import AuditContext
 from app.features.core.enhanced_base_service import BaseService
+from app.features.core.full_text_search import search_match, search_rank
 from app.features.community.models import Partner, Member
+from app.features.community.services.dashboard.dashboard_cache import invalidate_tenant_dashboard_after_commit
 
 
 class PartnerCrudService(BaseService[Partner]):
@@ -39,15 +41,9 @@ class PartnerCrudService(BaseService[Partner]):
             if self.tenant_id is not None:
                 filters.append(Partner.tenant_id == self.tenant_id)
 
+            fuzzy_columns = (Partner.name,)
             if search:
-                like = f"%{search.lower()}%"
-                filters.append(
-                    or_(
-                        func.lower(Partner.name).like(like),
-                        func.lower(Partner.description).like(like),
-                        func.lower(Partner.offer).like(like),
-                    )
-                )
+                filters.append(search_match(Partner.search_vector, search, fuzzy_columns))
 
             if category:
                 filters.append(func.lower(Partner.category) == category.lower())
@@ -56,6 +52,8 @@ class PartnerCrudService(BaseService[Partner]):
             if filters:
                 stmt = stmt.where(*filters)
 
+            if search:
+                stmt = stmt.order_by(search_rank(Partner.search_vector, search, fuzzy_columns).desc())
             stmt = stmt.order_by(func.lower(Partner.name)).offset(offset).limit(limit)
             result = await self.db.execute(stmt)
             partners = list(result.scalars().all())
@@ -92,6 +90,7 @@ class PartnerCrudService(BaseService[Partner]):
             self.db.add(partner)
             await self.db.flush()
             await self.db.refresh(partner)
+            invalidate_tenant_dashboard_after_commit(self.db, partner.tenant_id)
             return partner
         except Exception as exc:
             await self.handle_error("create_partner", exc)
@@ -148,6 +147,7 @@ class PartnerCrudService(BaseService[Partner]):
             return False
         await self.db.delete(partner)
         await self.db.flush()
+        invalidate_tenant_dashboard_after_commit(self.db, partner.tenant_id)
         return True
 
     async def list_partner_contacts(self, partner_id: str) -> List[Member]:
@@ -1,3 +1,4 @@
 from .crud_services import PollCrudService, PollVoteCrudService
+from .live_results import get_poll_results_channel, schedule_results_push
 
-__all__ = ["PollCrudService", "PollVoteCrudService"]
+__all__ = ["PollCrudService", "PollVoteCrudService", "get_poll_results_channel", "schedule_results_push"]
@@ -2,13 +2,34 @@
 
 from __future__ import annotations
 
+import random
 from typing import Dict, List, Optional, Tuple
 from uuid import uuid4
 
-from app.features.core.sqlalchemy_imports import AsyncSession, func, select, selectinload
+from app.features.core.config import get_settings
+from app.features.core.sqlalchemy_imports import (
+    AsyncSession,
+    aliased,
+    func,
+    get_logger,
+    pg_insert,
+    select,
+    selectinload,
+)
 from app.features.core.audit_mixin import AuditContext
 from app.features.core.enhanced_base_service import BaseService
-from app.features.community.models import Poll, PollOption, PollVote
+from app.features.community.models import Poll, PollOption, PollVote, PollVoteCounter
+from app.features.community.services.dashboard.dashboard_cache import invalidate_hub_dashboards_after_commit
+from sqlalchemy import literal, union_all
+from sqlalchemy.orm import lazyload
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Counter rows per option; a vote lands on a random one to spread row locks
+COUNTER_SHARDS = max(int(getattr(settings, "COMMUNITY_POLL_COUNTER_SHARDS", 8)), 1)
+# Shard that reconciliation writes its corrections to
+RECONCILE_SHARD = 0
 
 
 class PollCrudService(BaseService[Poll]):
@@ -99,6 +120,7 @@ class PollCrudService(BaseService[Poll]):
                 await self.db.flush()
 
             await self.db.refresh(poll, attribute_names=["options"])
+            invalidate_hub_dashboards_after_commit(self.db)
             return poll
         except Exception as exc:
             await self.handle_error("create_poll", exc)
@@ -119,6 +141,7 @@ class PollCrudService(BaseService[Poll]):
                 poll.set_updated_by(audit_ctx.user_email, audit_ctx.user_name)
             await self.db.flush()
             await self.db.refresh(poll)
+            invalidate_hub_dashboards_after_commit(self.db)
             return poll
         except Exception as exc:
             await self.handle_error("update_poll", exc, poll_id=poll_id)
@@ -163,6 +186,7 @@ class PollCrudService(BaseService[Poll]):
 
             await self.db.flush()
             await self.db.refresh(poll)
+            invalidate_hub_dashboards_after_commit(self.db)
             return poll
         except Exception as exc:
             await self.handle_error("update_poll_with_options", exc, poll_id=poll_id)
@@ -174,6 +198,7 @@ class PollCrudService(BaseService[Poll]):
             return False
         await self.db.delete(poll)
         await self.db.flush()
+        invalidate_hub_dashboards_after_commit(self.db)
         return True
 
 
@@ -187,45 +212,92 @@ class PollVoteCrudService(BaseService[PollVote]):
         return await super().get_by_id(PollVote, vote_id)
 
     async def cast_vote(self, poll_id: str, option_id: str, member_id: Optional[str]) -> PollVote:
-        """Cast or replace a vote."""
-        try:
-            tenant_id = self.tenant_id or "global"
+        """
+        Cast or change a member's vote and move the option counters with it.
 
-            if member_id:
-                await self.db.execute(
-                    PollVote.__table__.delete().where(
-                        PollVote.poll_id == poll_id,
-                        PollVote.member_id == member_id,
-                        PollVote.tenant_id == tenant_id,
-                    )
-                )
-
-            vote = PollVote(
-                id=str(uuid4()),
+        One statement upserts the vote on (poll_id, member_id), reads the
+        member's previous option from the statement snapshot, and applies
+        +1/-1 to the counters, so the vote and the counts commit together.
+        """
+        try:
+            stmt = self._cast_vote_statement(
+                vote_id=str(uuid4()),
+                tenant_id=self.tenant_id or "global",
                 poll_id=poll_id,
                 option_id=option_id,
                 member_id=member_id,
-                tenant_id=tenant_id,
+                shard=random.randrange(COUNTER_SHARDS),
             )
-            self.db.add(vote)
-            await self.db.flush()
-            await self.db.refresh(vote)
-            return vote
+            result = await self.db.execute(stmt)
+            return result.scalar_one()
         except Exception as exc:
             await self.handle_error("cast_vote", exc, poll_id=poll_id)
 
+    @staticmethod
+    def _cast_vote_statement(
+        vote_id: str,
+        tenant_id: str,
+        poll_id: str,
+        option_id: str,
+        member_id: Optional[str],
+        shard: int,
+    ):
+        vote_insert = pg_insert(PollVote).values(
+            id=vote_id,
+            tenant_id=tenant_id,
+            poll_id=poll_id,
+            option_id=option_id,
+            member_id=member_id,
+        )
+        vote = (
+            vote_insert.on_conflict_do_update(
+                index_elements=["poll_id", "member_id"],
+                set_={"option_id": vote_insert.excluded.option_id, "updated_at": func.now()},
+            )
+            .returning(*PollVote.__table__.c)
+            .cte("vote")
+        )
+
+        deltas = [select(vote.c.option_id, literal(1).label("delta"))]
+        if member_id:
+            # Every CTE sees the statement's snapshot, so this is the vote as it was before
+            # the upsert. No FOR UPDATE: locking would skip the row the upsert just changed.
+            previous = (
+                select(PollVote.option_id)
+                .where(PollVote.poll_id == poll_id, PollVote.member_id == member_id)
+                .cte("previous")
+            )
+            deltas.append(select(previous.c.option_id, literal(-1).label("delta")))
+        delta = union_all(*deltas).subquery("deltas")
+        net = func.sum(delta.c.delta)
+
+        counter_insert = pg_insert(PollVoteCounter).from_select(
+            ["option_id", "shard", "poll_id", "count"],
+            select(delta.c.option_id, literal(shard), literal(poll_id), net)
+            .group_by(delta.c.option_id)
+            .having(net != 0),
+        )
+        counters = counter_insert.on_conflict_do_update(
+            index_elements=["option_id", "shard"],
+            set_={"count": PollVoteCounter.count + counter_insert.excluded.count},
+        ).cte("counters")
+
+        # No eager loads: the poll's backrefs would pull in every vote cast so far
+        return select(aliased(PollVote, vote)).options(lazyload("*")).add_cte(counters)
+
     async def vote_summary(self, poll_id: str) -> List[Dict[str, any]]:
-        """Return aggregated vote counts for charting."""
+        """Return vote counts for charting, read from the option counters."""
         try:
+            counts = (
+                select(PollVoteCounter.option_id, func.sum(PollVoteCounter.count).label("votes"))
+                .where(PollVoteCounter.poll_id == poll_id)
+                .group_by(PollVoteCounter.option_id)
+                .subquery()
+            )
             stmt = (
-                select(
-                    PollOption.id,
-                    PollOption.text,
-                    func.count(PollVote.id).label("votes"),
-                )
-                .join(PollVote, PollVote.option_id == PollOption.id, isouter=True)
+                select(PollOption.id, PollOption.text, counts.c.votes)
+                .join(counts, counts.c.option_id == PollOption.id, isouter=True)
                 .where(PollOption.poll_id == poll_id)
-                .group_by(PollOption.id, PollOption.text)
                 .order_by(PollOption.order.asc())
             )
             result = await self.db.execute(stmt)
@@ -236,3 +308,51 @@ class PollVoteCrudService(BaseService[PollVote]):
             ]
         except Exception as exc:
             await self.handle_error("vote_summary", exc, poll_id=poll_id)
+
+    async def reconcile_vote_counters(self, poll_id: Optional[str] = None) -> int:
+        """
+        Repair option counters that drifted from the raw votes.
+
+        Stored and actual counts are read in one statement (one snapshot), and
+        the difference is added to a single shard, so votes cast while this
+        runs keep their own increments. Returns the number of options fixed.
+        """
+        try:
+            actual = (
+                select(PollVote.option_id, func.count(PollVote.id).label("votes"))
+                .group_by(PollVote.option_id)
+                .subquery()
+            )
+            stored = (
+                select(PollVoteCounter.option_id, func.sum(PollVoteCounter.count).label("votes"))
+                .group_by(PollVoteCounter.option_id)
+                .subquery()
+            )
+            drift = func.coalesce(actual.c.votes, 0) - func.coalesce(stored.c.votes, 0)
+            stmt = (
+                select(PollOption.id, PollOption.poll_id, drift.label("drift"))
+                .join(actual, actual.c.option_id == PollOption.id, isouter=True)
+                .join(stored, stored.c.option_id == PollOption.id, isouter=True)
+                .where(drift != 0)
+                .order_by(PollOption.id)
+            )
+            if poll_id:
+                stmt = stmt.where(PollOption.poll_id == poll_id)
+            rows = (await self.db.execute(stmt)).all()
+            if not rows:
+                return 0
+
+            counter_insert = pg_insert(PollVoteCounter).values([
+                {"option_id": row.id, "shard": RECONCILE_SHARD, "poll_id": row.poll_id, "count": int(row.drift)}
+                for row in rows
+            ])
+            await self.db.execute(
+                counter_insert.on_conflict_do_update(
+                    index_elements=["option_id", "shard"],
+                    set_={"count": PollVoteCounter.count + counter_insert.excluded.count},
+                )
+            )
+            logger.warning("Repaired drifted poll vote counters", options=len(rows), poll_id=poll_id)
+            return len(rows)
+        except Exception as exc:
+            await self.handle_error("reconcile_vote_counters", exc, poll_id=poll_id)
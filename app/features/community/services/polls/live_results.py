@@ -0,0 +1,134 @@
+"""
+Live poll results for open poll pages.
+
+Casting a vote schedules a results push instead of sending one: the first
+vote on a poll claims a debounce window, and when the window closes a
+single task reads the option counters and publishes the totals to the
+poll's log. Votes arriving inside the window are covered by that push, so
+a poll receiving thousands of votes a second still costs one summary
+query per window, shared by every open page.
+
+Poll logs reuse the inbox channel implementations (keyed by poll id under
+their own prefix): Redis when ``REDIS_URL`` is set so the claim and the
+pushes are shared by every uvicorn worker, memory otherwise. SSE framing
+comes from ``app.features.core.event_streams``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set
+
+from app.features.core.config import get_settings
+from app.features.core.database import get_async_session
+from app.features.core.event_streams import HEARTBEAT_MESSAGE, format_sse, retry_message
+from app.features.core.sqlalchemy_imports import get_logger
+
+from app.features.community.services.messages.inbox_channel import (
+    HEARTBEAT_SECONDS,
+    InboxChannel,
+    InMemoryInboxChannel,
+    RedisInboxChannel,
+)
+from .crud_services import PollVoteCrudService
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Longest a vote waits before open pages see it; also the most one poll is pushed
+RESULTS_DEBOUNCE_SECONDS = float(getattr(settings, "COMMUNITY_POLL_RESULTS_DEBOUNCE_MS", 500)) / 1000
+# Pushes kept per poll for Last-Event-ID resumption (only the newest matters)
+MAX_RESULTS_PER_POLL = 20
+
+_pending: Set[asyncio.Task] = set()
+
+
+def results_payload(poll_id: str, summary: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Event data for one results push."""
+    return {
+        "poll_id": poll_id,
+        "options": summary,
+        "total_votes": sum(option["votes"] for option in summary),
+    }
+
+
+async def publish_results(
+    channel: InboxChannel,
+    poll_id: str,
+    session_factory: Optional[Callable[[], Any]] = None,
+) -> Optional[str]:
+    """Read the poll's counters and publish them to its open pages."""
+    session_factory = session_factory or get_async_session()
+    async with session_factory() as session:
+        summary = await PollVoteCrudService(session, tenant_id=None).vote_summary(poll_id)
+    return await channel.publish(poll_id, "results", results_payload(poll_id, summary))
+
+
+async def schedule_results_push(
+    poll_id: str,
+    channel: Optional[InboxChannel] = None,
+    session_factory: Optional[Callable[[], Any]] = None,
+    delay: float = RESULTS_DEBOUNCE_SECONDS,
+) -> bool:
+    """
+    Push the poll's results once ``delay`` has passed, unless a push is
+    already scheduled. Call after the vote has committed.
+
+    Returns False when the vote is covered by an already scheduled push.
+    """
+    channel = channel or get_poll_results_channel()
+    if not await channel.claim(f"results:{poll_id}", delay):
+        return False
+
+    async def push() -> None:
+        await asyncio.sleep(delay)
+        try:
+            await publish_results(channel, poll_id, session_factory)
+        except Exception:
+            logger.exception("Failed to push poll results", poll_id=poll_id)
+
+    task = asyncio.get_running_loop().create_task(push())
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+    return True
+
+
+async def poll_results_stream(
+    channel: InboxChannel,
+    poll_id: str,
+    cursor: str,
+    initial: Optional[Dict[str, Any]] = None,
+    heartbeat_seconds: float = HEARTBEAT_SECONDS,
+) -> AsyncIterator[str]:
+    """
+    Yield SSE messages for one open poll page.
+
+    Opens with the current results (when given), then relays pushes. Each
+    push carries full totals, so a backlog collapses to its newest entry.
+    """
+    yield retry_message()
+    if initial is not None:
+        yield format_sse("results", initial)
+    while True:
+        events = await channel.read(poll_id, cursor, timeout=heartbeat_seconds)
+        if not events:
+            yield HEARTBEAT_MESSAGE
+            continue
+        latest = events[-1]
+        cursor = latest.id
+        yield format_sse(latest.event, latest.data, latest.id)
+
+
+_channel: Optional[InboxChannel] = None
+
+
+def get_poll_results_channel() -> InboxChannel:
+    """Return the process-wide poll results channel."""
+    global _channel
+    if _channel is None:
+        if os.getenv("REDIS_URL"):
+            _channel = RedisInboxChannel(key_prefix="community:polls", max_events=MAX_RESULTS_PER_POLL)
+        else:
+            _channel = InMemoryInboxChannel(max_events=MAX_RESULTS_PER_POLL)
+    return _channel
@@ -0,0 +1,3 @@
+from .search_services import COMMUNITY_SEARCH_TARGETS, CommunitySearchService
+
+__all__ = ["COMMUNITY_SEARCH_TARGETS", "CommunitySearchService"]
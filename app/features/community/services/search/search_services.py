@@ -0,0 +1,109 @@
+"""Community-wide search across the hub's full-text indexed entities."""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+from app.features.core.sqlalchemy_imports import AsyncSession, func
+from app.features.core.full_text_search import SearchHit, SearchTarget
+from app.features.core.search_service import DEFAULT_RESULTS_PER_KIND, FullTextSearchService
+from app.features.community.models import (
+    CommunityContent,
+    Event,
+    Group,
+    Member,
+    NewsItem,
+    PodcastEpisode,
+    VideoResource,
+)
+
+# Content, events and groups are hub-wide (see dependencies.py); members
+# stay scoped to the caller's tenant.
+COMMUNITY_SEARCH_TARGETS: Dict[str, SearchTarget] = {
+    target.kind: target
+    for target in (
+        SearchTarget(
+            kind="article",
+            model=CommunityContent,
+            title=CommunityContent.title,
+            document=CommunityContent.body_md,
+            sort_date=CommunityContent.published_at,
+            fuzzy_columns=(CommunityContent.title,),
+            tenant_scoped=False,
+        ),
+        SearchTarget(
+            kind="podcast",
+            model=PodcastEpisode,
+            title=PodcastEpisode.title,
+            document=PodcastEpisode.description,
+            sort_date=PodcastEpisode.published_at,
+            fuzzy_columns=(PodcastEpisode.title,),
+            tenant_scoped=False,
+        ),
+        SearchTarget(
+            kind="video",
+            model=VideoResource,
+            title=VideoResource.title,
+            document=VideoResource.description,
+            sort_date=VideoResource.published_at,
+            fuzzy_columns=(VideoResource.title,),
+            tenant_scoped=False,
+        ),
+        SearchTarget(
+            kind="news",
+            model=NewsItem,
+            title=NewsItem.headline,
+            document=NewsItem.summary,
+            sort_date=NewsItem.publish_date,
+            fuzzy_columns=(NewsItem.headline,),
+            tenant_scoped=False,
+        ),
+        SearchTarget(
+            kind="event",
+            model=Event,
+            title=Event.title,
+            document=Event.description,
+            sort_date=Event.start_date,
+            fuzzy_columns=(Event.title,),
+            tenant_scoped=False,
+        ),
+        SearchTarget(
+            kind="group",
+            model=Group,
+            title=Group.name,
+            document=Group.description,
+            sort_date=Group.created_at,
+            fuzzy_columns=(Group.name,),
+            tenant_scoped=False,
+        ),
+        SearchTarget(
+            kind="member",
+            model=Member,
+            title=Member.name,
+            document=func.concat_ws(" · ", Member.location, Member.bio),
+            sort_date=Member.created_at,
+            fuzzy_columns=(Member.name, Member.email),
+        ),
+    )
+}
+
+
+class CommunitySearchService(FullTextSearchService):
+    """Typed search results for the whole community hub in one query."""
+
+    def __init__(self, db_session: AsyncSession, tenant_id: Optional[str]):
+        super().__init__(db_session, tenant_id)
+
+    async def search_community(
+        self,
+        term: str,
+        kinds: Optional[Sequence[str]] = None,
+        per_kind: int = DEFAULT_RESULTS_PER_KIND,
+    ) -> List[SearchHit]:
+        """Best matches of each requested kind (all kinds when none given)."""
+        targets = [
+            target
+            for kind, target in COMMUNITY_SEARCH_TARGETS.items()
+            if not kinds or kind in kinds
+        ]
+        return await self.search(targets, term, per_kind=per_kind)
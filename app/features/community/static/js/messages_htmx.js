@@ -34,3 +34,135 @@ document.body.addEventListener("openThread", (event) => {
     htmx.ajax("GET", url, { target: "#thread-pane", swap: "innerHTML" });
   }
 });
+
+/**
+ * Live inbox: one EventSource per open inbox. Message and read events
+ * re-render only the affected conversation row (and the open thread);
+ * typing and presence events toggle indicators without any request.
+ */
+(function liveInbox() {
+  const rail = document.getElementById("conversation-rail");
+  if (!rail || !window.EventSource) {
+    return;
+  }
+
+  const memberId = window.currentMemberId;
+  const onlineUsers = new Set();
+  let typingTimer = null;
+
+  function openThreadId() {
+    const pane = document.querySelector("#thread-pane [data-thread-id]");
+    return pane ? pane.dataset.threadId : null;
+  }
+
+  function applyPresence(row) {
+    const ids = (row.dataset.participantIds || "").split(",").filter((id) => id && id !== memberId);
+    const dot = row.querySelector(".conversation-presence");
+    if (!dot) {
+      return;
+    }
+    const online = ids.some((id) => onlineUsers.has(id));
+    dot.classList.toggle("d-none", !online);
+    dot.classList.toggle("status-dot-animated", online);
+    dot.classList.toggle("status-green", online);
+  }
+
+  function applyPresenceAll() {
+    rail.querySelectorAll("[data-participant-ids]").forEach(applyPresence);
+  }
+
+  // Replace (or insert) one conversation row and move it to the top
+  function refreshRow(threadId) {
+    const url = `/features/community/messages/partials/conversations/${threadId}`;
+    fetch(url, { headers: { "HX-Request": "true" }, credentials: "same-origin" })
+      .then((response) => (response.ok ? response.text() : ""))
+      .then((html) => {
+        const template = document.createElement("template");
+        template.innerHTML = html.trim();
+        const fresh = template.content.querySelector(`#conversation-${CSS.escape(threadId)}`);
+        if (!fresh) {
+          return;
+        }
+        let list = rail.querySelector(".conversation-list");
+        if (!list) {
+          // First conversation: render the whole (now non-empty) rail once
+          htmx.ajax("GET", "/features/community/messages/partials/conversations", { target: rail });
+          return;
+        }
+        const existing = document.getElementById(`conversation-${threadId}`);
+        if (existing) {
+          existing.remove();
+        }
+        list.prepend(fresh);
+        htmx.process(fresh);
+        applyPresence(fresh);
+      });
+  }
+
+  const source = new EventSource("/features/community/messages/stream");
+
+  source.addEventListener("message", (event) => {
+    const data = JSON.parse(event.data);
+    if (data.thread_id === openThreadId() && data.sender_id !== memberId) {
+      // Re-rendering the open thread also marks it read
+      htmx.ajax("GET", `/features/community/messages/threads/${data.thread_id}`, {
+        target: "#thread-pane",
+        swap: "innerHTML",
+      });
+    }
+    refreshRow(data.thread_id);
+  });
+
+  source.addEventListener("read", (event) => {
+    const data = JSON.parse(event.data);
+    if (data.user_id === memberId) {
+      refreshRow(data.thread_id);
+      return;
+    }
+    if (data.thread_id === openThreadId()) {
+      const seen = document.getElementById("thread-seen");
+      if (seen) {
+        seen.textContent = "Seen";
+      }
+    }
+  });
+
+  source.addEventListener("typing", (event) => {
+    const data = JSON.parse(event.data);
+    const indicator = document.getElementById("thread-typing");
+    if (!indicator || data.thread_id !== openThreadId()) {
+      return;
+    }
+    indicator.textContent = "Typing…";
+    clearTimeout(typingTimer);
+    typingTimer = setTimeout(() => {
+      indicator.textContent = "";
+    }, (data.expires_in || 6) * 1000);
+  });
+
+  source.addEventListener("roster", (event) => {
+    const data = JSON.parse(event.data);
+    onlineUsers.clear();
+    (data.online || []).forEach((id) => onlineUsers.add(id));
+    applyPresenceAll();
+  });
+
+  source.addEventListener("presence", (event) => {
+    const data = JSON.parse(event.data);
+    if (data.online) {
+      onlineUsers.add(data.user_id);
+    } else {
+      onlineUsers.delete(data.user_id);
+    }
+    applyPresenceAll();
+  });
+
+  // A freshly loaded rail (manual refresh, paging) picks up current presence
+  document.body.addEventListener("htmx:afterSwap", (event) => {
+    if (rail.contains(event.target)) {
+      applyPresenceAll();
+    }
+  });
+
+  window.addEventListener("beforeunload", () => source.close());
+})();
@@ -19,40 +19,70 @@ function resetResultsPanel(message = "Select a poll to load results.") {
   if (panel) {
     panel.innerHTML = `<div class="text-muted">${message}</div>`;
   }
+  stopWatchingPollResults();
   selectedPollId = null;
 }
 
+function renderPollResults(summary) {
+  const widget = document.getElementById("poll-results-widget");
+  if (!widget) return;
+  // Ensure the widget markup exists (in case it was reset)
+  if (typeof widget.render === "function") {
+    widget.render();
+    chartInitialized = true;
+  }
+  const categories = summary.map((item) => item.label);
+  const values = summary.map((item) => item.votes);
+
+  // chart-widget expects categories/values for bar charts
+  if (typeof widget.renderChart === "function") {
+    widget.renderChart({ categories, values });
+  }
+
+  // If no data yet, show a friendly placeholder
+  if (!summary.length && typeof widget.showNoData === "function") {
+    widget.showNoData();
+  }
+}
+
 function loadPollSummary(pollId) {
   fetch(`/features/community/polls/api/${pollId}/summary`)
     .then((resp) => resp.json())
-    .then((payload) => {
-      const widget = document.getElementById("poll-results-widget");
-      if (!widget) return;
-      // Ensure the widget markup exists (in case it was reset)
-      if (typeof widget.render === "function") {
-        widget.render();
-        chartInitialized = true;
-      }
-      const summary = payload.data || [];
-      const categories = summary.map((item) => item.label);
-      const values = summary.map((item) => item.votes);
-
-      // chart-widget expects categories/values for bar charts
-      if (typeof widget.renderChart === "function") {
-        widget.renderChart({ categories, values });
-      }
-
-      // If no data yet, show a friendly placeholder
-      if (!summary.length && typeof widget.showNoData === "function") {
-        widget.showNoData();
-      }
-    })
+    .then((payload) => renderPollResults(payload.data || []))
     .catch((error) => {
       console.error("Failed to load poll summary", error);
       resetResultsPanel("Unable to load poll results.");
     });
 }
 
+let resultsSource = null;
+
+function stopWatchingPollResults() {
+  if (resultsSource) {
+    resultsSource.close();
+    resultsSource = null;
+  }
+}
+
+/**
+ * Follow a poll's totals over SSE: the stream opens with the current
+ * results and the server pushes new totals at most once per debounce window.
+ */
+function watchPollResults(pollId) {
+  stopWatchingPollResults();
+  if (typeof window.EventSource !== "function") {
+    loadPollSummary(pollId);
+    return;
+  }
+  const source = new EventSource(`/features/community/polls/api/${pollId}/stream`);
+  source.addEventListener("results", (event) => {
+    if (pollId !== selectedPollId) return;
+    const payload = JSON.parse(event.data);
+    renderPollResults(payload.options || []);
+  });
+  resultsSource = source;
+}
+
 function renderVotePanel(poll) {
   const panel = document.getElementById("poll-vote-panel");
   if (!panel) return;
@@ -111,7 +141,9 @@ function renderVotePanel(poll) {
         if (typeof window.showToast === "function") {
           window.showToast("Vote recorded", "success");
         }
-        loadPollSummary(poll.id);
+        if (!resultsSource) {
+          loadPollSummary(poll.id);
+        }
       })
       .catch((error) => {
         console.error("Failed to submit vote", error);
@@ -159,8 +191,10 @@ window.initializePollsTable = function initializePollsTable() {
 
   table.on("rowClick", (event, row) => {
     const data = row.getData();
-    loadPollSummary(data.id);
     renderVotePanel(data);
+    if (selectedPollId === data.id) {
+      watchPollResults(data.id);
+    }
   });
 
   window.pollsTable = table;
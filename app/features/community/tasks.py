@@ -0,0 +1,43 @@
+"""
+Celery tasks for the community hub.
+
+Runs the periodic poll counter reconciliation, which repairs any drift
+between the per-option vote counters and the raw votes (for example two
+first votes by the same member racing each other).
+"""
+
+import asyncio
+from typing import Any, Dict, Optional
+
+import structlog
+
+from app.features.core.celery_app import celery_app
+from app.features.core.database import get_async_session
+from app.features.community.services.polls import PollVoteCrudService
+
+logger = structlog.get_logger(__name__)
+
+
+def _run_async(coro):
+    """Utility to run async code inside a Celery task."""
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    return loop.run_until_complete(coro)
+
+
+@celery_app.task(bind=True, soft_time_limit=600, time_limit=900)
+def reconcile_poll_vote_counters_task(self, poll_id: Optional[str] = None) -> Dict[str, Any]:
+    """Recount poll votes and fix drifted option counters (scheduled by beat)."""
+
+    async def run() -> int:
+        async with get_async_session()() as db:
+            repaired = await PollVoteCrudService(db, tenant_id=None).reconcile_vote_counters(poll_id)
+            await db.commit()
+            return repaired
+
+    repaired = _run_async(run())
+    logger.info("Reconciled poll vote counters", poll_id=poll_id, repaired=repaired)
+    return {"poll_id": poll_id, "repaired": repaired}
@@ -3,6 +3,7 @@ Celery application configuration for background tasks.
 """
 import os
 from celery import Celery
+from celery.schedules import crontab
 from kombu import Queue
 
 # Read configuration from environment
@@ -21,6 +22,8 @@ celery_app = Celery(
         "app.features.tasks.cleanup_tasks",
         "app.features.msp.cspm.tasks",  # CSPM compliance scan tasks
         "app.features.business_automations.content_broadcaster.tasks",
+        "app.features.business_automations.marketing_intellegence_hub.tasks",
+        "app.features.community.tasks",
     ]
 )
 
@@ -32,6 +35,8 @@ celery_app.conf.update(
         "app.features.tasks.data_processing_tasks.*": {"queue": "data_processing"},
         "app.features.tasks.cleanup_tasks.*": {"queue": "cleanup"},
         "app.features.business_automations.content_broadcaster.tasks.*": {"queue": "content_broadcaster"},
+        "app.features.business_automations.marketing_intellegence_hub.tasks.*": {"queue": "data_processing"},
+        "app.features.community.tasks.*": {"queue": "data_processing"},
     },
 
     # Queue definitions
@@ -79,6 +84,23 @@ celery_app.conf.update(
             "task": "app.features.tasks.cleanup_tasks.health_check_task",
             "schedule": 300.0,  # Run every 5 minutes
         },
+        "ga4-fleet-sync": {
+            "task": "app.features.business_automations.marketing_intellegence_hub.tasks.sync_ga4_fleet_task",
+            # Fixed UTC hours (default every 6 hours from midnight) so runs don't drift with restarts
+            "schedule": crontab(minute=0, hour=os.getenv("GA4_FLEET_SYNC_CRON_HOURS", "0,6,12,18")),
+        },
+        "ga4-anomaly-detection": {
+            "task": "app.features.business_automations.marketing_intellegence_hub.tasks.detect_ga4_anomalies_task",
+            # Daily, after the midnight fleet sync has landed yesterday's data (sync time limit is 1 hour)
+            "schedule": crontab(
+                minute=os.getenv("GA4_ANOMALY_CRON_MINUTE", "30"),
+                hour=os.getenv("GA4_ANOMALY_CRON_HOUR", "1"),
+            ),
+        },
+        "community-poll-counter-reconcile": {
+            "task": "app.features.community.tasks.reconcile_poll_vote_counters_task",
+            "schedule": float(os.getenv("COMMUNITY_POLL_RECONCILE_INTERVAL_SECONDS", "3600")),  # Default hourly
+        },
     },
 )
 
@@ -0,0 +1,201 @@
+"""
+Resumable event logs for Server-Sent Events.
+
+Producers append events to a short per-key log with monotonically
+increasing ids; an SSE endpoint blocks on the log and relays what it
+reads, so a client that reconnects with ``Last-Event-ID`` resumes where
+it left off instead of polling the database.
+
+``RedisEventLog`` keeps one capped Redis stream per key, so events cross
+processes (Celery workers, every uvicorn worker). ``InMemoryEventLog``
+only reaches readers in the publishing process (development, tests).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.features.core.sqlalchemy_imports import get_logger
+
+logger = get_logger(__name__)
+
+# Events kept per key for Last-Event-ID resumption
+MAX_EVENTS_PER_KEY = 200
+# Logs outlive any task that writes to them
+STREAM_TTL_SECONDS = 86400
+# Client reconnect delay advertised to EventSource
+RECONNECT_MILLISECONDS = 3000
+
+INITIAL_EVENT_ID = "0-0"
+HEARTBEAT_MESSAGE = ": heartbeat\n\n"
+
+
+@dataclass
+class StreamEvent:
+    """One published event."""
+
+    id: str
+    event: str
+    data: Dict[str, Any]
+
+
+def event_id_key(event_id: str) -> Tuple[int, int]:
+    """Sortable form of a ``<ms>-<seq>`` event id (malformed ids sort first)."""
+    try:
+        first, _, second = event_id.partition("-")
+        return int(first), int(second or 0)
+    except (AttributeError, ValueError):
+        return (0, 0)
+
+
+def format_sse(event: str, data: Dict[str, Any], event_id: Optional[str] = None) -> str:
+    """One SSE message (``id`` is omitted when there is nothing to resume from)."""
+    prefix = f"id: {event_id}\n" if event_id else ""
+    return f"{prefix}event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def retry_message(milliseconds: int = RECONNECT_MILLISECONDS) -> str:
+    """The ``retry`` directive a stream opens with."""
+    return f"retry: {milliseconds}\n\n"
+
+
+class EventLog(ABC):
+    """Per-key append-only event log with blocking reads."""
+
+    @abstractmethod
+    async def publish(self, key: str, event: str, data: Dict[str, Any]) -> Optional[str]:
+        """Append an event; returns its id (None if it could not be published)."""
+
+    @abstractmethod
+    async def latest_id(self, key: str) -> str:
+        """Id of the newest event, or INITIAL_EVENT_ID when there is none."""
+
+    @abstractmethod
+    async def read(self, key: str, after_id: str, timeout: float) -> List[StreamEvent]:
+        """Events newer than ``after_id``, waiting up to ``timeout`` seconds for one."""
+
+
+class InMemoryEventLog(EventLog):
+    """Per-process log (development, tests, single-process deployments)."""
+
+    def __init__(self, max_events: int = MAX_EVENTS_PER_KEY):
+        self.max_events = max_events
+        self._events: Dict[str, Deque[StreamEvent]] = {}
+        self._sequence = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._condition_loop = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Celery tasks run each asyncio.run() on a new loop; conditions are loop-bound.
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._condition_loop is not loop:
+            self._condition = asyncio.Condition()
+            self._condition_loop = loop
+        return self._condition
+
+    def _after(self, key: str, after_id: str) -> List[StreamEvent]:
+        after = event_id_key(after_id)
+        return [event for event in self._events.get(key, ()) if event_id_key(event.id) > after]
+
+    async def publish(self, key, event, data):
+        self._sequence += 1
+        event_id = f"{self._sequence}-0"
+        log = self._events.setdefault(key, deque(maxlen=self.max_events))
+        log.append(StreamEvent(event_id, event, data))
+        condition = self._get_condition()
+        async with condition:
+            condition.notify_all()
+        return event_id
+
+    async def latest_id(self, key):
+        log = self._events.get(key)
+        return log[-1].id if log else INITIAL_EVENT_ID
+
+    async def read(self, key, after_id, timeout):
+        condition = self._get_condition()
+        async with condition:
+            try:
+                await asyncio.wait_for(
+                    condition.wait_for(lambda: bool(self._after(key, after_id))),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                return []
+        return self._after(key, after_id)
+
+
+class RedisEventLog(EventLog):
+    """
+    Log shared through Redis streams (one capped stream per key).
+
+    Redis errors fail soft: publishes are dropped with an error log and
+    reads behave like an idle stream, so pages fall back to their next
+    reload instead of the producer failing.
+    """
+
+    def __init__(self, key_prefix: str, max_events: int = MAX_EVENTS_PER_KEY, redis_url: Optional[str] = None):
+        self.key_prefix = key_prefix
+        self.max_events = max_events
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        self._redis = None
+
+    async def _get_redis(self):
+        """Lazy initialization of Redis connection."""
+        if self._redis is None:
+            import redis.asyncio as redis
+            self._redis = redis.from_url(self.redis_url, decode_responses=True)
+        return self._redis
+
+    def _stream_key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    async def publish(self, key, event, data):
+        try:
+            client = await self._get_redis()
+            stream_key = self._stream_key(key)
+            pipe = client.pipeline(transaction=False)
+            pipe.xadd(
+                stream_key,
+                {"event": event, "data": json.dumps(data, default=str)},
+                maxlen=self.max_events,
+                approximate=True,
+            )
+            pipe.expire(stream_key, STREAM_TTL_SECONDS)
+            results = await pipe.execute()
+            return results[0]
+        except Exception as e:
+            logger.error("Event stream publish failed", stream=self._stream_key(key), event=event, error=str(e))
+            return None
+
+    async def latest_id(self, key):
+        try:
+            client = await self._get_redis()
+            entries = await client.xrevrange(self._stream_key(key), count=1)
+            return entries[0][0] if entries else INITIAL_EVENT_ID
+        except Exception as e:
+            logger.error("Event stream lookup failed", stream=self._stream_key(key), error=str(e))
+            return INITIAL_EVENT_ID
+
+    async def read(self, key, after_id, timeout):
+        try:
+            client = await self._get_redis()
+            response = await client.xread(
+                {self._stream_key(key): after_id},
+                count=self.max_events,
+                block=max(int(timeout * 1000), 1),
+            )
+        except Exception as e:
+            logger.error("Event stream read failed", stream=self._stream_key(key), error=str(e))
+            await asyncio.sleep(timeout)
+            return []
+        events = []
+        for _, entries in response or []:
+            for event_id, fields in entries:
+                events.append(StreamEvent(event_id, fields.get("event", "message"), json.loads(fields.get("data") or "{}")))
+        return events
@@ -0,0 +1,156 @@
+"""
+Postgres full-text search shared by feature services.
+
+Searchable tables carry a generated ``search_vector`` tsvector column (built
+with ``search_vector_column``) behind a GIN index, and pg_trgm GIN indexes on
+their short name/title columns. Services match with ``search_match``, order
+with ``search_rank`` and, for typed results across several tables, run one
+``UNION ALL`` query through ``core.search_service.FullTextSearchService``.
+
+Models import this module, so it must not import services.
+"""
+
+from __future__ import annotations
+
+import html
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import Column, Computed, Index, cast, literal
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.features.core.sqlalchemy_imports import func, or_
+
+# Every vector and query uses the same configuration so one tsquery can be
+# matched against any searchable table.
+SEARCH_CONFIG = "english"
+
+# ts_headline wraps matches in these; highlight_html turns them into <mark>
+# after escaping the surrounding text.
+_HIGHLIGHT_START = "\x02"
+_HIGHLIGHT_STOP = "\x03"
+HEADLINE_OPTIONS = (
+    f'StartSel="{_HIGHLIGHT_START}", StopSel="{_HIGHLIGHT_STOP}", '
+    "MaxFragments=2, MaxWords=24, MinWords=8, FragmentDelimiter=\" … \""
+)
+
+
+def tsvector_sql(*weighted_columns: Tuple[str, str]) -> str:
+    """SQL for a weighted tsvector over ``(column, weight)`` pairs.
+
+    Used as the generated-column expression, so the migrations repeat the
+    exact string this returns.
+    """
+    parts = [
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted_columns
+    ]
+    return " || ".join(parts)
+
+
+def search_vector_column(*weighted_columns: Tuple[str, str]) -> Column:
+    """Stored generated ``search_vector`` column over the given columns."""
+    return Column(
+        "search_vector",
+        TSVECTOR,
+        Computed(tsvector_sql(*weighted_columns), persisted=True),
+        nullable=True,
+    )
+
+
+def search_vector_index(name: str) -> Index:
+    """GIN index over a table's ``search_vector``."""
+    return Index(name, "search_vector", postgresql_using="gin")
+
+
+def trigram_index(name: str, column: str) -> Index:
+    """pg_trgm GIN index for substring and fuzzy lookups on one column."""
+    return Index(name, column, postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"})
+
+
+def ts_query(term: str) -> ColumnElement:
+    """Parse user input the way web search boxes do (quotes, OR, -word)."""
+    return func.websearch_to_tsquery(cast(literal(SEARCH_CONFIG), REGCONFIG), term)
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("/", "//").replace("%", "/%").replace("_", "/_")
+    return f"%{escaped}%"
+
+
+def search_match(vector, term: str, fuzzy_columns: Sequence[Any] = ()) -> ColumnElement:
+    """Rows whose vector matches ``term`` or whose name columns resemble it.
+
+    The fuzzy columns keep substring lookups on names and e-mails working
+    (and catch typos); their trigram indexes serve both operators.
+    """
+    clauses = [vector.op("@@")(ts_query(term))]
+    for column in fuzzy_columns:
+        clauses.append(column.ilike(_like_pattern(term), escape="/"))
+        clauses.append(column.op("%")(term))
+    return or_(*clauses)
+
+
+def search_rank(vector, term: str, fuzzy_columns: Sequence[Any] = ()) -> ColumnElement:
+    """Relevance score: cover density of the text match or name similarity."""
+    rank = func.ts_rank_cd(vector, ts_query(term))
+    if fuzzy_columns:
+        rank = func.greatest(rank, *(func.similarity(column, term) for column in fuzzy_columns))
+    return rank
+
+
+def search_headline(document, term: str) -> ColumnElement:
+    """Highlighted excerpt of ``document``; render it with ``highlight_html``."""
+    return func.ts_headline(
+        cast(literal(SEARCH_CONFIG), REGCONFIG), document, ts_query(term), HEADLINE_OPTIONS
+    )
+
+
+def highlight_html(snippet: Optional[str]) -> str:
+    """Escape a ``search_headline`` excerpt and mark its matches."""
+    if not snippet:
+        return ""
+    return (
+        html.escape(snippet)
+        .replace(_HIGHLIGHT_START, "<mark>")
+        .replace(_HIGHLIGHT_STOP, "</mark>")
+    )
+
+
+@dataclass(frozen=True)
+class SearchTarget:
+    """One searchable table as it appears in mixed-type search results."""
+
+    kind: str
+    model: Any
+    title: Any
+    document: Any
+    sort_date: Any
+    fuzzy_columns: Tuple[Any, ...] = ()
+    # Hub-wide tables are visible to every tenant
+    tenant_scoped: bool = True
+    filters: Tuple[Any, ...] = ()
+
+
+@dataclass
+class SearchHit:
+    """A typed search result with an HTML-safe highlighted snippet."""
+
+    kind: str
+    id: str
+    title: str
+    snippet: str
+    rank: float
+    date: Optional[datetime]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "id": self.id,
+            "title": self.title,
+            "snippet": self.snippet,
+            "rank": self.rank,
+            "date": self.date.isoformat() if self.date else None,
+        }
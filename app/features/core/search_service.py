@@ -0,0 +1,96 @@
+"""Typed, ranked search across several full-text indexed tables."""
+
+from __future__ import annotations
+
+from typing import Any, List, Sequence
+
+from sqlalchemy import DateTime, String, Text, literal, union_all
+
+from app.features.core.sqlalchemy_imports import cast, func, select
+from app.features.core.enhanced_base_service import BaseService
+from app.features.core.full_text_search import (
+    SearchHit,
+    SearchTarget,
+    highlight_html,
+    search_headline,
+    search_match,
+    search_rank,
+)
+
+DEFAULT_RESULTS_PER_KIND = 5
+
+
+class FullTextSearchService(BaseService[Any]):
+    """Ranked, highlighted search across several tables in one query."""
+
+    def _target_select(self, target: SearchTarget, term: str):
+        model = target.model
+        stmt = select(
+            literal(target.kind, String).label("kind"),
+            cast(model.id, String).label("id"),
+            cast(target.title, String).label("title"),
+            cast(target.document, Text).label("document"),
+            cast(target.sort_date, DateTime(timezone=True)).label("sort_date"),
+            search_rank(model.search_vector, term, target.fuzzy_columns).label("rank"),
+        ).where(search_match(model.search_vector, term, target.fuzzy_columns), *target.filters)
+        if target.tenant_scoped and self.tenant_id is not None:
+            stmt = stmt.where(model.tenant_id == self.tenant_id)
+        return stmt
+
+    def build_search_query(
+        self,
+        targets: Sequence[SearchTarget],
+        term: str,
+        per_kind: int = DEFAULT_RESULTS_PER_KIND,
+    ):
+        """Top ``per_kind`` matches of every target, best first.
+
+        Headlines are computed in the outer query so ts_headline only runs
+        on the rows that are returned.
+        """
+        matches = union_all(*(self._target_select(target, term) for target in targets)).subquery("matches")
+        ranked = select(
+            matches,
+            func.row_number().over(
+                partition_by=matches.c.kind,
+                order_by=(matches.c.rank.desc(), matches.c.sort_date.desc().nullslast()),
+            ).label("kind_rank"),
+        ).subquery("ranked")
+        return (
+            select(
+                ranked.c.kind,
+                ranked.c.id,
+                ranked.c.title,
+                search_headline(ranked.c.document, term).label("snippet"),
+                ranked.c.rank,
+                ranked.c.sort_date,
+            )
+            .where(ranked.c.kind_rank <= per_kind)
+            .order_by(ranked.c.rank.desc(), ranked.c.sort_date.desc().nullslast(), ranked.c.id)
+        )
+
+    async def search(
+        self,
+        targets: Sequence[SearchTarget],
+        term: str,
+        per_kind: int = DEFAULT_RESULTS_PER_KIND,
+    ) -> List[SearchHit]:
+        """Run ``build_search_query``; blank terms return no hits."""
+        term = (term or "").strip()
+        if not term or not targets:
+            return []
+        try:
+            result = await self.db.execute(self.build_search_query(targets, term, per_kind))
+            return [
+                SearchHit(
+                    kind=row.kind,
+                    id=row.id,
+                    title=row.title,
+                    snippet=highlight_html(row.snippet),
+                    rank=float(row.rank or 0),
+                    date=row.sort_date,
+                )
+                for row in result.all()
+            ]
+        except Exception as exc:
+            await self.handle_error("search", exc)
@@ -2,7 +2,7 @@
 Task manager utilities for background task execution.
 """
 import structlog
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from celery.result import AsyncResult
 from app.features.core.celery_app import celery_app
 
@@ -188,5 +188,21 @@ def process_content_plan_async(
     )
 
 
+def process_content_plan_batch_async(
+    batch_id: str,
+    plan_ids: List[str],
+    tenant_id: str,
+    triggered_by: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Process a batch of Content Broadcaster plans via Celery."""
+    return TaskManager.start_task(
+        "app.features.business_automations.content_broadcaster.tasks.process_content_plan_batch_task",
+        batch_id,
+        plan_ids,
+        tenant_id,
+        triggered_by or {},
+    )
+
+
 # Global task manager instance
 task_manager = TaskManager()
@@ -23,6 +23,7 @@ from .features.core.database import engine, Base, get_db
 from .features.core.templates import templates
 from .features.core.secrets_manager import get_secrets_manager
 from .features.core.bootstrap import global_admin_bootstrap
+from .features.community.services.content.engagement.ingest import close_engagement_buffer
 from .features.auth.routes import router as auth_router
 from .features.core.log_viewer import router as log_viewer_router
 from .features.administration.logs.routes import router as admin_logs_router
@@ -84,6 +85,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Shutdown logic
     logging.info("Shutting down FastAPI application")
 
+    # Write engagement events still waiting in the ingest buffer
+    await close_engagement_buffer()
+
 
 app = FastAPI(
     title="TerraAutomationPlatform",
@@ -0,0 +1,64 @@
+"""Store rendered article HTML with the hash of its markdown source.
+
+Revision ID: community_article_html
+Revises: community_engagement_rollups
+Create Date: 2026-10-18
+"""
+
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import markdown
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "community_article_html"
+down_revision: Union[str, Sequence[str], None] = "community_engagement_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same extensions as ARTICLE_MARKDOWN_EXTENSIONS in
+# app/features/community/services/content/articles/rendering.py
+MARKDOWN_EXTENSIONS = ["extra", "sane_lists"]
+BACKFILL_BATCH_SIZE = 200
+
+
+def _render(body: str) -> str:
+    # Mirrors render_article_html(): bodies that already contain HTML are kept
+    if "<" in body:
+        return body
+    return markdown.markdown(body, extensions=MARKDOWN_EXTENSIONS)
+
+
+def upgrade() -> None:
+    """Add body_html/body_hash and render every existing article once."""
+    op.add_column("community_content", sa.Column("body_html", sa.Text(), nullable=True))
+    op.add_column("community_content", sa.Column("body_hash", sa.String(length=64), nullable=True))
+
+    conn = op.get_bind()
+    select_batch = sa.text(
+        "SELECT id, body_md FROM community_content WHERE body_hash IS NULL ORDER BY id LIMIT :limit"
+    )
+    update_row = sa.text("UPDATE community_content SET body_html = :body_html, body_hash = :body_hash WHERE id = :id")
+    while True:
+        rows = conn.execute(select_batch, {"limit": BACKFILL_BATCH_SIZE}).all()
+        if not rows:
+            break
+        conn.execute(
+            update_row,
+            [
+                {
+                    "id": row.id,
+                    "body_html": _render(row.body_md or ""),
+                    "body_hash": hashlib.sha256((row.body_md or "").encode()).hexdigest(),
+                }
+                for row in rows
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Drop the rendered HTML columns."""
+    op.drop_column("community_content", "body_hash")
+    op.drop_column("community_content", "body_html")
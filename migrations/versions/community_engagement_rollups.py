@@ -0,0 +1,120 @@
+"""Add engagement rollup counters and per-day member sketches.
+
+Revision ID: community_engagement_rollups
+Revises: community_search_vectors
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "community_engagement_rollups"
+down_revision: Union[str, Sequence[str], None] = "community_search_vectors"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same values as ENGAGEMENT_ALL_TIME in app/features/community/models.py and
+# SKETCH_PRECISION in services/content/engagement/sketch.py
+ALL_TIME = "0001-01-01"
+SKETCH_PRECISION = 11
+
+
+def _sketch_backfill(day_expression: str) -> str:
+    """
+    Build HyperLogLog registers in SQL, hashing like MemberSketch.add():
+    the top SKETCH_PRECISION bits of md5(member_id)[:8] pick the register,
+    the position of the first set bit in the rest is its rank.
+    """
+    registers = 1 << SKETCH_PRECISION
+    empty_rank = 64 - SKETCH_PRECISION + 1
+    return f"""
+        WITH members AS (
+            SELECT DISTINCT tenant_id, {day_expression} AS day,
+                   ('x' || substr(md5(member_id), 1, 16))::bit(64) AS hash
+            FROM community_content_engagement
+            WHERE member_id IS NOT NULL
+        ),
+        ranks AS (
+            SELECT tenant_id, day,
+                   substring(hash FROM 1 FOR {SKETCH_PRECISION})::bit({SKETCH_PRECISION})::integer AS register,
+                   max(coalesce(nullif(position(B'1' IN substring(hash FROM {SKETCH_PRECISION + 1})), 0),
+                                {empty_rank})) AS rank
+            FROM members
+            GROUP BY tenant_id, day, register
+        )
+        INSERT INTO community_engagement_member_sketches (tenant_id, day, registers)
+        SELECT keys.tenant_id, keys.day,
+               decode(string_agg(lpad(to_hex(coalesce(ranks.rank, 0)), 2, '0'), '' ORDER BY slot.register), 'hex')
+        FROM (SELECT DISTINCT tenant_id, day FROM ranks) AS keys
+        CROSS JOIN generate_series(0, {registers - 1}) AS slot(register)
+        LEFT JOIN ranks
+          ON ranks.tenant_id = keys.tenant_id AND ranks.day = keys.day AND ranks.register = slot.register
+        GROUP BY keys.tenant_id, keys.day
+    """
+
+
+def upgrade() -> None:
+    """Create the rollup tables and backfill them from the engagement log."""
+    op.create_table(
+        "community_engagement_counters",
+        sa.Column("tenant_id", sa.String(length=64), nullable=False),
+        sa.Column("content_id", sa.String(length=36), nullable=False),
+        sa.Column("action", sa.String(length=64), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.Column("last_occurred_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["content_id"], ["community_content.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tenant_id", "content_id", "action"),
+    )
+    op.create_index(
+        "ix_community_engagement_counters_content", "community_engagement_counters", ["content_id"]
+    )
+    op.create_table(
+        "community_engagement_daily",
+        sa.Column("tenant_id", sa.String(length=64), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("action", sa.String(length=64), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("tenant_id", "day", "action"),
+    )
+    op.create_table(
+        "community_engagement_member_sketches",
+        sa.Column("tenant_id", sa.String(length=64), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("registers", sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint("tenant_id", "day"),
+    )
+
+    utc_day = "(occurred_at AT TIME ZONE 'UTC')::date"
+    op.execute(
+        """
+        INSERT INTO community_engagement_counters (tenant_id, content_id, action, count, last_occurred_at)
+        SELECT tenant_id, content_id, action, count(*), max(occurred_at)
+        FROM community_content_engagement
+        GROUP BY tenant_id, content_id, action
+        """
+    )
+    op.execute(
+        f"""
+        INSERT INTO community_engagement_daily (tenant_id, day, action, count)
+        SELECT tenant_id, {utc_day}, action, count(*)
+        FROM community_content_engagement
+        GROUP BY tenant_id, {utc_day}, action
+        UNION ALL
+        SELECT tenant_id, DATE '{ALL_TIME}', action, count(*)
+        FROM community_content_engagement
+        GROUP BY tenant_id, action
+        """
+    )
+    op.execute(_sketch_backfill(utc_day))
+    op.execute(_sketch_backfill(f"DATE '{ALL_TIME}'"))
+
+
+def downgrade() -> None:
+    """Drop the rollup tables (the engagement log is untouched)."""
+    op.drop_table("community_engagement_member_sketches")
+    op.drop_table("community_engagement_daily")
+    op.drop_index("ix_community_engagement_counters_content", table_name="community_engagement_counters")
+    op.drop_table("community_engagement_counters")
@@ -0,0 +1,28 @@
+"""Add keyset indexes for the group discussion feed.
+
+Revision ID: community_group_feed_indexes
+Revises: sales_company_name_key
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "community_group_feed_indexes"
+down_revision: Union[str, Sequence[str], None] = "sales_company_name_key"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index posts by (group, created_at, id) and comments by (post, created_at, id)."""
+    op.create_index("ix_group_posts_group_feed", "group_posts", ["group_id", "created_at", "id"])
+    op.create_index("ix_group_comments_post_created", "group_comments", ["post_id", "created_at", "id"])
+
+
+def downgrade() -> None:
+    """Drop the feed indexes."""
+    op.drop_index("ix_group_comments_post_created", table_name="group_comments")
+    op.drop_index("ix_group_posts_group_feed", table_name="group_posts")
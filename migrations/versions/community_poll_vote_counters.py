@@ -0,0 +1,46 @@
+"""Add sharded per-option poll vote counters.
+
+Revision ID: community_poll_vote_counters
+Revises: community_article_html
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "community_poll_vote_counters"
+down_revision: Union[str, Sequence[str], None] = "community_article_html"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the counter table and backfill it (into shard 0) from existing votes."""
+    op.create_table(
+        "poll_vote_counters",
+        sa.Column("option_id", sa.String(length=36), nullable=False),
+        sa.Column("shard", sa.Integer(), nullable=False),
+        sa.Column("poll_id", sa.String(length=36), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["option_id"], ["poll_options.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["poll_id"], ["polls.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("option_id", "shard"),
+    )
+    op.create_index("ix_poll_vote_counters_poll_id", "poll_vote_counters", ["poll_id"])
+    op.execute(
+        """
+        INSERT INTO poll_vote_counters (option_id, shard, poll_id, count)
+        SELECT option_id, 0, poll_id, count(*)
+        FROM poll_votes
+        GROUP BY option_id, poll_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop the counters (votes are untouched)."""
+    op.drop_index("ix_poll_vote_counters_poll_id", table_name="poll_vote_counters")
+    op.drop_table("poll_vote_counters")
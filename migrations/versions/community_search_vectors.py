@@ -0,0 +1,132 @@
+"""Add full-text search vectors and trigram indexes to searchable tables.
+
+Revision ID: community_search_vectors
+Revises: community_thread_index
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "community_search_vectors"
+down_revision: Union[str, Sequence[str], None] = "community_thread_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same configuration as SEARCH_CONFIG in app/features/core/full_text_search.py
+SEARCH_CONFIG = "english"
+
+# (table, search vector index, weighted columns, {trigram index: column})
+SEARCHABLE_TABLES = (
+    (
+        "members",
+        "ix_members_search_vector",
+        (("name", "A"), ("email", "A"), ("location", "B"), ("bio", "C")),
+        {"ix_members_name_trgm": "name", "ix_members_email_trgm": "email"},
+    ),
+    (
+        "partners",
+        "ix_partners_search_vector",
+        (("name", "A"), ("category", "B"), ("offer", "B"), ("description", "C")),
+        {"ix_partners_name_trgm": "name"},
+    ),
+    (
+        "groups",
+        "ix_groups_search_vector",
+        (("name", "A"), ("description", "B")),
+        {"ix_groups_name_trgm": "name"},
+    ),
+    (
+        "events",
+        "ix_events_search_vector",
+        (("title", "A"), ("category", "B"), ("location", "B"), ("description", "C")),
+        {"ix_events_title_trgm": "title"},
+    ),
+    (
+        "community_content",
+        "ix_community_content_search_vector",
+        (("title", "A"), ("category", "B"), ("body_md", "C")),
+        {"ix_community_content_title_trgm": "title"},
+    ),
+    (
+        "community_podcasts",
+        "ix_community_podcasts_search_vector",
+        (("title", "A"), ("host", "B"), ("description", "C")),
+        {"ix_community_podcasts_title_trgm": "title"},
+    ),
+    (
+        "community_videos",
+        "ix_community_videos_search_vector",
+        (("title", "A"), ("category", "B"), ("description", "C")),
+        {"ix_community_videos_title_trgm": "title"},
+    ),
+    (
+        "community_news",
+        "ix_community_news_search_vector",
+        (("headline", "A"), ("source", "B"), ("category", "B"), ("summary", "C")),
+        {"ix_community_news_headline_trgm": "headline"},
+    ),
+    (
+        "audit_logs",
+        "idx_audit_search_vector",
+        (("action", "A"), ("resource_type", "B"), ("description", "C")),
+        {"idx_audit_action_trgm": "action"},
+    ),
+    (
+        "content_plans",
+        "idx_content_plans_search_vector",
+        (("title", "A"), ("description", "B")),
+        {"idx_content_plans_title_trgm": "title"},
+    ),
+    (
+        "content_items",
+        "idx_content_items_search_vector",
+        (("title", "A"), ("body", "B")),
+        {"idx_content_items_title_trgm": "title"},
+    ),
+)
+
+
+def _tsvector_sql(weighted_columns) -> str:
+    # Same expression as tsvector_sql() in app/features/core/full_text_search.py
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted_columns
+    )
+
+
+def upgrade() -> None:
+    """Add generated search_vector columns with GIN indexes, plus trigram name indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, vector_index, weighted_columns, trigram_indexes in SEARCHABLE_TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(_tsvector_sql(weighted_columns), persisted=True),
+                nullable=True,
+            ),
+        )
+        op.create_index(vector_index, table, ["search_vector"], postgresql_using="gin")
+        for index_name, column in trigram_indexes.items():
+            op.create_index(
+                index_name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            )
+
+
+def downgrade() -> None:
+    """Drop the search columns and their indexes (pg_trgm stays installed)."""
+    for table, vector_index, _weighted_columns, trigram_indexes in reversed(SEARCHABLE_TABLES):
+        for index_name in trigram_indexes:
+            op.drop_index(index_name, table_name=table)
+        op.drop_index(vector_index, table_name=table)
+        op.drop_column(table, "search_vector")
@@ -0,0 +1,81 @@
+"""Add a denormalized thread index for direct message inboxes.
+
+Revision ID: community_thread_index
+Revises: community_group_feed_indexes
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "community_thread_index"
+down_revision: Union[str, Sequence[str], None] = "community_group_feed_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add last-message and read-marker columns, backfill them, index inbox recency."""
+    op.add_column("threads", sa.Column("last_message_id", sa.String(length=36), nullable=True))
+    op.add_column("threads", sa.Column("last_message_at", sa.DateTime(timezone=True), nullable=True))
+    op.add_column(
+        "thread_participants",
+        sa.Column("last_message_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "thread_participants",
+        sa.Column("last_read_message_id", sa.String(length=36), nullable=True),
+    )
+    op.add_column(
+        "thread_participants",
+        sa.Column("last_read_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "thread_participants",
+        sa.Column("unread_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    op.execute(
+        """
+        UPDATE threads
+        SET last_message_id = latest.id, last_message_at = latest.created_at
+        FROM (
+            SELECT DISTINCT ON (thread_id) thread_id, id, created_at
+            FROM messages
+            WHERE thread_id IS NOT NULL
+            ORDER BY thread_id, created_at DESC, id DESC
+        ) AS latest
+        WHERE threads.id = latest.thread_id
+        """
+    )
+    # Existing history starts out read: per-reader read state was never recorded
+    op.execute(
+        """
+        UPDATE thread_participants
+        SET last_message_at = threads.last_message_at,
+            last_read_message_id = threads.last_message_id,
+            last_read_at = threads.last_message_at
+        FROM threads
+        WHERE threads.id = thread_participants.thread_id
+        """
+    )
+
+    op.create_index(
+        "ix_thread_participants_user_recent",
+        "thread_participants",
+        ["user_id", "last_message_at", "thread_id"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the thread index columns."""
+    op.drop_index("ix_thread_participants_user_recent", table_name="thread_participants")
+    op.drop_column("thread_participants", "unread_count")
+    op.drop_column("thread_participants", "last_read_at")
+    op.drop_column("thread_participants", "last_read_message_id")
+    op.drop_column("thread_participants", "last_message_at")
+    op.drop_column("threads", "last_message_at")
+    op.drop_column("threads", "last_message_id")
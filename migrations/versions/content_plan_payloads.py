@@ -0,0 +1,109 @@
+"""Move heavy content plan JSONB payloads to an off-row side table.
+
+Revision ID: content_plan_payloads
+Revises: remove_group_privacy_column
+Create Date: 2026-10-18
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "content_plan_payloads"
+down_revision: Union[str, Sequence[str], None] = "remove_group_privacy_column"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PAYLOAD_COLUMNS = ("research_data", "generation_metadata", "refinement_history")
+
+
+def _use_lz4_compression(conn) -> None:
+    """Switch payload TOAST compression to lz4 (PostgreSQL 14+ built with lz4)."""
+    if conn.dialect.name != "postgresql":
+        return
+    version = int(conn.execute(sa.text("SHOW server_version_num")).scalar())
+    if version < 140000:
+        return
+    try:
+        with conn.begin_nested():
+            for column in PAYLOAD_COLUMNS:
+                conn.execute(sa.text(
+                    f"ALTER TABLE content_plan_payloads ALTER COLUMN {column} SET COMPRESSION lz4"
+                ))
+    except sa.exc.DBAPIError:
+        # Server built without lz4: keep the default pglz compression.
+        pass
+
+
+def upgrade() -> None:
+    """Create content_plan_payloads, backfill it, then drop the inline columns."""
+    op.create_table(
+        "content_plan_payloads",
+        sa.Column(
+            "plan_id",
+            sa.String(length=36),
+            sa.ForeignKey("content_plans.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("tenant_id", sa.String(length=50), nullable=False, server_default="global"),
+        sa.Column("research_data", postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("generation_metadata", postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("refinement_history", postgresql.JSONB(), nullable=False, server_default=sa.text("'[]'::jsonb")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+    )
+    op.create_index("ix_content_plan_payloads_tenant_id", "content_plan_payloads", ["tenant_id"])
+    _use_lz4_compression(op.get_bind())
+
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    columns = {col["name"] for col in inspector.get_columns("content_plans")}
+    if set(PAYLOAD_COLUMNS) <= columns:
+        op.execute(
+            """
+            INSERT INTO content_plan_payloads (plan_id, tenant_id, research_data, generation_metadata, refinement_history)
+            SELECT id,
+                   tenant_id,
+                   COALESCE(research_data, '{}'::jsonb),
+                   COALESCE(generation_metadata, '{}'::jsonb),
+                   COALESCE(refinement_history, '[]'::jsonb)
+            FROM content_plans
+            ON CONFLICT (plan_id) DO NOTHING
+            """
+        )
+    else:
+        op.execute(
+            """
+            INSERT INTO content_plan_payloads (plan_id, tenant_id)
+            SELECT id, tenant_id FROM content_plans
+            ON CONFLICT (plan_id) DO NOTHING
+            """
+        )
+
+    with op.batch_alter_table("content_plans") as batch_op:
+        for column in PAYLOAD_COLUMNS:
+            if column in columns:
+                batch_op.drop_column(column)
+
+
+def downgrade() -> None:
+    """Restore the inline columns from the side table and drop it."""
+    with op.batch_alter_table("content_plans") as batch_op:
+        batch_op.add_column(sa.Column("research_data", postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")))
+        batch_op.add_column(sa.Column("generation_metadata", postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")))
+        batch_op.add_column(sa.Column("refinement_history", postgresql.JSONB(), nullable=False, server_default=sa.text("'[]'::jsonb")))
+
+    op.execute(
+        """
+        UPDATE content_plans AS plans
+        SET research_data = payloads.research_data,
+            generation_metadata = payloads.generation_metadata,
+            refinement_history = payloads.refinement_history
+        FROM content_plan_payloads AS payloads
+        WHERE payloads.plan_id = plans.id
+        """
+    )
+
+    op.drop_index("ix_content_plan_payloads_tenant_id", table_name="content_plan_payloads")
+    op.drop_table("content_plan_payloads")
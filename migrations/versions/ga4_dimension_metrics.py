@@ -0,0 +1,59 @@
+"""Add GA4 per-dimension daily fact table.
+
+Revision ID: ga4_dimension_metrics
+Revises: content_plan_payloads
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "ga4_dimension_metrics"
+down_revision: Union[str, Sequence[str], None] = "content_plan_payloads"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ga4_dimension_metrics with a BRIN date index."""
+    op.create_table(
+        "ga4_dimension_metrics",
+        sa.Column("tenant_id", sa.String(length=64), nullable=False),
+        sa.Column(
+            "connection_id",
+            sa.String(length=36),
+            sa.ForeignKey("ga4_connections.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("dimension", sa.String(length=32), nullable=False),
+        sa.Column("dimension_value", sa.String(length=255), nullable=False),
+        sa.Column("sessions", sa.Numeric(18, 2), nullable=True),
+        sa.Column("users", sa.Numeric(18, 2), nullable=True),
+        sa.Column("new_users", sa.Numeric(18, 2), nullable=True),
+        sa.Column("conversions", sa.Numeric(18, 2), nullable=True),
+        sa.Column("engaged_sessions", sa.Numeric(18, 2), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.text("now()"), nullable=True),
+        sa.PrimaryKeyConstraint("tenant_id", "connection_id", "date", "dimension", "dimension_value"),
+    )
+    op.create_index(
+        "ix_ga4_dimension_metrics_date_brin",
+        "ga4_dimension_metrics",
+        ["date"],
+        postgresql_using="brin",
+    )
+    op.create_index(
+        "ix_ga4_dimension_metrics_tenant_dimension_date",
+        "ga4_dimension_metrics",
+        ["tenant_id", "dimension", "date"],
+    )
+
+
+def downgrade() -> None:
+    """Drop ga4_dimension_metrics."""
+    op.drop_index("ix_ga4_dimension_metrics_tenant_dimension_date", table_name="ga4_dimension_metrics")
+    op.drop_index("ix_ga4_dimension_metrics_date_brin", table_name="ga4_dimension_metrics")
+    op.drop_table("ga4_dimension_metrics")
@@ -0,0 +1,36 @@
+"""Add ranking fields to GA4 insights for anomaly detection.
+
+Revision ID: ga4_insight_anomaly_fields
+Revises: ga4_dimension_metrics
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "ga4_insight_anomaly_fields"
+down_revision: Union[str, Sequence[str], None] = "ga4_dimension_metrics"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add score/details columns and a ranking index."""
+    op.add_column("ga4_insights", sa.Column("score", sa.Numeric(10, 4), nullable=True))
+    op.add_column("ga4_insights", sa.Column("details", postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.create_index(
+        "ix_ga4_insights_tenant_type_score",
+        "ga4_insights",
+        ["tenant_id", "summary_type", "score"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the ranking index and columns."""
+    op.drop_index("ix_ga4_insights_tenant_type_score", table_name="ga4_insights")
+    op.drop_column("ga4_insights", "details")
+    op.drop_column("ga4_insights", "score")
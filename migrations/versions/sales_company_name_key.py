@@ -0,0 +1,75 @@
+"""Add normalized name/domain keys and a trigram index to sales companies.
+
+Revision ID: sales_company_name_key
+Revises: sales_prospect_dedupe_key
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "sales_company_name_key"
+down_revision: Union[str, Sequence[str], None] = "sales_prospect_dedupe_key"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same list as LEGAL_SUFFIXES in utils/entity_resolution.py
+LEGAL_SUFFIXES = (
+    "inc", "incorporated", "llc", "llp", "lp", "ltd", "limited", "corp",
+    "corporation", "co", "company", "plc", "gmbh", "ag", "sa", "bv", "nv",
+    "pty", "pc", "group", "holdings",
+)
+
+
+def upgrade() -> None:
+    """Add name_key and domain_key, backfill both from name/domain and index them for matching."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column("sales_companies", sa.Column("name_key", sa.String(length=255), nullable=True))
+    op.add_column("sales_companies", sa.Column("domain_key", sa.String(length=255), nullable=True))
+
+    # Same normalization as normalize_company_name() in utils/entity_resolution.py
+    suffixes = "|".join(LEGAL_SUFFIXES)
+    op.execute(
+        f"""
+        UPDATE sales_companies
+        SET name_key = trim(regexp_replace(
+            trim(regexp_replace(replace(lower(name), '&', ' and '), '[^a-z0-9]+', ' ', 'g')),
+            '( ({suffixes}))+$', ''
+        ))
+        """
+    )
+    # Same normalization as normalize_domain(): bare lowercase host (domain itself is left as entered)
+    op.execute(
+        r"""
+        UPDATE sales_companies
+        SET domain_key = NULLIF(rtrim(regexp_replace(
+            split_part(split_part(split_part(split_part(
+                regexp_replace(lower(trim(domain)), '^[a-z]+://', ''),
+                '/', 1), '?', 1), '#', 1), ':', 1),
+            '^www[0-9]*\.', ''
+        ), '.'), '')
+        WHERE domain IS NOT NULL
+        """
+    )
+
+    op.create_index("idx_companies_tenant_name_key", "sales_companies", ["tenant_id", "name_key"])
+    op.create_index("idx_companies_tenant_domain_key", "sales_companies", ["tenant_id", "domain_key"])
+    op.create_index(
+        "idx_companies_name_key_trgm",
+        "sales_companies",
+        ["name_key"],
+        postgresql_using="gin",
+        postgresql_ops={"name_key": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Drop the name/domain keys and their indexes."""
+    op.drop_index("idx_companies_name_key_trgm", table_name="sales_companies")
+    op.drop_index("idx_companies_tenant_domain_key", table_name="sales_companies")
+    op.drop_index("idx_companies_tenant_name_key", table_name="sales_companies")
+    op.drop_column("sales_companies", "domain_key")
+    op.drop_column("sales_companies", "name_key")
@@ -0,0 +1,71 @@
+"""Add per-campaign de-duplication key to sales prospects.
+
+Revision ID: sales_prospect_dedupe_key
+Revises: ga4_insight_anomaly_fields
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "sales_prospect_dedupe_key"
+down_revision: Union[str, Sequence[str], None] = "ga4_insight_anomaly_fields"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add dedupe_key, backfill it and enforce uniqueness per campaign."""
+    op.add_column("sales_prospects", sa.Column("dedupe_key", sa.String(length=64), nullable=True))
+
+    # Same normalization as prospect_dedupe_key() in the prospect CRUD service.
+    op.execute(
+        r"""
+        UPDATE sales_prospects
+        SET dedupe_key = CASE
+            WHEN NULLIF(trim(linkedin_url), '') IS NOT NULL THEN 'li:' || md5(
+                rtrim(
+                    split_part(split_part(
+                        regexp_replace(
+                            regexp_replace(lower(trim(linkedin_url)), '^[a-z]+://', ''),
+                            '^([a-z0-9-]+\.)*linkedin\.com', 'linkedin.com'
+                        ),
+                        '?', 1), '#', 1),
+                    '/'
+                )
+            )
+            ELSE 'fp:' || md5(
+                lower(regexp_replace(trim(full_name), '\s+', ' ', 'g')) || '|' || coalesce(company_id, '')
+            )
+        END
+        """
+    )
+    # Existing duplicates keep their rows; only the oldest one claims the key.
+    op.execute(
+        """
+        UPDATE sales_prospects AS p
+        SET dedupe_key = NULL
+        FROM (
+            SELECT id, row_number() OVER (
+                PARTITION BY tenant_id, campaign_id, dedupe_key ORDER BY created_at, id
+            ) AS position
+            FROM sales_prospects
+        ) AS ranked
+        WHERE p.id = ranked.id AND ranked.position > 1
+        """
+    )
+    op.create_index(
+        "idx_prospects_dedupe",
+        "sales_prospects",
+        ["tenant_id", "campaign_id", "dedupe_key"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Drop the de-duplication key."""
+    op.drop_index("idx_prospects_dedupe", table_name="sales_prospects")
+    op.drop_column("sales_prospects", "dedupe_key")
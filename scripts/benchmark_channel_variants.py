@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Channel variant generation benchmark.
+
+Compares the sequential baseline with the default strategy for the same
+article, reporting wall time, summed call latency and token usage:
+
+- Sequential baseline: the original prompt construction, one call per
+  channel, one at a time, with the article embedded in each channel prompt
+  as the only (user) message.
+- Default strategy: the article sent once as a shared system message,
+  short-form channels combined into one structured call, all calls
+  concurrent.
+
+Usage:
+    OPENAI_API_KEY=sk-... python scripts/benchmark_channel_variants.py --article article.md
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+try:
+    from app.features.core.database import get_async_session
+    from app.features.business_automations.content_broadcaster.services.ai_generation_service import (
+        AIGenerationService,
+        VARIANT_CONCURRENCY,
+        VARIANT_COMPLETION_TOKENS,
+    )
+    from openai import AsyncOpenAI
+except ImportError as e:
+    logger.error(f"Failed to import content broadcaster modules: {e}")
+    logger.error("Make sure you're running this from the project root directory")
+    sys.exit(1)
+
+DEFAULT_CHANNELS = ["twitter", "linkedin", "facebook", "wordpress", "medium"]
+
+
+def summarize(label: str, wall_seconds: float, variants) -> None:
+    """Log totals, counting each completion call once."""
+    calls = {}
+    for variant in variants:
+        generation = variant["variant_metadata"].get("generation", {})
+        calls[generation.get("call")] = generation
+
+    logger.info(f"{label}:")
+    logger.info(f"   Variants: {len(variants)} from {len(calls)} calls")
+    logger.info(f"   Wall time: {wall_seconds * 1000:.0f} ms")
+    logger.info(f"   Summed call latency: {sum(c.get('latency_ms', 0) for c in calls.values())} ms")
+    logger.info(f"   Prompt tokens: {sum(c.get('prompt_tokens', 0) for c in calls.values())}"
+                f" (cached: {sum(c.get('cached_tokens', 0) for c in calls.values())})")
+    logger.info(f"   Completion tokens: {sum(c.get('completion_tokens', 0) for c in calls.values())}")
+    logger.info(f"   Total tokens: {sum(c.get('total_tokens', 0) for c in calls.values())}")
+
+
+async def generate_variants_sequential_baseline(service, article: str, title: str, channels, api_key: str):
+    """Channel variants as generated before the shared-prefix change."""
+    client = AsyncOpenAI(api_key=api_key)
+    variants = []
+    for channel in dict.fromkeys(channels):
+        try:
+            prompt = await service._render_variant_prompt(channel, title, {}, content=article)
+            started = time.monotonic()
+            response = await service._create_completion(
+                client,
+                VARIANT_COMPLETION_TOKENS,
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.7
+            )
+        except Exception as e:
+            logger.error(f"Baseline variant for {channel} failed: {e}")
+            continue
+        generation = service._variant_call_stats(channel, started, response)
+        variants.append(service._build_variant(channel, response.choices[0].message.content.strip(), generation))
+    return variants
+
+
+async def run_benchmark(article: str, title: str, channels, api_key: str, tenant_id: str):
+    session_factory = get_async_session()
+    async with session_factory() as db:
+        service = AIGenerationService(db, tenant_id)
+
+        started = time.monotonic()
+        variants = await generate_variants_sequential_baseline(service, article, title, channels, api_key)
+        summarize("Sequential baseline (per-channel prompts embedding the article)", time.monotonic() - started, variants)
+
+        started = time.monotonic()
+        variants = await service.generate_variants_per_channel(
+            content=article,
+            title=title,
+            channels=channels,
+            openai_api_key=api_key,
+            max_concurrency=VARIANT_CONCURRENCY,
+            combine_short_form=True
+        )
+        summarize("Shared article prefix, concurrent + combined short-form", time.monotonic() - started, variants)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark channel variant generation strategies")
+    parser.add_argument("--article", required=True, help="Path to the base article (markdown/text)")
+    parser.add_argument("--title", default="Benchmark Article", help="Article title")
+    parser.add_argument("--channels", nargs="+", default=DEFAULT_CHANNELS, help="Channels to generate")
+    parser.add_argument("--tenant-id", default="global", help="Tenant used for prompt lookups")
+    args = parser.parse_args()
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        logger.error("OPENAI_API_KEY environment variable is required")
+        sys.exit(1)
+
+    with open(args.article, encoding="utf-8") as handle:
+        article = handle.read()
+
+    asyncio.run(run_benchmark(article, args.title, args.channels, api_key, args.tenant_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+GA4 daily metric ingestion benchmark.
+
+Compares the previous ORM loop (one SELECT per day, then mutate/add) with the
+set-based INSERT ... ON CONFLICT path of Ga4MetricsIngestionService for the
+same rows, then re-runs the bulk path on unchanged data to show the
+IS DISTINCT FROM guard skipping every row. Uses a throwaway tenant and
+connection that are deleted afterwards.
+
+Usage:
+    python scripts/benchmark_ga4_upsert.py --rows 10000
+"""
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+import uuid
+from datetime import date, timedelta
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+try:
+    from sqlalchemy import delete, select
+    from app.features.core.database import get_async_session
+    from app.features.business_automations.marketing_intellegence_hub.models import Ga4Connection, Ga4DailyMetric
+    from app.features.business_automations.marketing_intellegence_hub.schemas import Ga4DailyMetricPayload
+    from app.features.business_automations.marketing_intellegence_hub.services import Ga4MetricsIngestionService
+except ImportError as e:
+    logger.error(f"Failed to import marketing intelligence modules: {e}")
+    logger.error("Make sure you're running this from the project root directory")
+    sys.exit(1)
+
+
+def build_payloads(rows: int, seed: int):
+    rng = random.Random(seed)
+    start = date(2000, 1, 1)
+    payloads = []
+    for offset in range(rows):
+        sessions = rng.randint(100, 5000)
+        conversions = rng.randint(0, 200)
+        payloads.append(Ga4DailyMetricPayload(
+            date=start + timedelta(days=offset),
+            sessions=sessions,
+            users=int(sessions * 0.8),
+            new_users=int(sessions * 0.2),
+            conversions=conversions,
+            engagement_rate=round(rng.uniform(0.3, 0.9), 2),
+            bounce_rate=round(rng.uniform(0.1, 0.7), 2),
+            avg_engagement_time=rng.randint(30, 300),
+            conversion_rate=round(conversions / sessions, 4),
+            conversions_per_1k=round(conversions / sessions * 1000, 4),
+        ))
+    return payloads
+
+
+async def orm_loop_upsert(db, tenant_id: str, connection_id: str, payloads) -> None:
+    """The per-row ORM implementation the bulk path replaced."""
+    for payload in payloads:
+        stmt = select(Ga4DailyMetric).where(
+            Ga4DailyMetric.connection_id == connection_id,
+            Ga4DailyMetric.tenant_id == tenant_id,
+            Ga4DailyMetric.date == payload.date,
+        )
+        existing = (await db.execute(stmt)).scalar_one_or_none()
+        values = payload.model_dump()
+        if existing:
+            for key, value in values.items():
+                setattr(existing, key, value)
+        else:
+            db.add(Ga4DailyMetric(tenant_id=tenant_id, connection_id=connection_id, **values))
+    await db.flush()
+
+
+async def timed(label: str, coro):
+    started = time.perf_counter()
+    result = await coro
+    elapsed = time.perf_counter() - started
+    logger.info(f"{label}: {elapsed * 1000:.0f} ms")
+    return result
+
+
+async def run_benchmark(rows: int, chunk_size: int):
+    session_factory = get_async_session()
+    tenant_id = f"bench-{uuid.uuid4().hex[:8]}"
+    first = build_payloads(rows, seed=1)
+    second = build_payloads(rows, seed=2)
+
+    async with session_factory() as db:
+        connection = Ga4Connection(tenant_id=tenant_id, property_id=f"properties/{tenant_id}", status="inactive")
+        db.add(connection)
+        await db.commit()
+        service = Ga4MetricsIngestionService(db, tenant_id)
+
+        try:
+            logger.info(f"Benchmarking {rows} rows (chunk size {chunk_size})")
+            await timed("ORM loop, insert", orm_loop_upsert(db, tenant_id, connection.id, first))
+            await db.commit()
+            await timed("ORM loop, update", orm_loop_upsert(db, tenant_id, connection.id, second))
+            await db.commit()
+
+            await db.execute(delete(Ga4DailyMetric).where(Ga4DailyMetric.connection_id == connection.id))
+            await db.commit()
+            db.expunge_all()
+
+            written = await timed("Bulk upsert, insert", service.upsert_daily_metrics(connection.id, first, chunk_size=chunk_size))
+            logger.info(f"   rows written: {written}")
+            await db.commit()
+            written = await timed("Bulk upsert, update", service.upsert_daily_metrics(connection.id, second, chunk_size=chunk_size))
+            logger.info(f"   rows written: {written}")
+            await db.commit()
+            written = await timed("Bulk upsert, unchanged", service.upsert_daily_metrics(connection.id, second, chunk_size=chunk_size))
+            logger.info(f"   rows written: {written}")
+            await db.commit()
+        finally:
+            await db.execute(delete(Ga4DailyMetric).where(Ga4DailyMetric.connection_id == connection.id))
+            await db.execute(delete(Ga4Connection).where(Ga4Connection.id == connection.id))
+            await db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GA4 daily metric upsert strategies")
+    parser.add_argument("--rows", type=int, default=10000, help="Daily rows to write")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="Rows per bulk upsert statement")
+    args = parser.parse_args()
+
+    asyncio.run(run_benchmark(args.rows, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
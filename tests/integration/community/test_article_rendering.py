@@ -0,0 +1,120 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.features.community.services import ArticleCrudService
+from app.features.community.services.content.articles import rendering
+from app.features.community.services.content.articles.rendering import (
+    PreviewRenderCache,
+    article_body_hash,
+)
+
+BODY = "# Pricing\n\n| Tier | Price |\n| --- | --- |\n| Pro | 10 |\n\n```\ncode\n```"
+
+
+class FakeSession:
+    def __init__(self):
+        self.added = []
+        self.sync_session = Session()
+
+    def add(self, item):
+        self.added.append(item)
+
+    async def flush(self):
+        pass
+
+    async def refresh(self, item):
+        pass
+
+
+async def _resolved(value):
+    return value
+
+
+def _count_renders(monkeypatch):
+    calls = []
+    original = rendering.render_article_html
+
+    def counting(body):
+        calls.append(body)
+        return original(body)
+
+    monkeypatch.setattr(rendering, "render_article_html", counting)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_article_html_is_rendered_on_write_only_when_body_changes(monkeypatch):
+    calls = _count_renders(monkeypatch)
+    session = FakeSession()
+    service = ArticleCrudService(session, tenant_id="tenant_a")
+
+    article = await service.create_article({"title": "Pricing", "body_md": BODY}, None)
+    assert "<table>" in article.body_html and "<pre><code>" in article.body_html
+    assert article.body_hash == article_body_hash(BODY)
+    assert len(calls) == 1
+
+    monkeypatch.setattr(service, "get_by_id", lambda *args: _resolved(article))
+    await service.update_article(article.id, {"category": "sales"}, None)
+    assert len(calls) == 1
+
+    await service.update_article(article.id, {"body_md": "Plain *text*"}, None)
+    assert article.body_html == "<p>Plain <em>text</em></p>"
+    assert article.body_hash == article_body_hash("Plain *text*")
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_preview_cache_is_bounded_and_offloads_large_bodies(monkeypatch):
+    calls = _count_renders(monkeypatch)
+    threaded = []
+
+    async def fake_to_thread(func, *args):
+        threaded.append(args[0])
+        return func(*args)
+
+    monkeypatch.setattr(rendering.asyncio, "to_thread", fake_to_thread)
+    cache = PreviewRenderCache(max_entries=2, offload_chars=100)
+
+    assert await cache.render("**a**") == "<p><strong>a</strong></p>"
+    await cache.render("**a**")
+    await cache.render("b")
+    assert len(calls) == 2 and threaded == []
+
+    await cache.render("**a**")  # refreshes "a", so "b" is evicted next
+    await cache.render("c")
+    assert len(cache) == 2
+    await cache.render("**a**")
+    await cache.render("b")
+    assert calls == ["**a**", "b", "c", "b"]
+
+    large = "word " * 50
+    await cache.render(large)
+    assert threaded == [large]
+
+
+@pytest.mark.asyncio
+async def test_article_view_serves_stored_html_without_rendering(monkeypatch):
+    from starlette.requests import Request
+
+    from app.features.community.models import CommunityContent
+    from app.features.community.routes.content import form_routes
+
+    def fail(body):
+        raise AssertionError("article view rendered markdown")
+
+    monkeypatch.setattr(form_routes, "render_article_html", fail)
+    article = CommunityContent(
+        id="a1", tenant_id="tenant_a", title="Pricing", body_md="**old**", tags=[],
+        body_html="<p>stored <strong>html</strong></p>", body_hash=article_body_hash("**old**"),
+    )
+    service = SimpleNamespace(get_by_id=lambda content_id: _resolved(article))
+
+    response = await form_routes.content_article_view_partial(
+        Request({"type": "http", "method": "GET", "headers": [], "query_string": b""}),
+        content_id="a1",
+        content_service=service,
+        current_user=None,
+    )
+    assert "<p>stored <strong>html</strong></p>" in response.body.decode()
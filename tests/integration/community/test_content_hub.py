@@ -1,4 +1,5 @@
 import pytest
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
 from app.features.community.services import (
@@ -8,6 +9,7 @@ from app.features.community.services import (
     NewsCrudService,
     ContentEngagementCrudService,
 )
+from app.features.community.services.content.engagement import EngagementBuffer
 
 
 class DummyUser:
@@ -34,6 +36,7 @@ async def test_article_crud_flow(test_db_session):
     article = await service.create_article(payload, actor)
     assert article.tenant_id == TENANT_ID
     assert article.title == payload["title"]
+    assert article.body_html and article.body_hash
 
     articles, total = await service.list_articles()
     assert total == 1
@@ -110,6 +113,12 @@ async def test_engagement_summary(test_db_session):
     engagement_service = ContentEngagementCrudService(test_db_session, TENANT_ID)
     actor = DummyUser()
 
+    @asynccontextmanager
+    async def test_session():
+        yield test_db_session
+
+    buffer = EngagementBuffer(test_session, flush_interval=60)
+
     article = await content_service.create_article(
         {
             "title": "Client Segmentation Walkthrough",
@@ -128,6 +137,7 @@ async def test_engagement_summary(test_db_session):
             "occurred_at": datetime.now(timezone.utc),
         },
         actor,
+        buffer=buffer,
     )
     await engagement_service.record_engagement(
         {
@@ -138,6 +148,7 @@ async def test_engagement_summary(test_db_session):
             "occurred_at": datetime.now(timezone.utc),
         },
         actor,
+        buffer=buffer,
     )
     await engagement_service.record_engagement(
         {
@@ -148,8 +159,11 @@ async def test_engagement_summary(test_db_session):
             "occurred_at": datetime.now(timezone.utc),
         },
         actor,
+        buffer=buffer,
     )
 
+    # Nothing is counted until the buffer is flushed into the rollups
+    assert await buffer.flush() == 3
     summary = await engagement_service.get_summary()
 
     assert summary["total_actions"] == 3
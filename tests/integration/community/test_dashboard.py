@@ -0,0 +1,177 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.util import greenlet_spawn
+
+from app.features.community.routes.pages_routes import _build_announcements
+from app.features.community.services import ArticleCrudService, CommunityDashboardService
+from app.features.community.services.content.engagement.sketch import MemberSketch
+from app.features.community.services.dashboard import dashboard_cache
+from app.features.community.services.dashboard.dashboard_cache import InMemoryDashboardCache
+
+
+class SnapshotSession:
+    """Answers every statement with one snapshot row and records it."""
+
+    def __init__(self, row=None):
+        self.row = row or _snapshot_row()
+        self.statements = []
+        self.added = []
+        # Unbound: commits fire the session events without touching a database
+        self.sync_session = Session()
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        return SimpleNamespace(one=lambda: SimpleNamespace(_mapping=dict(self.row)))
+
+    def add(self, item):
+        self.added.append(item)
+
+    async def flush(self):
+        # Like a real flush, opens the transaction that the commit or rollback ends
+        if not self.sync_session.in_transaction():
+            self.sync_session.begin()
+
+    async def refresh(self, item, attribute_names=None):
+        pass
+
+    async def commit(self):
+        await greenlet_spawn(self.sync_session.commit)
+
+    async def rollback(self):
+        await greenlet_spawn(self.sync_session.rollback)
+
+
+def _snapshot_row(**overrides):
+    row = {
+        "member_count": 12,
+        "partner_count": 3,
+        "article_total": 7,
+        "podcast_total": 0,
+        "video_total": 2,
+        "news_total": 1,
+        "articles": [
+            {"id": "a1", "title": "Pricing", "category": "sales", "excerpt": "  Raise prices.  ",
+             "published_at": "2026-03-01T12:00:00+00:00"},
+        ],
+        "podcasts": [],
+        "videos": [{"id": "v1", "title": "Intro", "published_at": None}],
+        "news_items": [
+            {"id": "n1", "headline": "Rates", "summary": "Rates held.", "source": None, "category": "macro",
+             "url": "https://example.com/rates", "publish_date": "2026-03-02T08:00:00+00:00"},
+        ],
+        "events": [{"id": "e1", "title": "Summit", "description": None, "start_date": "2026-04-10T09:00:00+00:00"}],
+        "polls": [{"id": "p1", "question": "Next topic?", "expires_at": None, "option_count": 1}],
+        "engagement_actions": {"view": 5, "like": 2},
+        "engagement_sketches": [MemberSketch().update(["m1", "m2"]).to_bytes(), MemberSketch().update(["m2", "m3"]).to_bytes()],
+    }
+    row.update(overrides)
+    return row
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = InMemoryDashboardCache()
+    monkeypatch.setattr(dashboard_cache, "_cache", cache)
+    return cache
+
+
+def test_snapshot_is_one_statement_with_tenant_scoped_people(cache):
+    sql = str(CommunityDashboardService(SnapshotSession(), "tenant_a").build_snapshot_query().compile(
+        dialect=postgresql.dialect()
+    ))
+    assert sql.startswith("WITH member_count_cte AS")
+    for name in ("partner_count", "article_total", "articles", "news_items", "events", "polls", "engagement_sketches"):
+        assert f"{name}_cte AS" in sql
+    assert "WHERE members.tenant_id = " in sql and "WHERE partners.tenant_id = " in sql
+    assert "community_content.tenant_id" not in sql
+    assert "jsonb_agg(jsonb_build_object(" in sql and "ORDER BY articles_rows.position" in sql
+
+    global_sql = str(CommunityDashboardService(SnapshotSession(), None).build_snapshot_query().compile(
+        dialect=postgresql.dialect()
+    ))
+    assert "members.tenant_id" not in global_sql
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_cached_until_a_write_invalidates_it(cache):
+    session = SnapshotSession()
+    service = CommunityDashboardService(session, "tenant_a")
+
+    snapshot = await service.get_snapshot()
+    assert snapshot["member_count"] == 12
+    assert snapshot["articles"][0]["published_at"] == datetime(2026, 3, 1, 12, tzinfo=timezone.utc)
+    assert snapshot["engagement_summary"] == {"total_actions": 7, "unique_members": 3, "actions": {"view": 5, "like": 2}}
+
+    await service.get_snapshot()
+    await CommunityDashboardService(session, "tenant_b").get_snapshot()
+    assert len(session.statements) == 2  # tenant_a once, tenant_b once
+
+    # Another tenant's member leaves tenant_a cached; hub content reaches everyone
+    await dashboard_cache.invalidate_tenant_dashboard("tenant_b")
+    await service.get_snapshot()
+    assert len(session.statements) == 2
+
+    # The write only reaches the cache once its transaction commits
+    writer = SnapshotSession()
+    await ArticleCrudService(writer, None).create_article(
+        {"tenant_id": "tenant_a", "title": "New", "body_md": "Body"}, None
+    )
+    await service.get_snapshot()
+    assert len(session.statements) == 2
+
+    await writer.commit()
+    await service.get_snapshot()
+    await CommunityDashboardService(session, "tenant_b").get_snapshot()
+    assert len(session.statements) == 4
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_writes_leave_the_cache_alone(cache):
+    writer = SnapshotSession()
+    await ArticleCrudService(writer, None).create_article(
+        {"tenant_id": "tenant_a", "title": "New", "body_md": "Body"}, None
+    )
+    await writer.rollback()
+    await writer.commit()
+    assert cache._generations == {}
+
+    dashboard_cache.invalidate_tenant_dashboard_after_commit(writer, "tenant_a")
+    dashboard_cache.invalidate_hub_dashboards_after_commit(writer)
+    await writer.commit()
+    assert cache._generations == {"hub": 1, "tenant:tenant_a": 1, "tenant:global": 1}
+
+
+@pytest.mark.asyncio
+async def test_expired_snapshots_are_reloaded():
+    now = [0.0]
+    cache = InMemoryDashboardCache(ttl_seconds=30, clock=lambda: now[0])
+    session = SnapshotSession()
+    service = CommunityDashboardService(session, "tenant_a", cache=cache)
+
+    await service.get_snapshot()
+    now[0] = 29
+    await service.get_snapshot()
+    now[0] = 31
+    await service.get_snapshot()
+    assert len(session.statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_announcements_come_from_the_snapshot(cache):
+    snapshot = await CommunityDashboardService(SnapshotSession(), "tenant_a").get_snapshot()
+
+    announcements = _build_announcements(snapshot)
+    assert [item["label"] for item in announcements] == ["Upcoming Event", "Open Poll", "New Insight", "Industry News"]
+    assert announcements[0]["meta"] == "Apr 10"
+    assert announcements[1]["body"] == "1 option • Cast your vote"
+    assert announcements[2]["body"] == "Raise prices."
+    assert announcements[3]["meta"] == "macro"
+
+    empty = await CommunityDashboardService(
+        SnapshotSession(_snapshot_row(articles=[], news_items=[], events=[], polls=[])), "tenant_c"
+    ).get_snapshot()
+    assert _build_announcements(empty) == []
@@ -0,0 +1,202 @@
+import asyncio
+import hashlib
+import random
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.community.models import ENGAGEMENT_ALL_TIME
+from app.features.community.services import ContentEngagementCrudService
+from app.features.community.services.content.engagement import ingest
+from app.features.community.services.content.engagement.ingest import (
+    EngagementBuffer,
+    EngagementEvent,
+    write_engagement_batch,
+)
+from app.features.community.services.content.engagement.sketch import (
+    SKETCH_PRECISION,
+    SKETCH_REGISTERS,
+    MemberSketch,
+)
+
+NOON = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class ScriptedSession:
+    """Returns queued results in order and records every statement."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.committed = False
+
+    async def execute(self, stmt, params=None):
+        self.statements.append((stmt, params))
+        rows = self.results.pop(0) if self.results else []
+        return SimpleNamespace(
+            all=lambda: rows,
+            scalars=lambda: SimpleNamespace(all=lambda: rows),
+            scalar_one_or_none=lambda: rows[0] if rows else None,
+        )
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _event(content_id="c1", member_id="m1", action="view", **extra):
+    return EngagementEvent(
+        tenant_id="tenant_a", content_id=content_id, member_id=member_id, action=action,
+        occurred_at=NOON, **extra,
+    )
+
+
+def test_sketch_estimates_and_merges_distinct_members():
+    members = [f"member-{i}" for i in range(20_000)]
+    random.Random(7).shuffle(members)
+    first, second = MemberSketch().update(members[:12_000]), MemberSketch().update(members[8_000:])
+
+    assert abs(first.estimate() - 12_000) / 12_000 < 0.05
+    merged = MemberSketch(first.to_bytes()).merge(second)
+    assert abs(merged.estimate() - 20_000) / 20_000 < 0.05
+    # Re-adding members already counted changes nothing
+    assert MemberSketch(merged.to_bytes()).update(members[:500]).to_bytes() == merged.to_bytes()
+    assert MemberSketch().update(["a", "b", "c", "a"]).estimate() == 3
+
+    with pytest.raises(ValueError):
+        MemberSketch(b"\x00" * 10)
+
+
+def test_sketch_registers_match_the_migration_backfill_hash():
+    # Mirrors the SQL in migrations/versions/community_engagement_rollups.py
+    def sql_register(member_id):
+        bits = format(int(hashlib.md5(member_id.encode()).hexdigest()[:16], 16), "064b")
+        first_set = bits[SKETCH_PRECISION:].find("1") + 1
+        return int(bits[:SKETCH_PRECISION], 2), first_set or 64 - SKETCH_PRECISION + 1
+
+    expected = bytearray(SKETCH_REGISTERS)
+    for member_id in (f"member-{i}" for i in range(3_000)):
+        register, rank = sql_register(member_id)
+        expected[register] = max(expected[register], rank)
+
+    assert MemberSketch().update(f"member-{i}" for i in range(3_000)).to_bytes() == bytes(expected)
+
+
+@pytest.mark.asyncio
+async def test_batch_appends_events_and_upserts_rollups():
+    stored = MemberSketch().update(["m9"])
+    session = ScriptedSession(
+        ["c1"],  # known content ids
+        [], [], [], [],  # event insert, counter, daily and sketch upserts
+        [SimpleNamespace(tenant_id="tenant_a", day=day, registers=stored.to_bytes())
+         for day in (ENGAGEMENT_ALL_TIME, NOON.date())],
+    )
+    events = [_event(), _event(member_id="m2"), _event(action="like"), _event(content_id="gone")]
+
+    assert await write_engagement_batch(session, events) == 3
+
+    (_, _), (insert_stmt, rows), (counters, _), (daily, _), (sketch_rows, _), (locked, _), *updates = session.statements
+    assert [row["content_id"] for row in rows] == ["c1", "c1", "c1"]
+    assert _sql(insert_stmt).startswith("INSERT INTO community_content_engagement")
+
+    counter_sql = _sql(counters)
+    assert "ON CONFLICT (tenant_id, content_id, action) DO UPDATE SET count = " in counter_sql
+    assert "community_engagement_counters.count + excluded.count" in counter_sql
+    assert counters.compile().params["count_m0"] == 1  # like
+    assert counters.compile().params["count_m1"] == 2  # view
+
+    daily_params = daily.compile().params
+    assert {daily_params["day_m0"], daily_params["day_m2"]} == {ENGAGEMENT_ALL_TIME, date(2026, 3, 1)}
+    assert "DO NOTHING" in _sql(sketch_rows)
+    assert "FOR UPDATE" in _sql(locked)
+
+    assert len(updates) == 2
+    merged = MemberSketch(updates[0][0].compile().params["registers"])
+    assert merged.to_bytes() == MemberSketch().update(["m1", "m2", "m9"]).to_bytes()
+
+
+@pytest.mark.asyncio
+async def test_buffer_flushes_batches_and_retries_failures(monkeypatch):
+    written, failures = [], [1]
+
+    async def fake_write(session, events):
+        if failures:
+            failures.pop()
+            raise RuntimeError("database unavailable")
+        written.append([event.id for event in events])
+        return len(events)
+
+    monkeypatch.setattr(ingest, "write_engagement_batch", fake_write)
+    sessions = []
+
+    def session_factory():
+        sessions.append(ScriptedSession())
+        return sessions[-1]
+
+    buffer = EngagementBuffer(session_factory, flush_interval=0.01, batch_size=2, max_buffered=3)
+    events = [_event(member_id=f"m{i}") for i in range(4)]
+    for event in events:
+        buffer.add(event)
+
+    # The oldest event was dropped at capacity; the first attempt failed and was retried
+    for _ in range(200):
+        if len(written) == 2:
+            break
+        await asyncio.sleep(0.01)
+    assert written == [[events[1].id, events[2].id], [events[3].id]]
+    assert events[1].attempts == 1 and len(buffer) == 0
+    assert all(session.committed for session in sessions[1:])
+
+    buffer.add(_event(member_id="late"))
+    await buffer.close()
+    assert len(written) == 3
+
+
+@pytest.mark.asyncio
+async def test_record_queues_and_summary_reads_only_rollups():
+    buffer = EngagementBuffer(ScriptedSession, flush_interval=60)
+    session = ScriptedSession(
+        [("view", 5), ("like", 2)],
+        [MemberSketch().update(["m1", "m2"]).to_bytes(), MemberSketch().update(["m2", "m3"]).to_bytes()],
+    )
+    service = ContentEngagementCrudService(session, tenant_id=None)
+
+    event = await service.record_engagement(
+        {"tenant_id": "tenant_a", "content_id": "c1", "action": "like", "member_id": "m1"}, buffer=buffer
+    )
+    assert session.statements == [] and len(buffer) == 1 and event.action == "like"
+
+    summary = await service.get_summary()
+    assert summary == {"total_actions": 7, "unique_members": 3, "actions": {"view": 5, "like": 2}}
+    daily_sql, sketch_sql = (_sql(stmt) for stmt, _ in session.statements)
+    assert "FROM community_engagement_daily" in daily_sql
+    assert "FROM community_engagement_member_sketches" in sketch_sql
+    assert "community_content_engagement" not in daily_sql + sketch_sql
+    assert session.statements[0][0].compile().params["day_1"] == ENGAGEMENT_ALL_TIME
+
+    await buffer.close()
+
+
+@pytest.mark.asyncio
+async def test_content_exists_is_a_primary_key_lookup():
+    session = ScriptedSession(["c1"], [])
+    service = ContentEngagementCrudService(session, tenant_id=None)
+
+    assert await service.content_exists("c1") is True
+    assert await service.content_exists("missing") is False
+    sql = _sql(session.statements[0][0])
+    assert sql.startswith("SELECT community_content.id") and "LIMIT" in sql
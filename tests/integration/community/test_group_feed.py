@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.community.services import GroupPostCrudService
+from app.features.community.services.keyset import decode_cursor, encode_cursor
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _row(post_index, comment_index=None, comment_total=0):
+    post_id = f"post-{post_index}"
+    row = {
+        "post_id": post_id,
+        "group_id": "group-1",
+        "post_author_id": "user-1",
+        "post_author_name": "Owner One",
+        "title": None,
+        "post_content": f"Post {post_index}",
+        "post_created_at": START - timedelta(minutes=post_index),
+        "comment_total": comment_total or None,
+        "comment_id": None,
+        "comment_author_id": None,
+        "comment_author_name": None,
+        "comment_content": None,
+        "comment_created_at": None,
+    }
+    if comment_index is not None:
+        row.update(
+            comment_id=f"{post_id}-c{comment_index}",
+            comment_author_id="user-2",
+            comment_author_name="Replier",
+            comment_content=f"Comment {comment_index}",
+            comment_created_at=START + timedelta(minutes=comment_index),
+        )
+    return SimpleNamespace(**row)
+
+
+class FeedSession:
+    """Returns canned feed rows and records every executed statement."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(all=lambda: self.rows)
+
+    async def rollback(self):
+        pass
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trips_and_rejects_garbage():
+    cursor = encode_cursor(START, "post-9")
+    assert decode_cursor(cursor) == (START, "post-9")
+    assert decode_cursor(None) is None
+    assert decode_cursor("not-a-cursor") is None
+
+
+@pytest.mark.asyncio
+async def test_feed_page_loads_posts_comments_and_authors_in_one_query():
+    rows = [
+        _row(0, 1, comment_total=5),
+        _row(0, 2, comment_total=5),
+        _row(1),
+        _row(2, 1, comment_total=1),
+    ]
+    session = FeedSession(rows)
+    service = GroupPostCrudService(session, "tenant_a")
+
+    page = await service.load_feed("group-1", limit=2)
+
+    assert len(session.statements) == 1
+    sql = _sql(session.statements[0])
+    assert "row_number() OVER (PARTITION BY group_comments.post_id" in sql
+    assert "count(*) OVER (PARTITION BY group_comments.post_id)" in sql
+    assert "LEFT OUTER JOIN users" in sql
+    assert "OFFSET" not in sql
+    assert "group_posts.tenant_id" in sql and "group_comments.tenant_id" in sql
+
+    # limit + 1 posts came back, so the last one only signals another page
+    assert [post.id for post in page.posts] == ["post-0", "post-1"]
+    first, second = page.posts
+    assert [comment.content for comment in first.comments] == ["Comment 1", "Comment 2"]
+    assert first.comment_total == 5 and first.comments[0].author_name == "Replier"
+    assert second.comments == [] and second.comment_total == 0
+    assert decode_cursor(page.next_cursor) == (second.created_at, "post-1")
+
+
+@pytest.mark.asyncio
+async def test_feed_continues_after_cursor_and_ends_without_one():
+    session = FeedSession([_row(3)])
+    service = GroupPostCrudService(session, "tenant_a")
+
+    page = await service.load_feed("group-1", limit=2, cursor=encode_cursor(START, "post-2"))
+
+    sql = _sql(session.statements[0])
+    assert "(group_posts.created_at, group_posts.id) < (" in sql
+    assert [post.id for post in page.posts] == ["post-3"]
+    assert page.next_cursor is None
@@ -0,0 +1,99 @@
+import asyncio
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.features.community.services import MessageCrudService
+from app.features.core.event_streams import INITIAL_EVENT_ID, StreamEvent
+from app.features.community.services.messages.inbox_channel import (
+    InMemoryInboxChannel,
+    coalesce_events,
+    inbox_event_stream,
+    publish_typing,
+)
+
+
+class RowsSession:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def execute(self, stmt):
+        return SimpleNamespace(all=lambda: self.rows)
+
+    async def rollback(self):
+        pass
+
+
+def _parse(message):
+    lines = dict(line.split(": ", 1) for line in message.strip().splitlines() if ": " in line)
+    return lines.get("event"), json.loads(lines.get("data", "null"))
+
+
+def test_coalesce_keeps_messages_and_latest_ephemeral_state():
+    events = [
+        StreamEvent("1-0", "typing", {"thread_id": "t1", "user_id": "u2"}),
+        StreamEvent("2-0", "message", {"thread_id": "t1", "message_id": "m1"}),
+        StreamEvent("3-0", "presence", {"user_id": "u2", "online": True}),
+        StreamEvent("4-0", "typing", {"thread_id": "t1", "user_id": "u2"}),
+        StreamEvent("5-0", "presence", {"user_id": "u2", "online": False}),
+        StreamEvent("6-0", "typing", {"thread_id": "t2", "user_id": "u2"}),
+    ]
+
+    assert [event.id for event in coalesce_events(events)] == ["2-0", "4-0", "5-0", "6-0"]
+
+
+@pytest.mark.asyncio
+async def test_typing_is_fanned_out_once_per_window():
+    channel = InMemoryInboxChannel()
+
+    assert await publish_typing(channel, "t1", "u1", ["u1", "u2", "u3"], window=60)
+    assert not await publish_typing(channel, "t1", "u1", ["u1", "u2", "u3"], window=60)
+
+    assert await channel.latest_id("u1") == INITIAL_EVENT_ID
+    for recipient in ("u2", "u3"):
+        events = await channel.read(recipient, INITIAL_EVENT_ID, timeout=0.01)
+        assert [(e.event, e.data["user_id"]) for e in events] == [("typing", "u1")]
+
+
+@pytest.mark.asyncio
+async def test_stream_announces_presence_and_relays_events():
+    channel = InMemoryInboxChannel()
+    await channel.connect("u2")
+    stream = inbox_event_stream(channel, "u1", ["u2"], INITIAL_EVENT_ID, heartbeat_seconds=0.05)
+
+    assert (await stream.__anext__()).startswith("retry:")
+    assert _parse(await stream.__anext__()) == ("roster", {"online": ["u2"]})
+
+    next_event = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0.01)
+    await channel.publish("u1", "message", {"thread_id": "t1", "message_id": "m1", "unread_count": 1})
+    assert _parse(await next_event) == ("message", {"thread_id": "t1", "message_id": "m1", "unread_count": 1})
+    assert await channel.online(["u1", "u2"]) == {"u1", "u2"}
+
+    await stream.aclose()
+    assert await channel.online(["u1"]) == set()
+    partner_events = await channel.read("u2", INITIAL_EVENT_ID, timeout=0.01)
+    assert [e.data for e in partner_events] == [
+        {"user_id": "u1", "online": True},
+        {"user_id": "u1", "online": False},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_notify_message_sends_each_participant_their_unread_count():
+    channel = InMemoryInboxChannel()
+    session = RowsSession([
+        SimpleNamespace(user_id="u1", unread_count=0),
+        SimpleNamespace(user_id="u2", unread_count=3),
+    ])
+    service = MessageCrudService(session, tenant_id=None)
+    message = SimpleNamespace(id="m1", thread_id="t1", sender_id="u1", created_at=datetime(2026, 1, 1))
+
+    await service.notify_message(message, channel=channel)
+
+    for user_id, unread in (("u1", 0), ("u2", 3)):
+        [event] = await channel.read(user_id, INITIAL_EVENT_ID, timeout=0.01)
+        assert event.event == "message"
+        assert event.data["thread_id"] == "t1" and event.data["unread_count"] == unread
@@ -0,0 +1,128 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.community.services import MessageCrudService
+from app.features.community.services.keyset import decode_cursor
+
+START = datetime(2026, 1, 1, 12, 0, 0)
+
+
+class RecordingSession:
+    """Answers every statement with the same canned result and records it."""
+
+    def __init__(self, rows=(), scalars=()):
+        self.rows = list(rows)
+        self.scalar_rows = list(scalars)
+        self.statements = []
+        self.added = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(
+            all=lambda: self.rows,
+            first=lambda: self.rows[0] if self.rows else None,
+            scalars=lambda: SimpleNamespace(all=lambda: self.scalar_rows),
+        )
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def flush(self):
+        pass
+
+    async def refresh(self, obj):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _inbox_row(index, unread=0):
+    return SimpleNamespace(
+        thread_id=f"thread-{index}",
+        last_message_at=START - timedelta(minutes=index),
+        unread_count=unread,
+        last_message=f"Message {index}",
+        last_sender_id="user-2",
+        participants=["Owner One", "Replier"],
+        participant_ids=["user-1", "user-2"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_inbox_is_one_query_over_the_thread_index():
+    session = RecordingSession(rows=[_inbox_row(0, unread=2), _inbox_row(1), _inbox_row(2)])
+    service = MessageCrudService(session, tenant_id=None)
+
+    page = await service.load_inbox("user-1", limit=2)
+
+    assert len(session.statements) == 1
+    sql = _sql(session.statements[0])
+    assert "FROM thread_participants JOIN threads" in sql
+    assert "messages.id = threads.last_message_id" in sql
+    assert "array_agg(" in sql
+    assert "ORDER BY thread_participants.last_message_at DESC, thread_participants.thread_id DESC" in sql
+    assert "OFFSET" not in sql
+
+    assert [c["thread_id"] for c in page.conversations] == ["thread-0", "thread-1"]
+    assert page.conversations[0]["unread_count"] == 2
+    assert decode_cursor(page.next_cursor) == (START - timedelta(minutes=1), "thread-1")
+
+    await service.load_inbox("user-1", limit=2, cursor=page.next_cursor)
+    assert "(thread_participants.last_message_at, thread_participants.thread_id) < (" in _sql(
+        session.statements[-1]
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_message_advances_thread_and_participant_counters():
+    session = RecordingSession(rows=[SimpleNamespace(id="participant-1")])
+    service = MessageCrudService(session, tenant_id=None)
+
+    message = await service.create_message({"thread_id": "thread-1", "content": "Hi"}, sender_id="user-1")
+
+    assert session.added == [message]
+    check, thread_update, participant_update = session.statements
+    assert "thread_participants.user_id" in _sql(check)
+    thread_sql = _sql(thread_update)
+    assert thread_sql.startswith("UPDATE threads SET last_message_id=")
+    assert "threads.last_message_at <=" in thread_sql
+    participant_sql = _sql(participant_update)
+    assert "unread_count=CASE WHEN (thread_participants.user_id =" in participant_sql
+    assert "thread_participants.unread_count + " in participant_sql
+    assert "greatest(" in participant_sql
+
+
+@pytest.mark.asyncio
+async def test_create_message_rejects_non_participants():
+    session = RecordingSession(rows=[])
+    service = MessageCrudService(session, tenant_id=None)
+
+    with pytest.raises(ValueError):
+        await service.create_message({"thread_id": "thread-1", "content": "Hi"}, sender_id="stranger")
+    assert session.added == []
+
+
+@pytest.mark.asyncio
+async def test_mark_read_moves_the_readers_marker_once_per_thread():
+    messages = [
+        SimpleNamespace(id="m1", thread_id="thread-1", created_at=START, is_read=False),
+        SimpleNamespace(id="m2", thread_id="thread-1", created_at=START + timedelta(minutes=5), is_read=False),
+    ]
+    session = RecordingSession(scalars=messages)
+    service = MessageCrudService(session, tenant_id=None)
+
+    await service.mark_read(["m1", "m2"], reader_id="user-1")
+
+    assert all(message.is_read for message in messages)
+    assert len(session.statements) == 2
+    marker_sql = _sql(session.statements[1])
+    assert marker_sql.startswith("UPDATE thread_participants SET last_read_message_id=")
+    assert "messages.sender_id !=" in marker_sql
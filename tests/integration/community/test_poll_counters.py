@@ -0,0 +1,150 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.community.services import PollCrudService, PollVoteCrudService
+from app.features.community.services.messages.inbox_channel import InMemoryInboxChannel
+from app.features.community.services.polls.live_results import (
+    poll_results_stream,
+    publish_results,
+    schedule_results_push,
+)
+
+
+class ScriptedSession:
+    """Returns queued results in order and records every statement."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        rows = self.results.pop(0) if self.results else []
+        return SimpleNamespace(all=lambda: rows, scalar_one=lambda: rows[0])
+
+    async def rollback(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def _summary_rows(*votes):
+    return [SimpleNamespace(id=f"o{i}", text=f"Option {i}", votes=count) for i, count in enumerate(votes)]
+
+
+@pytest.mark.asyncio
+async def test_vote_and_counter_change_are_one_statement():
+    vote = SimpleNamespace(id="v1", option_id="o2")
+    session = ScriptedSession([vote])
+    service = PollVoteCrudService(session, tenant_id="tenant_a")
+
+    assert await service.cast_vote("p1", "o2", member_id="m1") is vote
+    (stmt,) = session.statements
+    sql = _sql(stmt)
+    assert "ON CONFLICT (poll_id, member_id) DO UPDATE SET option_id = excluded.option_id" in sql
+    assert "previous AS" in sql
+    # Locking would skip the row the upsert already modified, losing the -1
+    assert "FOR UPDATE" not in sql
+    assert "INSERT INTO poll_vote_counters" in sql
+    assert "ON CONFLICT (option_id, shard) DO UPDATE SET count = (poll_vote_counters.count + excluded.count)" in sql
+    # A re-vote for the same option nets to zero and leaves the counters alone
+    assert "HAVING sum(deltas.delta) !=" in sql
+    assert "LEFT OUTER JOIN" not in sql
+
+    anonymous = PollVoteCrudService._cast_vote_statement("v2", "tenant_a", "p1", "o1", None, 0)
+    assert "previous" not in _sql(anonymous)
+
+
+@pytest.mark.asyncio
+async def test_changing_a_vote_moves_the_count_between_options(test_db_session):
+    poll = await PollCrudService(test_db_session, "tenant_a").create_poll(
+        {"question": "Best quarter?", "options": [{"text": "A", "order": 0}, {"text": "B", "order": 1}]},
+        None,
+    )
+    option_a, option_b = sorted(poll.options, key=lambda option: option.text)
+    service = PollVoteCrudService(test_db_session, "tenant_a")
+
+    await service.cast_vote(poll.id, option_a.id, member_id="m1")
+    await service.cast_vote(poll.id, option_b.id, member_id="m1")
+
+    votes = {item["option_id"]: item["votes"] for item in await service.vote_summary(poll.id)}
+    assert votes == {option_a.id: 0, option_b.id: 1}
+
+
+@pytest.mark.asyncio
+async def test_summary_reads_counters_and_reconcile_fixes_drift():
+    session = ScriptedSession(
+        _summary_rows(3, None),
+        [SimpleNamespace(id="o1", poll_id="p1", drift=-2), SimpleNamespace(id="o2", poll_id="p1", drift=1)],
+        [],
+    )
+    service = PollVoteCrudService(session, tenant_id=None)
+
+    summary = await service.vote_summary("p1")
+    assert [item["votes"] for item in summary] == [3, 0]
+    summary_sql = _sql(session.statements[0])
+    assert "sum(poll_vote_counters.count)" in summary_sql and "poll_votes" not in summary_sql
+
+    assert await service.reconcile_vote_counters("p1") == 2
+    drift_sql, repair = _sql(session.statements[1]), session.statements[2]
+    assert "count(poll_votes.id)" in drift_sql and "sum(poll_vote_counters.count)" in drift_sql
+    params = repair.compile().params
+    assert (params["count_m0"], params["count_m1"]) == (-2, 1)
+    assert {params["shard_m0"], params["shard_m1"]} == {0}
+
+    assert await PollVoteCrudService(ScriptedSession([]), tenant_id=None).reconcile_vote_counters() == 0
+
+
+@pytest.mark.asyncio
+async def test_votes_in_a_window_share_one_results_push():
+    channel = InMemoryInboxChannel()
+    sessions = []
+
+    def session_factory():
+        sessions.append(ScriptedSession(_summary_rows(4, 1)))
+        return sessions[-1]
+
+    scheduled = [
+        await schedule_results_push("p1", channel, session_factory, delay=0.05) for _ in range(5)
+    ]
+    assert scheduled == [True, False, False, False, False]
+
+    events = await channel.read("p1", "0-0", timeout=1)
+    assert len(sessions) == 1 and len(events) == 1
+    assert events[0].event == "results"
+    assert events[0].data["total_votes"] == 5
+    assert [option["votes"] for option in events[0].data["options"]] == [4, 1]
+
+    # The window has passed, so the next vote schedules a new push
+    assert await schedule_results_push("p1", channel, session_factory, delay=0.05) is True
+    await asyncio.sleep(0.1)
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_current_results_then_newest_push():
+    channel = InMemoryInboxChannel()
+    stream = poll_results_stream(channel, "p1", "0-0", {"poll_id": "p1", "total_votes": 0}, heartbeat_seconds=0.05)
+
+    assert (await stream.__anext__()).startswith("retry:")
+    assert '"total_votes": 0' in await stream.__anext__()
+
+    await publish_results(channel, "p1", lambda: ScriptedSession(_summary_rows(1)))
+    await publish_results(channel, "p1", lambda: ScriptedSession(_summary_rows(2)))
+    message = await stream.__anext__()
+    assert message.startswith("id: 2-0\nevent: results\n")
+    assert json.loads(message.split("data: ", 1)[1])["total_votes"] == 2
+
+    assert await stream.__anext__() == ": heartbeat\n\n"
+    await stream.aclose()
@@ -0,0 +1,111 @@
+import importlib.util
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.core.database import Base
+from app.features.core.full_text_search import highlight_html
+from app.features.community.services import CommunitySearchService, MemberCrudService
+
+MIGRATION = Path(__file__).resolve().parents[3] / "migrations" / "versions" / "community_search_vectors.py"
+
+
+class RecordingSession:
+    """Answers every statement with the same canned rows and records it."""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(
+            all=lambda: self.rows,
+            scalars=lambda: SimpleNamespace(all=lambda: self.rows),
+            scalar_one=lambda: len(self.rows),
+        )
+
+    async def rollback(self):
+        pass
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_highlight_escapes_text_and_marks_matches():
+    assert highlight_html("<b>Tax</b> \x02planning\x03 & more") == (
+        "&lt;b&gt;Tax&lt;/b&gt; <mark>planning</mark> &amp; more"
+    )
+    assert highlight_html(None) == ""
+
+
+def test_migration_matches_model_search_vectors():
+    spec = importlib.util.spec_from_file_location("community_search_vectors", MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+
+    for table, vector_index, weighted_columns, trigram_indexes in migration.SEARCHABLE_TABLES:
+        model_table = Base.metadata.tables[table]
+        expected = str(model_table.c.search_vector.computed.sqltext)
+        assert migration._tsvector_sql(weighted_columns) == expected, table
+        index_names = {index.name for index in model_table.indexes}
+        assert {vector_index, *trigram_indexes} <= index_names, table
+
+
+@pytest.mark.asyncio
+async def test_member_search_uses_the_indexes_and_ranks_matches():
+    session = RecordingSession()
+    service = MemberCrudService(session, tenant_id="tenant_a")
+
+    await service.list_members(search="ann")
+
+    sql = _sql(session.statements[0])
+    assert "members.search_vector @@ websearch_to_tsquery(" in sql
+    assert "members.name ILIKE" in sql and "members.email %" in sql
+    assert "ORDER BY greatest(ts_rank_cd(members.search_vector" in sql
+    assert "lower(members.name) LIKE" not in sql
+
+
+@pytest.mark.asyncio
+async def test_community_search_is_one_ranked_union_with_typed_hits():
+    session = RecordingSession(rows=[
+        SimpleNamespace(
+            kind="article", id="a1", title="Tax planning", snippet="\x02Tax\x03 <tips>",
+            rank=0.8, sort_date=datetime(2026, 1, 1),
+        ),
+        SimpleNamespace(kind="member", id="m1", title="Tax Tim", snippet=None, rank=0.4, sort_date=None),
+    ])
+    service = CommunitySearchService(session, tenant_id="tenant_a")
+
+    hits = await service.search_community("tax")
+
+    assert len(session.statements) == 1
+    sql = _sql(session.statements[0])
+    assert sql.count("UNION ALL") == 6
+    assert sql.count("ts_headline(") == 1
+    assert "row_number() OVER (PARTITION BY matches.kind" in sql
+    # Only members are tenant-scoped; the content hub is shared
+    assert "members.tenant_id = " in sql
+    assert "community_content.tenant_id" not in sql
+
+    assert [(hit.kind, hit.id) for hit in hits] == [("article", "a1"), ("member", "m1")]
+    assert hits[0].snippet == "<mark>Tax</mark> &lt;tips&gt;"
+    assert hits[0].to_dict()["date"] == "2026-01-01T00:00:00"
+
+
+@pytest.mark.asyncio
+async def test_community_search_filters_kinds_and_skips_blank_terms():
+    session = RecordingSession()
+    service = CommunitySearchService(session, tenant_id=None)
+
+    assert await service.search_community("   ") == []
+    assert session.statements == []
+
+    await service.search_community("retirement", kinds=["podcast", "news"])
+    sql = _sql(session.statements[0])
+    assert sql.count("UNION ALL") == 1
+    assert "community_podcasts" in sql and "community_news" in sql and "members" not in sql
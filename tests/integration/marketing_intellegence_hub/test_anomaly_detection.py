@@ -0,0 +1,108 @@
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.business_automations.marketing_intellegence_hub.services.insights.anomaly_service import (
+    ANOMALY_METRICS,
+    Ga4AnomalyDetectionService,
+    build_matrices,
+    detect_anomalies,
+    robust_seasonal_scores,
+)
+
+
+def _weekly_pattern(connections: int, days: int, seed: int = 3) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    weekday = np.array([1.0, 1.1, 1.05, 1.0, 0.9, 0.5, 0.45])
+    level = rng.uniform(200, 5000, size=(connections, 1))
+    pattern = np.tile(weekday, days // 7 + 1)[:days]
+    noise = rng.normal(1.0, 0.03, size=(connections, days))
+    return level * pattern * noise
+
+
+def test_weekend_dips_are_not_anomalies_but_spikes_are():
+    matrix = _weekly_pattern(50, 63)
+    matrix[7, -1] *= 3.0
+    zscores, baselines = robust_seasonal_scores(matrix, eval_days=7)
+
+    flagged = np.argwhere(np.abs(zscores) >= 3.5)
+    assert [tuple(cell) for cell in flagged] == [(7, 6)]
+    assert baselines[7, 6] > 0
+
+
+def test_detect_anomalies_ranks_one_per_connection():
+    start = date(2025, 1, 1)
+    days = 57
+    connections = [(f"conn_{i}", "tenant_a" if i % 2 else "tenant_b", f"Client {i}", None, f"properties/{i}") for i in range(6)]
+    sessions = _weekly_pattern(len(connections), days)
+    sessions[2, -1] *= 0.2
+    sessions[3, -1] *= 4.0
+    rows = []
+    for row, (connection_id, *_rest) in enumerate(connections):
+        for column in range(days):
+            value = sessions[row, column]
+            rows.append((connection_id, start + timedelta(days=column), value, value * 0.02, 0.6, 0.02))
+    # Missing rows become gaps rather than zeros.
+    rows = [r for r in rows if not (r[0] == "conn_5" and r[1] == start + timedelta(days=days - 8))]
+
+    matrices = build_matrices(rows, [c[0] for c in connections], start, start + timedelta(days=days - 1))
+    assert np.isnan(matrices["sessions"][5, days - 8])
+
+    anomalies = detect_anomalies(connections, matrices, start, eval_days=1)
+
+    assert [a.connection_id for a in anomalies] == ["conn_3", "conn_2"]
+    assert anomalies[0].tenant_id == "tenant_a" and anomalies[0].zscore > 0
+    assert anomalies[1].zscore < 0
+    assert anomalies[0].day == start + timedelta(days=days - 1)
+    assert "Client 3" in anomalies[0].template_text()
+
+
+def test_portfolio_scoring_is_fast_for_large_fleets():
+    matrix = _weekly_pattern(1000, 400)
+    started = time.perf_counter()
+    zscores, _ = robust_seasonal_scores(matrix, eval_days=400 - 56)
+    elapsed = time.perf_counter() - started
+    assert zscores.shape == (1000, 344)
+    assert elapsed < 10
+
+
+class RecordingSession:
+    def __init__(self):
+        self.statements = []
+        self.added = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt.compile(dialect=postgresql.dialect()))
+
+    def add(self, item):
+        self.added.append(item)
+
+    async def flush(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_rerun_clears_the_window_for_every_processed_connection():
+    session = RecordingSession()
+    service = Ga4AnomalyDetectionService(session, narrator=lambda tenant_id, anomalies: None)
+    connections = [("conn_a", "tenant_a", "A", None, "properties/1"), ("conn_b", "tenant_b", "B", None, "properties/2")]
+
+    async def load_matrix(start, end):
+        days = (end - start).days + 1
+        return connections, {metric: _weekly_pattern(len(connections), days) for metric in ANOMALY_METRICS}
+
+    service.load_matrix = load_matrix
+    result = await service.run(as_of=date(2025, 3, 10), eval_days=2)
+
+    # Nothing is anomalous now, yet yesterday's rows for both connections are removed.
+    assert result.anomalies == 0 and session.added == []
+    (delete,) = session.statements
+    assert str(delete).startswith("DELETE FROM ga4_insights")
+    assert "ga4_insights.tenant_id" not in str(delete)
+    params = delete.params
+    assert {"conn_a", "conn_b", "2025-03-10", "2025-03-09", "anomaly"} <= {
+        item for value in params.values() for item in (value if isinstance(value, list) else [value])
+    }
@@ -0,0 +1,59 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from app.features.business_automations.marketing_intellegence_hub.services.metrics.derived_metrics import (
+    compute_derived_metrics,
+    compute_period_deltas,
+)
+
+
+def _days(count, start=date(2025, 1, 1)):
+    return [start + timedelta(days=offset) for offset in range(count)]
+
+
+def test_moving_averages_and_deltas_match_a_naive_loop():
+    rng = np.random.default_rng(7)
+    values = list(rng.integers(100, 1000, size=60).astype(float))
+    derived = compute_derived_metrics(_days(60), {"sessions": values})
+
+    day = 40
+    sessions = derived[day]
+    assert sessions["moving_averages"]["sessions"]["ma7"] == pytest.approx(np.mean(values[day - 6:day + 1]), abs=1e-4)
+    assert sessions["moving_averages"]["sessions"]["ma28"] == pytest.approx(np.mean(values[day - 27:day + 1]), abs=1e-4)
+    assert sessions["changes"]["sessions"]["dod"] == pytest.approx((values[day] / values[day - 1] - 1) * 100, abs=0.01)
+    assert sessions["changes"]["sessions"]["wow"] == pytest.approx((values[day] / values[day - 7] - 1) * 100, abs=0.01)
+    baseline = np.array(values[day - 28:day])
+    expected_z = (values[day] - baseline.mean()) / baseline.std()
+    assert sessions["changes"]["sessions"]["zscore"] == pytest.approx(expected_z, abs=1e-3)
+
+    # Not enough history yet for deltas or a z-score on the first day.
+    assert derived[0]["changes"]["sessions"] == {"dod": None, "wow": None, "zscore": None}
+
+
+def test_missing_days_are_gaps_not_zeros():
+    days = _days(20)
+    del days[10]
+    values = [100.0] * 19
+    derived = compute_derived_metrics(days, {"sessions": values, "conversions": [None] * 19})
+
+    # The day after the gap has no day-over-day change, but the 7-day average ignores the hole.
+    after_gap = derived[10]
+    assert after_gap["changes"]["sessions"]["dod"] is None
+    assert after_gap["moving_averages"]["sessions"]["ma7"] == pytest.approx(100.0)
+    assert after_gap["moving_averages"]["conversions"]["ma7"] is None
+
+
+def test_flat_history_has_no_zscore():
+    derived = compute_derived_metrics(_days(40), {"sessions": [50.0] * 40})
+    assert derived[-1]["changes"]["sessions"]["zscore"] is None
+
+
+def test_period_deltas_skip_missing_and_zero_baselines():
+    deltas = compute_period_deltas(
+        {"sessions": 300.0, "users": 50.0, "conversions": None, "bounce_rate": 0.4},
+        {"sessions": 150.0, "users": 0.0, "conversions": 10.0, "bounce_rate": None},
+        ("sessions", "users", "conversions", "bounce_rate", "new_users"),
+    )
+    assert deltas == {"sessions": 100.0}
@@ -0,0 +1,76 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.business_automations.marketing_intellegence_hub.clients.fake_ga4_client import FakeGa4Client
+from app.features.business_automations.marketing_intellegence_hub.schemas import Ga4DimensionMetricPayload
+from app.features.business_automations.marketing_intellegence_hub.services import Ga4MetricsIngestionService
+from app.features.business_automations.marketing_intellegence_hub.services.sync import (
+    Ga4FleetSyncService,
+    PropertyQuotaTracker,
+    month_windows,
+)
+
+
+class RecordingSession:
+    """Captures compiled statements instead of talking to Postgres."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.statements.append((str(compiled), compiled.params))
+
+        class Result:
+            rowcount = len([key for key in compiled.params if key.startswith("date_")])
+
+        return Result()
+
+
+@pytest.mark.asyncio
+async def test_fetch_breakdowns_sends_one_window_per_batch():
+    client = FakeGa4Client()
+    service = Ga4FleetSyncService(session_factory=object(), quota_tracker=PropertyQuotaTracker())
+    windows = month_windows(date(2025, 1, 1), date(2025, 2, 28))
+    rows = []
+
+    async def on_batch(batch):
+        rows.extend(batch.rows)
+
+    completed = await service.fetch_windows(
+        client, "properties/1", windows, on_batch, fetch=client.batch_fetch_breakdowns, group_size=1
+    )
+
+    assert completed == date(2025, 2, 28)
+    # Channel, device and geo reports for one month go out together.
+    assert [len(call["breakdowns"]) for call in client.calls] == [3, 3]
+    days = 59
+    assert len([row for row in rows if row["dimension"] == "device"]) == days * 3
+    jan_first = [row for row in rows if row["date"] == date(2025, 1, 1) and row["dimension"] == "channel"]
+    daily = client.batch_fetch_daily_metrics("properties/1", [(date(2025, 1, 1), date(2025, 1, 1))]).rows[0]
+    assert sum(row["sessions"] for row in jan_first) == pytest.approx(daily["sessions"], abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_dimension_upsert_is_chunked_keyed_and_guarded():
+    session = RecordingSession()
+    service = Ga4MetricsIngestionService(session, "tenant_a")
+    payloads = [
+        Ga4DimensionMetricPayload(date=date(2025, 1, day), dimension="device", dimension_value=value, sessions=day)
+        for day in range(1, 4)
+        for value in ("desktop", "mobile")
+    ]
+    payloads.append(
+        Ga4DimensionMetricPayload(date=date(2025, 1, 1), dimension="device", dimension_value="desktop", sessions=42)
+    )
+
+    written = await service.upsert_dimension_metrics("conn_1", payloads, chunk_size=4)
+
+    assert written == 6
+    assert len(session.statements) == 2
+    sql, params = session.statements[0]
+    assert "ON CONFLICT (tenant_id, connection_id, date, dimension, dimension_value) DO UPDATE" in sql
+    assert "IS DISTINCT FROM" in sql
+    assert params["sessions_m0"] == 42
@@ -0,0 +1,89 @@
+import asyncio
+from datetime import date, datetime
+
+import pytest
+
+from app.features.business_automations.marketing_intellegence_hub.clients.fake_ga4_client import FakeGa4Client
+from app.features.business_automations.marketing_intellegence_hub.services.sync import (
+    Ga4FleetSyncService,
+    PropertyQuotaTracker,
+    month_windows,
+    sync_range,
+)
+
+
+def test_month_windows_split_on_calendar_months():
+    assert month_windows(date(2025, 1, 20), date(2025, 3, 5)) == [
+        (date(2025, 1, 20), date(2025, 1, 31)),
+        (date(2025, 2, 1), date(2025, 2, 28)),
+        (date(2025, 3, 1), date(2025, 3, 5)),
+    ]
+
+
+def test_sync_range_uses_watermark_minus_restatement_window():
+    today = date(2025, 6, 10)
+    assert sync_range(datetime(2025, 6, 8, 14, 30), today, restatement_days=3) == (date(2025, 6, 5), today)
+    assert sync_range(None, today, initial_backfill_days=10) == (date(2025, 6, 1), today)
+
+
+def test_quota_tracker_blocks_low_properties_until_cooldown():
+    now = [0.0]
+    tracker = PropertyQuotaTracker(min_remaining=100, clock=lambda: now[0])
+    tracker.record("properties/1", {"tokens_per_hour": 50, "tokens_per_day": 10000})
+    assert not tracker.can_request("properties/1")
+    assert tracker.can_request("properties/2")
+    now[0] = 3601.0
+    assert tracker.can_request("properties/1")
+
+
+@pytest.mark.asyncio
+async def test_fetch_windows_batches_reports_with_fake_client():
+    client = FakeGa4Client()
+    service = Ga4FleetSyncService(session_factory=object(), quota_tracker=PropertyQuotaTracker())
+    windows = month_windows(date(2025, 1, 1), date(2025, 7, 15))
+    batches = []
+
+    async def on_batch(batch):
+        batches.append(batch)
+
+    completed = await service.fetch_windows(client, "properties/1", windows, on_batch)
+
+    assert completed == date(2025, 7, 15)
+    # Seven month windows go out as one batch of five and one of two.
+    assert [len(call["windows"]) for call in client.calls] == [5, 2]
+    assert sum(len(batch.rows) for batch in batches) == (date(2025, 7, 15) - date(2025, 1, 1)).days + 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_windows_stops_when_property_quota_runs_out():
+    client = FakeGa4Client(tokens_per_hour=60, tokens_per_report=10)
+    tracker = PropertyQuotaTracker(min_remaining=1)
+    service = Ga4FleetSyncService(session_factory=object(), quota_tracker=tracker)
+    windows = month_windows(date(2025, 1, 1), date(2025, 12, 31))
+
+    async def on_batch(batch):
+        pass
+
+    completed = await service.fetch_windows(client, "properties/1", windows, on_batch)
+
+    # The first batch (5 reports) fits the quota; the second is rejected.
+    assert completed == date(2025, 5, 31)
+    assert not tracker.can_request("properties/1")
+
+
+@pytest.mark.asyncio
+async def test_fetch_windows_requests_next_group_while_writing():
+    client = FakeGa4Client()
+    service = Ga4FleetSyncService(session_factory=object(), quota_tracker=PropertyQuotaTracker())
+    windows = month_windows(date(2025, 1, 1), date(2025, 12, 31))
+    calls_seen_while_writing = []
+
+    async def on_batch(batch):
+        await asyncio.sleep(0.05)
+        calls_seen_while_writing.append(len(client.calls))
+
+    completed = await service.fetch_windows(client, "properties/1", windows, on_batch, group_size=4)
+
+    assert completed == date(2025, 12, 31)
+    # Each group after the first was already requested while the previous one was written.
+    assert calls_seen_while_writing == [2, 3, 3]
@@ -0,0 +1,118 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.business_automations.marketing_intellegence_hub.schemas import Ga4DailyMetricPayload
+from app.features.business_automations.marketing_intellegence_hub.services import (
+    Ga4MetricsIngestionService,
+    Ga4MetricsQueryService,
+)
+from app.features.business_automations.marketing_intellegence_hub.services.metrics.metrics_cache import (
+    InMemoryMetricsCache,
+)
+
+KPIS = 9
+
+
+def _row(by_date, by_connection, day, connection_id, current, compare=None):
+    current = list(current) + [None] * (KPIS - len(current))
+    compare = [] if compare is None else list(compare) + [None] * (KPIS - len(compare))
+    return (by_date, by_connection, day, connection_id, date(2024, 6, 1), date(2025, 1, 31), *current, *compare)
+
+
+class SnapshotSession:
+    """Returns canned grouping-sets rows and records every statement."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        rows = self.rows
+
+        class Result:
+            rowcount = 1
+
+            def all(self):
+                return rows
+
+        return Result()
+
+
+@pytest.mark.asyncio
+async def test_kpis_series_and_top_come_from_one_cached_query():
+    rows = [
+        _row(1, 1, None, None, [300, 200, 12], [150, 100, 6]),
+        _row(0, 1, date(2025, 1, 2), None, [200, 120, 8]),
+        _row(0, 1, date(2025, 1, 1), None, [100, 80, 4]),
+        # A day that only belongs to the comparison window.
+        _row(0, 1, date(2024, 12, 1), None, [None, None, None]),
+        _row(1, 0, None, "conn_b", [100, 60, 10]),
+        _row(1, 0, None, "conn_a", [200, 140, 2]),
+    ]
+    session = SnapshotSession(rows)
+    cache = InMemoryMetricsCache()
+    service = Ga4MetricsQueryService(session, "tenant_a", cache=cache)
+    ids = ["conn_a", "conn_b"]
+    args = (ids, date(2025, 1, 1), date(2025, 1, 31), date(2024, 12, 1), date(2024, 12, 31))
+
+    kpis = await service.get_rollup_kpis(*args)
+    assert kpis.sessions == 300 and kpis.deltas["sessions"] == 100.0
+    assert len(session.statements) == 1
+    sql = session.statements[0]
+    assert "GROUPING SETS" in sql and "FILTER (WHERE" in sql
+
+    # Warm: same ranges in any id order hit the cache.
+    await service.get_rollup_kpis(list(reversed(ids)), *args[1:])
+    assert len(session.statements) == 1
+
+    series_service = Ga4MetricsQueryService(session, "tenant_a", cache=cache)
+    points = await series_service.get_time_series_multi(ids, date(2025, 1, 1), date(2025, 1, 31))
+    top = await series_service.get_top_connections(ids, date(2025, 1, 1), date(2025, 1, 31), limit=1)
+    assert [p.date for p in points] == [date(2025, 1, 1), date(2025, 1, 2)]
+    assert top == [{"connection_id": "conn_b", "conversions": 10.0, "sessions": 100.0}]
+    # Series and top share one snapshot (no comparison window).
+    assert len(session.statements) == 2
+
+
+@pytest.mark.asyncio
+async def test_committed_ingestion_invalidates_cached_snapshots():
+    session = SnapshotSession([_row(1, 1, None, None, [10])])
+    cache = InMemoryMetricsCache()
+    query = Ga4MetricsQueryService(session, "tenant_a", cache=cache)
+    ingest = Ga4MetricsIngestionService(session, "tenant_a", cache=cache)
+
+    await query.get_kpis("conn_a", date(2025, 1, 1), date(2025, 1, 7))
+    await query.get_kpis("conn_a", date(2025, 1, 1), date(2025, 1, 7))
+    await query.get_rollup_kpis(["conn_a", "conn_b"], date(2025, 1, 1), date(2025, 1, 7))
+    assert len(session.statements) == 2
+
+    await ingest.upsert_daily_metrics("conn_b", [Ga4DailyMetricPayload(date=date(2025, 1, 3), sessions=5)])
+    statements = len(session.statements)
+
+    # Not yet committed: cached snapshots stay valid until the caller invalidates.
+    await query.get_rollup_kpis(["conn_a", "conn_b"], date(2025, 1, 1), date(2025, 1, 7))
+    assert len(session.statements) == statements
+    await ingest.invalidate_cached_metrics(["conn_b"])
+
+    await query.get_kpis("conn_a", date(2025, 1, 1), date(2025, 1, 7))
+    assert len(session.statements) == statements
+    await query.get_rollup_kpis(["conn_a", "conn_b"], date(2025, 1, 1), date(2025, 1, 7))
+    assert len(session.statements) == statements + 1
+
+
+def test_cache_entries_expire():
+    now = [0.0]
+    cache = InMemoryMetricsCache(ttl_seconds=5, clock=lambda: now[0])
+
+    async def scenario():
+        lookup = await cache.get(["c"], "k")
+        await cache.set("k", {"v": 1}, lookup.generations)
+        assert (await cache.get(["c"], "k")).value == {"v": 1}
+        now[0] = 6
+        assert not (await cache.get(["c"], "k")).hit
+
+    import asyncio
+    asyncio.run(scenario())
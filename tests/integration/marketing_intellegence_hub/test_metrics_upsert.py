@@ -0,0 +1,46 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.business_automations.marketing_intellegence_hub.schemas import Ga4DailyMetricPayload
+from app.features.business_automations.marketing_intellegence_hub.services import Ga4MetricsIngestionService
+
+
+class RecordingSession:
+    """Captures compiled statements instead of talking to Postgres."""
+
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.statements.append((str(compiled), compiled.params))
+
+        class Result:
+            rowcount = len([key for key in compiled.params if key.startswith("date_")])
+
+        return Result()
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_chunks_dedupes_and_guards_updates():
+    session = RecordingSession()
+    service = Ga4MetricsIngestionService(session, "tenant_a")
+    payloads = [
+        Ga4DailyMetricPayload(date=date(2025, 1, day), sessions=day, users=day * 2)
+        for day in range(1, 6)
+    ]
+    # Later payload for the same day wins.
+    payloads.append(Ga4DailyMetricPayload(date=date(2025, 1, 1), sessions=99, users=1))
+
+    written = await service.upsert_daily_metrics("conn_1", payloads, chunk_size=2)
+
+    assert written == 5
+    assert len(session.statements) == 3
+    sql, params = session.statements[0]
+    assert "ON CONFLICT (tenant_id, connection_id, date) DO UPDATE" in sql
+    assert "IS DISTINCT FROM" in sql
+    # Fields that were never set are not written (so breakdowns are not nulled).
+    assert "channel_breakdown" not in sql
+    assert params["sessions_m0"] == 99
@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+import pytest
+
+from app.features.business_automations.sales_outreach_prep.services.campaigns.progress_channel import (
+    campaign_event_stream,
+)
+from app.features.core.event_streams import InMemoryEventLog
+
+
+def parse(message):
+    fields = {}
+    for line in message.strip().splitlines():
+        key, _, value = line.partition(":")
+        fields[key] = value.strip()
+    if "data" in fields:
+        fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+SNAPSHOT = {
+    "id": "c1",
+    "status": "draft",
+    "discovery_type": "ai_research",
+    "total_prospects": 0,
+    "enriched_prospects": 0,
+}
+
+
+@pytest.mark.asyncio
+async def test_stream_sends_snapshot_then_diffs_heartbeats_and_closes_on_complete():
+    channel = InMemoryEventLog()
+    await channel.publish("c1", "progress", {"id": "c1", "total_prospects": 0})
+    cursor = await channel.latest_id("c1")
+
+    stream = campaign_event_stream(channel, "c1", dict(SNAPSHOT), cursor, heartbeat_seconds=0.05)
+    assert (await stream.__anext__()).startswith("retry:")
+    first = parse(await stream.__anext__())
+    assert (first["event"], first["id"], first["data"]) == ("progress", cursor, SNAPSHOT)
+
+    # Idle: a heartbeat comment rather than a database poll
+    assert await stream.__anext__() == ": heartbeat\n\n"
+
+    # Unchanged fields are dropped; a progress event with no changes sends nothing
+    await channel.publish("c1", "progress", {"id": "c1", "status": "draft", "total_prospects": 5})
+    await channel.publish("c1", "progress", {"id": "c1", "total_prospects": 5})
+    await channel.publish("c1", "complete", {"campaign_id": "c1", "status": "active"})
+
+    diff = parse(await stream.__anext__())
+    assert diff["data"] == {"id": "c1", "total_prospects": 5}
+    complete = parse(await stream.__anext__())
+    assert complete["event"] == "complete"
+    with pytest.raises(StopAsyncIteration):
+        await stream.__anext__()
+
+
+@pytest.mark.asyncio
+async def test_stream_resumes_after_last_event_id():
+    channel = InMemoryEventLog()
+    seen = await channel.publish("c1", "progress", {"id": "c1", "enriched_prospects": 3})
+    await channel.publish("c1", "progress", {"id": "c1", "enriched_prospects": 7})
+    await channel.publish("c2", "progress", {"id": "c2", "enriched_prospects": 1})
+
+    stream = campaign_event_stream(channel, "c1", None, seen, heartbeat_seconds=0.05)
+    await stream.__anext__()
+    missed = parse(await stream.__anext__())
+    assert missed["data"] == {"id": "c1", "enriched_prospects": 7}
+
+    # A publish while the reader is blocked wakes it up immediately
+    reader = asyncio.ensure_future(stream.__anext__())
+    await asyncio.sleep(0)
+    await channel.publish("c1", "error", {"campaign_id": "c1", "error": "boom"})
+    assert parse(await asyncio.wait_for(reader, 1))["event"] == "error"
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stream_closes_immediately_for_finished_research():
+    channel = InMemoryEventLog()
+    snapshot = dict(SNAPSHOT, status="active")
+
+    messages = [message async for message in campaign_event_stream(channel, "c1", snapshot, "0-0")]
+
+    assert [parse(message).get("event") for message in messages[1:]] == ["progress", "complete"]
+    assert "id" not in parse(messages[1])
@@ -0,0 +1,157 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.features.business_automations.sales_outreach_prep.services.entity_resolution_service import (
+    EntityResolutionService,
+)
+from app.features.business_automations.sales_outreach_prep.utils.entity_resolution import (
+    BlockingIndex,
+    cluster_records,
+    company_record,
+    normalize_company_name,
+    normalize_domain,
+    prospect_record,
+    similarity,
+)
+
+
+class ProjectionSession:
+    """Returns canned projection rows for every SELECT."""
+
+    def __init__(self, rows):
+        self.rows = [SimpleNamespace(**row) for row in rows]
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(all=lambda: self.rows)
+
+    async def rollback(self):
+        pass
+
+
+def test_company_names_and_domains_normalize():
+    assert normalize_company_name("ACME, Inc.") == normalize_company_name("Acme Inc") == "acme"
+    assert normalize_company_name("Johnson & Johnson Co.") == "johnson and johnson"
+    # A name that is only a legal form keeps it
+    assert normalize_company_name("Company") == "company"
+    assert normalize_domain(" https://WWW.Acme.com:443/about?x=1") == "acme.com"
+    assert normalize_domain("") is None
+    assert similarity("acme", "acme") == 1.0
+    assert similarity("acme", "globex") == 0.0
+
+
+def test_blocking_skips_oversized_blocks_and_clusters_oldest_first():
+    records = [
+        company_record("1", "Acme Inc", "acme.com"),
+        company_record("2", "ACME, Inc."),
+        company_record("3", "Globex"),
+        company_record("4", "Acme Technologies", "https://www.acme.com/"),
+        company_record("5", "Globex Corporation"),
+        company_record("6", "Initech"),
+    ]
+
+    suggestions = cluster_records(records, threshold=0.75)
+
+    assert [(s.canonical_id, s.duplicate_ids) for s in suggestions] == [("1", ["2", "4"]), ("3", ["5"])]
+    assert suggestions[0].reason == "mixed"
+
+    # A token shared by too many records narrows nothing and is not scanned
+    index = BlockingIndex(threshold=0.5, max_block_size=2)
+    for position in range(3):
+        index.add(company_record(str(position), f"Cloud Vendor{position}"))
+    assert index.match(company_record("x", "Cloud Vendr1")) is None
+    assert index.match(company_record("y", "Cloud Vendor1")).record.id == "1"
+
+
+def test_prospects_only_match_within_their_company():
+    index = BlockingIndex(threshold=0.85)
+    index.add(prospect_record("p1", "Jane Doe", "c1", email="jane@acme.com"))
+
+    assert index.match(prospect_record("n1", "Jane Doe, MBA", "c1")).record.id == "p1"
+    assert index.match(prospect_record("n2", "Jane Doe", "c2")) is None
+    assert index.match(prospect_record("n3", "J. Doe", "c2", email="JANE@acme.com")).reason == "email"
+
+
+@pytest.mark.asyncio
+async def test_resolve_companies_reuses_existing_and_groups_new_candidates():
+    session = ProjectionSession([
+        {"id": "co_1", "name": "Acme Inc", "name_key": "acme", "domain_key": "acme.com"},
+        {"id": "co_2", "name": "Initech", "name_key": "initech", "domain_key": None},
+    ])
+    service = EntityResolutionService(session, "tenant_a")
+
+    resolutions = await service.resolve_companies([
+        {"name": "ACME, Inc."},
+        {"name": "Totally Different", "website_url": "https://www.acme.com/contact"},
+        {"name": "Hooli"},
+        {"name": "Hooli LLC"},
+        {"name": "Initech Corporation"},
+    ])
+
+    assert [r.company_id for r in resolutions] == ["co_1", "co_1", None, None, "co_2"]
+    assert resolutions[1].reason == "domain"
+    assert resolutions[2].cluster == resolutions[3].cluster
+    # Existing companies are loaded once as a narrow, tenant-filtered projection
+    assert len(session.statements) == 1
+    sql = str(session.statements[0])
+    assert "sales_companies.tenant_id" in sql and "sales_companies.description" not in sql
+    assert "%" not in sql
+
+
+@pytest.mark.asyncio
+async def test_single_candidate_only_loads_its_trigram_neighbours():
+    session = ProjectionSession([
+        {"id": "co_1", "name": "Acme Inc", "name_key": "acme", "domain_key": None},
+    ])
+    service = EntityResolutionService(session, "tenant_a")
+
+    [resolution] = await service.resolve_companies([{"name": "ACME, Inc.", "domain": "https://acme.io/"}])
+
+    assert resolution.company_id == "co_1"
+    sql = str(session.statements[0].compile(compile_kwargs={"literal_binds": True}))
+    assert "sales_companies.name_key % 'acme'" in sql
+    assert "sales_companies.domain_key = 'acme.io'" in sql
+
+
+@pytest.mark.asyncio
+async def test_filter_new_prospects_drops_near_duplicates():
+    session = ProjectionSession([
+        {"id": "p1", "full_name": "Jane Doe", "company_id": "c1",
+         "linkedin_url": "https://linkedin.com/in/jane", "email": None},
+    ])
+    service = EntityResolutionService(session, "tenant_a")
+    rows = [
+        {"full_name": "Jane Doe PhD", "company_id": "c1"},
+        {"full_name": "Someone", "company_id": "c9", "linkedin_url": "https://uk.linkedin.com/in/Jane/"},
+        {"full_name": "John Roe", "company_id": "c1"},
+        {"full_name": "John Roe", "company_id": "c1"},
+        {"full_name": "John Roe", "company_id": "c2"},
+    ]
+
+    kept, skipped = await service.filter_new_prospects("camp_1", rows)
+
+    assert kept == [rows[2], rows[4]]
+    assert skipped == 3
+
+
+@pytest.mark.asyncio
+async def test_shared_prospect_index_is_loaded_once_and_sees_earlier_batches():
+    session = ProjectionSession([
+        {"id": "p1", "full_name": "Jane Doe", "company_id": "c1", "linkedin_url": None, "email": None},
+    ])
+    service = EntityResolutionService(session, "tenant_a")
+    index = await service.prospect_index("camp_1")
+
+    first, _ = await service.filter_new_prospects("camp_1", [{"full_name": "John Roe", "company_id": "c1"}], index)
+    second, skipped = await service.filter_new_prospects("camp_1", [
+        {"full_name": "John Roe", "company_id": "c1"},
+        {"full_name": "Jane Doe", "company_id": "c1"},
+        {"full_name": "Ann Poe", "company_id": "c1"},
+    ], index)
+
+    assert len(first) == 1
+    assert [row["full_name"] for row in second] == ["Ann Poe"]
+    assert skipped == 2
+    assert len(session.statements) == 1
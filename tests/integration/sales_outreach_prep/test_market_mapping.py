@@ -0,0 +1,147 @@
+import asyncio
+import json
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+from app.features.business_automations.sales_outreach_prep.services import market_mapping_service
+from app.features.business_automations.sales_outreach_prep.services.market_mapping_service import (
+    MarketMappingService,
+    build_executives_frame,
+    clean_full_names,
+    jitter_duplicate_points,
+    write_market_map_workbook,
+)
+
+LANDSCAPE = json.dumps([
+    {"company name": "Globex", "short description": "Rival", "estimated market size": "High",
+     "product breadth": "Broad", "innovation score": 6, "completeness of vision": 7, "ability to execute": 7},
+    {"company name": "Initech", "short description": "Niche rival", "estimated market size": "Low",
+     "product breadth": "Niche", "innovation score": 4, "completeness of vision": 7, "ability to execute": 7},
+]) + "\nExecutive Summary:\nA crowded market.\nAI Insights:\n- Consolidation ahead\n- Pricing pressure\n"
+
+
+class FakeOpenAI:
+    def __init__(self):
+        self.domain_lookups = []
+
+    async def chat_completion(self, messages, **kwargs):
+        prompt = messages[-1]["content"]
+        if "domain" in prompt:
+            company = prompt.split('"')[1]
+            self.domain_lookups.append(company)
+            return f"- {company.lower()}.com\n- not a domain\n"
+        return LANDSCAPE
+
+
+class FakeFirecrawl:
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self.searches = []
+
+    async def search_linkedin_profiles(self, company_name, job_titles, location, max_results):
+        self.searches.append((company_name, location))
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        slug = f"{company_name}-{location}".lower()
+        return [
+            {"full_name": "Jane Doe, MBA", "job_title": "VP Sales", "linkedin_url": f"https://linkedin.com/in/jane-{slug}",
+             "linkedin_snippet": ""},
+            {"full_name": "Sam Roe", "job_title": None, "linkedin_url": f"https://linkedin.com/in/sam-{slug}",
+             "linkedin_snippet": "I work as Head of Growth at " + company_name},
+        ]
+
+
+class FakeHunter:
+    def __init__(self):
+        self.calls = []
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+    async def find_email(self, first_name, last_name, domain):
+        self.calls.append((first_name, last_name, domain))
+        if first_name == "Jane":
+            return {"email": f"jane@{domain}", "confidence": 90}
+        return None
+
+
+def test_vectorized_transforms():
+    df = pd.DataFrame({"x": [5, 5, 6, 5], "y": [5, 5, 6, 5]})
+    jittered = jitter_duplicate_points(df, "x", "y", rng=np.random.default_rng(0))
+    assert jittered.iloc[0].tolist() == [5.0, 5.0] and jittered.iloc[2].tolist() == [6.0, 6.0]
+    assert (jittered.iloc[[1, 3]] != 5.0).any(axis=1).all()
+    assert df["x"].tolist() == [5, 5, 6, 5]
+
+    assert clean_full_names(pd.Series(["Jane Doe, MBA", "Dr Sam Roe PhD", None])).tolist() == [
+        "Jane Doe", "Dr Sam Roe", ""
+    ]
+    frame = build_executives_frame([
+        {"company": "A", "country": "UK", "full_name": "Sam", "job_title": "",
+         "linkedin_url": "u1", "linkedin_snippet": "currently a Principal Engineer at A"},
+        {"company": "A", "country": "US", "full_name": "Sam", "job_title": "CTO",
+         "linkedin_url": "u1", "linkedin_snippet": None},
+    ])
+    assert frame[["Title", "Region"]].values.tolist() == [["Principal Engineer", "UK"]]
+
+
+@pytest.mark.asyncio
+async def test_market_map_runs_searches_concurrently_and_streams_workbook(tmp_path, monkeypatch):
+    monkeypatch.setattr(market_mapping_service, "_domain_cache", OrderedDict())
+    openai, firecrawl, hunter = FakeOpenAI(), FakeFirecrawl(), FakeHunter()
+    async with MarketMappingService(openai, firecrawl, hunter, search_concurrency=3) as service:
+        market_map = await service.build_market_map("Acme", ["VP"], ["Boston", "London"])
+    assert hunter.closed
+
+    # Competitors x countries, never the subject company, at most 3 at once
+    assert sorted(firecrawl.searches) == [
+        ("Globex", "Boston"), ("Globex", "London"), ("Initech", "Boston"), ("Initech", "London")
+    ]
+    assert firecrawl.peak == 3
+    assert market_map.market_data["Company name"].tolist() == ["Globex", "Initech", "Acme"]
+    assert market_map.insights == ["Consolidation ahead", "Pricing pressure"]
+
+    executives = market_map.executives
+    assert len(executives) == 8
+    jane = executives[executives["Name"] == "Jane Doe, MBA"]
+    assert set(jane["Email"]) == {"jane@globex.com", "jane@initech.com"}
+    assert set(executives.loc[executives["Name"] == "Sam Roe", "Title"]) == {"Head of Growth"}
+    assert market_map.stats["emails_found"] == 4
+
+    # Domain lookups are cached across runs
+    await service.build_market_map("Acme", ["VP"], ["Boston"])
+    assert sorted(openai.domain_lookups) == ["Globex", "Initech"]
+
+    path = write_market_map_workbook(market_map, str(tmp_path / "map.xlsx"))
+    workbook = load_workbook(path, read_only=True)
+    assert workbook.sheetnames == ["Executive Summary", "Market Data", "Executives"]
+    rows = list(workbook["Executives"].iter_rows(values_only=True))
+    assert rows[0] == ("Company", "Name", "Title", "Region", "Domain", "Email", "Source", "Snippet")
+    assert len(rows) == 9
+    market_rows = list(workbook["Market Data"].iter_rows(values_only=True))
+    assert market_rows[-1][:2] == ("Acme", "Subject of analysis")
+
+
+def test_domain_cache_drops_expired_and_least_recently_used(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(market_mapping_service, "_domain_cache", OrderedDict())
+    monkeypatch.setattr(market_mapping_service, "DOMAIN_CACHE_MAX_ENTRIES", 2)
+    monkeypatch.setattr(market_mapping_service, "DOMAIN_CACHE_TTL_SECONDS", 10)
+    monkeypatch.setattr(market_mapping_service.time, "monotonic", lambda: now[0])
+
+    market_mapping_service._cache_domains("a", ["a.com"])
+    market_mapping_service._cache_domains("b", ["b.com"])
+    assert market_mapping_service._cached_domains("a") == ["a.com"]
+    market_mapping_service._cache_domains("c", ["c.com"])
+    assert list(market_mapping_service._domain_cache) == ["a", "c"]
+
+    now[0] = 10
+    assert market_mapping_service._cached_domains("a") is None
+    assert list(market_mapping_service._domain_cache) == ["c"]
@@ -0,0 +1,72 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.business_automations.sales_outreach_prep.services.prospects import ProspectCrudService
+from app.features.business_automations.sales_outreach_prep.services.prospects.crud_services import (
+    normalize_linkedin_url,
+    prospect_dedupe_key,
+)
+
+
+class RecordingSession:
+    """Answers the campaign check and pretends every other inserted row was a conflict."""
+
+    def __init__(self, campaign_ids):
+        self.campaign_ids = campaign_ids
+        self.statements = []
+
+    async def execute(self, stmt):
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        self.statements.append((str(compiled), compiled.params))
+        if stmt.is_select:
+            values = self.campaign_ids
+        else:
+            values = [value for key, value in compiled.params.items() if key.startswith("id_m")][::2]
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: values))
+
+    async def rollback(self):
+        pass
+
+
+def test_linkedin_urls_normalize_to_one_key():
+    assert normalize_linkedin_url("https://uk.linkedin.com/in/Ada-L/?trk=people") == "linkedin.com/in/ada-l"
+    assert normalize_linkedin_url(" linkedin.com/in/ada-l# ") == "linkedin.com/in/ada-l"
+    assert normalize_linkedin_url("   ") is None
+    assert prospect_dedupe_key("http://www.linkedin.com/in/ada-l", "Ada", "c1") == prospect_dedupe_key(
+        "https://linkedin.com/in/ADA-L/", "Someone Else", "c2"
+    )
+    # Without a profile URL the name (case/whitespace-insensitive) and company identify the person.
+    assert prospect_dedupe_key(None, "Ada  Lovelace", "c1") == prospect_dedupe_key("", "ada lovelace", "c1")
+    assert prospect_dedupe_key(None, "Ada Lovelace", "c1") != prospect_dedupe_key(None, "Ada Lovelace", "c2")
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_validates_once_and_inserts_in_batches():
+    session = RecordingSession(["camp_1"])
+    service = ProspectCrudService(session, "tenant_a")
+    items = [
+        {"campaign_id": "camp_1", "company_id": "c1", "full_name": f"Person {index}",
+         "linkedin_url": f"https://www.linkedin.com/in/person-{index}"}
+        for index in range(5)
+    ]
+    items.append({"campaign_id": "camp_1", "full_name": "Person 0", "linkedin_url": "linkedin.com/in/PERSON-0/"})
+    items.append({"campaign_id": "camp_1", "full_name": None})
+
+    created = await service.bulk_create_prospects(items, user=None, batch_size=2)
+
+    # One campaign check, then three INSERTs for the five distinct people.
+    assert len(session.statements) == 4
+    assert session.statements[0][0].startswith("SELECT sales_campaigns.id")
+    sql, params = session.statements[1]
+    assert "ON CONFLICT (tenant_id, campaign_id, dedupe_key) DO NOTHING RETURNING sales_prospects.id" in sql
+    assert params["first_name_m0"] == "Person" and params["tenant_id_m1"] == "tenant_a"
+    assert len(created) == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_rejects_unknown_campaign():
+    service = ProspectCrudService(RecordingSession([]), "tenant_a")
+    with pytest.raises(ValueError):
+        await service.bulk_create_prospects([{"campaign_id": "other", "full_name": "Ada"}], user=None)
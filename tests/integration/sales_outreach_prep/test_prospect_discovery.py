@@ -0,0 +1,110 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.features.business_automations.sales_outreach_prep import tasks
+
+
+class FakeSession:
+    def __init__(self, log):
+        self.log = log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        self.log.append("commit")
+
+    async def rollback(self):
+        self.log.append("rollback")
+
+
+@pytest.mark.asyncio
+async def test_each_company_is_stored_as_soon_as_its_search_resolves(monkeypatch):
+    log = []
+    fast_stored = asyncio.Event()
+    campaign = SimpleNamespace(
+        id="camp_1", tenant_id="tenant_a", discovery_type="company_discovery",
+        target_roles="CTO", target_geography=None, auto_enrich_on_discovery=False,
+    )
+    companies = [SimpleNamespace(id="c_slow", name="Slow Corp"), SimpleNamespace(id="c_fast", name="Fast Inc")]
+
+    class Campaigns:
+        def __init__(self, db):
+            pass
+
+        async def get_campaign_by_id(self, campaign_id):
+            return campaign
+
+        async def update_campaign_stats(self, campaign_id):
+            log.append("stats")
+
+    class Companies:
+        def __init__(self, db, tenant_id):
+            pass
+
+        async def list_companies(self, limit):
+            return companies, len(companies)
+
+    class Prospects:
+        def __init__(self, db, tenant_id):
+            pass
+
+        async def bulk_create_prospects(self, rows, user=None):
+            log.append(("insert", [row["company_id"] for row in rows]))
+            if rows[0]["company_id"] == "c_fast":
+                fast_stored.set()
+            return [f"p{i}" for i, _ in enumerate(rows)]
+
+    class Resolver:
+        def __init__(self, db, tenant_id):
+            pass
+
+        async def prospect_index(self, campaign_id):
+            log.append("index")
+            return object()
+
+        async def filter_new_prospects(self, campaign_id, rows, index=None):
+            assert index is not None
+            return rows, []
+
+    class Firecrawl:
+        def __init__(self, api_key):
+            pass
+
+        async def search_linkedin_profiles(self, company_name, **kwargs):
+            if company_name == "Slow Corp":
+                # Resolves only after the other branch's prospects were stored
+                await asyncio.wait_for(fast_stored.wait(), timeout=5)
+            return [{"full_name": f"{company_name} CTO", "linkedin_url": f"https://linkedin.com/in/{company_name}"}]
+
+    async def api_key(db, tenant_id):
+        return "fc-key"
+
+    async def publish(campaign_id, data, event="progress"):
+        log.append("publish")
+
+    monkeypatch.setattr(tasks, "async_session", lambda: FakeSession(log))
+    monkeypatch.setattr(tasks, "CampaignCrudService", Campaigns)
+    monkeypatch.setattr(tasks, "CompanyCrudService", Companies)
+    monkeypatch.setattr(tasks, "ProspectCrudService", Prospects)
+    monkeypatch.setattr(tasks, "EntityResolutionService", Resolver)
+    monkeypatch.setattr(tasks, "FirecrawlClient", Firecrawl)
+    monkeypatch.setattr(tasks, "get_firecrawl_api_key", api_key)
+    monkeypatch.setattr(tasks, "_publish_campaign_event", publish)
+    monkeypatch.setattr(tasks, "campaign_snapshot", lambda campaign: {"id": campaign.id})
+
+    result = await tasks._discover_prospects_async("camp_1", None, 5)
+
+    assert result["success"] is True
+    assert (result["companies_searched"], result["prospects_created"], result["duplicates_skipped"]) == (2, 2, 0)
+    # The campaign's prospects are indexed once for the whole run
+    assert log == [
+        "index",
+        ("insert", ["c_fast"]), "stats", "commit", "publish",
+        ("insert", ["c_slow"]), "stats", "commit", "publish",
+    ]
@@ -0,0 +1,209 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.features.business_automations.sales_outreach_prep.models import Prospect
+from app.features.business_automations.sales_outreach_prep.services.prospects import ProspectEnrichmentService
+from app.features.business_automations.sales_outreach_prep.utils import HunterClient, RedisTokenBucket, TokenBucket, get_token_bucket
+
+
+class StubHunter:
+    """Local HTTP server speaking enough of Hunter.io's email-finder API for the client."""
+
+    def __init__(self, throttle_first=0, latency=0.02):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.throttle_remaining = throttle_first
+        self.latency = latency
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+                with stub.lock:
+                    stub.requests.append(query)
+                    stub.in_flight += 1
+                    stub.max_in_flight = max(stub.max_in_flight, stub.in_flight)
+                    throttled = stub.throttle_remaining > 0
+                    if throttled:
+                        stub.throttle_remaining -= 1
+                time.sleep(stub.latency)
+                with stub.lock:
+                    stub.in_flight -= 1
+
+                if throttled:
+                    body, status, headers = {"errors": [{"id": "too_many_requests"}]}, 429, {"Retry-After": "0"}
+                elif query["last_name"] == "Nobody":
+                    body, status, headers = {"data": {"email": None}}, 200, {}
+                else:
+                    email = f"{query['first_name']}.{query['last_name']}@{query['domain']}".lower()
+                    body, status, headers = {"data": {"email": email, "score": 91, "status": "valid"}}, 200, {}
+
+                payload = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class RecordingSession:
+    """Answers the company lookup and records the bulk writes."""
+
+    def __init__(self, companies):
+        self.companies = companies
+        self.statements = []
+
+    async def execute(self, stmt, params=None):
+        self.statements.append((stmt, params))
+        companies = self.companies
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: companies))
+
+
+def _prospects(count):
+    prospects = []
+    for index in range(count):
+        last_name = "Nobody" if index % 5 == 0 else f"Person{index}"
+        prospects.append(Prospect(
+            id=f"p{index}",
+            tenant_id="tenant_a",
+            campaign_id="camp_1",
+            company_id="c1" if index % 2 else "c2",
+            full_name=f"Ada {last_name}",
+            status="new",
+        ))
+    # No company: skipped without a Hunter.io call
+    prospects.append(Prospect(id="orphan", tenant_id="tenant_a", campaign_id="camp_1", full_name="No Company"))
+    return prospects
+
+
+@pytest.mark.asyncio
+async def test_enrichment_runs_concurrently_and_writes_in_bulk():
+    session = RecordingSession([
+        SimpleNamespace(id="c1", domain="acme.com"),
+        SimpleNamespace(id="c2", domain="globex.com"),
+    ])
+    service = ProspectEnrichmentService(session, "tenant_a", concurrency=4, flush_every=10)
+    progress_reports = []
+
+    async def on_progress(progress):
+        progress_reports.append(progress.to_dict())
+
+    with StubHunter(throttle_first=2) as stub:
+        async with HunterClient(api_key="test", base_url=stub.base_url, rate_limiter=TokenBucket(1000)) as hunter:
+            progress = await service.enrich("camp_1", _prospects(20), hunter, on_progress=on_progress)
+
+    # 20 lookups plus the two throttled attempts that were retried after Retry-After.
+    assert len(stub.requests) == 22
+    assert 1 < stub.max_in_flight <= 4
+    assert (progress.enriched, progress.failed, progress.skipped) == (16, 4, 1)
+    assert [report["processed"] for report in progress_reports] == [10, 20]
+
+    # One company query, then per flush: log INSERT, prospect UPDATE, campaign counter UPDATE.
+    assert len(session.statements) == 1 + 2 * 3
+    inserts = [params for stmt, params in session.statements if stmt.is_insert]
+    assert sum(len(params) for params in inserts) == 20
+    prospect_updates = [params for stmt, params in session.statements if stmt.is_update and params]
+    rows = [row for params in prospect_updates for row in params]
+    assert len(rows) == 16
+    assert all(row["status"] == "enriched" and row["email"].endswith(".com") for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_hunter_client_gives_up_after_max_retries():
+    with StubHunter(throttle_first=10) as stub:
+        async with HunterClient(
+            api_key="test", base_url=stub.base_url, rate_limiter=TokenBucket(1000), max_retries=2
+        ) as hunter:
+            result = await hunter.find_email("Ada", "Lovelace", "acme.com")
+
+    assert result is None
+    assert len(stub.requests) == 3
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_and_pauses():
+    now = [0.0]
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=fake_sleep)
+    for _ in range(4):
+        await bucket.acquire()
+    assert now[0] == pytest.approx(1.0)
+
+    await bucket.pause(5)
+    await bucket.acquire()
+    assert now[0] == pytest.approx(6.5)
+
+
+class FakeScript:
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = []
+
+    async def __call__(self, keys, args):
+        self.calls.append((keys, args))
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.mark.asyncio
+async def test_shared_bucket_waits_for_redis_grant_and_fails_open(monkeypatch):
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setenv("REDIS_URL", "redis://redis:6379/0")
+    bucket = get_token_bucket("hunter", "secret-key", rate=15)
+    assert isinstance(bucket, RedisTokenBucket)
+    assert bucket.key.startswith("rate_limit:hunter:") and "secret-key" not in bucket.key
+
+    bucket.sleep = fake_sleep
+    bucket._redis = object()
+    acquire = FakeScript(["0.25", "0", ConnectionError("redis down")])
+    pause = FakeScript([1])
+    bucket._scripts = {"acquire": acquire, "pause": pause}
+
+    await bucket.acquire()
+    assert len(slept) == 1 and 0.25 <= slept[0] < 0.27
+    assert acquire.calls[0] == ([bucket.key], [15.0, 15.0])
+
+    await bucket.pause(2)
+    assert pause.calls == [([bucket.key], [15.0, 15.0, 2])]
+
+    # Redis unavailable: the request is not blocked
+    await bucket.acquire()
+    assert len(slept) == 1
+
+    monkeypatch.delenv("REDIS_URL")
+    assert isinstance(get_token_bucket("hunter", "secret-key", rate=15), TokenBucket)
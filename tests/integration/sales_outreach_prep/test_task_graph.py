@@ -0,0 +1,98 @@
+import asyncio
+import json
+
+import pytest
+
+from app.features.business_automations.sales_outreach_prep.services.prospect_research_service import (
+    ProspectResearchService,
+)
+from app.features.business_automations.sales_outreach_prep.utils import TaskGraph
+
+
+@pytest.mark.asyncio
+async def test_graph_limits_dedupes_times_out_and_chains():
+    in_flight = {"firecrawl": 0}
+    peak = {"firecrawl": 0}
+    calls = []
+    results = []
+
+    async def search(query, delay=0.01):
+        calls.append(query)
+        in_flight["firecrawl"] += 1
+        peak["firecrawl"] = max(peak["firecrawl"], in_flight["firecrawl"])
+        await asyncio.sleep(delay)
+        in_flight["firecrawl"] -= 1
+        return [f"{query}-hit"]
+
+    graph = TaskGraph({"firecrawl": 2}, timeout=0.2)
+
+    def follow_up(found):
+        results.append(found)
+        if found:
+            graph.spawn("firecrawl", ("detail", found[0]), lambda: search(f"detail {found[0]}"), then=results.append)
+
+    for query in ["a", "b", "c", "a"]:
+        graph.spawn("firecrawl", ("search", query), lambda query=query: search(query), then=follow_up)
+    graph.spawn("firecrawl", ("search", "slow"), lambda: search("slow", delay=1), then=results.append)
+
+    stats = await graph.join()
+
+    assert sorted(calls) == ["a", "b", "c", "detail a-hit", "detail b-hit", "detail c-hit", "slow"]
+    assert peak["firecrawl"] == 2
+    # The duplicate "a" still reaches its continuation (sharing the first result),
+    # whose follow-up is deduplicated in turn; the timed-out node hands None on.
+    assert (stats.deduplicated, stats.timed_out) == (2, 1)
+    assert results.count(["a-hit"]) == 2
+    assert None in results
+
+
+class FakeFirecrawl:
+    def __init__(self):
+        self.searches = []
+        self.scrapes = []
+
+    async def search(self, query, limit=10):
+        self.searches.append(query)
+        if query.endswith("corporate events awards"):
+            return [{"title": "Gala", "url": "https://gala.example"}]
+        if query.startswith("venue"):
+            return [{"title": f"{query} hall", "url": f"https://{query}.example"}]
+        name = query.replace(" ", "-").lower()
+        return [{"title": f"{name} - CEO at Org", "url": f"https://linkedin.com/in/{name}", "snippet": ""}]
+
+    async def scrape(self, url, formats=None):
+        self.scrapes.append(url)
+        return {"markdown": f"organizer page {url}"}
+
+
+class FakeOpenAI:
+    def __init__(self):
+        self.calls = 0
+
+    async def chat_completion(self, messages, temperature=0.3, model=None):
+        self.calls += 1
+        return json.dumps({"name": "Org A", "website": "https://org.example"})
+
+
+@pytest.mark.asyncio
+async def test_unknown_orgs_workflow_streams_prospects_per_branch():
+    service = ProspectResearchService(tenant_id="tenant_a")
+    service.firecrawl_client = FakeFirecrawl()
+    service.openai_client = FakeOpenAI()
+    batches = []
+
+    async def on_prospects(found):
+        batches.append(len(found))
+
+    prospects = await service._unknown_orgs_then_contacts_workflow(
+        {"linkedin_queries": ["venue1", "venue2"], "target_roles": ["CEO"]},
+        on_prospects=on_prospects,
+    )
+
+    # Both venues lead to the same event page: scraped and extracted once.
+    assert service.firecrawl_client.scrapes == ["https://gala.example"]
+    assert service.openai_client.calls == 1
+    assert service.firecrawl_client.searches.count("CEO Org A") == 1
+    assert batches == [1]
+    assert prospects[0]["discovered_via_org"] == "Org A"
+    assert prospects[0]["company_website"] == "https://org.example"
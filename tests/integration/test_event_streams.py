@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+from app.features.core.event_streams import (
+    INITIAL_EVENT_ID,
+    InMemoryEventLog,
+    event_id_key,
+    format_sse,
+)
+
+
+def test_sse_framing_and_id_ordering():
+    assert format_sse("progress", {"n": 1}, "5-0") == 'id: 5-0\nevent: progress\ndata: {"n": 1}\n\n'
+    assert format_sse("results", {}).startswith("event: results\n")
+    assert event_id_key("1700000000000-2") > event_id_key("999-9") > event_id_key("garbage")
+
+
+@pytest.mark.asyncio
+async def test_in_memory_log_is_capped_per_key_and_resumes_after_an_id():
+    log = InMemoryEventLog(max_events=2)
+    assert await log.latest_id("a") == INITIAL_EVENT_ID
+    first = await log.publish("a", "progress", {"n": 1})
+    await log.publish("a", "progress", {"n": 2})
+    await log.publish("a", "progress", {"n": 3})
+    await log.publish("b", "progress", {"n": 9})
+
+    events = await log.read("a", INITIAL_EVENT_ID, timeout=0.01)
+    assert [event.data["n"] for event in events] == [2, 3]
+    assert [event.data["n"] for event in await log.read("a", events[0].id, timeout=0.01)] == [3]
+    assert await log.read("a", await log.latest_id("a"), timeout=0.01) == []
+
+    reader = asyncio.ensure_future(log.read("a", await log.latest_id("a"), timeout=1))
+    await asyncio.sleep(0)
+    await log.publish("a", "complete", {"done": True})
+    [event] = await asyncio.wait_for(reader, 1)
+    assert (event.event, event.data) == ("complete", {"done": True})
+    assert first == "1-0"